@@ -6,7 +6,7 @@ Registers all version 1 routers in the FastAPI application.
 
 from fastapi import APIRouter
 
-from .endpoints import auth, seats, meeting_rooms, status, reservations
+from .endpoints import auth, seats, meeting_rooms, status, reservations, admin, waitlist
 
 api_router = APIRouter()
 
@@ -19,6 +19,9 @@ api_router.include_router(seats.router)
 # Seat reservation routes (/api/reservations/seats)
 api_router.include_router(seats.reservation_router, prefix="/api")
 
+# Seat waitlist routes (/api/reservations/seats/waitlist)
+api_router.include_router(waitlist.router, prefix="/api")
+
 # Meeting-room routes (/api/reservations/meeting-rooms)
 api_router.include_router(meeting_rooms.router, prefix="/api")
 
@@ -27,3 +30,6 @@ api_router.include_router(reservations.router, prefix="/api")
 
 # Status routes (/api/status)
 api_router.include_router(status.router, prefix="/api")
+
+# Admin routes (/api/admin)
+api_router.include_router(admin.router, prefix="/api")
@@ -4,6 +4,6 @@ api/v1/endpoints package
 API v1 엔드포인트 모듈
 """
 
-from . import auth, seats, meeting_rooms, status, reservations
+from . import auth, seats, meeting_rooms, status, reservations, admin
 
-__all__ = ["auth", "seats", "meeting_rooms", "status", "reservations"]
+__all__ = ["auth", "seats", "meeting_rooms", "status", "reservations", "admin"]
@@ -0,0 +1,358 @@
+"""
+api/v1/endpoints/admin.py - Admin endpoints.
+============================================
+관리자 전체 예약 조회·내보내기·일괄 취소/이동, 시설 레지스트리·이용 가능 여부, 예약 인덱스 점검 및
+쓰기 락 프로파일 API
+"""
+
+from datetime import date as Date
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from sqlalchemy.orm import Session
+
+from app import facility_availability, facility_registry, lock_profiler, models, schemas
+from app.api.docs import BAD_REQUEST, FORBIDDEN
+from app.auth.deps import get_current_admin_id
+from app.config import settings
+from app.database import get_db, get_read_db, get_read_session_factory
+from app.services import admin_service, reservation_service
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+# 관리자 예약 목록 한 페이지의 최대 크기
+MAX_PAGE_SIZE = 500
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+
+@router.get(
+    "/reservations",
+    response_model=schemas.ApiResponse[schemas.AdminReservationsPayload],
+    responses={**BAD_REQUEST, **FORBIDDEN},
+    summary="전체 예약 조회 (관리자)",
+    description="""
+    기간·시설 유형·상태로 필터링한 전체 예약을 시작 시각 오름차순으로 조회합니다.
+
+    Query Parameters (선택):
+    - from / to: 조회 기간 (YYYY-MM-DD, KST)
+    - type: 예약 유형 필터 (meeting_room | seat)
+    - status: 예약 상태 필터 (RESERVED | IN_USE | COMPLETED | CANCELED)
+    - limit: 페이지 크기 (기본 50, 최대 500)
+    - cursor: 이전 응답의 next_cursor
+    """,
+)
+def list_reservations(
+    from_date: Optional[Date] = Query(None, alias="from", description="시작 날짜 (YYYY-MM-DD)"),
+    to_date: Optional[Date] = Query(None, alias="to", description="종료 날짜 (YYYY-MM-DD)"),
+    reservation_type: Optional[str] = Query(None, alias="type", description="예약 유형 (meeting_room | seat)"),
+    status: Optional[models.ReservationStatus] = Query(None, description="예약 상태"),
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    db: Session = Depends(get_read_db),
+    admin_id: int = Depends(get_current_admin_id),
+):
+    """전체 예약 조회 (Keyset Pagination)"""
+    start_from, start_before = reservation_service.kst_date_range_to_utc(from_date, to_date)
+
+    rows = admin_service.list_reservations(
+        db,
+        start_from=start_from,
+        start_before=start_before,
+        reservation_type=reservation_type,
+        status=status,
+        limit=limit + 1,
+        cursor=reservation_service.decode_cursor(cursor) if cursor else None,
+    )
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = reservation_service.encode_cursor(rows[-1].start_time, rows[-1].reservation_id)
+
+    payload = schemas.AdminReservationsPayload(
+        items=[schemas.AdminReservationItem(**admin_service.to_item_dict(row)) for row in rows],
+        next_cursor=next_cursor,
+    )
+
+    return schemas.ApiResponse[schemas.AdminReservationsPayload](
+        is_success=True,
+        code=None,
+        payload=payload,
+    )
+
+
+@router.get(
+    "/reservations/export",
+    response_class=StreamingResponse,
+    responses={**BAD_REQUEST, **FORBIDDEN},
+    summary="전체 예약 내보내기 (관리자)",
+    description="""
+    조회 조건에 맞는 전체 예약을 CSV 또는 NDJSON으로 스트리밍합니다.
+    결과 크기와 관계없이 일정한 메모리로 즉시 전송을 시작합니다.
+    """,
+)
+def export_reservations(
+    export_format: Literal["csv", "ndjson"] = Query("csv", alias="format", description="내보내기 형식"),
+    from_date: Optional[Date] = Query(None, alias="from", description="시작 날짜 (YYYY-MM-DD)"),
+    to_date: Optional[Date] = Query(None, alias="to", description="종료 날짜 (YYYY-MM-DD)"),
+    reservation_type: Optional[str] = Query(None, alias="type", description="예약 유형 (meeting_room | seat)"),
+    status: Optional[models.ReservationStatus] = Query(None, description="예약 상태"),
+    session_factory=Depends(get_read_session_factory),
+    admin_id: int = Depends(get_current_admin_id),
+):
+    """전체 예약 스트리밍 내보내기"""
+    start_from, start_before = reservation_service.kst_date_range_to_utc(from_date, to_date)
+
+    chunks = admin_service.iter_export(
+        session_factory,
+        export_format,
+        start_from=start_from,
+        start_before=start_before,
+        reservation_type=reservation_type,
+        status=status,
+    )
+
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="reservations.{export_format}"'},
+    )
+
+
+@router.post(
+    "/reservations/bulk",
+    response_model=schemas.ApiResponse[schemas.AdminBulkReservationPayload],
+    responses={**BAD_REQUEST, **FORBIDDEN},
+    summary="예약 일괄 취소 / 이동 (관리자)",
+    description="""
+    시설·기간 조건에 맞는 RESERVED 예약을 한 번에 취소하거나 이동합니다. (시설 폐쇄, 일정 변경 등)
+
+    - action=cancel: 조건에 맞는 예약 전체 취소 (대기열 자동 전환 없음)
+    - action=move: shift_minutes만큼 시간 이동 및/또는 target_facility_ids(target_reading_room_id)로 재배정
+      - 운영 시간, 이동할 시설의 기존 예약, 예약자·참여자의 다른 예약과의 겹침을 검사합니다.
+      - 검증에 실패한 예약은 그대로 두고 항목별 code/message로 보고합니다.
+      - 관리자 작업이므로 일일·주간 이용 한도는 적용하지 않습니다.
+    - dry_run=true(기본): 같은 검증을 거친 결과만 반환하고 변경하지 않습니다.
+    """,
+)
+def bulk_update_reservations(
+    request: schemas.AdminBulkReservationRequest,
+    db: Session = Depends(get_db),
+    admin_id: int = Depends(get_current_admin_id),
+):
+    """예약 일괄 취소 / 이동"""
+    payload = schemas.AdminBulkReservationPayload(**admin_service.bulk_update_reservations(db, request))
+
+    return schemas.ApiResponse[schemas.AdminBulkReservationPayload](
+        is_success=True,
+        code=None,
+        payload=payload,
+    )
+
+
+@router.post(
+    "/facilities/refresh",
+    response_model=schemas.ApiResponse[schemas.AdminFacilityRegistryPayload],
+    responses={**FORBIDDEN},
+    summary="시설 레지스트리 갱신 (관리자)",
+    description="""
+    buildings / reading_rooms / meeting_rooms 테이블을 다시 읽어 시설 스냅샷을 교체하고,
+    좌석·회의실 이용 가능 여부 캐시도 DB에서 다시 읽습니다.
+    건물·열람실을 추가한 뒤 호출하면 재배포 없이 예약 검증과 현황 조회에 반영됩니다.
+    (현재 프로세스의 스냅샷만 갱신됩니다)
+    """,
+)
+def refresh_facilities(
+    db: Session = Depends(get_read_db),
+    admin_id: int = Depends(get_current_admin_id),
+):
+    """시설 레지스트리 스냅샷 / 이용 가능 여부 캐시 갱신"""
+    snapshot = facility_registry.refresh(db)
+    availability = facility_availability.reload(db)
+
+    buildings = [
+        schemas.AdminBuildingItem(
+            building_id=building.building_id,
+            name=building.name,
+            reading_rooms=[
+                schemas.AdminReadingRoomItem(
+                    reading_room_id=room.reading_room_id,
+                    name=room.name,
+                    seat_min_id=room.seat_min_id,
+                    seat_max_id=room.seat_max_id,
+                )
+                for room in (snapshot.reading_rooms[r_id] for r_id in building.reading_room_ids)
+            ],
+            meeting_room_ids=list(building.meeting_room_ids),
+        )
+        for building in sorted(snapshot.buildings.values(), key=lambda b: b.building_id)
+    ]
+
+    payload = schemas.AdminFacilityRegistryPayload(
+        buildings=buildings,
+        seat_count=len(snapshot.seat_ids),
+        meeting_room_count=len(snapshot.meeting_room_ids),
+        loaded_at=snapshot.loaded_at.isoformat() if snapshot.loaded_at else None,
+        disabled_seat_ids=sorted(availability.disabled_seat_ids),
+        disabled_meeting_room_ids=sorted(availability.disabled_meeting_room_ids),
+    )
+
+    return schemas.ApiResponse[schemas.AdminFacilityRegistryPayload](
+        is_success=True,
+        code=None,
+        payload=payload,
+    )
+
+
+@router.post(
+    "/facilities/availability",
+    response_model=schemas.ApiResponse[schemas.AdminFacilityAvailabilityPayload],
+    responses={**BAD_REQUEST, **FORBIDDEN},
+    summary="시설 이용 가능 여부 일괄 변경 (관리자)",
+    description="""
+    좌석 또는 회의실을 한 번에 이용 불가/가능으로 바꿉니다.
+    대상은 facility_ids, from_id ~ to_id 범위(예: 좌석 한 줄), reading_room_id 중 하나로 지정합니다.
+
+    - 변경 즉시 예약 검증·랜덤 배정·현황 조회에 반영됩니다. (이용 가능 여부 메모리 캐시)
+    - 이미 잡힌 예약은 유지되므로 필요하면 POST /admin/reservations/bulk로 취소·이동하세요.
+    - 워커가 여러 개면 다른 워커는 POST /admin/facilities/refresh 전까지 이전 상태를 봅니다.
+    """,
+)
+def set_facility_availability(
+    request: schemas.AdminFacilityAvailabilityRequest,
+    db: Session = Depends(get_db),
+    admin_id: int = Depends(get_current_admin_id),
+):
+    """시설 이용 가능 여부 일괄 변경"""
+    payload = schemas.AdminFacilityAvailabilityPayload(**admin_service.set_facility_availability(db, request))
+
+    return schemas.ApiResponse[schemas.AdminFacilityAvailabilityPayload](
+        is_success=True,
+        code=None,
+        payload=payload,
+    )
+
+
+@router.get(
+    "/reservation-index",
+    response_model=schemas.ApiResponse[schemas.AdminReservationIndexPayload],
+    responses={**FORBIDDEN},
+    summary="예약 인덱스 점검 (관리자)",
+    description="""
+    활성 예약(RESERVED / IN_USE) 메모리 인덱스를 DB와 비교합니다.
+    missing / stale / mismatched가 있으면 POST /admin/reservation-index/rebuild로 재구성하세요.
+    (현재 프로세스의 인덱스만 점검합니다)
+    """,
+)
+def check_reservation_index(
+    db: Session = Depends(get_read_db),
+    admin_id: int = Depends(get_current_admin_id),
+):
+    """예약 인덱스 일관성 점검"""
+    payload = schemas.AdminReservationIndexPayload(**admin_service.check_reservation_index(db))
+
+    return schemas.ApiResponse[schemas.AdminReservationIndexPayload](
+        is_success=True,
+        code=None,
+        payload=payload,
+    )
+
+
+@router.post(
+    "/reservation-index/rebuild",
+    response_model=schemas.ApiResponse[schemas.AdminReservationIndexPayload],
+    responses={**FORBIDDEN},
+    summary="예약 인덱스 재구성 (관리자)",
+    description="""
+    DB의 활성 예약으로 메모리 인덱스를 다시 구성한 뒤 점검 결과를 반환합니다.
+    """,
+)
+def rebuild_reservation_index(
+    db: Session = Depends(get_read_db),
+    admin_id: int = Depends(get_current_admin_id),
+):
+    """예약 인덱스 재구성"""
+    payload = schemas.AdminReservationIndexPayload(
+        **admin_service.check_reservation_index(db, rebuild=True)
+    )
+
+    return schemas.ApiResponse[schemas.AdminReservationIndexPayload](
+        is_success=True,
+        code=None,
+        payload=payload,
+    )
+
+
+@router.get(
+    "/lock-profile",
+    response_model=schemas.ApiResponse[schemas.AdminLockProfilePayload],
+    responses={**FORBIDDEN},
+    summary="쓰기 락 구간 프로파일 (관리자)",
+    description="""
+    BEGIN IMMEDIATE 쓰기 락 구간(seat.reserve, meeting_room.reserve, reservation.cancel)의
+    락 대기·보유 시간과 검증 단계별 시간을 백분위로 보여줍니다.
+
+    - LOCK_PROFILER_ENABLED=true일 때만 쌓입니다. (현재 프로세스 기준)
+    - share는 락 보유 시간 누적 중 해당 단계의 비중입니다.
+    - flame graph용 누적 시간은 GET /admin/lock-profile/folded로 내려받습니다.
+    """,
+)
+def read_lock_profile(
+    admin_id: int = Depends(get_current_admin_id),
+):
+    """쓰기 락 구간 프로파일"""
+    payload = schemas.AdminLockProfilePayload(
+        enabled=settings.LOCK_PROFILER_ENABLED,
+        **lock_profiler.report(),
+    )
+
+    return schemas.ApiResponse[schemas.AdminLockProfilePayload](
+        is_success=True,
+        code=None,
+        payload=payload,
+    )
+
+
+@router.get(
+    "/lock-profile/folded",
+    response_class=PlainTextResponse,
+    responses={**FORBIDDEN},
+    summary="쓰기 락 구간 flame graph 데이터 (관리자)",
+    description="""
+    구간·단계별 누적 시간을 folded stack 형식("구간;held;단계 마이크로초")으로 반환합니다.
+    flamegraph.pl이나 speedscope에 그대로 넣을 수 있습니다.
+    """,
+)
+def read_lock_profile_folded(
+    admin_id: int = Depends(get_current_admin_id),
+):
+    """쓰기 락 구간 folded stack"""
+    return PlainTextResponse(lock_profiler.folded())
+
+
+@router.post(
+    "/lock-profile/reset",
+    response_model=schemas.ApiResponse[schemas.AdminLockProfilePayload],
+    responses={**FORBIDDEN},
+    summary="쓰기 락 구간 프로파일 초기화 (관리자)",
+)
+def reset_lock_profile(
+    admin_id: int = Depends(get_current_admin_id),
+):
+    """쓰기 락 구간 프로파일 초기화"""
+    lock_profiler.reset()
+    payload = schemas.AdminLockProfilePayload(
+        enabled=settings.LOCK_PROFILER_ENABLED,
+        **lock_profiler.report(),
+    )
+
+    return schemas.ApiResponse[schemas.AdminLockProfilePayload](
+        is_success=True,
+        code=None,
+        payload=payload,
+    )
@@ -9,8 +9,9 @@ from app import schemas
 from app.api.docs import BAD_REQUEST, CONFLICT
 from app.database import get_db
 from app.auth.deps import get_current_student_id
+from app.config import settings
 from app.schemas.common import ApiResponse
-from app.services import meeting_room_service
+from app.services import meeting_room_service, series_service, shard_service
 
 router = APIRouter(prefix="/reservations/meeting-rooms", tags=["Meeting Room Reservations"])
 
@@ -38,7 +39,8 @@ def create_meeting_room_reservation(
     - 일일 제한: 2시간
     - 주간 제한: 5시간
     """
-    reservation_orm = meeting_room_service.process_reservation(
+    service = shard_service if settings.SHARDING_ENABLED else meeting_room_service
+    reservation_orm = service.process_reservation(
         db=db,
         request=request,
         student_id=student_id
@@ -51,3 +53,35 @@ def create_meeting_room_reservation(
         code=None,
         payload=reservation_schema
     )
+
+
+
+@router.post(
+    "/series",
+    response_model=ApiResponse[schemas.MeetingRoomSeriesResponse],
+    status_code=status.HTTP_201_CREATED,
+    responses={**BAD_REQUEST},
+)
+def create_meeting_room_series(
+    request: schemas.MeetingRoomSeriesCreate,
+    db: Session = Depends(get_db),
+    student_id: int = Depends(get_current_student_id),
+):
+    """
+    회의실 반복 예약 생성 (매일 / 매주)
+
+    - start_date부터 end_date까지 회차를 펼쳐 단건 예약과 같은 규칙으로 검증
+    - 통과한 회차만 한 번에 생성하고, 실패한 회차는 occurrences에 사유(code, message)와 함께 반환
+    - 앞선 회차의 사용 시간도 이후 회차의 일일/주간 한도에 포함
+    """
+    payload = series_service.create_series(
+        db=db,
+        student_id=student_id,
+        request=request,
+    )
+
+    return ApiResponse[schemas.MeetingRoomSeriesResponse](
+        is_success=True,
+        code=None,
+        payload=payload
+    )
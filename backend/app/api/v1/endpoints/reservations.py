@@ -2,27 +2,32 @@
 api/v1/endpoints/reservations.py - My Reservations endpoints.
 """
 
-from datetime import date as Date, datetime, timezone, timedelta
+from datetime import date as Date, timezone, timedelta
 from typing import Optional
 
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
 from app import schemas
-from app.api.docs import NOT_FOUND, FORBIDDEN
+from app.api.docs import BAD_REQUEST, NOT_FOUND, FORBIDDEN
 from app.auth.deps import get_current_student_id
+from app.config import settings
 from app.constants import ReservationType
-from app.database import get_db
-from app.services import reservation_service
+from app.database import get_db, get_read_db
+from app.services import archive_service, reservation_service, shard_service
 
 router = APIRouter(prefix="/reservations", tags=["My Reservations"])
 
 KST = timezone(timedelta(hours=9))
 
+# 내 예약 목록 한 페이지의 최대 크기
+MAX_PAGE_SIZE = 100
+
 
 @router.get(
     "/me",
     response_model=schemas.ApiResponse[schemas.MyReservationsPayload],
+    responses={**BAD_REQUEST},
     summary="내 예약 목록 조회",
     description="""
     본인의 예약 내역을 조회합니다 (회의실 + 좌석 통합).
@@ -31,36 +36,54 @@ KST = timezone(timedelta(hours=9))
     - from: 시작 날짜 (YYYY-MM-DD)
     - to: 종료 날짜 (YYYY-MM-DD)
     - type: 예약 유형 필터 (meeting_room | seat)
+    - limit: 페이지 크기 (생략 시 전체 조회)
+    - cursor: 이전 응답의 next_cursor (다음 페이지 조회)
+
+    from이 보존 기간 이전이면 아카이브된 과거 예약도 함께 조회합니다.
     """,
 )
 def get_my_reservations(
     from_date: Optional[Date] = Query(None, alias="from", description="시작 날짜 (YYYY-MM-DD)"),
     to_date: Optional[Date] = Query(None, alias="to", description="종료 날짜 (YYYY-MM-DD)"),
     reservation_type: Optional[str] = Query(None, alias="type", description="예약 유형 (meeting_room | seat)"),
-    db: Session = Depends(get_db),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기 (생략 시 전체)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    db: Session = Depends(get_read_db),
     student_id: int = Depends(get_current_student_id),
 ):
     """
     내 예약 목록 조회
 
     """
-    # 1. DB에서 모든 예약 조회
-    reservations = reservation_service.get_user_reservations(db, student_id)
+    # 1. KST 날짜 구간 -> UTC 시각 구간
+    start_from, start_before = reservation_service.kst_date_range_to_utc(from_date, to_date)
+
+    # 2. DB에서 필터링 + 페이지 조회 (다음 페이지 여부 확인을 위해 limit + 1건)
+    #    (샤딩 모드: 메인 DB의 사용자 예약 인덱스에서 조회)
+    service = shard_service if settings.SHARDING_ENABLED else reservation_service
+    rows = service.get_user_reservations_page(
+        db,
+        student_id,
+        start_from=start_from,
+        start_before=start_before,
+        reservation_type=reservation_type,
+        limit=limit + 1 if limit else None,
+        cursor=reservation_service.decode_cursor(cursor) if cursor else None,
+        include_archived=archive_service.covers_archive(from_date),
+    )
 
-    # 2. 날짜 및 타입 필터링
-    filtered_items = []
-    for res in reservations:
+    next_cursor = None
+    if limit and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = reservation_service.encode_cursor(rows[-1].start_time, rows[-1].reservation_id)
+
+    # 3. 응답 아이템 변환 (페이지 크기만큼만 수행)
+    items = []
+    for res in rows:
         # UTC -> KST 변환
         start_kst = res.start_time.replace(tzinfo=timezone.utc).astimezone(KST) if res.start_time.tzinfo is None else res.start_time.astimezone(KST)
         end_kst = res.end_time.replace(tzinfo=timezone.utc).astimezone(KST) if res.end_time.tzinfo is None else res.end_time.astimezone(KST)
 
-        # 날짜 필터링
-        res_date = start_kst.date()
-        if from_date and res_date < from_date:
-            continue
-        if to_date and res_date > to_date:
-            continue
-
         # 타입 결정
         if res.meeting_room_id is not None:
             item_type = ReservationType.MEETING_ROOM
@@ -71,10 +94,6 @@ def get_my_reservations(
             room_id = None
             seat_id = res.seat_id
 
-        # 타입 필터링
-        if reservation_type and item_type != reservation_type:
-            continue
-
         # 상태 변환
         status_value = res.status.value if hasattr(res.status, "value") else res.status
 
@@ -84,15 +103,15 @@ def get_my_reservations(
             type=item_type,
             room_id=room_id,
             seat_id=seat_id,
-            date=res_date.isoformat(),
+            date=start_kst.date().isoformat(),
             start_time=start_kst.strftime("%H:%M"),
             end_time=end_kst.strftime("%H:%M"),
             status=status_value,
         )
-        filtered_items.append(item)
+        items.append(item)
 
-    # 3. 응답 생성
-    payload = schemas.MyReservationsPayload(items=filtered_items)
+    # 4. 응답 생성
+    payload = schemas.MyReservationsPayload(items=items, next_cursor=next_cursor)
 
     return schemas.ApiResponse[schemas.MyReservationsPayload](
         is_success=True,
@@ -122,7 +141,8 @@ def cancel_reservation(
 ):
     """예약 취소 - 중앙화된 에러 핸들링"""
     # 서비스 계층에서 검증 및 취소 처리
-    reservation = reservation_service.cancel_reservation(
+    service = shard_service if settings.SHARDING_ENABLED else reservation_service
+    reservation = service.cancel_reservation(
         db=db,
         reservation_id=reservation_id,
         student_id=student_id,
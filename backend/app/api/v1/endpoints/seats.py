@@ -10,11 +10,12 @@ from sqlalchemy.orm import Session
 from app import schemas
 from app.api.docs import BAD_REQUEST, CONFLICT, NOT_FOUND
 from app.auth.deps import get_current_student_id
+from app.config import settings
 from app.constants import ErrorCode, ReservationType
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.exceptions import BusinessException
 from app.schemas.common import ApiResponse
-from app.services import seat_service
+from app.services import seat_service, shard_service
 
 # Seat metadata router (/seats)
 router = APIRouter(prefix="/seats", tags=["Seats"])
@@ -51,7 +52,7 @@ def create_seat(seat: schemas.SeatCreate, db: Session = Depends(get_db)):
     "",
     response_model=ApiResponse[List[schemas.SeatResponse]],
 )
-def read_seats(db: Session = Depends(get_db)):
+def read_seats(db: Session = Depends(get_read_db)):
     """
     전체 좌석 조회
     """
@@ -71,7 +72,7 @@ def read_seats(db: Session = Depends(get_db)):
     response_model=ApiResponse[schemas.SeatResponse],
     responses={**NOT_FOUND},
 )
-def read_seat(seat_id: int, db: Session = Depends(get_db)):
+def read_seat(seat_id: int, db: Session = Depends(get_read_db)):
     """
     특정 좌석 조회
     """
@@ -112,7 +113,8 @@ def create_seat_reservation(
     - 동일 시간대 회의실 예약(본인) 존재 금지
     """
 
-    reservation = seat_service.reserve_seat(db, student_id, request)
+    service = shard_service if settings.SHARDING_ENABLED else seat_service
+    reservation = service.reserve_seat(db, student_id, request)
 
     status_value = (
         reservation.status.value if hasattr(reservation.status, "value") else reservation.status
@@ -166,7 +168,8 @@ def create_random_seat_reservation(
     request.seat_id = None
 
     # 기존 reserve_seat 함수 재사용
-    reservation = seat_service.reserve_seat(db, student_id, request)
+    service = shard_service if settings.SHARDING_ENABLED else seat_service
+    reservation = service.reserve_seat(db, student_id, request)
 
     # 응답 생성
     status_value = (
@@ -187,3 +190,65 @@ def create_random_seat_reservation(
         code=None,
         payload=payload,
     )
+
+
+@reservation_router.post(
+    "/batch",
+    response_model=ApiResponse[schemas.SeatReservationBatchResponse],
+    status_code=status.HTTP_201_CREATED,
+    responses={**BAD_REQUEST, **CONFLICT},
+    summary="좌석 일괄 예약",
+    description="""
+    여러 좌석 예약 항목을 한 번의 요청(쓰기 락 1회, 커밋 1회)으로 처리합니다.
+
+    - 항목마다 단건 예약과 같은 규칙으로 검증하며, 배치 안의 항목끼리도 일일 한도·시간 중복을 함께 계산합니다.
+    - mode=atomic (기본): 하나라도 실패하면 아무것도 생성하지 않고 해당 에러를 반환합니다. (details.index = 실패 항목 위치)
+    - mode=best_effort: 통과한 항목만 생성하고 items에 항목별 결과(실패 시 code, message)를 반환합니다.
+    """,
+)
+def create_seat_reservation_batch(
+    request: schemas.SeatReservationBatchCreate,
+    db: Session = Depends(get_db),
+    student_id: int = Depends(get_current_student_id),
+):
+    """
+    좌석 일괄 예약 생성
+    """
+    outcomes = seat_service.reserve_seats_batch(db, student_id, request)
+
+    items = []
+    for index, (item, (reservation, error)) in enumerate(zip(request.items, outcomes)):
+        if reservation is None:
+            items.append(schemas.SeatReservationBatchItem(
+                index=index, code=error.code, message=error.message
+            ))
+            continue
+
+        status_value = (
+            reservation.status.value if hasattr(reservation.status, "value") else reservation.status
+        )
+        items.append(schemas.SeatReservationBatchItem(
+            index=index,
+            reservation=schemas.SeatReservationResponse(
+                reservation_id=reservation.reservation_id,
+                seat_id=reservation.seat_id,
+                date=item.date.isoformat(),
+                start_time=item.start_time.strftime("%H:%M"),
+                end_time=item.end_time.strftime("%H:%M"),
+                status=status_value,
+                type=ReservationType.SEAT,
+            ),
+        ))
+
+    created_count = sum(1 for entry in items if entry.reservation is not None)
+    payload = schemas.SeatReservationBatchResponse(
+        created_count=created_count,
+        failed_count=len(items) - created_count,
+        items=items,
+    )
+
+    return ApiResponse[schemas.SeatReservationBatchResponse](
+        is_success=True,
+        code=None,
+        payload=payload,
+    )
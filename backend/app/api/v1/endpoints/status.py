@@ -9,9 +9,10 @@ from datetime import date, time
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
-from app import schemas
-from app.database import get_db
-from app.services import status_service
+from app import responses, schemas
+from app.config import settings
+from app.database import get_read_db
+from app.services import shard_service, status_service
 
 router = APIRouter(prefix="/status", tags=["Status"])
 
@@ -22,12 +23,14 @@ router = APIRouter(prefix="/status", tags=["Status"])
 )
 def get_meeting_room_status(
     date: date = Query(..., description="조회 날짜 (YYYY-MM-DD)"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """날짜별 회의실 예약 현황을 조회합니다."""
 
-    payload = status_service.get_meeting_room_status(db, date)
-    return schemas.ApiResponse(is_success=True, code=None, payload=payload)
+    service = shard_service if settings.SHARDING_ENABLED else status_service
+    payload = service.get_meeting_room_status(db, date)
+    # 서비스가 만든 스키마 객체를 재검증 없이 직렬화
+    return responses.envelope(payload)
 
 
 @router.get(
@@ -36,9 +39,11 @@ def get_meeting_room_status(
 )
 def get_seat_status(
     date: date = Query(..., description="조회 날짜 (YYYY-MM-DD)"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """날짜별 좌석 예약 현황을 조회합니다."""
 
-    payload = status_service.get_seat_status(db, date)
-    return schemas.ApiResponse(is_success=True, code=None, payload=payload)
+    service = shard_service if settings.SHARDING_ENABLED else status_service
+    payload = service.get_seat_status(db, date)
+    # 좌석 × 슬롯 수백 개 payload - 재검증 없이 직렬화
+    return responses.envelope(payload)
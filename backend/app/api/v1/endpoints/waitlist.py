@@ -0,0 +1,111 @@
+"""
+api/v1/endpoints/waitlist.py - Seat waitlist endpoints.
+"""
+
+from datetime import timedelta, timezone
+from typing import List
+
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.orm import Session
+
+from app import models, schemas
+from app.api.docs import BAD_REQUEST, CONFLICT, FORBIDDEN, NOT_FOUND
+from app.auth.deps import get_current_student_id
+from app.database import get_db, get_read_db
+from app.schemas.common import ApiResponse
+from app.services import waitlist_service
+
+router = APIRouter(
+    prefix="/reservations/seats/waitlist",
+    tags=["Seat Waitlist"],
+)
+
+KST = timezone(timedelta(hours=9))
+
+
+def _to_response(entry: models.SeatWaitlistEntry, position=None) -> schemas.SeatWaitlistResponse:
+    # UTC -> KST 변환
+    start_kst = entry.start_time.replace(tzinfo=timezone.utc).astimezone(KST) if entry.start_time.tzinfo is None else entry.start_time.astimezone(KST)
+    end_kst = entry.end_time.replace(tzinfo=timezone.utc).astimezone(KST) if entry.end_time.tzinfo is None else entry.end_time.astimezone(KST)
+    status_value = entry.status.value if hasattr(entry.status, "value") else entry.status
+    return schemas.SeatWaitlistResponse(
+        waitlist_id=entry.waitlist_id,
+        seat_id=entry.seat_id,
+        date=start_kst.date().isoformat(),
+        start_time=start_kst.strftime("%H:%M"),
+        end_time=end_kst.strftime("%H:%M"),
+        status=status_value,
+        position=position,
+        reservation_id=entry.reservation_id,
+    )
+
+
+@router.post(
+    "",
+    response_model=ApiResponse[schemas.SeatWaitlistResponse],
+    status_code=status.HTTP_201_CREATED,
+    responses={**BAD_REQUEST, **CONFLICT},
+    summary="좌석 대기 등록",
+    description="""
+    만석인 좌석 시간대에 대기를 등록합니다. seat_id를 생략하면 같은 시간대의 아무 좌석이나 기다립니다.
+
+    - 예약이 취소되면 선착순으로 대기 항목이 자동으로 예약 전환됩니다. (일일 한도·중복 이용 재검증)
+    - 지금 바로 예약 가능한 시간대는 400을 반환합니다.
+    - 전환 여부는 GET /api/reservations/seats/waitlist 또는 내 예약 목록에서 확인합니다.
+    """,
+)
+def join_waitlist(
+    request: schemas.SeatReservationCreate,
+    db: Session = Depends(get_db),
+    student_id: int = Depends(get_current_student_id),
+):
+    """좌석 대기 등록"""
+    entry = waitlist_service.join_waitlist(db, student_id, request)
+    position = waitlist_service.get_positions(db, [entry]).get(entry.waitlist_id)
+
+    return ApiResponse[schemas.SeatWaitlistResponse](
+        is_success=True,
+        code=None,
+        payload=_to_response(entry, position),
+    )
+
+
+@router.get(
+    "",
+    response_model=ApiResponse[List[schemas.SeatWaitlistResponse]],
+    summary="내 좌석 대기 목록",
+)
+def read_my_waitlist(
+    db: Session = Depends(get_read_db),
+    student_id: int = Depends(get_current_student_id),
+):
+    """내 대기 목록 (WAITING 항목은 현재 순번 포함)"""
+    entries = waitlist_service.get_my_waitlist(db, student_id)
+    positions = waitlist_service.get_positions(db, entries)
+
+    return ApiResponse[List[schemas.SeatWaitlistResponse]](
+        is_success=True,
+        code=None,
+        payload=[_to_response(entry, positions.get(entry.waitlist_id)) for entry in entries],
+    )
+
+
+@router.delete(
+    "/{waitlist_id}",
+    response_model=ApiResponse[schemas.SeatWaitlistResponse],
+    responses={**NOT_FOUND, **FORBIDDEN},
+    summary="좌석 대기 취소",
+)
+def cancel_waitlist(
+    waitlist_id: int,
+    db: Session = Depends(get_db),
+    student_id: int = Depends(get_current_student_id),
+):
+    """좌석 대기 취소 (WAITING 상태만)"""
+    entry = waitlist_service.cancel_waitlist(db, student_id, waitlist_id)
+
+    return ApiResponse[schemas.SeatWaitlistResponse](
+        is_success=True,
+        code=None,
+        payload=_to_response(entry),
+    )
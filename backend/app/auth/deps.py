@@ -10,8 +10,9 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.orm import Session
 
 from app.constants import ErrorCode
-from app.database import get_db
-from app.exceptions import BusinessException
+from app.database import get_read_db
+from app.config import settings
+from app.exceptions import BusinessException, ForbiddenException
 from app.services import user_service
 
 # Bearer 헤더가 없을 때도 쿠키로 대체하기 위해 auto_error=False
@@ -37,10 +38,13 @@ def _extract_token(credentials: HTTPAuthorizationCredentials | None, request: Re
 def get_current_student_id(
     credentials: HTTPAuthorizationCredentials | None = Security(bearer_scheme),
     request: Request = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> int:
     """
     Bearer 헤더 또는 access_token 쿠키에서 token-<student_id>-<random>을 읽어 학번을 추출한다.
+
+    사용자 확인은 읽기 전용 세션에서 조회만 하므로 인증만으로 쓰기 락을 잡지 않는다.
+    (로그인 시간 갱신·사용자 생성은 /auth/login)
     """
     token = _extract_token(credentials, request)
     if not token.startswith("token-"):
@@ -64,6 +68,20 @@ def get_current_student_id(
             message="학번이 올바르지 않습니다.",
         )
 
-    # 금지 학번 검증 및 존재 보장
-    user_service.login_student(db, student_id)
+    # 금지 학번 검증 및 로그인한 사용자인지 확인 (조회만)
+    user_service.get_authenticated_user(db, student_id)
+    return student_id
+
+
+def get_current_admin_id(
+    student_id: int = Depends(get_current_student_id),
+) -> int:
+    """
+    현재 사용자가 관리자(settings.ADMIN_STUDENT_IDS)인지 확인하고 학번을 반환한다.
+    """
+    if student_id not in settings.ADMIN_STUDENT_IDS:
+        raise ForbiddenException(
+            code=ErrorCode.AUTH_FORBIDDEN,
+            message="관리자만 접근할 수 있습니다.",
+        )
     return student_id
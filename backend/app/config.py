@@ -0,0 +1,120 @@
+"""
+config.py - Application Settings
+================================
+환경 변수 기반 런타임 설정 (pydantic-settings)
+
+모든 값은 `LIBRARY_` 접두어가 붙은 환경 변수로 덮어쓸 수 있습니다.
+예: LIBRARY_ARCHIVE_RETENTION_DAYS=180
+"""
+
+from typing import List, Literal
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    """운영 환경별로 조정 가능한 설정 값"""
+
+    model_config = SettingsConfigDict(env_prefix="LIBRARY_", extra="ignore")
+
+    # ------------------------------------------------------------------
+    # 데이터베이스
+    # ------------------------------------------------------------------
+    # SQLite DB 파일 경로 (실행 디렉터리 기준)
+    DATABASE_PATH: str = "./library_reservation.db"
+    # 쓰기 엔진 커넥션 풀 크기 (SQLite는 한 번에 하나의 writer만 허용)
+    DB_WRITE_POOL_SIZE: int = 5
+    # 읽기 전용 엔진 커넥션 풀 크기 (WAL 모드에서 reader는 writer를 막지 않음)
+    DB_READ_POOL_SIZE: int = 10
+
+    # ------------------------------------------------------------------
+    # SQLite 성능 프로파일 (커넥션 생성 시 PRAGMA로 적용)
+    # ------------------------------------------------------------------
+    # 락 획득 대기 시간(ms) - 초과 시 "database is locked"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    # 페이지 캐시 크기 (음수는 KiB 단위, -16000 ≈ 16MB)
+    SQLITE_CACHE_SIZE: int = -16000
+    # 메모리 맵 I/O 크기(bytes), 0이면 사용 안 함
+    SQLITE_MMAP_SIZE: int = 134217728
+    # 임시 테이블/인덱스 저장 위치
+    SQLITE_TEMP_STORE: Literal["DEFAULT", "FILE", "MEMORY"] = "MEMORY"
+    # WAL 파일이 이 페이지 수를 넘으면 자동 체크포인트
+    SQLITE_WAL_AUTOCHECKPOINT: int = 1000
+    # 쓰기 커넥션을 닫을 때 PRAGMA optimize 실행 (통계 갱신)
+    SQLITE_OPTIMIZE_ON_CLOSE: bool = True
+
+    # ------------------------------------------------------------------
+    # 쓰기 락 재시도 (BEGIN IMMEDIATE)
+    # ------------------------------------------------------------------
+    # busy_timeout 이후에도 락을 얻지 못했을 때 재시도 횟수
+    WRITE_LOCK_MAX_RETRIES: int = 3
+    # 재시도 간 기본 대기(ms) - 지수 증가 + 지터 적용
+    WRITE_LOCK_RETRY_BASE_MS: int = 50
+
+    # ------------------------------------------------------------------
+    # 건물별 샤딩 (선택)
+    # ------------------------------------------------------------------
+    # True이면 건물마다 별도 SQLite 파일에 시설·예약을 저장 (쓰기 락이 건물 단위로 분리)
+    SHARDING_ENABLED: bool = False
+    # 샤드 DB 파일 디렉터리 (building_<id>.db)
+    SHARD_DIRECTORY: str = "./shards"
+
+    # ------------------------------------------------------------------
+    # 활성 예약 메모리 인덱스
+    # ------------------------------------------------------------------
+    # True이면 예약 생성 전 메모리 인덱스로 후보 충돌을 먼저 거절 (최종 판단은 DB 검사)
+    RESERVATION_INDEX_ENABLED: bool = True
+
+    # ------------------------------------------------------------------
+    # 디버그 / 요청별 SQL 계측
+    # ------------------------------------------------------------------
+    # True이면 응답에 X-DB-Queries / X-DB-Time 헤더를 포함하고 N+1 의심 요청을 경고 로그로 남김
+    DEBUG: bool = False
+    # 한 요청에서 같은 SQL이 이 횟수 이상 실행되면 N+1 의심으로 보고
+    QUERY_REPEAT_WARN_THRESHOLD: int = 20
+
+    # ------------------------------------------------------------------
+    # 느린 쿼리 로그 (JSON 한 줄씩, 크기 기준 로테이션)
+    # ------------------------------------------------------------------
+    # True이면 SLOW_QUERY_THRESHOLD_MS 이상 걸린 SQL을 파라미터·EXPLAIN QUERY PLAN과 함께 기록
+    SLOW_QUERY_LOG_ENABLED: bool = False
+    SLOW_QUERY_THRESHOLD_MS: float = 50.0
+    SLOW_QUERY_LOG_PATH: str = "./logs/slow_query.log"
+    # 파일 하나의 최대 크기(bytes)와 보관할 이전 파일 수
+    SLOW_QUERY_LOG_MAX_BYTES: int = 10 * 1024 * 1024
+    SLOW_QUERY_LOG_BACKUP_COUNT: int = 5
+
+    # ------------------------------------------------------------------
+    # 런타임 지표
+    # ------------------------------------------------------------------
+    # True이면 GET /metrics로 Prometheus 텍스트 형식 지표 노출
+    METRICS_ENABLED: bool = True
+    # True이면 이름 붙은 쓰기 락 구간(좌석·회의실 예약, 취소)을 단계별로 측정 (GET /admin/lock-profile)
+    LOCK_PROFILER_ENABLED: bool = False
+    # 구간·단계별 백분위 계산에 쓰는 최근 표본 수
+    LOCK_PROFILER_SAMPLE_SIZE: int = 1024
+
+    # ------------------------------------------------------------------
+    # 관리자
+    # ------------------------------------------------------------------
+    # 관리자 권한을 가진 학번 목록 (JSON 배열, 예: LIBRARY_ADMIN_STUDENT_IDS='[202000001]')
+    ADMIN_STUDENT_IDS: List[int] = []
+
+    # ------------------------------------------------------------------
+    # 예약 아카이빙 (Cold Storage)
+    # ------------------------------------------------------------------
+    # 종료 후 이 기간(일)이 지난 COMPLETED/CANCELED 예약을 아카이브 테이블로 이동
+    ARCHIVE_RETENTION_DAYS: int = 90
+    # 한 트랜잭션에서 이동할 최대 예약 건수
+    ARCHIVE_BATCH_SIZE: int = 500
+    # 아카이브 작업 실행 시각 (스케줄러 로컬 시각 기준 cron hour)
+    ARCHIVE_CRON_HOUR: int = 4
+
+    # ------------------------------------------------------------------
+    # 관리자 예약 조회 / 내보내기
+    # ------------------------------------------------------------------
+    # 내보내기 시 DB에서 한 번에 가져올 행 수 (yield_per)
+    EXPORT_FETCH_SIZE: int = 1000
+
+
+settings = Settings()
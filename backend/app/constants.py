@@ -27,6 +27,7 @@ class ErrorCode(str, Enum):
     SEAT_NOT_AVAILABLE = "SEAT_NOT_AVAILABLE"
     AUTH_INVALID_STUDENT_ID = "AUTH_INVALID_STUDENT_ID"
     MEETING_ROOM_NOT_AVAILABLE = "MEETING_ROOM_NOT_AVAILABLE"
+    DATABASE_BUSY = "DATABASE_BUSY"
 
 
 ERROR_MESSAGES = {
@@ -46,6 +47,7 @@ ERROR_MESSAGES = {
     ErrorCode.SEAT_NOT_AVAILABLE: "해당 좌석은 현재 이용 불가 상태입니다.",
     ErrorCode.AUTH_INVALID_STUDENT_ID: "유효하지 않은 학번입니다.",
     ErrorCode.MEETING_ROOM_NOT_AVAILABLE: "해당 회의실은 현재 이용 불가 상태입니다.",
+    ErrorCode.DATABASE_BUSY: "요청이 많아 처리하지 못했습니다. 잠시 후 다시 시도해주세요.",
 }
 
 
@@ -67,10 +69,12 @@ class ReservationLimits:
     MEETING_ROOM_WEEKLY_LIMIT_MINUTES = 300  # 5 hours per week
     MEETING_ROOM_MIN_PARTICIPANTS = 3
     MEETING_ROOM_MAX_PARTICIPANTS = 6
+    MEETING_ROOM_SERIES_MAX_OCCURRENCES = 20  # occurrences per recurring series
 
     # Seat limits
     SEAT_SLOT_MINUTES = 120  # 2 hours
     SEAT_DAILY_LIMIT_MINUTES = 240  # 4 hours per day
+    SEAT_BATCH_MAX_ITEMS = 8  # items per batch reservation request
 
 
 class ReservationType:
@@ -90,8 +94,18 @@ class ReservationStatus:
 
 
 class FacilityConstants:
-    """Facility constants."""
-
+    """
+    Facility bootstrap defaults.
+
+    Used only to seed an empty database (and as the registry snapshot before
+    the first load). At runtime the facility registry is read from the
+    buildings / reading_rooms / meeting_rooms tables.
+    """
+
+    DEFAULT_BUILDING_ID = 1
+    DEFAULT_BUILDING_NAME = "중앙도서관"
+    DEFAULT_READING_ROOM_ID = 1
+    DEFAULT_READING_ROOM_NAME = "제1열람실"
     MEETING_ROOM_IDS = [1, 2, 3]
     SEAT_MIN_ID = 1
     SEAT_MAX_ID = 70
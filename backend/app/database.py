@@ -7,39 +7,131 @@ Key Concepts for Students:
 - Engine: The starting point for SQLAlchemy, manages the connection pool
 - SessionLocal: A factory that creates new database sessions
 - get_db: A dependency that provides a session and ensures cleanup
+- read_engine / get_read_db: A separate read-only pool for GET endpoints
+- begin_immediate: Acquires the SQLite write lock with retry + jitter
+- start_query_tracking: Counts SQL statements and DB time per request
+- slow_query_log: Logs statements over a threshold with their query plan
 """
 
-from sqlalchemy import create_engine, event
-from sqlalchemy.orm import sessionmaker, declarative_base
+import random
+import sqlite3
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
+
+from app import lock_profiler, metrics, slow_query_log
+from app.config import settings
+from app.constants import ErrorCode
+from app.exceptions import ServiceUnavailableException
 
 # ---------------------------------------------------------------------------
 # Database URL Configuration
 # ---------------------------------------------------------------------------
 # SQLite database file will be created in the project root directory
 # The three slashes (///) indicate a relative path
-SQLALCHEMY_DATABASE_URL = "sqlite:///./library_reservation.db"
+SQLALCHEMY_DATABASE_URL = f"sqlite:///{settings.DATABASE_PATH}"
+
+# Read-only URL for the same file (SQLite URI mode, mode=ro)
+SQLALCHEMY_READ_DATABASE_URL = f"sqlite:///file:{settings.DATABASE_PATH}?mode=ro&uri=true"
+
 
 # ---------------------------------------------------------------------------
-# Create the SQLAlchemy Engine
+# SQLite Performance Profile
+# ---------------------------------------------------------------------------
+def apply_pragma_profile(dbapi_connection, read_only: bool = False):
+    """
+    Apply the settings-driven PRAGMA profile to a new DBAPI connection.
+
+    busy_timeout, cache_size, mmap_size and temp_store are per-connection,
+    so both engines apply them. wal_autocheckpoint only matters for writers.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+    cursor.execute(f"PRAGMA cache_size={int(settings.SQLITE_CACHE_SIZE)}")
+    cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+    cursor.execute(f"PRAGMA temp_store={settings.SQLITE_TEMP_STORE}")
+    if read_only:
+        cursor.execute("PRAGMA query_only=ON")
+    else:
+        cursor.execute(f"PRAGMA wal_autocheckpoint={int(settings.SQLITE_WAL_AUTOCHECKPOINT)}")
+    cursor.close()
+
+
+# ---------------------------------------------------------------------------
+# Engine Factories
 # ---------------------------------------------------------------------------
-# The engine is the core interface to the database
-#
 # connect_args={"check_same_thread": False}:
 #   - SQLite by default only allows one thread to communicate with it
 #   - FastAPI uses multiple threads, so we need to disable this check
 #   - This is safe because SQLAlchemy manages connections properly
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False}
-)
+def create_write_engine(url: str = SQLALCHEMY_DATABASE_URL):
+    """
+    Engine for transactions that write (BEGIN IMMEDIATE sections, scheduler, init).
+
+    SQLite allows a single writer at a time, so this pool is kept small.
+    """
+    write_engine = create_engine(
+        url,
+        connect_args={"check_same_thread": False},
+        pool_size=settings.DB_WRITE_POOL_SIZE,
+    )
+
+    # SQLite WAL 모드 활성화 (동시성 성능 향상 및 락 대기 최적화)
+    @event.listens_for(write_engine, "connect")
+    def set_sqlite_pragma(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+        apply_pragma_profile(dbapi_connection)
+
+    # 커넥션 종료 시 쿼리 플래너 통계 갱신 (변경이 있었던 테이블만 ANALYZE)
+    @event.listens_for(write_engine, "close")
+    def optimize_on_close(dbapi_connection, connection_record):
+        if not settings.SQLITE_OPTIMIZE_ON_CLOSE:
+            return
+        try:
+            dbapi_connection.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            pass  # 종료 경로에서는 실패해도 무시
+
+    return write_engine
+
+
+def create_read_engine(url: str = SQLALCHEMY_READ_DATABASE_URL):
+    """
+    Read-only engine for GET endpoints.
+
+    In WAL mode readers never block the writer, so reads get their own,
+    larger pool instead of queueing behind lock-holding write transactions.
+    query_only=ON makes any accidental write fail immediately.
+    """
+    read_engine = create_engine(
+        url,
+        connect_args={"check_same_thread": False},
+        pool_size=settings.DB_READ_POOL_SIZE,
+        max_overflow=settings.DB_READ_POOL_SIZE,
+    )
+
+    @event.listens_for(read_engine, "connect")
+    def set_sqlite_read_pragma(dbapi_connection, connection_record):
+        apply_pragma_profile(dbapi_connection, read_only=True)
+
+    return read_engine
 
-# SQLite WAL 모드 활성화 (동시성 성능 향상 및 락 대기 최적화)
-@event.listens_for(engine, "connect")
-def set_sqlite_pragma(dbapi_connection, connection_record):
-    cursor = dbapi_connection.cursor()
-    cursor.execute("PRAGMA journal_mode=WAL")
-    cursor.execute("PRAGMA synchronous=NORMAL")
-    cursor.close()
+
+# ---------------------------------------------------------------------------
+# Create the SQLAlchemy Engines
+# ---------------------------------------------------------------------------
+# The engine is the core interface to the database
+engine = create_write_engine()
+read_engine = create_read_engine()
 
 # ---------------------------------------------------------------------------
 # Create a Session Factory
@@ -49,6 +141,9 @@ def set_sqlite_pragma(dbapi_connection, connection_record):
 # - autoflush=False: We control when to flush changes to the database
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# ReadSessionLocal creates sessions on the read-only engine
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
 # ---------------------------------------------------------------------------
 # Create a Base Class for Models
 # ---------------------------------------------------------------------------
@@ -83,3 +178,185 @@ def get_db():
         yield db  # Provide the session to the endpoint
     finally:
         db.close()  # Always close the session, even if an error occurred
+
+
+def get_read_db():
+    """
+    Dependency function that provides a read-only database session.
+
+    Use it for endpoints that only query (status, seat list, my reservations).
+    Sessions come from the read-only pool, so they never wait for a
+    connection held by a write transaction.
+    """
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def get_read_session_factory():
+    """
+    Dependency that provides the read-only session factory itself.
+
+    Same as get_session_factory, for long-running read streams (e.g. exports).
+    """
+    return ReadSessionLocal
+
+
+def get_session_factory():
+    """
+    Dependency that provides the session factory itself.
+
+    StreamingResponse bodies are sent after dependencies with 'yield' have
+    already been cleaned up, so long-running streams must open (and close)
+    their own session instead of using get_db.
+    """
+    return SessionLocal
+
+
+# ---------------------------------------------------------------------------
+# Write Lock Acquisition (BEGIN IMMEDIATE)
+# ---------------------------------------------------------------------------
+# 요청 단위 락 대기 통계 (미들웨어가 요청 시작 시 새 dict를 설정)
+# 동기 엔드포인트는 스레드풀에서 복사된 컨텍스트로 실행되므로,
+# 값 자체를 교체하지 않고 같은 dict를 갱신해야 미들웨어에서 보입니다.
+_lock_wait_stats: ContextVar[Optional[Dict[str, float]]] = ContextVar(
+    "lock_wait_stats", default=None
+)
+
+
+# session.info 키: BEGIN IMMEDIATE로 쓰기 락을 얻은 시각
+_WRITE_LOCK_ACQUIRED_KEY = "write_lock_acquired_at"
+
+
+def holds_write_lock(db: Session) -> bool:
+    """세션이 begin_immediate로 얻은 쓰기 락을 보유 중인지 여부"""
+    return _WRITE_LOCK_ACQUIRED_KEY in db.info
+
+
+def start_lock_wait_tracking() -> Dict[str, float]:
+    """현재 요청의 락 대기 통계를 초기화하고 반환"""
+    stats = {"wait_ms": 0.0, "retries": 0}
+    _lock_wait_stats.set(stats)
+    return stats
+
+
+def _is_lock_error(exc: OperationalError) -> bool:
+    message = str(exc.orig).lower()
+    return "database is locked" in message or "database is busy" in message
+
+
+def begin_immediate(db: Session, section: Optional[str] = None) -> None:
+    """
+    쓰기 트랜잭션 시작 (BEGIN IMMEDIATE) + 락 경합 시 재시도.
+
+    - 각 시도는 busy_timeout 동안 SQLite 내부에서 대기합니다.
+    - 그래도 락을 얻지 못하면 지수 백오프 + Full Jitter로 잠시 쉬었다가
+      WRITE_LOCK_MAX_RETRIES번까지 다시 시도합니다. (동시에 실패한 요청들이
+      같은 시각에 몰려 재충돌하는 것을 방지)
+    - 모두 실패하면 503 DATABASE_BUSY 예외를 발생시킵니다.
+    - 대기한 시간은 요청 단위로 누적되어 Server-Timing 헤더로 보고됩니다.
+    - section을 주면 LOCK_PROFILER_ENABLED일 때 락 보유 구간을 단계별로 측정합니다.
+      (lock_profiler.mark로 단계 구분)
+    """
+    stats = _lock_wait_stats.get()
+    started = time.perf_counter()
+    attempt = 0
+
+    try:
+        while True:
+            try:
+                db.execute(text("BEGIN IMMEDIATE"))
+                # 락 보유 시간은 커밋/롤백 이벤트에서 측정
+                db.info[_WRITE_LOCK_ACQUIRED_KEY] = time.perf_counter()
+                if section is not None and settings.LOCK_PROFILER_ENABLED:
+                    lock_profiler.start(db, section, waited=time.perf_counter() - started)
+                return
+            except OperationalError as e:
+                if not _is_lock_error(e):
+                    raise
+
+                db.rollback()
+                if attempt >= settings.WRITE_LOCK_MAX_RETRIES:
+                    metrics.DB_WRITE_LOCK_BUSY.inc()
+                    raise ServiceUnavailableException(
+                        code=ErrorCode.DATABASE_BUSY,
+                        details={"retries": attempt},
+                    ) from e
+
+                backoff_ms = settings.WRITE_LOCK_RETRY_BASE_MS * (2 ** attempt)
+                time.sleep(random.uniform(0, backoff_ms) / 1000)
+                attempt += 1
+    finally:
+        waited = time.perf_counter() - started
+        metrics.DB_WRITE_LOCK_WAIT.observe(waited)
+        if attempt:
+            metrics.DB_WRITE_LOCK_RETRIES.inc(attempt)
+        if stats is not None:
+            stats["wait_ms"] += waited * 1000
+            stats["retries"] += attempt
+
+
+@event.listens_for(Session, "after_commit")
+def _observe_write_lock_commit(session: Session) -> None:
+    acquired = session.info.pop(_WRITE_LOCK_ACQUIRED_KEY, None)
+    if acquired is not None:
+        metrics.DB_WRITE_LOCK_HOLD.observe(time.perf_counter() - acquired, outcome="commit")
+
+
+@event.listens_for(Session, "after_rollback")
+def _observe_write_lock_rollback(session: Session) -> None:
+    acquired = session.info.pop(_WRITE_LOCK_ACQUIRED_KEY, None)
+    if acquired is not None:
+        metrics.DB_WRITE_LOCK_HOLD.observe(time.perf_counter() - acquired, outcome="rollback")
+
+
+# ---------------------------------------------------------------------------
+# Per-request Query Counting
+# ---------------------------------------------------------------------------
+# 요청 단위 SQL 통계 (미들웨어가 요청 시작 시 새 dict를 설정, 락 대기 통계와 같은 방식)
+_query_stats: ContextVar[Optional[Dict[str, Any]]] = ContextVar("query_stats", default=None)
+
+# connection.info 키: 실행 중인 SQL의 시작 시각
+_QUERY_STARTED_KEY = "query_started_at"
+
+
+def start_query_tracking() -> Dict[str, Any]:
+    """
+    현재 요청(컨텍스트)의 SQL 통계를 초기화하고 반환
+
+    {"count": 실행 횟수, "time_ms": DB 시간 합계, "statements": Counter(SQL → 실행 횟수)}
+    """
+    stats = {"count": 0, "time_ms": 0.0, "statements": Counter()}
+    _query_stats.set(stats)
+    return stats
+
+
+def repeated_statements(stats: Dict[str, Any], threshold: int) -> List[Tuple[str, int]]:
+    """threshold번 이상 반복된 SQL (N+1 의심, 많은 순)"""
+    return [(sql, n) for sql, n in stats["statements"].most_common() if n >= threshold]
+
+
+# 모든 엔진(쓰기/읽기/샤드/테스트)에 적용되도록 Engine 클래스에 등록
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info[_QUERY_STARTED_KEY] = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.pop(_QUERY_STARTED_KEY, None)
+    if started is None:
+        return
+    elapsed = time.perf_counter() - started
+    metrics.DB_QUERY_DURATION.observe(elapsed)
+    if settings.SLOW_QUERY_LOG_ENABLED and elapsed * 1000 >= settings.SLOW_QUERY_THRESHOLD_MS:
+        slow_query_log.record(cursor.connection, statement, parameters, executemany, elapsed)
+
+    stats = _query_stats.get()
+    if stats is None:
+        return
+    stats["count"] += 1
+    stats["time_ms"] += elapsed * 1000
+    stats["statements"][statement] += 1
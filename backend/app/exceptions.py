@@ -31,3 +31,6 @@ class LimitExceededException(BusinessException):
 
 class ForbiddenException(BusinessException):
     pass
+
+class ServiceUnavailableException(BusinessException):
+    pass
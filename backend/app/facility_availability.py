@@ -0,0 +1,286 @@
+"""
+facility_availability.py - Facility Availability Cache
+======================================================
+좌석 / 회의실의 is_available 플래그를 메모리에 보관합니다.
+
+- 예약 검증(이용 가능 여부)과 랜덤 좌석 배정, 현황 조회가 요청마다 seats / meeting_rooms를
+  다시 조회하지 않고 캐시를 읽습니다.
+- 변경이 있을 때마다 version을 1 올린 새 불변 스냅샷으로 참조만 교체하므로, 읽는 쪽은
+  락 없이 항상 일관된 하나의 스냅샷을 봅니다.
+- ORM 객체로 바꾼 좌석/회의실은 세션 이벤트로 커밋 시 반영하고(롤백된 변경은 버림),
+  일괄 UPDATE는 stage_bulk_changes()로 같은 대기 목록에 올립니다.
+- 시작 시 reload()로 DB 전체를 읽기 전에는 캐시 대신 DB를 직접 조회합니다.
+- 프로세스 단위 캐시이므로 워커가 여러 개면 워커마다 따로 유지됩니다.
+  이용 가능 여부를 바꾸는 트랜잭션은 DB의 facility_availability_version도 함께 올리고,
+  쓰기 락을 잡은 트랜잭션의 첫 조회(ensure_current)가 이 한 행만 읽어 스냅샷의 db_version과
+  다르면 다시 읽습니다. (다른 워커의 변경 반영 - 예약 검증은 항상 최신 값 기준)
+"""
+
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from itertools import chain
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, Mapping, Optional, Tuple
+
+from sqlalchemy import event, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from app import metrics, models
+from app.database import holds_write_lock
+
+# session.info 키: 플러시 후 커밋 대기 중인 변경
+# {"seats": {id: bool | None}, "meeting_rooms": {...}, "base_version": int, "db_version": int}
+PENDING_KEY = "facility_availability_pending"
+# session.info 키: 현재 쓰기 트랜잭션에서 DB 버전을 이미 비교했는지 여부
+CHECKED_KEY = "facility_availability_checked"
+
+
+@dataclass(frozen=True)
+class AvailabilitySnapshot:
+    """시설 이용 가능 여부 불변 스냅샷"""
+
+    version: int
+    # 좌석/회의실 ID → is_available (DB에 행이 있는 시설만)
+    seats: Mapping[int, bool]
+    meeting_rooms: Mapping[int, bool]
+    # DB 전체를 반영했는지 여부 (False면 캐시에 없는 시설은 DB 조회로 대체)
+    loaded: bool = False
+    loaded_at: Optional[datetime] = None
+    # 반영한 DB facility_availability_version (None이면 알 수 없음 - 다음 비교에서 다시 읽음)
+    db_version: Optional[int] = None
+    disabled_seat_ids: FrozenSet[int] = field(init=False)
+    disabled_meeting_room_ids: FrozenSet[int] = field(init=False)
+    # 랜덤 배정 후보 (정렬)
+    available_seat_ids: Tuple[int, ...] = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self, "disabled_seat_ids", frozenset(k for k, v in self.seats.items() if not v)
+        )
+        object.__setattr__(
+            self, "disabled_meeting_room_ids", frozenset(k for k, v in self.meeting_rooms.items() if not v)
+        )
+        object.__setattr__(
+            self, "available_seat_ids", tuple(sorted(k for k, v in self.seats.items() if v))
+        )
+
+
+_lock = threading.Lock()
+_snapshot = AvailabilitySnapshot(version=0, seats=MappingProxyType({}), meeting_rooms=MappingProxyType({}))
+
+
+def get_snapshot() -> AvailabilitySnapshot:
+    """현재 이용 가능 여부 스냅샷"""
+    return _snapshot
+
+
+def _replace(
+    seats: Dict[int, bool],
+    meeting_rooms: Dict[int, bool],
+    loaded: bool,
+    loaded_at,
+    db_version: Optional[int],
+) -> AvailabilitySnapshot:
+    # 호출자가 _lock을 잡은 상태에서만 호출
+    global _snapshot
+    _snapshot = AvailabilitySnapshot(
+        version=_snapshot.version + 1,
+        seats=MappingProxyType(seats),
+        meeting_rooms=MappingProxyType(meeting_rooms),
+        loaded=loaded,
+        loaded_at=loaded_at,
+        db_version=db_version,
+    )
+    return _snapshot
+
+
+def _read_db_version(db: Session) -> int:
+    version = db.connection().scalar(
+        select(models.FacilityAvailabilityVersion.version)
+        .where(models.FacilityAvailabilityVersion.id == 1)
+    )
+    return version or 0
+
+
+def _bump_db_version(db: Session) -> int:
+    """현재 트랜잭션에서 DB 버전을 1 올리고 새 값 반환 (행이 없으면 생성)"""
+    table = models.FacilityAvailabilityVersion.__table__
+    connection = db.connection()
+    connection.execute(
+        insert(table)
+        .values(id=1, version=1)
+        .on_conflict_do_update(index_elements=[table.c.id], set_={"version": table.c.version + 1})
+    )
+    return _read_db_version(db)
+
+
+def reload(db: Session) -> AvailabilitySnapshot:
+    """DB의 seats / meeting_rooms 전체를 다시 읽어 스냅샷 교체"""
+    # 버전을 먼저 읽음 (사이에 바뀌면 다음 비교에서 한 번 더 읽을 뿐 낡은 값을 최신으로 보지 않음)
+    db_version = _read_db_version(db)
+    seats = dict(db.execute(select(models.Seat.seat_id, models.Seat.is_available)).all())
+    meeting_rooms = dict(
+        db.execute(select(models.MeetingRoom.room_id, models.MeetingRoom.is_available)).all()
+    )
+    with _lock:
+        return _replace(
+            seats, meeting_rooms, loaded=True, loaded_at=datetime.now(timezone.utc), db_version=db_version
+        )
+
+
+def reset() -> AvailabilitySnapshot:
+    """빈 DB 기준으로 초기화 (테스트에서 테이블을 비운 직후)"""
+    with _lock:
+        return _replace({}, {}, loaded=True, loaded_at=datetime.now(timezone.utc), db_version=None)
+
+
+def ensure_current(db: Session) -> AvailabilitySnapshot:
+    """
+    쓰기 락 안에서 DB 버전과 비교한 스냅샷 (다르면 다시 읽음)
+
+    다른 워커가 바꾼 이용 가능 여부를 놓치지 않도록, begin_immediate로 락을 잡은 트랜잭션에서
+    한 번만 facility_availability_version 한 행을 읽어 비교합니다. 락 밖이나 시작 전
+    (reload 전)에는 비교하지 않고 현재 스냅샷을 반환합니다.
+    """
+    snapshot = _snapshot
+    if not snapshot.loaded or not holds_write_lock(db) or db.info.get(CHECKED_KEY):
+        return snapshot
+
+    db.info[CHECKED_KEY] = True
+    if _read_db_version(db) == snapshot.db_version:
+        return snapshot
+    metrics.CACHE_LOOKUPS.inc(cache="facility_availability", result="reload")
+    return reload(db)
+
+
+def apply(
+    seat_changes: Mapping[int, Optional[bool]],
+    meeting_room_changes: Mapping[int, Optional[bool]],
+    base_version: Optional[int] = None,
+    db_version: Optional[int] = None,
+) -> AvailabilitySnapshot:
+    """
+    변경분 반영 (None은 삭제된 시설)
+
+    커밋한 트랜잭션이 DB 버전을 base_version → db_version으로 올렸다면, 스냅샷이 base_version을
+    반영하고 있을 때만 db_version을 이어받습니다. (사이에 다른 워커의 변경이 있었으면 다음 비교에서 다시 읽음)
+    """
+    if not seat_changes and not meeting_room_changes:
+        return _snapshot
+
+    with _lock:
+        seats = dict(_snapshot.seats)
+        meeting_rooms = dict(_snapshot.meeting_rooms)
+        for target, changes in ((seats, seat_changes), (meeting_rooms, meeting_room_changes)):
+            for facility_id, available in changes.items():
+                if available is None:
+                    target.pop(facility_id, None)
+                else:
+                    target[facility_id] = available
+        current_version = _snapshot.db_version
+        if db_version is not None:
+            current_version = db_version if current_version == base_version else None
+        return _replace(seats, meeting_rooms, _snapshot.loaded, _snapshot.loaded_at, current_version)
+
+
+def seat_available(db: Session, seat_id: int) -> Optional[bool]:
+    """좌석 이용 가능 여부 (좌석이 없으면 None, 쓰기 락 안에서는 DB 버전 확인 후)"""
+    snapshot = ensure_current(db)
+    if seat_id in snapshot.seats or snapshot.loaded:
+        metrics.CACHE_LOOKUPS.inc(cache="facility_availability", result="hit")
+        return snapshot.seats.get(seat_id)
+    metrics.CACHE_LOOKUPS.inc(cache="facility_availability", result="miss")
+    return db.scalar(select(models.Seat.is_available).where(models.Seat.seat_id == seat_id))
+
+
+def meeting_room_available(db: Session, room_id: int) -> Optional[bool]:
+    """회의실 이용 가능 여부 (회의실이 없으면 None, 쓰기 락 안에서는 DB 버전 확인 후)"""
+    snapshot = ensure_current(db)
+    if room_id in snapshot.meeting_rooms or snapshot.loaded:
+        metrics.CACHE_LOOKUPS.inc(cache="facility_availability", result="hit")
+        return snapshot.meeting_rooms.get(room_id)
+    metrics.CACHE_LOOKUPS.inc(cache="facility_availability", result="miss")
+    return db.scalar(select(models.MeetingRoom.is_available).where(models.MeetingRoom.room_id == room_id))
+
+
+def stage_bulk_changes(
+    session: Session,
+    seat_ids: Iterable[int] = (),
+    meeting_room_ids: Iterable[int] = (),
+) -> None:
+    """
+    일괄 UPDATE로 바꾼 시설을 커밋 시 캐시에 반영하도록 등록 (UPDATE 실행 후 호출)
+
+    세션 이벤트와 같은 대기 목록을 쓰므로 롤백하면 함께 버려집니다.
+    """
+    seat_ids, meeting_room_ids = list(seat_ids), list(meeting_room_ids)
+    # 현재 트랜잭션의 DB 상태로 읽어 두고 커밋 시 반영
+    connection = session.connection()
+    seats = dict(connection.execute(
+        select(models.Seat.seat_id, models.Seat.is_available).where(models.Seat.seat_id.in_(seat_ids))
+    ).all())
+    meeting_rooms = dict(connection.execute(
+        select(models.MeetingRoom.room_id, models.MeetingRoom.is_available)
+        .where(models.MeetingRoom.room_id.in_(meeting_room_ids))
+    ).all())
+
+    pending = _stage_version(session)
+    for seat_id in seat_ids:
+        pending["seats"][seat_id] = seats.get(seat_id)
+    for room_id in meeting_room_ids:
+        pending["meeting_rooms"][room_id] = meeting_rooms.get(room_id)
+
+
+def _stage_version(session: Session) -> dict:
+    """대기 목록을 꺼내고 같은 트랜잭션에서 DB 버전을 올림 (트랜잭션 시작 전 버전은 처음 한 번만 기록)"""
+    pending = session.info.setdefault(PENDING_KEY, {"seats": {}, "meeting_rooms": {}})
+    db_version = _bump_db_version(session)
+    pending.setdefault("base_version", db_version - 1)
+    pending["db_version"] = db_version
+    return pending
+
+
+# ---------------------------------------------------------------------------
+# 세션 이벤트 (커밋 시 반영)
+# ---------------------------------------------------------------------------
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_facilities(session: Session, flush_context) -> None:
+    """플러시된 좌석/회의실 변경 수집"""
+    changes = []
+    for obj in chain(session.new, session.dirty):
+        if isinstance(obj, models.Seat):
+            changes.append(("seats", obj.seat_id, bool(obj.is_available)))
+        elif isinstance(obj, models.MeetingRoom):
+            changes.append(("meeting_rooms", obj.room_id, bool(obj.is_available)))
+    for obj in session.deleted:
+        if isinstance(obj, models.Seat):
+            changes.append(("seats", obj.seat_id, None))
+        elif isinstance(obj, models.MeetingRoom):
+            changes.append(("meeting_rooms", obj.room_id, None))
+    if not changes:
+        return
+
+    pending = _stage_version(session)
+    for kind, facility_id, available in changes:
+        pending[kind][facility_id] = available
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_committed_facilities(session: Session) -> None:
+    session.info.pop(CHECKED_KEY, None)
+    pending = session.info.pop(PENDING_KEY, None)
+    if pending:
+        apply(pending["seats"], pending["meeting_rooms"], pending["base_version"], pending["db_version"])
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_facilities(session: Session) -> None:
+    session.info.pop(CHECKED_KEY, None)
+    session.info.pop(PENDING_KEY, None)
+
+
+metrics.registry.register(metrics.Gauge(
+    "facility_availability_version", "시설 이용 가능 여부 캐시 버전", function=lambda: _snapshot.version,
+))
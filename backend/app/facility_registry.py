@@ -0,0 +1,188 @@
+"""
+facility_registry.py - Facility Registry Snapshot
+=================================================
+건물 → 열람실/회의실 → 좌석 구성을 DB에서 읽어 불변(in-memory) 스냅샷으로 보관합니다.
+
+- 스키마 검증기와 현황 조회는 요청마다 DB를 조회하지 않고 스냅샷의
+  frozenset으로 O(1) 멤버십 검사를 합니다.
+- refresh()는 새 스냅샷을 만든 뒤 참조만 교체하므로, 읽는 쪽은 락 없이
+  항상 일관된 하나의 스냅샷을 봅니다.
+- 건물/열람실을 DB에 추가한 뒤 관리자 API로 refresh하면 재배포 없이 반영됩니다.
+  (프로세스 단위 캐시이므로 워커가 여러 개면 각 워커에서 갱신 필요)
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import FrozenSet, Mapping, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app import models
+from app.constants import FacilityConstants
+
+
+@dataclass(frozen=True)
+class ReadingRoomInfo:
+    """열람실 정보 (좌석 번호 범위 포함)"""
+
+    reading_room_id: int
+    building_id: int
+    name: str
+    seat_min_id: int
+    seat_max_id: int
+
+
+@dataclass(frozen=True)
+class BuildingInfo:
+    """건물 정보 (소속 열람실/회의실 ID)"""
+
+    building_id: int
+    name: str
+    reading_room_ids: Tuple[int, ...] = ()
+    meeting_room_ids: Tuple[int, ...] = ()
+
+
+@dataclass(frozen=True)
+class FacilitySnapshot:
+    """시설 구성 불변 스냅샷"""
+
+    buildings: Mapping[int, BuildingInfo]
+    reading_rooms: Mapping[int, ReadingRoomInfo]
+    seat_ids: FrozenSet[int]
+    meeting_room_ids: FrozenSet[int]
+    # 좌석/회의실 → 건물 (미지정 회의실은 None)
+    seat_buildings: Mapping[int, int]
+    meeting_room_buildings: Mapping[int, Optional[int]]
+    loaded_at: Optional[datetime] = None
+    # 현황 조회용 정렬 목록
+    sorted_seat_ids: Tuple[int, ...] = field(init=False)
+    sorted_meeting_room_ids: Tuple[int, ...] = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "sorted_seat_ids", tuple(sorted(self.seat_ids)))
+        object.__setattr__(self, "sorted_meeting_room_ids", tuple(sorted(self.meeting_room_ids)))
+
+    def has_seat(self, seat_id: int) -> bool:
+        return seat_id in self.seat_ids
+
+    def has_meeting_room(self, room_id: int) -> bool:
+        return room_id in self.meeting_room_ids
+
+
+def build_snapshot(
+    buildings: Mapping[int, str],
+    reading_rooms: Tuple[ReadingRoomInfo, ...],
+    meeting_rooms: Mapping[int, Optional[int]],
+    loaded_at: Optional[datetime] = None,
+) -> FacilitySnapshot:
+    """
+    건물/열람실/회의실 정의로 스냅샷 생성
+
+    Args:
+        buildings: building_id → 이름
+        reading_rooms: 열람실 목록
+        meeting_rooms: room_id → building_id
+    """
+    seat_buildings = {}
+    for room in reading_rooms:
+        for seat_id in range(room.seat_min_id, room.seat_max_id + 1):
+            seat_buildings[seat_id] = room.building_id
+
+    building_infos = {
+        building_id: BuildingInfo(
+            building_id=building_id,
+            name=name,
+            reading_room_ids=tuple(sorted(
+                r.reading_room_id for r in reading_rooms if r.building_id == building_id
+            )),
+            meeting_room_ids=tuple(sorted(
+                room_id for room_id, b_id in meeting_rooms.items() if b_id == building_id
+            )),
+        )
+        for building_id, name in buildings.items()
+    }
+
+    return FacilitySnapshot(
+        buildings=MappingProxyType(building_infos),
+        reading_rooms=MappingProxyType({r.reading_room_id: r for r in reading_rooms}),
+        seat_ids=frozenset(seat_buildings),
+        meeting_room_ids=frozenset(meeting_rooms),
+        seat_buildings=MappingProxyType(seat_buildings),
+        meeting_room_buildings=MappingProxyType(dict(meeting_rooms)),
+        loaded_at=loaded_at,
+    )
+
+
+def default_snapshot() -> FacilitySnapshot:
+    """DB 로드 전 기본 스냅샷 (constants.py 초기값)"""
+    building_id = FacilityConstants.DEFAULT_BUILDING_ID
+    return build_snapshot(
+        buildings={building_id: FacilityConstants.DEFAULT_BUILDING_NAME},
+        reading_rooms=(
+            ReadingRoomInfo(
+                reading_room_id=FacilityConstants.DEFAULT_READING_ROOM_ID,
+                building_id=building_id,
+                name=FacilityConstants.DEFAULT_READING_ROOM_NAME,
+                seat_min_id=FacilityConstants.SEAT_MIN_ID,
+                seat_max_id=FacilityConstants.SEAT_MAX_ID,
+            ),
+        ),
+        meeting_rooms={room_id: building_id for room_id in FacilityConstants.MEETING_ROOM_IDS},
+    )
+
+
+def load_snapshot(db: Session) -> FacilitySnapshot:
+    """DB의 buildings / reading_rooms / meeting_rooms로 스냅샷 생성"""
+    buildings = {
+        row.building_id: row.name
+        for row in db.execute(select(models.Building.building_id, models.Building.name))
+    }
+    reading_rooms = tuple(
+        ReadingRoomInfo(
+            reading_room_id=row.reading_room_id,
+            building_id=row.building_id,
+            name=row.name,
+            seat_min_id=row.seat_min_id,
+            seat_max_id=row.seat_max_id,
+        )
+        for row in db.execute(
+            select(
+                models.ReadingRoom.reading_room_id,
+                models.ReadingRoom.building_id,
+                models.ReadingRoom.name,
+                models.ReadingRoom.seat_min_id,
+                models.ReadingRoom.seat_max_id,
+            ).order_by(models.ReadingRoom.reading_room_id)
+        )
+    )
+    meeting_rooms = {
+        row.room_id: row.building_id
+        for row in db.execute(select(models.MeetingRoom.room_id, models.MeetingRoom.building_id))
+    }
+    return build_snapshot(
+        buildings, reading_rooms, meeting_rooms, loaded_at=datetime.now(timezone.utc)
+    )
+
+
+# 현재 스냅샷 (참조 교체로만 갱신)
+_snapshot: FacilitySnapshot = default_snapshot()
+
+
+def get_snapshot() -> FacilitySnapshot:
+    """현재 시설 스냅샷"""
+    return _snapshot
+
+
+def refresh(db: Session) -> FacilitySnapshot:
+    """DB에서 다시 읽어 스냅샷 교체"""
+    global _snapshot
+    _snapshot = load_snapshot(db)
+    return _snapshot
+
+
+def set_snapshot(snapshot: FacilitySnapshot) -> None:
+    """스냅샷 직접 교체 (시딩 직후 / 테스트용)"""
+    global _snapshot
+    _snapshot = snapshot
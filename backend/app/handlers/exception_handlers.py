@@ -8,7 +8,8 @@ from app.exceptions import (
     ConflictException,
     ValidationException,
     LimitExceededException,
-    ForbiddenException
+    ForbiddenException,
+    ServiceUnavailableException,
 )
 from app.constants import ErrorCode, ERROR_MESSAGES
 from app.schemas.common import ApiResponse, ErrorPayload
@@ -21,6 +22,7 @@ EXCEPTION_STATUS_MAP: dict[Type[BusinessException], int] = {
     ValidationException: status.HTTP_400_BAD_REQUEST,
     LimitExceededException: status.HTTP_400_BAD_REQUEST,
     ForbiddenException: status.HTTP_403_FORBIDDEN,
+    ServiceUnavailableException: status.HTTP_503_SERVICE_UNAVAILABLE,
 }
 
 # --------------------------------------------------------------------------
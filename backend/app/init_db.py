@@ -1,55 +1,299 @@
 # app/db/init_db.py
+import time
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import func, insert, select, text, update
 from sqlalchemy.orm import Session
+from app.config import settings
 from app.database import SessionLocal
-from app import models, services
+from app import facility_availability, facility_registry, models, reservation_index
 from app.constants import FacilityConstants  # [NEW] 상수 사용을 위해 import
 from app.constants import ReservationLimits
+from app.sharding import reservation_sessions, shard_router
+
+# 다중 행 INSERT 한 번에 담을 행 수
+# (SQLite 바인드 변수 제한 999개 이하로 유지: 좌석 2컬럼 × 400행 = 800개)
+SEED_CHUNK_SIZE = 400
+
+
+def _insert_or_ignore(db: Session, model, rows: List[dict]) -> int:
+    """
+    다중 행 INSERT OR IGNORE (이미 있는 PK는 건너뜀)
+
+    Returns:
+        실제로 추가된 행 수
+    """
+    inserted = 0
+    for i in range(0, len(rows), SEED_CHUNK_SIZE):
+        chunk = rows[i:i + SEED_CHUNK_SIZE]
+        result = db.execute(insert(model).prefix_with("OR IGNORE").values(chunk))
+        inserted += result.rowcount
+    return inserted
+
+
+def _count_in(db: Session, column, ids: List[int]) -> int:
+    """설정된 ID 중 이미 DB에 존재하는 개수 (범위로 조회하여 바인드 변수 제한 회피)"""
+    if not ids:
+        return 0
+    existing = db.execute(
+        select(column).where(column.between(min(ids), max(ids)))
+    ).scalars()
+    wanted = set(ids)
+    return sum(1 for value in existing if value in wanted)
+
+
+# 정수 시각(epoch 분) 컬럼을 가진 테이블과 추가할 인덱스 (이전 DateTime 인덱스는 제거)
+EPOCH_MINUTE_TABLES = {
+    "reservations": {
+        "create": {
+            "idx_room_minute": "meeting_room_id, start_minute, status",
+            "idx_seat_minute": "seat_id, start_minute, status",
+            "idx_student_minute": "student_id, start_minute",
+        },
+        "drop": ["idx_room_start", "idx_seat_start"],
+    },
+    "user_reservation_index": {
+        "create": {"idx_user_index_student_minute": "student_id, start_minute"},
+        "drop": [],
+    },
+}
+
+
+# create_all이 기존 테이블에 만들지 않는 인덱스 (테이블 → {인덱스 이름: 컬럼})
+SCHEMA_INDEXES = {
+    "reservation_participants": {
+        "idx_participant_reservation": "reservation_id",
+        "idx_participant_student": "participant_student_id, reservation_id",
+    },
+}
+
+
+def _table_columns(db: Session, table: str) -> set:
+    return {row[1] for row in db.execute(text(f"PRAGMA table_info({table})"))}
+
+
+def migrate_epoch_minutes(db: Session, table: str) -> int:
+    """
+    start_minute / end_minute 컬럼 추가 및 기존 행 백필 (멱등)
+
+    Returns:
+        백필한 행 수
+    """
+    columns = _table_columns(db, table)
+    if not columns:
+        return 0
+
+    for column in ("start_minute", "end_minute"):
+        if column not in columns:
+            db.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} INTEGER"))
+
+    # DateTime은 UTC 문자열로 저장되어 있으므로 strftime('%s')로 epoch 초를 구함
+    result = db.execute(text(
+        f"UPDATE {table} SET "
+        f"start_minute = CAST(strftime('%s', start_time) AS INTEGER) / 60, "
+        f"end_minute = CAST(strftime('%s', end_time) AS INTEGER) / 60 "
+        f"WHERE start_minute IS NULL OR end_minute IS NULL"
+    ))
+
+    indexes = EPOCH_MINUTE_TABLES.get(table, {})
+    for name, index_columns in indexes.get("create", {}).items():
+        db.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({index_columns})"))
+    for name in indexes.get("drop", []):
+        db.execute(text(f"DROP INDEX IF EXISTS {name}"))
+
+    return result.rowcount
+
+
+def migrate_schema(db: Session) -> None:
+    """
+    create_all이 기존 테이블에 추가하지 않는 컬럼·인덱스 보강 (멱등)
+    """
+    columns = _table_columns(db, "meeting_rooms")
+    if columns and "building_id" not in columns:
+        db.execute(text(
+            "ALTER TABLE meeting_rooms ADD COLUMN building_id INTEGER "
+            "REFERENCES buildings(building_id)"
+        ))
+
+    columns = _table_columns(db, "reservations")
+    if columns and "series_id" not in columns:
+        db.execute(text(
+            "ALTER TABLE reservations ADD COLUMN series_id INTEGER "
+            "REFERENCES reservation_series(series_id)"
+        ))
+
+    for table, indexes in SCHEMA_INDEXES.items():
+        if not _table_columns(db, table):
+            continue
+        for name, index_columns in indexes.items():
+            db.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({index_columns})"))
+
+    for table in EPOCH_MINUTE_TABLES:
+        backfilled = migrate_epoch_minutes(db, table)
+        if backfilled:
+            print(f"🔢 Backfilled epoch minutes for {backfilled} rows in {table}.")
+
+    db.commit()
+
+
+def _bootstrap_registry(db: Session) -> None:
+    """건물이 하나도 없으면 constants.py 기본값으로 건물/열람실 생성"""
+    if db.execute(select(func.count()).select_from(models.Building)).scalar():
+        return
+
+    db.execute(insert(models.Building).prefix_with("OR IGNORE").values(
+        building_id=FacilityConstants.DEFAULT_BUILDING_ID,
+        name=FacilityConstants.DEFAULT_BUILDING_NAME,
+    ))
+    db.execute(insert(models.ReadingRoom).prefix_with("OR IGNORE").values(
+        reading_room_id=FacilityConstants.DEFAULT_READING_ROOM_ID,
+        building_id=FacilityConstants.DEFAULT_BUILDING_ID,
+        name=FacilityConstants.DEFAULT_READING_ROOM_NAME,
+        seat_min_id=FacilityConstants.SEAT_MIN_ID,
+        seat_max_id=FacilityConstants.SEAT_MAX_ID,
+    ))
+    # 기존 DB의 건물 미지정 회의실은 기본 건물 소속으로 지정
+    db.execute(
+        update(models.MeetingRoom)
+        .where(models.MeetingRoom.building_id.is_(None))
+        .values(building_id=FacilityConstants.DEFAULT_BUILDING_ID)
+    )
+
+
+def seed_facilities(
+    db: Session,
+    seat_ids: Optional[Iterable[int]] = None,
+    meeting_room_ids: Optional[Iterable[int]] = None,
+) -> Dict[str, int]:
+    """
+    설정된 좌석/회의실을 한 트랜잭션에서 일괄·멱등 생성.
+
+    - 좌석 설정 범위는 시설 레지스트리(reading_rooms의 좌석 번호 범위)입니다.
+      건물이 없는 빈 DB는 constants.py 기본값으로 건물/열람실을 먼저 만듭니다.
+    - 설정 범위와 기존 행을 비교해 빠진 시설만 추가합니다. (비어 있을 때만 생성하던 방식과 달리
+      범위를 늘리면 다음 시작 시 자동 반영)
+    - 이미 모두 존재하면 COUNT 조회만 하고 끝나므로 재시작 비용이 거의 없습니다.
+    - 설정 범위 밖의 기존 시설은 예약 이력이 연결되어 있을 수 있어 삭제하지 않고 개수만 보고합니다.
+
+    Returns:
+        {"seats_created", "meeting_rooms_created", "seats_unconfigured", "meeting_rooms_unconfigured"}
+    """
+    result = {
+        "seats_created": 0,
+        "meeting_rooms_created": 0,
+        "seats_unconfigured": 0,
+        "meeting_rooms_unconfigured": 0,
+    }
+
+    try:
+        _bootstrap_registry(db)
+        registry = facility_registry.load_snapshot(db)
+
+        if seat_ids is None:
+            seat_ids = registry.seat_ids
+        if meeting_room_ids is None:
+            meeting_room_ids = registry.meeting_room_ids or FacilityConstants.MEETING_ROOM_IDS
+
+        seat_ids = sorted(set(seat_ids))
+        meeting_room_ids = sorted(set(meeting_room_ids))
+        default_building_id = (
+            FacilityConstants.DEFAULT_BUILDING_ID
+            if FacilityConstants.DEFAULT_BUILDING_ID in registry.buildings
+            else None
+        )
+
+        # 1. 좌석: 설정된 ID가 모두 있으면 INSERT 생략
+        existing_seats = _count_in(db, models.Seat.seat_id, seat_ids)
+        if existing_seats < len(seat_ids):
+            result["seats_created"] = _insert_or_ignore(
+                db,
+                models.Seat,
+                [{"seat_id": seat_id, "is_available": True} for seat_id in seat_ids],
+            )
+
+        # 2. 회의실
+        existing_rooms = _count_in(db, models.MeetingRoom.room_id, meeting_room_ids)
+        if existing_rooms < len(meeting_room_ids):
+            result["meeting_rooms_created"] = _insert_or_ignore(
+                db,
+                models.MeetingRoom,
+                [
+                    {
+                        "room_id": room_id,
+                        "building_id": default_building_id,
+                        "min_capacity": ReservationLimits.MEETING_ROOM_MIN_PARTICIPANTS,
+                        "max_capacity": ReservationLimits.MEETING_ROOM_MAX_PARTICIPANTS,
+                        "is_available": True,
+                    }
+                    for room_id in meeting_room_ids
+                ],
+            )
+
+        # 3. 설정 범위 밖의 기존 시설 (정리 대상 보고용)
+        total_seats = db.execute(select(func.count()).select_from(models.Seat)).scalar()
+        total_rooms = db.execute(select(func.count()).select_from(models.MeetingRoom)).scalar()
+        result["seats_unconfigured"] = total_seats - len(seat_ids)
+        result["meeting_rooms_unconfigured"] = total_rooms - len(meeting_room_ids)
+
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    return result
+
+
 def init_db_data(db: Session):
     """
     실제 DB 초기화 로직 (세션은 외부에서 주입받음)
     constants.py의 설정을 기반으로 데이터를 생성합니다.
     """
     try:
-        # ---------------------------------------------------------
-        # 1. 미팅룸 초기화 (FacilityConstants.MEETING_ROOM_IDS 사용)
-        # ---------------------------------------------------------
-        meeting_rooms_count = services.meeting_room_service.get_meeting_room_count(db)
-        
-        # [수정] DB가 비어있을 때 상수 목록에 있는 방들을 생성
-        if meeting_rooms_count == 0:
-            target_ids = FacilityConstants.MEETING_ROOM_IDS
-            print(f"📝 Meeting rooms not found. Creating rooms: {target_ids}...")
-            
-            for room_id in target_ids:
-                room = models.MeetingRoom(
-                    room_id=room_id,
-                    min_capacity=ReservationLimits.MEETING_ROOM_MIN_PARTICIPANTS,
-                    max_capacity=ReservationLimits.MEETING_ROOM_MAX_PARTICIPANTS,
-                )
-                db.add(room)
-            
-            db.commit()
-            print(f"✅ Created {len(target_ids)} meeting rooms.")
-        
-        # ---------------------------------------------------------
-        # 2. 좌석 초기화 (SEAT_MIN_ID ~ SEAT_MAX_ID 사용)
-        # ---------------------------------------------------------
-        seats_count = services.seat_service.get_seats_count(db)
-        
-        if seats_count == 0:
-            min_id = FacilityConstants.SEAT_MIN_ID
-            max_id = FacilityConstants.SEAT_MAX_ID
-            
-            print(f"📝 Seats not found. Creating {min_id}-{max_id}...")
-            
-            # [수정] 하드코딩된 range(1, 71) 대신 상수를 사용하여 범위 설정
-            for seat_id in range(min_id, max_id + 1):
-                services.seat_service.create_seat(db, seat_id=seat_id)
-            
-            # create_seat 내부 로직에 따라 commit이 필요할 수 있음 (서비스 로직 확인 결과 commit 포함됨)
-            # 안전을 위해 한 번 더 확인하거나 생략 가능. 여기서는 서비스가 개별 commit한다고 가정.
-            print(f"✅ Created {max_id - min_id + 1} seats.")
-            
+        migrate_schema(db)
+
+        started = time.perf_counter()
+        result = seed_facilities(db)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        if result["meeting_rooms_created"]:
+            print(f"✅ Created {result['meeting_rooms_created']} meeting rooms.")
+        if result["seats_created"]:
+            print(f"✅ Created {result['seats_created']} seats.")
+        if result["seats_unconfigured"] or result["meeting_rooms_unconfigured"]:
+            print(
+                f"⚠️ Facilities outside configured ranges: "
+                f"{result['seats_unconfigured']} seats, "
+                f"{result['meeting_rooms_unconfigured']} meeting rooms"
+            )
+        print(f"🪑 Facility seeding finished in {elapsed_ms:.1f}ms.")
+
+        # 시설 레지스트리 스냅샷 로드 (검증기 / 현황 조회에서 사용)
+        snapshot = facility_registry.refresh(db)
+        print(
+            f"🏢 Facility registry loaded: {len(snapshot.buildings)} buildings, "
+            f"{len(snapshot.seat_ids)} seats, {len(snapshot.meeting_room_ids)} meeting rooms."
+        )
+
+        # 시설 이용 가능 여부 캐시 (예약 검증 / 현황 조회에서 사용)
+        availability = facility_availability.reload(db)
+        print(
+            f"🚦 Facility availability loaded: {len(availability.disabled_seat_ids)} seats, "
+            f"{len(availability.disabled_meeting_room_ids)} meeting rooms disabled."
+        )
+
+        # 건물별 샤드 DB 준비 (샤딩 모드)
+        if settings.SHARDING_ENABLED:
+            for building_id in shard_router.building_ids():
+                with shard_router.session(building_id) as shard:
+                    migrate_schema(shard)
+            print(f"🧩 Sharding enabled: {len(snapshot.buildings)} building shards in {shard_router.directory}.")
+
+        # 활성 예약 메모리 인덱스 (예약 생성 전 후보 충돌 거절용)
+        if settings.RESERVATION_INDEX_ENABLED:
+            with reservation_sessions(db) as sessions:
+                indexed = reservation_index.rebuild(sessions)
+            print(f"🗂️ Reservation index loaded: {indexed} active reservations.")
+
     except Exception as e:
         print(f"❌ Error initializing data: {e}")
         db.rollback()
@@ -59,4 +303,4 @@ def initialize_data():
     앱 시작 시 호출될 진입점 함수
     """
     with SessionLocal() as db:
-        init_db_data(db)
\ No newline at end of file
+        init_db_data(db)
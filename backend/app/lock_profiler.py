@@ -0,0 +1,183 @@
+"""
+lock_profiler.py - Write-Lock Critical Section Profiler
+=======================================================
+BEGIN IMMEDIATE ~ 커밋/롤백 사이(쓰기 락 보유 구간)를 단계별로 나눠 측정합니다.
+
+- begin_immediate(db, section=...)로 이름 붙인 구간만 기록합니다. (LOCK_PROFILER_ENABLED)
+- 서비스 코드는 각 검증 단계가 끝날 때 mark(db, "단계")를 호출합니다.
+  단계 시간 = 직전 mark(또는 락 획득)부터 이번 mark까지, 마지막 단계는 commit / rollback.
+- 구간·단계별 최근 LOCK_PROFILER_SAMPLE_SIZE개 표본으로 백분위를 계산하고(report),
+  누적 시간은 flame graph 도구가 읽는 folded stack 형식으로 내보냅니다(folded).
+- 프로세스 단위 집계이므로 워커가 여러 개면 워커마다 따로 쌓입니다.
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Deque, Dict, List, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.config import settings
+
+# session.info 키: 진행 중인 구간 {"section", "acquired_at", "waited", "marks": [(단계, 시각)]}
+PROFILE_KEY = "lock_profile"
+
+# 락 획득 대기 / 보유 전체를 나타내는 가상 단계 이름
+LOCK_WAIT = "lock_wait"
+HOLD = "hold"
+
+_lock = threading.Lock()
+# (구간, 단계) → 최근 표본(초)
+_samples: Dict[Tuple[str, str], Deque[float]] = {}
+# (구간, 단계) → [누적 시간(초), 횟수]  (표본 수와 무관한 전체 누적, folded 출력용)
+_totals: Dict[Tuple[str, str], List[float]] = {}
+# 구간 → {"commit": n, "rollback": n}
+_outcomes: Dict[str, Dict[str, int]] = {}
+_since = datetime.now(timezone.utc)
+
+
+def start(db: Session, section: str, waited: float) -> None:
+    """쓰기 락 획득 직후 구간 기록 시작 (begin_immediate가 호출)"""
+    db.info[PROFILE_KEY] = {
+        "section": section,
+        "acquired_at": time.perf_counter(),
+        "waited": waited,
+        "marks": [],
+    }
+
+
+def mark(db: Session, phase: str) -> None:
+    """직전 단계가 끝난 시점 기록 (기록 중인 구간이 없으면 아무것도 하지 않음)"""
+    profile = db.info.get(PROFILE_KEY)
+    if profile is not None:
+        profile["marks"].append((phase, time.perf_counter()))
+
+
+def reset() -> None:
+    """집계 초기화"""
+    global _since
+    with _lock:
+        _samples.clear()
+        _totals.clear()
+        _outcomes.clear()
+        _since = datetime.now(timezone.utc)
+
+
+def _record(section: str, phase: str, seconds: float) -> None:
+    # 호출자가 _lock을 잡은 상태에서만 호출
+    key = (section, phase)
+    samples = _samples.get(key)
+    if samples is None:
+        samples = _samples[key] = deque(maxlen=settings.LOCK_PROFILER_SAMPLE_SIZE)
+    samples.append(seconds)
+    total = _totals.setdefault(key, [0.0, 0])
+    total[0] += seconds
+    total[1] += 1
+
+
+def finish(db: Session, outcome: str) -> None:
+    """구간 종료 (커밋/롤백 세션 이벤트가 호출)"""
+    profile = db.info.pop(PROFILE_KEY, None)
+    if profile is None:
+        return
+
+    ended_at = time.perf_counter()
+    section = profile["section"]
+    previous = profile["acquired_at"]
+    with _lock:
+        _record(section, LOCK_WAIT, profile["waited"])
+        for phase, at in profile["marks"]:
+            _record(section, phase, at - previous)
+            previous = at
+        _record(section, outcome, ended_at - previous)
+        _record(section, HOLD, ended_at - profile["acquired_at"])
+        counts = _outcomes.setdefault(section, {"commit": 0, "rollback": 0})
+        counts[outcome] += 1
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    """nearest-rank 백분위 (ordered는 오름차순)"""
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+def _phase_stats(phase: str, samples: Deque[float], total: List[float], hold_total: float) -> dict:
+    ordered = sorted(samples)
+    return {
+        "phase": phase,
+        "count": int(total[1]),
+        "total_ms": round(total[0] * 1000, 3),
+        "share": round(total[0] / hold_total, 4) if hold_total else 0.0,
+        "p50_ms": round(_percentile(ordered, 0.50) * 1000, 3),
+        "p95_ms": round(_percentile(ordered, 0.95) * 1000, 3),
+        "p99_ms": round(_percentile(ordered, 0.99) * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
+
+
+def report() -> dict:
+    """구간별 락 대기 / 보유 / 단계 백분위 (share는 보유 시간 중 단계 비중)"""
+    with _lock:
+        samples = {key: list(values) for key, values in _samples.items()}
+        totals = {key: list(values) for key, values in _totals.items()}
+        outcomes = {section: dict(counts) for section, counts in _outcomes.items()}
+        since = _since
+
+    sections = []
+    for section, counts in outcomes.items():
+        hold_total = totals[(section, HOLD)][0]
+        phases = [
+            _phase_stats(phase, samples[(name, phase)], totals[(name, phase)], hold_total)
+            for name, phase in samples
+            if name == section and phase not in (LOCK_WAIT, HOLD)
+        ]
+        sections.append({
+            "section": section,
+            "commits": counts["commit"],
+            "rollbacks": counts["rollback"],
+            "lock_wait": _phase_stats(LOCK_WAIT, samples[(section, LOCK_WAIT)], totals[(section, LOCK_WAIT)], hold_total),
+            "hold": _phase_stats(HOLD, samples[(section, HOLD)], totals[(section, HOLD)], hold_total),
+            "phases": phases,
+        })
+
+    # 보유 시간 누적이 큰 구간부터
+    sections.sort(key=lambda item: item["hold"]["total_ms"], reverse=True)
+    return {
+        "since": since.isoformat(),
+        "sample_size": settings.LOCK_PROFILER_SAMPLE_SIZE,
+        "sections": sections,
+    }
+
+
+def folded() -> str:
+    """
+    folded stack 형식 누적 시간 (한 줄: "구간;held;단계 마이크로초")
+
+    flamegraph.pl, speedscope 등에 그대로 넣어 단계별 비중을 볼 수 있습니다.
+    """
+    with _lock:
+        totals = {key: values[0] for key, values in _totals.items()}
+
+    lines = []
+    for (section, phase), seconds in totals.items():
+        if phase == HOLD:
+            continue
+        stack = f"{section};{phase}" if phase == LOCK_WAIT else f"{section};held;{phase}"
+        lines.append(f"{stack} {round(seconds * 1_000_000)}")
+    return "\n".join(lines) + ("\n" if lines else "")
+
+
+# ---------------------------------------------------------------------------
+# 세션 이벤트 (커밋/롤백 시 구간 종료)
+# ---------------------------------------------------------------------------
+@event.listens_for(Session, "after_commit")
+def _finish_on_commit(session: Session) -> None:
+    finish(session, "commit")
+
+
+@event.listens_for(Session, "after_rollback")
+def _finish_on_rollback(session: Session) -> None:
+    finish(session, "rollback")
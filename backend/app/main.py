@@ -1,18 +1,30 @@
 """
 main.py - Application Entry Point
 """
+import logging
 import os
+import time
 from pathlib import Path
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-
-from app.scheduler import scheduler, update_reservation_status
-from app.database import engine, Base
+from fastapi.responses import FileResponse, PlainTextResponse
+
+from app import metrics
+from app.responses import DefaultJSONResponse
+from app.config import settings
+from app.scheduler import scheduler, update_reservation_status, archive_old_reservations
+from app.database import (
+    engine,
+    Base,
+    repeated_statements,
+    start_lock_wait_tracking,
+    start_query_tracking,
+)
 from app.init_db import initialize_data
+from app.sharding import shard_router
 from app.api.v1 import api_router
 from app.exceptions import BusinessException
 from app.handlers.exception_handlers import (
@@ -29,6 +41,7 @@ async def lifespan(app: FastAPI):
     initialize_data()
     
     scheduler.add_job(update_reservation_status, 'cron', minute='*')
+    scheduler.add_job(archive_old_reservations, 'cron', hour=settings.ARCHIVE_CRON_HOUR, minute=0)
     scheduler.start()
     
     print("🕒 Scheduler started.")
@@ -36,6 +49,7 @@ async def lifespan(app: FastAPI):
     yield
     
     scheduler.shutdown()
+    shard_router.dispose()
     print("🕒 Shutting down scheduler...")
     print("👋 Shutting down application...")
 
@@ -44,7 +58,8 @@ app = FastAPI(
     title="Library Seat Reservation System",
     description="API for reserving seats and meeting rooms",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=DefaultJSONResponse,
 )
 
 # 3. CORS 설정 - 정적 HTML 페이지(예: http://127.0.0.1:5500)와 연동
@@ -61,6 +76,54 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 3-1. 요청별 쓰기 락 대기 시간 보고 (Server-Timing 헤더)
+@app.middleware("http")
+async def report_lock_wait(request: Request, call_next):
+    stats = start_lock_wait_tracking()
+    response = await call_next(request)
+    response.headers["Server-Timing"] = (
+        f'db-lock;dur={stats["wait_ms"]:.1f};desc="retries={stats["retries"]}"'
+    )
+    return response
+
+# 3-2. 요청별 SQL 실행 횟수 / DB 시간 (디버그 모드에서 헤더 보고 + N+1 경고)
+logger = logging.getLogger(__name__)
+
+@app.middleware("http")
+async def report_query_stats(request: Request, call_next):
+    # 디버그 모드가 아니면 SQL별 집계를 만들지 않음 (쿼리 훅은 통계가 없으면 바로 반환)
+    if not settings.DEBUG:
+        return await call_next(request)
+
+    stats = start_query_tracking()
+    response = await call_next(request)
+    response.headers["X-DB-Queries"] = str(stats["count"])
+    response.headers["X-DB-Time"] = f'{stats["time_ms"]:.1f}'
+    for statement, count in repeated_statements(stats, settings.QUERY_REPEAT_WARN_THRESHOLD):
+        logger.warning(
+            "N+1 suspected: %s %s ran the same query %d times: %s",
+            request.method, request.url.path, count, " ".join(statement.split())[:200],
+        )
+    return response
+
+# 3-3. 요청 지표 (처리 중 요청 수, 경로 템플릿·상태별 처리 시간) - 가장 바깥 미들웨어
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    metrics.HTTP_REQUESTS_IN_FLIGHT.inc()
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        metrics.HTTP_REQUESTS_IN_FLIGHT.dec()
+        # 실제 경로 대신 라우트 템플릿을 써서 라벨 수를 제한
+        route = getattr(request.scope.get("route"), "path", "unmatched")
+        metrics.HTTP_REQUEST_DURATION.observe(
+            time.perf_counter() - started, method=request.method, route=route, status=status,
+        )
+
 # 4. 예외 핸들러 등록 (순서 중요)
 app.add_exception_handler(BusinessException, business_exception_handler)
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
@@ -83,6 +146,13 @@ if FRONTEND_DIR.exists():
 def health_check():
     return {"status": "healthy"}
 
+@app.get("/metrics", include_in_schema=False)
+def read_metrics():
+    """Prometheus 텍스트 형식 런타임 지표"""
+    if not settings.METRICS_ENABLED:
+        return PlainTextResponse("metrics disabled\n", status_code=404)
+    return PlainTextResponse(metrics.registry.expose(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
 # 8. HTML 페이지 라우팅 (SPA 스타일이 아닌 개별 페이지 서빙)
 @app.get("/")
 def serve_index():
@@ -0,0 +1,239 @@
+"""
+metrics.py - In-Process Metrics Registry
+========================================
+Prometheus 텍스트 노출 형식(/metrics)으로 내보내는 프로세스 내 지표 (외부 의존성 없음)
+
+- 값은 스레드별 샤드(threading.local)에 누적하고, 수집(scrape) 시에만 합산합니다.
+  요청/쿼리마다 호출되는 inc / observe 경로에는 락이 없으므로 계측이 병목이 되지 않습니다.
+  (락은 스레드가 지표를 처음 기록할 때 샤드를 등록하는 순간에만 사용)
+- 프로세스 단위 지표이므로 워커가 여러 개면 워커마다 따로 수집됩니다.
+"""
+
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# 요청 / 락 / 스케줄러 시간(초)용 기본 버킷
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# SQL 한 건 실행 시간(초)용 버킷
+QUERY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5)
+
+LabelValues = Tuple[str, ...]
+
+
+class _Metric(ABC):
+    """스레드별 샤드에 값을 누적하는 지표 공통 부분 (하위 클래스가 expose 구현)"""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._local = threading.local()
+        self._shards: List[dict] = []
+        self._shards_lock = threading.Lock()
+
+    def _shard(self) -> dict:
+        shard = getattr(self._local, "values", None)
+        if shard is None:
+            shard = {}
+            with self._shards_lock:
+                self._shards.append(shard)
+            self._local.values = shard
+        return shard
+
+    def _key(self, labels: Dict[str, object]) -> LabelValues:
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def _live_shards(self) -> List[dict]:
+        with self._shards_lock:
+            return list(self._shards)
+
+    def _snapshots(self) -> List[dict]:
+        # dict.copy()는 GIL 아래에서 한 번에 실행되므로 기록 중인 샤드도 안전하게 복사
+        return [shard.copy() for shard in self._live_shards()]
+
+    def _label_text(self, key: LabelValues, extra: Iterable[Tuple[str, str]] = ()) -> str:
+        pairs = list(zip(self.label_names, key)) + list(extra)
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+    def reset(self) -> None:
+        """누적 값 초기화 (테스트용)"""
+        for shard in self._live_shards():
+            shard.clear()
+
+    @abstractmethod
+    def expose(self) -> List[str]:
+        """Prometheus 텍스트 형식 샘플 줄 (HELP / TYPE 제외)"""
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    type_name = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        shard = self._shard()
+        key = self._key(labels)
+        shard[key] = shard.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        key = self._key(labels)
+        return sum(shard.get(key, 0) for shard in self._snapshots())
+
+    def _totals(self) -> Dict[LabelValues, float]:
+        totals: Dict[LabelValues, float] = {}
+        for shard in self._snapshots():
+            for key, amount in shard.items():
+                totals[key] = totals.get(key, 0) + amount
+        return totals
+
+    def expose(self) -> List[str]:
+        return [
+            f"{self.name}{self._label_text(key)} {_format(amount)}"
+            for key, amount in sorted(self._totals().items())
+        ]
+
+
+class Gauge(Counter):
+    """증감 게이지 (inc / dec), 또는 수집 시 계산하는 함수 게이지"""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = (),
+                 function: Optional[Callable[[], float]] = None):
+        super().__init__(name, documentation, label_names)
+        self._function = function
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def expose(self) -> List[str]:
+        if self._function is not None:
+            return [f"{self.name} {_format(self._function())}"]
+        return super().expose()
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램 (샤드 값: [버킷별 개수..., +Inf 개수, 합계])"""
+
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels) -> None:
+        shard = self._shard()
+        key = self._key(labels)
+        counts = shard.get(key)
+        if counts is None:
+            counts = shard[key] = [0] * (len(self.buckets) + 1) + [0.0]
+        counts[bisect_left(self.buckets, value)] += 1
+        counts[-1] += value
+
+    def count(self, **labels) -> int:
+        key = self._key(labels)
+        return sum(sum(shard[key][:-1]) for shard in self._snapshots() if key in shard)
+
+    def expose(self) -> List[str]:
+        merged: Dict[LabelValues, List[float]] = {}
+        for shard in self._snapshots():
+            for key, counts in shard.items():
+                counts = list(counts)
+                total = merged.setdefault(key, [0] * len(counts))
+                for i, value in enumerate(counts):
+                    total[i] += value
+
+        lines = []
+        for key, counts in sorted(merged.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts[:-1]):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _format(bound)
+                lines.append(f"{self.name}_bucket{self._label_text(key, [('le', le)])} {_format(cumulative)}")
+            lines.append(f"{self.name}_sum{self._label_text(key)} {_format(counts[-1])}")
+            lines.append(f"{self.name}_count{self._label_text(key)} {_format(cumulative)}")
+        return lines
+
+
+class Registry:
+    """지표 등록 및 텍스트 노출"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def expose(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            lines.extend(metric.expose())
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """모든 누적 값 초기화 (테스트용)"""
+        for metric in self._metrics.values():
+            metric.reset()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format(value: float) -> str:
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+# ---------------------------------------------------------------------------
+# 애플리케이션 지표
+# ---------------------------------------------------------------------------
+registry = Registry()
+
+HTTP_REQUEST_DURATION = registry.register(Histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간", ["method", "route", "status"],
+))
+HTTP_REQUESTS_IN_FLIGHT = registry.register(Gauge(
+    "http_requests_in_flight", "처리 중인 HTTP 요청 수",
+))
+DB_QUERY_DURATION = registry.register(Histogram(
+    "db_query_duration_seconds", "SQL 한 건 실행 시간", buckets=QUERY_BUCKETS,
+))
+DB_WRITE_LOCK_WAIT = registry.register(Histogram(
+    "db_write_lock_wait_seconds", "BEGIN IMMEDIATE 쓰기 락 획득 대기 시간 (재시도 포함)",
+))
+DB_WRITE_LOCK_HOLD = registry.register(Histogram(
+    "db_write_lock_hold_seconds", "쓰기 락 보유 시간 (BEGIN IMMEDIATE ~ 커밋/롤백)", ["outcome"],
+))
+DB_WRITE_LOCK_RETRIES = registry.register(Counter(
+    "db_write_lock_retries_total", "쓰기 락 획득 재시도 횟수",
+))
+DB_WRITE_LOCK_BUSY = registry.register(Counter(
+    "db_write_lock_busy_total", "재시도 후에도 쓰기 락을 얻지 못한 횟수 (503 DATABASE_BUSY)",
+))
+SCHEDULER_JOB_DURATION = registry.register(Histogram(
+    "scheduler_job_duration_seconds", "스케줄러 작업 실행 시간", ["job", "outcome"],
+))
+SCHEDULER_ROWS_UPDATED = registry.register(Counter(
+    "scheduler_rows_updated_total", "스케줄러 작업이 변경한 행 수", ["job", "table", "change"],
+))
+CACHE_LOOKUPS = registry.register(Counter(
+    "cache_lookups_total", "메모리 캐시 조회 (hit: 캐시로 응답, miss: DB 조회로 대체)", ["cache", "result"],
+))
+RESERVATION_PRECHECKS = registry.register(Counter(
+    "reservation_index_prechecks_total", "예약 인덱스 사전 충돌 검사 (rejected: DB 확인 후 락 없이 거절)", ["facility", "result"],
+))
+RESERVATION_INDEX_REPAIRS = registry.register(Counter(
+    "reservation_index_repairs_total", "충돌 확인 중 DB와 달라 고친 인덱스 예약 수 (다른 워커의 취소·변경)",
+))
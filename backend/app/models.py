@@ -4,13 +4,17 @@ from sqlalchemy import (
     String,
     Boolean,
     DateTime,
+    Date,
+    Time,
     ForeignKey,
     Enum,
     CheckConstraint,
     Index,
+    and_,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 from sqlalchemy.sql import func
+from datetime import datetime, timezone
 from enum import Enum as PyEnum
 
 from .database import Base
@@ -27,6 +31,69 @@ class ReservationStatus(str, PyEnum):
     COMPLETED = "COMPLETED"
 
 
+class WaitlistStatus(str, PyEnum):
+    """좌석 대기 상태"""
+    WAITING = "WAITING"
+    PROMOTED = "PROMOTED"  # 취소된 자리로 예약 전환됨
+    CANCELED = "CANCELED"  # 사용자가 대기 취소
+    EXPIRED = "EXPIRED"  # 시작 시각까지 자리가 나지 않음
+
+
+# ---------------------------------------------------------------------------
+# Epoch Minutes (정수 시각)
+# ---------------------------------------------------------------------------
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# 예약 한 건의 최대 길이(분). 예약은 하루 운영 시간 안에서만 가능하므로
+# 겹침 검사에서 start_minute 하한으로 사용해 인덱스 범위를 좁힙니다.
+MAX_RESERVATION_MINUTES = 24 * 60
+
+
+def to_epoch_minutes(value: datetime) -> int:
+    """UTC 기준 epoch 분 (naive datetime은 UTC로 간주)"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int((value - EPOCH).total_seconds() // 60)
+
+
+class EpochMinutesMixin:
+    """
+    start_time / end_time과 함께 정수 시각(start_minute / end_minute, UTC epoch 분)을 저장.
+
+    SQLite는 DateTime을 문자열로 저장하므로, 겹침·범위 검사는 정수 컬럼으로 비교합니다.
+    ORM에서 start_time / end_time을 설정하면 자동으로 동기화됩니다.
+    """
+
+    start_minute = Column(Integer, nullable=False)
+    end_minute = Column(Integer, nullable=False)
+
+    @validates("start_time", "end_time")
+    def _sync_epoch_minutes(self, key, value):
+        minutes = to_epoch_minutes(value) if value is not None else None
+        if key == "start_time":
+            self.start_minute = minutes
+        else:
+            self.end_minute = minutes
+        return value
+
+    @classmethod
+    def overlaps(cls, start_time: datetime, end_time: datetime):
+        """[start_time, end_time) 구간과 겹치는 행 조건"""
+        start_minute = to_epoch_minutes(start_time)
+        return and_(
+            cls.start_minute > start_minute - MAX_RESERVATION_MINUTES,
+            cls.start_minute < to_epoch_minutes(end_time),
+            cls.end_minute > start_minute,
+        )
+
+    @classmethod
+    def starts_between(cls, range_start: datetime, range_end: datetime):
+        """시작 시각이 [range_start, range_end] 안에 있는 행 조건"""
+        return cls.start_minute.between(
+            to_epoch_minutes(range_start), to_epoch_minutes(range_end)
+        )
+
+
 # ---------------------------------------------------------------------------
 # User Model (학생 계정)
 # ---------------------------------------------------------------------------
@@ -49,6 +116,48 @@ class User(Base):
         return f"<User(student_id={self.student_id}, last_login_at={self.last_login_at})>"
 
 
+# ---------------------------------------------------------------------------
+# Building / ReadingRoom Model (시설 레지스트리)
+# ---------------------------------------------------------------------------
+class Building(Base):
+    """
+    건물 테이블 (열람실·회의실의 상위 단위)
+    """
+    __tablename__ = "buildings"
+
+    building_id = Column(Integer, primary_key=True, autoincrement=False)
+    name = Column(String(100), nullable=False)
+
+    def __repr__(self):
+        return f"<Building(building_id={self.building_id}, name={self.name})>"
+
+
+class ReadingRoom(Base):
+    """
+    열람실 테이블
+
+    열람실마다 좌석 번호 범위(seat_min_id ~ seat_max_id)를 가지며,
+    시작 시 이 범위를 기준으로 seats 테이블이 채워집니다.
+    """
+    __tablename__ = "reading_rooms"
+
+    __table_args__ = (
+        CheckConstraint("seat_min_id <= seat_max_id", name="check_seat_range"),
+    )
+
+    reading_room_id = Column(Integer, primary_key=True, autoincrement=False)
+    building_id = Column(Integer, ForeignKey("buildings.building_id"), nullable=False)
+    name = Column(String(100), nullable=False)
+    seat_min_id = Column(Integer, nullable=False)
+    seat_max_id = Column(Integer, nullable=False)
+
+    def __repr__(self):
+        return (
+            f"<ReadingRoom(reading_room_id={self.reading_room_id}, "
+            f"seats={self.seat_min_id}-{self.seat_max_id})>"
+        )
+
+
 # ---------------------------------------------------------------------------
 # MeetingRoom Model (회의실 정보)
 # ---------------------------------------------------------------------------
@@ -59,6 +168,7 @@ class MeetingRoom(Base):
     __tablename__ = "meeting_rooms"
 
     room_id = Column(Integer, primary_key=True, autoincrement=False)
+    building_id = Column(Integer, ForeignKey("buildings.building_id"), nullable=True)
     min_capacity = Column(Integer, nullable=False, default=3)
     max_capacity = Column(Integer, nullable=False, default=6)
     is_available = Column(Boolean, nullable=False, default=True)
@@ -83,10 +193,26 @@ class Seat(Base):
         return f"<Seat(seat_id={self.seat_id})>"
 
 
+class FacilityAvailabilityVersion(Base):
+    """
+    시설 이용 가능 여부 변경 버전 (id=1 한 행).
+
+    좌석/회의실 is_available을 바꾸는 트랜잭션에서 함께 올리므로,
+    워커마다 따로 둔 메모리 캐시가 쓰기 락 안에서 이 값만 비교해 낡았는지 확인합니다.
+    """
+    __tablename__ = "facility_availability_version"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    version = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<FacilityAvailabilityVersion(version={self.version})>"
+
+
 # ---------------------------------------------------------------------------
 # Reservation Model (예약 테이블)
 # ---------------------------------------------------------------------------
-class Reservation(Base):
+class Reservation(EpochMinutesMixin, Base):
     """
     예약 통합 테이블
     """
@@ -100,8 +226,9 @@ class Reservation(Base):
             name="check_exclusive_facility"
         ),
         Index('idx_student_start', 'student_id', 'start_time'),
-        Index('idx_room_start', 'meeting_room_id', 'start_time', 'status'),
-        Index('idx_seat_start', 'seat_id', 'start_time', 'status'),
+        Index('idx_student_minute', 'student_id', 'start_minute'),
+        Index('idx_room_minute', 'meeting_room_id', 'start_minute', 'status'),
+        Index('idx_seat_minute', 'seat_id', 'start_minute', 'status'),
         Index('idx_status_start', 'status', 'start_time'),
         Index('idx_status_end', 'status', 'end_time'),
     )
@@ -112,6 +239,9 @@ class Reservation(Base):
     meeting_room_id = Column(Integer, ForeignKey("meeting_rooms.room_id"), nullable=True)
     seat_id = Column(Integer, ForeignKey("seats.seat_id"), nullable=True)
 
+    # 반복 예약으로 생성된 회차이면 소속 시리즈 ID
+    series_id = Column(Integer, ForeignKey("reservation_series.series_id"), nullable=True)
+
     # [수정됨] timezone=True 추가 (UTC 기준 저장)
     start_time = Column(DateTime(timezone=True), nullable=False)
     
@@ -133,12 +263,41 @@ class Reservation(Base):
     meeting_room = relationship("MeetingRoom")
     seat = relationship("Seat")
     participants = relationship("ReservationParticipant", back_populates="reservation")
+    series = relationship("ReservationSeries", back_populates="reservations")
 
     def __repr__(self):
         facility = f"room={self.meeting_room_id}" if self.meeting_room_id else f"seat={self.seat_id}"
         return f"<Reservation(id={self.reservation_id}, {facility}, status={self.status})>"
 
 
+# ---------------------------------------------------------------------------
+# ReservationSeries Model (회의실 반복 예약)
+# ---------------------------------------------------------------------------
+class ReservationSeries(Base):
+    """
+    회의실 반복 예약 시리즈.
+    회차는 생성 시점에 reservations 행으로 펼쳐 저장하고 series_id로 연결합니다.
+    """
+    __tablename__ = "reservation_series"
+
+    series_id = Column(Integer, primary_key=True, autoincrement=True)
+    student_id = Column(Integer, ForeignKey("users.student_id"), nullable=False)
+    meeting_room_id = Column(Integer, ForeignKey("meeting_rooms.room_id"), nullable=False)
+
+    frequency = Column(String(10), nullable=False)  # daily | weekly
+    start_date = Column(Date, nullable=False)
+    end_date = Column(Date, nullable=False)
+    start_time = Column(Time, nullable=False)  # KST 기준 시작 시각
+    end_time = Column(Time, nullable=False)  # KST 기준 종료 시각
+
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    reservations = relationship("Reservation", back_populates="series")
+
+    def __repr__(self):
+        return f"<ReservationSeries(id={self.series_id}, room={self.meeting_room_id}, {self.frequency})>"
+
+
 # ---------------------------------------------------------------------------
 # ReservationParticipant Model (회의실 참여자)
 # ---------------------------------------------------------------------------
@@ -148,6 +307,13 @@ class ReservationParticipant(Base):
     """
     __tablename__ = "reservation_participants"
 
+    __table_args__ = (
+        # 예약별 참여자 조회 (참여자 로딩, 중복 이용 검사의 JOIN)
+        Index('idx_participant_reservation', 'reservation_id'),
+        # 참여자 기준 조회 (내 예약 목록, 회의실 일일/주간 한도)
+        Index('idx_participant_student', 'participant_student_id', 'reservation_id'),
+    )
+
     id = Column(Integer, primary_key=True, autoincrement=True)
     
     reservation_id = Column(
@@ -167,3 +333,168 @@ class ReservationParticipant(Base):
     def __repr__(self):
         return f"<ReservationParticipant(reservation_id={self.reservation_id}, student={self.participant_student_id})>"
     
+
+
+# ---------------------------------------------------------------------------
+# ReservationArchive Model (아카이브 예약 - Cold Storage)
+# ---------------------------------------------------------------------------
+class ReservationArchive(Base):
+    """
+    보존 기간이 지난 COMPLETED/CANCELED 예약을 보관하는 테이블.
+    reservations 테이블과 동일한 컬럼 구조를 가지며 reservation_id를 그대로 유지합니다.
+    """
+    __tablename__ = "reservations_archive"
+
+    __table_args__ = (
+        Index('idx_archive_student_start', 'student_id', 'start_time'),
+        Index('idx_archive_start', 'start_time'),
+    )
+
+    reservation_id = Column(Integer, primary_key=True, autoincrement=False)
+
+    student_id = Column(Integer, nullable=False)
+    meeting_room_id = Column(Integer, nullable=True)
+    seat_id = Column(Integer, nullable=True)
+
+    start_time = Column(DateTime(timezone=True), nullable=False)
+    end_time = Column(DateTime(timezone=True), nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+
+    status = Column(
+        Enum(ReservationStatus, name="reservation_status_enum"),
+        nullable=False,
+    )
+
+    # 아카이브로 이동된 시각 (UTC)
+    archived_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    participants = relationship("ReservationParticipantArchive", back_populates="reservation")
+
+    def __repr__(self):
+        facility = f"room={self.meeting_room_id}" if self.meeting_room_id else f"seat={self.seat_id}"
+        return f"<ReservationArchive(id={self.reservation_id}, {facility}, status={self.status})>"
+
+
+# ---------------------------------------------------------------------------
+# ReservationParticipantArchive Model (아카이브 예약 참여자)
+# ---------------------------------------------------------------------------
+class ReservationParticipantArchive(Base):
+    """
+    아카이브된 회의실 예약의 참여자 테이블
+    """
+    __tablename__ = "reservation_participants_archive"
+
+    __table_args__ = (
+        Index('idx_archive_participant_student', 'participant_student_id'),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    reservation_id = Column(
+        Integer,
+        ForeignKey("reservations_archive.reservation_id", ondelete="CASCADE"),
+        nullable=False
+    )
+
+    participant_student_id = Column(Integer, nullable=False)
+
+    reservation = relationship("ReservationArchive", back_populates="participants")
+
+    def __repr__(self):
+        return f"<ReservationParticipantArchive(reservation_id={self.reservation_id}, student={self.participant_student_id})>"
+
+
+# ---------------------------------------------------------------------------
+# SeatWaitlistEntry Model (좌석 대기열)
+# ---------------------------------------------------------------------------
+class SeatWaitlistEntry(EpochMinutesMixin, Base):
+    """
+    만석인 좌석 시간대의 대기열 (선착순).
+    seat_id가 NULL이면 같은 시간대의 아무 좌석이나 기다립니다.
+    예약이 취소되면 같은 트랜잭션에서 대기 순번이 가장 앞선 항목이 예약으로 전환됩니다.
+    """
+    __tablename__ = "seat_waitlist"
+
+    __table_args__ = (
+        Index('idx_waitlist_status_start', 'status', 'start_minute'),
+        Index('idx_waitlist_student', 'student_id', 'status'),
+    )
+
+    waitlist_id = Column(Integer, primary_key=True, autoincrement=True)
+    student_id = Column(Integer, ForeignKey("users.student_id"), nullable=False)
+    seat_id = Column(Integer, ForeignKey("seats.seat_id"), nullable=True)
+
+    start_time = Column(DateTime(timezone=True), nullable=False)
+    end_time = Column(DateTime(timezone=True), nullable=False)
+
+    status = Column(
+        Enum(WaitlistStatus, name="waitlist_status_enum"),
+        nullable=False,
+        default=WaitlistStatus.WAITING
+    )
+    # 전환된 예약 ID
+    reservation_id = Column(Integer, ForeignKey("reservations.reservation_id"), nullable=True)
+
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    promoted_at = Column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return f"<SeatWaitlistEntry(id={self.waitlist_id}, seat={self.seat_id}, status={self.status})>"
+
+
+# ---------------------------------------------------------------------------
+# Sharding Models (건물별 샤딩 모드 - 메인 DB에만 존재)
+# ---------------------------------------------------------------------------
+class ReservationDirectory(Base):
+    """
+    샤드 간 전역 예약 ID 발급 및 예약 → 건물(샤드) 위치 테이블.
+
+    샤드마다 autoincrement를 쓰면 ID가 겹치므로, 여기서 발급한 ID를
+    샤드의 reservations.reservation_id로 그대로 사용합니다.
+    """
+    __tablename__ = "reservation_directory"
+
+    reservation_id = Column(Integer, primary_key=True, autoincrement=True)
+    building_id = Column(Integer, nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    def __repr__(self):
+        return f"<ReservationDirectory(id={self.reservation_id}, building={self.building_id})>"
+
+
+class UserReservationIndex(EpochMinutesMixin, Base):
+    """
+    사용자별 예약 인덱스 (샤드 간 중복 이용·이용 한도 검사 및 내 예약 조회용).
+
+    예약자와 회의실 참여자 각각에 한 행씩 기록하므로, 사용자 기준 조회가 JOIN 없이
+    인덱스 하나로 처리됩니다. (중복·한도 검사는 (student_id, start_minute), 내 예약 조회는 (student_id, start_time))
+    """
+    __tablename__ = "user_reservation_index"
+
+    __table_args__ = (
+        Index('idx_user_index_student_start', 'student_id', 'start_time'),
+        Index('idx_user_index_student_minute', 'student_id', 'start_minute'),
+        Index('idx_user_index_reservation', 'reservation_id'),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    reservation_id = Column(Integer, nullable=False)
+    student_id = Column(Integer, nullable=False)
+    building_id = Column(Integer, nullable=False)
+    meeting_room_id = Column(Integer, nullable=True)
+    seat_id = Column(Integer, nullable=True)
+
+    start_time = Column(DateTime(timezone=True), nullable=False)
+    end_time = Column(DateTime(timezone=True), nullable=False)
+
+    status = Column(
+        Enum(ReservationStatus, name="reservation_status_enum"),
+        nullable=False,
+        default=ReservationStatus.RESERVED
+    )
+
+    # 예약자 본인 행이면 True, 회의실 참여자 행이면 False
+    is_owner = Column(Boolean, nullable=False, default=True)
+
+    def __repr__(self):
+        return f"<UserReservationIndex(reservation={self.reservation_id}, student={self.student_id})>"
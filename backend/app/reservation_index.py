@@ -0,0 +1,371 @@
+"""
+reservation_index.py - In-Memory Active Reservation Index
+=========================================================
+RESERVED / IN_USE 예약을 시설별·학생별(예약자 + 회의실 참여자) 정렬 배열로 메모리에 보관합니다.
+
+- 예약 생성 전 후보 충돌을 트랜잭션(쓰기 락) 밖에서 먼저 걸러냅니다.
+  최종 판단은 여전히 락 안의 DB 검사입니다.
+- 시작 시 DB에서 전체를 다시 읽고(rebuild), 이후에는 SQLAlchemy 세션 이벤트로
+  커밋된 예약 변경만 반영합니다. (롤백된 변경은 버림)
+- ORM 객체를 거치지 않는 일괄 UPDATE/DELETE는 이벤트에 잡히지 않으므로,
+  변경한 예약 ID를 stage_bulk_changes()로 넘기거나 작업 뒤 rebuild가 필요합니다.
+  (스케줄러의 자동 시작/종료는 종료된 예약만 prune하면 되므로 예외)
+- verify()로 DB와 인덱스를 비교할 수 있습니다. (관리자 API)
+- 프로세스 단위 인덱스이므로 워커가 여러 개면 워커마다 따로 유지됩니다.
+  다른 워커의 취소·변경은 이 인덱스에 반영되지 않으므로, 인덱스 충돌은 후보일 뿐이고
+  confirm_conflict()로 DB에서 다시 확인한 뒤에만 거절합니다.
+"""
+
+import threading
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from itertools import chain
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from app import metrics, models
+from app.config import settings
+from app.models import MAX_RESERVATION_MINUTES, to_epoch_minutes
+from app.sharding import reservation_sessions
+
+ACTIVE_STATUSES = (
+    models.ReservationStatus.RESERVED,
+    models.ReservationStatus.IN_USE,
+)
+
+# session.info 키: 플러시 후 커밋 대기 중인 변경 {reservation_id: ReservationEntry | None}
+PENDING_KEY = "reservation_index_pending"
+
+# (start_minute, end_minute, reservation_id) 정렬 배열
+Interval = Tuple[int, int, int]
+
+
+@dataclass(frozen=True)
+class ReservationEntry:
+    """인덱스에 보관하는 활성 예약 한 건"""
+
+    reservation_id: int
+    student_ids: Tuple[int, ...]  # 예약자 + 회의실 참여자
+    seat_id: Optional[int]
+    meeting_room_id: Optional[int]
+    start_minute: int
+    end_minute: int
+
+    @property
+    def interval(self) -> Interval:
+        return (self.start_minute, self.end_minute, self.reservation_id)
+
+
+def _overlapping(intervals: List[Interval], start_minute: int, end_minute: int) -> List[int]:
+    """정렬 배열에서 [start_minute, end_minute)와 겹치는 구간의 예약 ID (최대 예약 길이로 탐색 범위 제한)"""
+    found = []
+    i = bisect_left(intervals, (start_minute - MAX_RESERVATION_MINUTES,))
+    while i < len(intervals) and intervals[i][0] < end_minute:
+        if intervals[i][1] > start_minute:
+            found.append(intervals[i][2])
+        i += 1
+    return found
+
+
+def _remove_interval(intervals: List[Interval], interval: Interval) -> None:
+    i = bisect_left(intervals, interval)
+    if i < len(intervals) and intervals[i] == interval:
+        del intervals[i]
+
+
+class ActiveReservationIndex:
+    """시설별·학생별 활성 예약 정렬 배열"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[int, ReservationEntry] = {}
+        self._by_seat: Dict[int, List[Interval]] = {}
+        self._by_room: Dict[int, List[Interval]] = {}
+        self._by_student_seat: Dict[int, List[Interval]] = {}
+        self._by_student_room: Dict[int, List[Interval]] = {}
+        self.rebuilt_at: Optional[datetime] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ------------------------------------------------------------------
+    # 변경
+    # ------------------------------------------------------------------
+    def _buckets(self, entry: ReservationEntry) -> List[List[Interval]]:
+        if entry.seat_id is not None:
+            buckets = [self._by_seat.setdefault(entry.seat_id, [])]
+            student_index = self._by_student_seat
+        else:
+            buckets = [self._by_room.setdefault(entry.meeting_room_id, [])]
+            student_index = self._by_student_room
+        buckets.extend(student_index.setdefault(sid, []) for sid in entry.student_ids)
+        return buckets
+
+    def _discard(self, reservation_id: int) -> None:
+        entry = self._entries.pop(reservation_id, None)
+        if entry is not None:
+            for intervals in self._buckets(entry):
+                _remove_interval(intervals, entry.interval)
+
+    def _put(self, entry: ReservationEntry) -> None:
+        self._discard(entry.reservation_id)
+        self._entries[entry.reservation_id] = entry
+        for intervals in self._buckets(entry):
+            insort(intervals, entry.interval)
+
+    def apply(self, changes: Dict[int, Optional[ReservationEntry]]) -> None:
+        """커밋된 변경 반영 (None이면 활성 예약에서 제외)"""
+        with self._lock:
+            for reservation_id, entry in changes.items():
+                if entry is None:
+                    self._discard(reservation_id)
+                else:
+                    self._put(entry)
+
+    def replace(self, entries: Iterable[ReservationEntry]) -> None:
+        """전체 교체"""
+        with self._lock:
+            self._entries.clear()
+            self._by_seat.clear()
+            self._by_room.clear()
+            self._by_student_seat.clear()
+            self._by_student_room.clear()
+            for entry in entries:
+                self._put(entry)
+            self.rebuilt_at = datetime.now(timezone.utc)
+
+    def clear(self) -> None:
+        self.replace([])
+
+    def prune(self, now: datetime) -> int:
+        """종료 시각이 지난 예약 제거 (스케줄러의 자동 종료와 함께 호출)"""
+        now_minute = to_epoch_minutes(now)
+        with self._lock:
+            ended = [rid for rid, entry in self._entries.items() if entry.end_minute <= now_minute]
+            for reservation_id in ended:
+                self._discard(reservation_id)
+        return len(ended)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def seat_conflict(self, seat_id: int, start_time: datetime, end_time: datetime) -> List[int]:
+        """좌석의 동일 시간대 활성 예약 ID (없으면 빈 목록)"""
+        with self._lock:
+            return _overlapping(
+                self._by_seat.get(seat_id, []),
+                to_epoch_minutes(start_time),
+                to_epoch_minutes(end_time),
+            )
+
+    def room_conflict(self, room_id: int, start_time: datetime, end_time: datetime) -> List[int]:
+        """회의실의 동일 시간대 활성 예약 ID (없으면 빈 목록)"""
+        with self._lock:
+            return _overlapping(
+                self._by_room.get(room_id, []),
+                to_epoch_minutes(start_time),
+                to_epoch_minutes(end_time),
+            )
+
+    def student_conflict(
+        self,
+        student_id: int,
+        start_time: datetime,
+        end_time: datetime,
+        include_seats: bool = True,
+        include_meeting_rooms: bool = True,
+    ) -> List[int]:
+        """학생의 동일 시간대 활성 예약(좌석 / 회의실 예약자·참여자) ID (없으면 빈 목록)"""
+        start_minute = to_epoch_minutes(start_time)
+        end_minute = to_epoch_minutes(end_time)
+        found = []
+        with self._lock:
+            if include_seats:
+                found += _overlapping(self._by_student_seat.get(student_id, []), start_minute, end_minute)
+            if include_meeting_rooms:
+                found += _overlapping(self._by_student_room.get(student_id, []), start_minute, end_minute)
+        return found
+
+    def get(self, reservation_id: int) -> Optional[ReservationEntry]:
+        with self._lock:
+            return self._entries.get(reservation_id)
+
+    def entries(self) -> Dict[int, ReservationEntry]:
+        with self._lock:
+            return dict(self._entries)
+
+
+# ---------------------------------------------------------------------------
+# DB 로드 / 비교
+# ---------------------------------------------------------------------------
+def load_entries(db: Session, reservation_ids: Optional[Iterable[int]] = None) -> Dict[int, ReservationEntry]:
+    """DB의 활성 예약을 ReservationEntry로 로드 (reservation_ids를 주면 해당 예약만)"""
+    reservation = models.Reservation
+    participant = models.ReservationParticipant
+
+    stmt = select(
+        reservation.reservation_id,
+        reservation.student_id,
+        reservation.seat_id,
+        reservation.meeting_room_id,
+        reservation.start_minute,
+        reservation.end_minute,
+    ).where(reservation.status.in_(ACTIVE_STATUSES))
+    participant_stmt = (
+        select(participant.reservation_id, participant.participant_student_id)
+        .join(reservation, reservation.reservation_id == participant.reservation_id)
+        .where(reservation.status.in_(ACTIVE_STATUSES))
+    )
+    if reservation_ids is not None:
+        reservation_ids = list(reservation_ids)
+        stmt = stmt.where(reservation.reservation_id.in_(reservation_ids))
+        participant_stmt = participant_stmt.where(participant.reservation_id.in_(reservation_ids))
+
+    # 세션 이벤트 안에서도 호출되므로 autoflush 없이 커넥션으로 직접 조회
+    connection = db.connection()
+    participants: Dict[int, List[int]] = {}
+    for row in connection.execute(participant_stmt):
+        participants.setdefault(row.reservation_id, []).append(row.participant_student_id)
+
+    entries = {}
+    for row in connection.execute(stmt):
+        student_ids = [row.student_id] + [
+            sid for sid in participants.get(row.reservation_id, []) if sid != row.student_id
+        ]
+        entries[row.reservation_id] = ReservationEntry(
+            reservation_id=row.reservation_id,
+            student_ids=tuple(student_ids),
+            seat_id=row.seat_id,
+            meeting_room_id=row.meeting_room_id,
+            start_minute=row.start_minute,
+            end_minute=row.end_minute,
+        )
+    return entries
+
+
+def rebuild(sessions: Iterable[Session]) -> int:
+    """DB(샤딩 모드에서는 모든 샤드)에서 활성 예약을 다시 읽어 인덱스 전체 교체"""
+    entries: Dict[int, ReservationEntry] = {}
+    for db in sessions:
+        entries.update(load_entries(db))
+    active_index.replace(entries.values())
+    return len(entries)
+
+
+def confirm_conflict(db: Session, lookup: Callable[[], List[int]]) -> bool:
+    """
+    인덱스 충돌 후보를 커밋된 DB 상태로 다시 확인
+
+    lookup은 인덱스 조회(seat_conflict 등)를 감싼 함수입니다. 후보 예약을 DB(샤딩 모드에서는
+    모든 샤드)에서 다시 읽어 인덱스를 고친 뒤 다시 조회하므로, 다른 워커에서 취소·변경된
+    예약 때문에 거절하지 않습니다. 후보가 없으면 DB를 읽지 않습니다.
+
+    Returns:
+        DB에서도 활성인 예약과 겹치면 True
+    """
+    candidates = lookup()
+    if not candidates:
+        return False
+
+    loaded: Dict[int, ReservationEntry] = {}
+    with reservation_sessions(db) as sessions:
+        for session in sessions:
+            loaded.update(load_entries(session, candidates))
+    stale = [rid for rid in candidates if loaded.get(rid) != active_index.get(rid)]
+    if not stale:
+        return True
+
+    metrics.RESERVATION_INDEX_REPAIRS.inc(len(stale))
+    active_index.apply({rid: loaded.get(rid) for rid in stale})
+    return bool(lookup())
+
+
+def verify(sessions: Iterable[Session]) -> Dict[str, List[int]]:
+    """
+    DB와 인덱스 비교
+
+    Returns:
+        {"missing": DB에만 있는 예약, "stale": 인덱스에만 있는 예약, "mismatched": 내용이 다른 예약}
+    """
+    expected: Dict[int, ReservationEntry] = {}
+    for db in sessions:
+        expected.update(load_entries(db))
+    actual = active_index.entries()
+
+    return {
+        "missing": sorted(set(expected) - set(actual)),
+        "stale": sorted(set(actual) - set(expected)),
+        "mismatched": sorted(
+            rid for rid in set(expected) & set(actual)
+            if expected[rid].student_ids != actual[rid].student_ids
+            or expected[rid].interval != actual[rid].interval
+            or expected[rid].seat_id != actual[rid].seat_id
+            or expected[rid].meeting_room_id != actual[rid].meeting_room_id
+        ),
+    }
+
+
+# ---------------------------------------------------------------------------
+# 세션 이벤트 (커밋 시 반영)
+# ---------------------------------------------------------------------------
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_reservations(session: Session, flush_context) -> None:
+    """플러시된 예약/참여자 변경의 reservation_id 수집"""
+    if not settings.RESERVATION_INDEX_ENABLED:
+        return
+
+    touched = set()
+    deleted = set()
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, (models.Reservation, models.ReservationParticipant)):
+            touched.add(obj.reservation_id)
+    for obj in session.deleted:
+        if isinstance(obj, models.Reservation):
+            deleted.add(obj.reservation_id)
+
+    touched.discard(None)
+    if not touched:
+        return
+
+    _stage(session, touched, deleted)
+
+
+def stage_bulk_changes(session: Session, reservation_ids: Iterable[int]) -> None:
+    """
+    일괄 UPDATE로 바꾼 예약을 커밋 시 인덱스에 반영하도록 등록 (UPDATE 실행 후 호출)
+
+    세션 이벤트와 같은 대기 목록을 쓰므로 롤백하면 함께 버려집니다.
+    """
+    if not settings.RESERVATION_INDEX_ENABLED:
+        return
+    _stage(session, set(reservation_ids), set())
+
+
+def _stage(session: Session, touched: set, deleted: set) -> None:
+    # 현재 트랜잭션의 DB 상태로 엔트리를 만들어 두고 커밋 시 반영
+    pending = session.info.setdefault(PENDING_KEY, {})
+    loaded = load_entries(session, touched - deleted)
+    for reservation_id in touched:
+        pending[reservation_id] = loaded.get(reservation_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_committed_reservations(session: Session) -> None:
+    pending = session.info.pop(PENDING_KEY, None)
+    if pending:
+        active_index.apply(pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_reservations(session: Session) -> None:
+    session.info.pop(PENDING_KEY, None)
+
+
+active_index = ActiveReservationIndex()
+
+metrics.registry.register(metrics.Gauge(
+    "reservation_index_entries", "활성 예약 메모리 인덱스 크기", function=lambda: len(active_index),
+))
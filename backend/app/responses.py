@@ -0,0 +1,30 @@
+"""
+responses.py - JSON Response Helpers
+====================================
+응답 직렬화 비용을 줄이기 위한 응답 클래스와 성공 응답 envelope 빌더.
+
+- DefaultJSONResponse: 앱 기본 응답 클래스. orjson이 있으면 ORJSONResponse(표준 json 인코더보다 빠름),
+  없으면 JSONResponse로 동작합니다.
+- envelope(payload): 서비스가 이미 스키마 객체로 만든 payload를 ApiResponse 형식의 JSON 바이트로 바로 만듭니다.
+  엔드포인트가 Response를 반환하면 FastAPI는 response_model 재검증과 jsonable_encoder 단계를 건너뛰므로,
+  response_model은 OpenAPI 문서용으로만 남습니다. 직렬화는 pydantic-core가 하므로 형식은 기존 응답과 같습니다.
+  (좌석 현황처럼 payload가 큰 조회 엔드포인트용 - 비교: python -m benchmarks.bench_responses)
+"""
+
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
+from pydantic import BaseModel
+
+try:
+    import orjson  # noqa: F401
+except ImportError:  # orjson 미설치 환경에서는 표준 json 인코더 사용
+    DefaultJSONResponse = JSONResponse
+else:
+    DefaultJSONResponse = ORJSONResponse
+
+_SUCCESS_PREFIX = b'{"is_success":true,"code":null,"payload":'
+
+
+def envelope(payload: BaseModel, status_code: int = 200) -> Response:
+    """성공 응답 {"is_success": true, "code": null, "payload": ...} (payload 재검증 없이 직렬화)"""
+    body = _SUCCESS_PREFIX + type(payload).__pydantic_serializer__.to_json(payload) + b"}"
+    return Response(content=body, status_code=status_code, media_type="application/json")
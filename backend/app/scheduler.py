@@ -2,55 +2,126 @@
 app/scheduler.py
 ================
 백그라운드 스케줄러 설정
-매 분마다 예약 상태를 자동으로 변경합니다.
+매 분마다 예약 상태를 자동으로 변경하고, 매일 오래된 예약을 아카이브합니다.
 """
+import time
 from datetime import datetime, timezone
 from sqlalchemy import update
 from sqlalchemy.orm import Session
 from apscheduler.schedulers.background import BackgroundScheduler
 
+from app import metrics, reservation_index
+from app.config import settings
 from app.database import SessionLocal
-from app.models import Reservation, ReservationStatus
+from app.models import Reservation, ReservationStatus, UserReservationIndex
+from app.services import archive_service, waitlist_service
+from app.sharding import shard_router
 
-def update_reservation_status():
+
+def _sync_status(db: Session, model, now: datetime) -> None:
     """
-    예약 상태 자동 동기화 작업 (Bulk Update)
+    예약 상태 일괄 전환 (reservations 또는 샤딩 모드의 user_reservation_index)
     1. 시작 시간 도래 -> IN_USE (자동 시작)
     2. 종료 시간 도래 -> COMPLETED (자동 종료)
     """
+    # 1. [자동 시작] 예약 시간이 된 건들 -> '사용 중'으로 일괄 변경
+    # "착한 사용자" 가정: 예약했으면 무조건 왔다고 침
+    started = db.execute(
+        update(model)
+        .where(
+            model.status == ReservationStatus.RESERVED,
+            model.start_time <= now
+        )
+        .values(status=ReservationStatus.IN_USE)
+    )
+
+    # 2. [자동 종료] 끝날 시간이 된 건들 -> '완료'로 일괄 변경
+    # "사용 중"인 것만 완료 처리 (취소된 건 건드리지 않음)
+    completed = db.execute(
+        update(model)
+        .where(
+            model.status == ReservationStatus.IN_USE,
+            model.end_time <= now
+        )
+        .values(status=ReservationStatus.COMPLETED)
+    )
+
+    labels = {"job": "update_reservation_status", "table": model.__tablename__}
+    metrics.SCHEDULER_ROWS_UPDATED.inc(started.rowcount, change="started", **labels)
+    metrics.SCHEDULER_ROWS_UPDATED.inc(completed.rowcount, change="completed", **labels)
+
+
+def update_reservation_status():
+    """
+    예약 상태 자동 동기화 작업 (Bulk Update)
+    샤딩 모드에서는 건물 샤드마다, 그리고 메인 DB의 사용자 인덱스에도 적용합니다.
+    """
     db: Session = SessionLocal()
+    job_started = time.perf_counter()
+    outcome = "success"
     try:
         now = datetime.now(timezone.utc)
-        
-        # 1. [자동 시작] 예약 시간이 된 건들 -> '사용 중'으로 일괄 변경
-        # "착한 사용자" 가정: 예약했으면 무조건 왔다고 침
-        db.execute(
-            update(Reservation)
-            .where(
-                Reservation.status == ReservationStatus.RESERVED,
-                Reservation.start_time <= now
-            )
-            .values(status=ReservationStatus.IN_USE)
-        )
 
-        # 2. [자동 종료] 끝날 시간이 된 건들 -> '완료'로 일괄 변경
-        # "사용 중"인 것만 완료 처리 (취소된 건 건드리지 않음)
-        db.execute(
-            update(Reservation)
-            .where(
-                Reservation.status == ReservationStatus.IN_USE,
-                Reservation.end_time <= now
-            )
-            .values(status=ReservationStatus.COMPLETED)
+        _sync_status(db, Reservation, now)
+        expired = waitlist_service.expire_waiting(db, now)
+        metrics.SCHEDULER_ROWS_UPDATED.inc(
+            expired, job="update_reservation_status", table="seat_waitlist", change="expired",
         )
-            
+        if settings.SHARDING_ENABLED:
+            _sync_status(db, UserReservationIndex, now)
         db.commit()
-        
+
+        if settings.SHARDING_ENABLED:
+            for building_id in shard_router.building_ids():
+                shard = shard_router.session(building_id)
+                try:
+                    _sync_status(shard, Reservation, now)
+                    shard.commit()
+                except Exception as e:
+                    print(f"[Scheduler Error] building {building_id}: {e}")
+                    shard.rollback()
+                finally:
+                    shard.close()
+
+        # 종료된 예약은 더 이상 충돌 대상이 아니므로 메모리 인덱스에서 제거
+        reservation_index.active_index.prune(now)
+
     except Exception as e:
+        outcome = "error"
         print(f"[Scheduler Error] {e}")
         db.rollback()
     finally:
         db.close()
+        metrics.SCHEDULER_JOB_DURATION.observe(
+            time.perf_counter() - job_started, job="update_reservation_status", outcome=outcome,
+        )
+
+def archive_old_reservations():
+    """
+    예약 아카이빙 작업 (Cold Storage)
+    보존 기간(settings.ARCHIVE_RETENTION_DAYS)이 지난 COMPLETED/CANCELED 예약을
+    참여자와 함께 아카이브 테이블로 배치 이동합니다.
+    """
+    db: Session = SessionLocal()
+    job_started = time.perf_counter()
+    outcome = "success"
+    try:
+        moved = archive_service.archive_reservations(db)
+        metrics.SCHEDULER_ROWS_UPDATED.inc(
+            moved, job="archive_old_reservations", table="reservations", change="archived",
+        )
+        if moved:
+            print(f"[Scheduler] Archived {moved} reservations.")
+
+    except Exception as e:
+        outcome = "error"
+        print(f"[Scheduler Error] {e}")
+        db.rollback()
+    finally:
+        db.close()
+        metrics.SCHEDULER_JOB_DURATION.observe(
+            time.perf_counter() - job_started, job="archive_old_reservations", outcome=outcome,
+        )
 
 # 백그라운드 스케줄러 인스턴스 생성
 scheduler = BackgroundScheduler()
\ No newline at end of file
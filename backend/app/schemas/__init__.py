@@ -19,6 +19,10 @@ from .seat import (
     SeatCreate,
     SeatReservationCreate,
     SeatReservationResponse,
+    SeatReservationBatchCreate,
+    SeatReservationBatchItem,
+    SeatReservationBatchResponse,
+    SeatWaitlistResponse,
     SeatResponse,
 )
 
@@ -26,7 +30,10 @@ from .seat import (
 from .meeting_room import (
     MeetingRoomResponse,
     MeetingRoomReservationCreate,
+    MeetingRoomSeriesCreate,
+    MeetingRoomSeriesResponse,
     ParticipantBase,
+    SeriesOccurrenceResult,
 )
 
 # Reservation
@@ -48,6 +55,25 @@ from .status import (
     SeatSeatStatus,
     SeatStatusPayload,
 )
+
+# Admin
+from .admin import (
+    AdminBuildingItem,
+    AdminBulkReservationItem,
+    AdminBulkReservationPayload,
+    AdminBulkReservationRequest,
+    AdminFacilityAvailabilityPayload,
+    AdminFacilityAvailabilityRequest,
+    AdminFacilityRegistryPayload,
+    AdminLockPhaseStats,
+    AdminLockProfilePayload,
+    AdminLockSectionProfile,
+    AdminReadingRoomItem,
+    AdminReservationIndexPayload,
+    AdminReservationItem,
+    AdminReservationsPayload,
+)
+
 __all__ = [
     "ApiResponse",
     "ErrorPayload",
@@ -58,8 +84,15 @@ __all__ = [
     "SeatResponse",
     "SeatReservationCreate",
     "SeatReservationResponse",
+    "SeatReservationBatchCreate",
+    "SeatReservationBatchItem",
+    "SeatReservationBatchResponse",
+    "SeatWaitlistResponse",
     "MeetingRoomResponse",
     "MeetingRoomReservationCreate",
+    "MeetingRoomSeriesCreate",
+    "MeetingRoomSeriesResponse",
+    "SeriesOccurrenceResult",
     "ParticipantBase",
     "ReservationResponse",
     "ReservationBase",
@@ -73,4 +106,18 @@ __all__ = [
     "SeatSlotStatus",
     "SeatSeatStatus",
     "SeatStatusPayload",
+    "AdminBuildingItem",
+    "AdminBulkReservationItem",
+    "AdminBulkReservationPayload",
+    "AdminBulkReservationRequest",
+    "AdminFacilityAvailabilityPayload",
+    "AdminFacilityAvailabilityRequest",
+    "AdminFacilityRegistryPayload",
+    "AdminLockPhaseStats",
+    "AdminLockProfilePayload",
+    "AdminLockSectionProfile",
+    "AdminReadingRoomItem",
+    "AdminReservationIndexPayload",
+    "AdminReservationItem",
+    "AdminReservationsPayload",
 ]
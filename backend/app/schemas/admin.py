@@ -0,0 +1,255 @@
+"""
+schemas/admin.py - Admin Schemas
+================================
+관리자 전체 예약 조회 / 일괄 취소·이동 / 시설 레지스트리·이용 가능 여부 / 예약 인덱스 스키마
+"""
+
+from datetime import date as Date
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field, model_validator
+
+from app import facility_registry
+from app.constants import ReservationType
+
+# 일괄 작업 한 번에 지정할 수 있는 최대 기간 (일)
+BULK_MAX_RANGE_DAYS = 31
+
+
+class AdminReservationItem(BaseModel):
+    """관리자 예약 목록 아이템 (회의실/좌석 통합)"""
+
+    reservation_id: int = Field(..., description="예약 ID")
+    type: str = Field(..., description="예약 유형 (meeting_room | seat)")
+    room_id: Optional[int] = Field(None, description="회의실 ID (type=meeting_room일 때)")
+    seat_id: Optional[int] = Field(None, description="좌석 ID (type=seat일 때)")
+    student_id: int = Field(..., description="예약자 학번")
+    date: str = Field(..., description="예약 날짜 (YYYY-MM-DD)")
+    start_time: str = Field(..., description="시작 시간 (HH:MM)")
+    end_time: str = Field(..., description="종료 시간 (HH:MM)")
+    status: str = Field(..., description="예약 상태")
+    created_at: Optional[str] = Field(None, description="생성 일시 (KST)")
+
+
+class AdminReservationsPayload(BaseModel):
+    """관리자 예약 목록 응답"""
+
+    items: List[AdminReservationItem] = Field(default_factory=list, description="예약 목록")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
+
+
+class AdminBulkReservationRequest(BaseModel):
+    """
+    관리자 예약 일괄 취소 / 이동 요청 (RESERVED 상태 예약 대상)
+
+    - 대상: type + 기간(from_date ~ to_date, KST) + 시설(facility_ids 또는 reading_room_id)
+    - move: shift_minutes만큼 시간을 옮기거나 target 시설로 재배정 (둘 다 가능)
+    - dry_run이면 같은 검증을 거친 결과만 보고하고 변경하지 않음
+    """
+
+    action: Literal["cancel", "move"] = Field(..., description="작업 (cancel | move)")
+    dry_run: bool = Field(True, description="결과만 미리 확인 (기본 true)")
+    type: Literal["seat", "meeting_room"] = Field(..., description="예약 유형 (meeting_room | seat)")
+    from_date: Date = Field(..., description="대상 시작 날짜 (YYYY-MM-DD, KST)")
+    to_date: Date = Field(..., description="대상 종료 날짜 (YYYY-MM-DD, KST, 포함)")
+    facility_ids: Optional[List[int]] = Field(None, min_length=1, description="대상 좌석/회의실 ID")
+    reading_room_id: Optional[int] = Field(None, description="대상 열람실 ID (type=seat일 때)")
+    shift_minutes: int = Field(0, description="이동할 시간 (분, 60분 단위)")
+    target_facility_ids: Optional[List[int]] = Field(
+        None, min_length=1, description="재배정할 좌석/회의실 ID (앞에서부터 빈 곳에 배정)"
+    )
+    target_reading_room_id: Optional[int] = Field(None, description="재배정할 열람실 ID (type=seat일 때)")
+
+    @model_validator(mode="after")
+    def validate_bulk_rules(self):
+        if self.to_date < self.from_date:
+            raise ValueError("종료 날짜는 시작 날짜보다 빠를 수 없습니다.")
+        if (self.to_date - self.from_date).days >= BULK_MAX_RANGE_DAYS:
+            raise ValueError(f"기간은 최대 {BULK_MAX_RANGE_DAYS}일까지 지정할 수 있습니다.")
+
+        if self.facility_ids is not None and self.reading_room_id is not None:
+            raise ValueError("facility_ids와 reading_room_id는 함께 지정할 수 없습니다.")
+        if self.target_facility_ids is not None and self.target_reading_room_id is not None:
+            raise ValueError("target_facility_ids와 target_reading_room_id는 함께 지정할 수 없습니다.")
+
+        reading_rooms = facility_registry.get_snapshot().reading_rooms
+        for room_id in (self.reading_room_id, self.target_reading_room_id):
+            if room_id is None:
+                continue
+            if self.type != ReservationType.SEAT:
+                raise ValueError("열람실 지정은 좌석 예약에만 사용할 수 있습니다.")
+            if room_id not in reading_rooms:
+                raise ValueError(f"존재하지 않는 열람실입니다. ({room_id})")
+
+        has_target = self.target_facility_ids is not None or self.target_reading_room_id is not None
+        if self.action == "move":
+            if self.shift_minutes % 60 != 0:
+                raise ValueError("이동 시간은 60분 단위여야 합니다.")
+            if self.shift_minutes == 0 and not has_target:
+                raise ValueError("이동 시간 또는 재배정할 시설을 지정해야 합니다.")
+        elif self.shift_minutes or has_target:
+            raise ValueError("취소 작업에는 이동 옵션을 지정할 수 없습니다.")
+        return self
+
+    def source_facility_ids(self) -> Optional[List[int]]:
+        """대상 시설 ID (None이면 해당 유형 전체)"""
+        return _facility_ids(self.facility_ids, self.reading_room_id)
+
+    def target_pool(self) -> Optional[List[int]]:
+        """재배정 후보 시설 ID (None이면 원래 시설 유지)"""
+        return _facility_ids(self.target_facility_ids, self.target_reading_room_id)
+
+
+def _facility_ids(facility_ids: Optional[List[int]], reading_room_id: Optional[int]) -> Optional[List[int]]:
+    if reading_room_id is not None:
+        room = facility_registry.get_snapshot().reading_rooms[reading_room_id]
+        return list(range(room.seat_min_id, room.seat_max_id + 1))
+    return list(facility_ids) if facility_ids is not None else None
+
+
+class AdminBulkReservationItem(BaseModel):
+    """일괄 작업 대상 예약별 결과"""
+
+    reservation_id: int = Field(..., description="예약 ID")
+    student_id: int = Field(..., description="예약자 학번")
+    facility_id: int = Field(..., description="좌석/회의실 ID")
+    date: str = Field(..., description="예약 날짜 (YYYY-MM-DD)")
+    start_time: str = Field(..., description="시작 시간 (HH:MM)")
+    end_time: str = Field(..., description="종료 시간 (HH:MM)")
+    new_facility_id: Optional[int] = Field(None, description="이동 후 좌석/회의실 ID (move)")
+    new_date: Optional[str] = Field(None, description="이동 후 날짜 (move)")
+    new_start_time: Optional[str] = Field(None, description="이동 후 시작 시간 (move)")
+    new_end_time: Optional[str] = Field(None, description="이동 후 종료 시간 (move)")
+    code: Optional[str] = Field(None, description="실패 코드 (성공 시 null)")
+    message: Optional[str] = Field(None, description="실패 사유")
+
+
+class AdminBulkReservationPayload(BaseModel):
+    """일괄 취소 / 이동 결과"""
+
+    action: str = Field(..., description="작업 (cancel | move)")
+    dry_run: bool = Field(..., description="미리 보기 여부 (true면 변경되지 않음)")
+    matched: int = Field(..., description="조건에 맞는 예약 수")
+    succeeded: int = Field(..., description="처리(미리 보기에서는 처리 가능)된 예약 수")
+    failed: int = Field(..., description="검증에 실패해 그대로 남는 예약 수")
+    items: List[AdminBulkReservationItem] = Field(default_factory=list, description="예약별 결과")
+
+
+class AdminFacilityAvailabilityRequest(BaseModel):
+    """
+    시설 이용 가능 여부 일괄 변경 요청
+
+    대상은 facility_ids, from_id ~ to_id 범위(예: 좌석 한 줄), reading_room_id(좌석) 중 하나로 지정합니다.
+    """
+
+    type: Literal["seat", "meeting_room"] = Field(..., description="시설 유형 (meeting_room | seat)")
+    is_available: bool = Field(..., description="변경할 이용 가능 여부")
+    facility_ids: Optional[List[int]] = Field(None, min_length=1, description="대상 좌석/회의실 ID")
+    from_id: Optional[int] = Field(None, ge=1, description="대상 ID 범위 시작")
+    to_id: Optional[int] = Field(None, ge=1, description="대상 ID 범위 끝 (포함)")
+    reading_room_id: Optional[int] = Field(None, description="대상 열람실 ID (type=seat일 때)")
+
+    @model_validator(mode="after")
+    def validate_target(self):
+        has_range = self.from_id is not None or self.to_id is not None
+        selectors = [self.facility_ids is not None, has_range, self.reading_room_id is not None]
+        if sum(selectors) != 1:
+            raise ValueError("facility_ids, from_id~to_id, reading_room_id 중 하나만 지정해야 합니다.")
+        if has_range and (self.from_id is None or self.to_id is None or self.to_id < self.from_id):
+            raise ValueError("from_id와 to_id를 함께, from_id <= to_id로 지정해야 합니다.")
+        if self.reading_room_id is not None:
+            if self.type != ReservationType.SEAT:
+                raise ValueError("열람실 지정은 좌석에만 사용할 수 있습니다.")
+            if self.reading_room_id not in facility_registry.get_snapshot().reading_rooms:
+                raise ValueError(f"존재하지 않는 열람실입니다. ({self.reading_room_id})")
+        return self
+
+    def target_ids(self) -> List[int]:
+        """대상 시설 ID"""
+        if self.from_id is not None:
+            return list(range(self.from_id, self.to_id + 1))
+        return _facility_ids(self.facility_ids, self.reading_room_id)
+
+
+class AdminFacilityAvailabilityPayload(BaseModel):
+    """시설 이용 가능 여부 변경 결과"""
+
+    type: str = Field(..., description="시설 유형 (meeting_room | seat)")
+    is_available: bool = Field(..., description="변경한 이용 가능 여부")
+    updated_ids: List[int] = Field(default_factory=list, description="변경된 시설 ID (이미 같은 상태였던 시설 제외)")
+    not_found_ids: List[int] = Field(default_factory=list, description="등록되지 않은 시설 ID")
+    disabled_count: int = Field(..., description="변경 후 이용 불가 시설 수 (해당 유형)")
+    version: int = Field(..., description="이용 가능 여부 캐시 버전")
+
+
+class AdminReadingRoomItem(BaseModel):
+    """열람실 정보 (좌석 번호 범위)"""
+
+    reading_room_id: int = Field(..., description="열람실 ID")
+    name: str = Field(..., description="열람실 이름")
+    seat_min_id: int = Field(..., description="시작 좌석 번호")
+    seat_max_id: int = Field(..., description="마지막 좌석 번호")
+
+
+class AdminBuildingItem(BaseModel):
+    """건물별 시설 구성"""
+
+    building_id: int = Field(..., description="건물 ID")
+    name: str = Field(..., description="건물 이름")
+    reading_rooms: List[AdminReadingRoomItem] = Field(default_factory=list, description="열람실 목록")
+    meeting_room_ids: List[int] = Field(default_factory=list, description="회의실 ID 목록")
+
+
+class AdminFacilityRegistryPayload(BaseModel):
+    """시설 레지스트리 스냅샷 응답"""
+
+    buildings: List[AdminBuildingItem] = Field(default_factory=list, description="건물 목록")
+    seat_count: int = Field(..., description="등록된 좌석 수")
+    meeting_room_count: int = Field(..., description="등록된 회의실 수")
+    loaded_at: Optional[str] = Field(None, description="스냅샷 로드 시각 (UTC, ISO 8601)")
+    disabled_seat_ids: List[int] = Field(default_factory=list, description="이용 불가 좌석 ID")
+    disabled_meeting_room_ids: List[int] = Field(default_factory=list, description="이용 불가 회의실 ID")
+
+
+class AdminLockPhaseStats(BaseModel):
+    """쓰기 락 구간 단계별 통계 (백분위는 최근 표본 기준)"""
+
+    phase: str = Field(..., description="단계 이름 (lock_wait / hold / 검증 단계 / commit / rollback)")
+    count: int = Field(..., description="누적 횟수")
+    total_ms: float = Field(..., description="누적 시간 (ms)")
+    share: float = Field(..., description="보유 시간(hold) 누적 대비 비중")
+    p50_ms: float = Field(..., description="50 백분위 (ms)")
+    p95_ms: float = Field(..., description="95 백분위 (ms)")
+    p99_ms: float = Field(..., description="99 백분위 (ms)")
+    max_ms: float = Field(..., description="최댓값 (ms)")
+
+
+class AdminLockSectionProfile(BaseModel):
+    """쓰기 락 구간 프로파일"""
+
+    section: str = Field(..., description="구간 이름 (예: seat.reserve)")
+    commits: int = Field(..., description="커밋으로 끝난 횟수")
+    rollbacks: int = Field(..., description="롤백으로 끝난 횟수")
+    lock_wait: AdminLockPhaseStats = Field(..., description="락 획득 대기")
+    hold: AdminLockPhaseStats = Field(..., description="락 보유 전체")
+    phases: List[AdminLockPhaseStats] = Field(default_factory=list, description="보유 구간 단계별 통계 (실행 순서)")
+
+
+class AdminLockProfilePayload(BaseModel):
+    """쓰기 락 경합 프로파일 응답"""
+
+    enabled: bool = Field(..., description="프로파일러 활성화 여부 (LOCK_PROFILER_ENABLED)")
+    since: str = Field(..., description="집계 시작 시각 (UTC, ISO 8601)")
+    sample_size: int = Field(..., description="단계별 백분위 계산에 쓰는 최근 표본 수")
+    sections: List[AdminLockSectionProfile] = Field(default_factory=list, description="보유 시간 누적이 큰 순")
+
+
+class AdminReservationIndexPayload(BaseModel):
+    """활성 예약 메모리 인덱스 점검 결과"""
+
+    indexed: int = Field(..., description="인덱스에 있는 활성 예약 수")
+    consistent: bool = Field(..., description="DB와 일치 여부")
+    missing: List[int] = Field(default_factory=list, description="DB에만 있는 예약 ID")
+    stale: List[int] = Field(default_factory=list, description="인덱스에만 있는 예약 ID")
+    mismatched: List[int] = Field(default_factory=list, description="내용이 다른 예약 ID")
+    rebuilt_at: Optional[str] = Field(None, description="마지막 전체 재구성 시각 (UTC, ISO 8601)")
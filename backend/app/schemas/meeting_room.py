@@ -4,18 +4,19 @@ schemas/meeting_room.py - Meeting Room Schemas
 회의실 정보 및 예약 요청 스키마
 """
 
-from typing import List, Self, Optional
+from typing import List, Literal, Self, Optional
 from datetime import date as Date, time as Time, datetime, timedelta
 from pydantic import BaseModel, Field, model_validator, field_validator
 
-from app.constants import OperationHours, ReservationLimits, FacilityConstants
+from app import facility_registry
+from app.constants import OperationHours, ReservationLimits
 from app.schemas.user import UserBase
 
 # -------------------------------------------------------------------
 # 1. Meeting Room Entity Schemas
 # -------------------------------------------------------------------
 class MeetingRoomBase(BaseModel):
-    room_id: int = Field(..., description="회의실 ID (1-3)")
+    room_id: int = Field(..., description="회의실 ID")
     min_capacity: int = Field(3, description="최소 수용 인원")
     max_capacity: int = Field(6, description="최대 수용 인원")
     is_available: bool = Field(True, description="사용 가능 여부")
@@ -51,16 +52,17 @@ class MeetingRoomReservationCreate(BaseModel):
     )
     
     # ---------------------------------------------------------
-    # 회의실 ID 검증 (Constants 기반)
+    # 회의실 ID 검증 (시설 레지스트리 기반)
     # ---------------------------------------------------------
     @field_validator("room_id")
     @classmethod
     def validate_room_id(cls, v: int) -> int:
         """
-        입력된 room_id가 constants.py에 정의된 유효한 ID 목록에 있는지 확인
+        입력된 room_id가 시설 레지스트리에 등록된 회의실인지 확인
         """
-        allowed_ids = FacilityConstants.MEETING_ROOM_IDS
-        if v not in allowed_ids:
+        snapshot = facility_registry.get_snapshot()
+        if not snapshot.has_meeting_room(v):
+            allowed_ids = list(snapshot.sorted_meeting_room_ids)
             raise ValueError(f"유효하지 않은 회의실 ID입니다. (허용 ID: {allowed_ids})")
         return v
     
@@ -145,3 +147,103 @@ class MeetingRoomReservationCreate(BaseModel):
                 raise ValueError("현재 시간 이후부터 예약할 수 있습니다.")
             
         return self
+
+
+# -------------------------------------------------------------------
+# 3. Recurring Series Schemas (반복 예약)
+# -------------------------------------------------------------------
+SERIES_STEP_DAYS = {"daily": 1, "weekly": 7}
+
+
+class MeetingRoomSeriesCreate(BaseModel):
+    """
+    회의실 반복 예약 요청
+    - start_date부터 end_date까지 frequency 간격으로 같은 시간대를 예약
+    - 시간 규칙·참여자 검증은 단건 예약(MeetingRoomReservationCreate)과 동일
+    """
+    room_id: int = Field(..., description="회의실 ID")
+    frequency: Literal["daily", "weekly"] = Field(..., description="반복 주기 (daily | weekly)")
+    start_date: Date = Field(..., description="첫 예약 날짜 (YYYY-MM-DD)")
+    end_date: Date = Field(..., description="마지막 예약 가능 날짜 (YYYY-MM-DD, 포함)")
+    start_time: Time = Field(..., description="시작 시간 (HH:MM)")
+    end_time: Time = Field(..., description="종료 시간 (HH:MM)")
+    participants: List[ParticipantBase] = Field(
+        ...,
+        min_length=ReservationLimits.MEETING_ROOM_MIN_PARTICIPANTS,
+        description=f"참여자 목록 (최소 {ReservationLimits.MEETING_ROOM_MIN_PARTICIPANTS}명)",
+    )
+
+    @field_validator("start_date")
+    @classmethod
+    def validate_start_date_not_past(cls, value: Date) -> Date:
+        """과거 날짜부터 시작하는 반복 예약 방지"""
+        if value < Date.today():
+            raise ValueError("과거 날짜는 예약할 수 없습니다.")
+        return value
+
+    @model_validator(mode='after')
+    def check_series_rules(self) -> Self:
+        if self.end_date < self.start_date:
+            raise ValueError("마지막 날짜는 첫 날짜 이후여야 합니다.")
+
+        max_occurrences = ReservationLimits.MEETING_ROOM_SERIES_MAX_OCCURRENCES
+        if self.occurrence_count() > max_occurrences:
+            raise ValueError(f"반복 예약은 최대 {max_occurrences}회까지 가능합니다.")
+
+        # 회의실 ID·시간 규칙·참여자는 단건 예약과 동일한 규칙으로 검증.
+        # 오늘 이미 지난 시간대 같은 날짜별 규칙은 회차 단위 실패로 보고하므로 내일 날짜로 검증
+        probe = MeetingRoomReservationCreate(
+            room_id=self.room_id,
+            date=Date.today() + timedelta(days=1),
+            start_time=self.start_time,
+            end_time=self.end_time,
+            participants=self.participants,
+        )
+        self.start_time = probe.start_time
+        self.end_time = probe.end_time
+        return self
+
+    def occurrence_count(self) -> int:
+        """펼치지 않고 계산한 회차 수 (먼 end_date도 상수 시간)"""
+        step_days = SERIES_STEP_DAYS[self.frequency]
+        return (self.end_date - self.start_date).days // step_days + 1
+
+    def occurrence_dates(self) -> List[Date]:
+        """반복 규칙으로 펼친 예약 날짜 목록"""
+        step = timedelta(days=SERIES_STEP_DAYS[self.frequency])
+        dates = []
+        current = self.start_date
+        while current <= self.end_date:
+            dates.append(current)
+            current += step
+        return dates
+
+    def occurrence_request(self, date: Date) -> MeetingRoomReservationCreate:
+        """회차별 단건 예약 요청 (회차 단위 검증 - 예: 당일 지난 시간)"""
+        return MeetingRoomReservationCreate(
+            room_id=self.room_id,
+            date=date,
+            start_time=self.start_time,
+            end_time=self.end_time,
+            participants=self.participants,
+        )
+
+
+class SeriesOccurrenceResult(BaseModel):
+    """반복 예약 회차별 결과"""
+
+    date: str = Field(..., description="예약 날짜 (YYYY-MM-DD)")
+    reservation_id: Optional[int] = Field(None, description="생성된 예약 ID (실패 시 null)")
+    code: Optional[str] = Field(None, description="실패 사유 코드 (성공 시 null)")
+    message: Optional[str] = Field(None, description="실패 사유 (성공 시 null)")
+
+
+class MeetingRoomSeriesResponse(BaseModel):
+    """반복 예약 생성 결과"""
+
+    series_id: Optional[int] = Field(None, description="반복 예약 ID (생성된 회차가 없으면 null)")
+    room_id: int = Field(..., description="회의실 ID")
+    frequency: str = Field(..., description="반복 주기")
+    created_count: int = Field(..., description="생성된 회차 수")
+    failed_count: int = Field(..., description="실패한 회차 수")
+    occurrences: List[SeriesOccurrenceResult] = Field(default_factory=list, description="회차별 결과")
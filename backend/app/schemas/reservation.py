@@ -62,6 +62,7 @@ class MyReservationsPayload(BaseModel):
     """내 예약 목록 응답"""
 
     items: List[MyReservationItem] = Field(default_factory=list, description="예약 목록")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
 
 
 # -------------------------------------------------------------------
@@ -5,12 +5,12 @@ schemas/seat.py - Seat Schemas
 """
 
 from datetime import date as Date, datetime, time as Time
-from typing import Optional
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+from app import facility_registry
 from app.constants import (
-    FacilityConstants,
     OperationHours,
     ReservationLimits,
     ReservationType,
@@ -32,9 +32,9 @@ class SeatCreate(BaseModel):
     @field_validator("seat_id")
     @classmethod
     def check_seat_range(cls, value: int) -> int:
-        max_id = FacilityConstants.SEAT_MAX_ID
-        if value > max_id:
-            raise ValueError(f"좌석 번호는 {max_id}번까지 생성할 수 있습니다.")
+        # 열람실 좌석 번호 범위(시설 레지스트리)에 속한 좌석만 생성 가능
+        if not facility_registry.get_snapshot().has_seat(value):
+            raise ValueError(f"좌석 번호 {value}번은 등록된 열람실 좌석 범위에 없습니다.")
         return value
 
 
@@ -62,11 +62,9 @@ class SeatReservationCreate(BaseModel):
         if value is None:
             return value
 
-        # seat_id가 있으면 범위 검증
-        if not (FacilityConstants.SEAT_MIN_ID <= value <= FacilityConstants.SEAT_MAX_ID):
-            raise ValueError(
-                f"좌석 번호는 {FacilityConstants.SEAT_MIN_ID}~{FacilityConstants.SEAT_MAX_ID} 범위여야 합니다."
-            )
+        # seat_id가 있으면 시설 레지스트리 등록 여부 검증 (O(1))
+        if not facility_registry.get_snapshot().has_seat(value):
+            raise ValueError(f"존재하지 않는 좌석 번호입니다. ({value}번)")
         return value
 
     @model_validator(mode="after")
@@ -114,3 +112,49 @@ class SeatReservationResponse(BaseModel):
     start_time: str = Field(..., description="시작 시간 (HH:MM)")
     end_time: str = Field(..., description="종료 시간 (HH:MM)")
     status: str = Field(..., description="예약 상태")
+
+
+class SeatReservationBatchCreate(BaseModel):
+    """
+    좌석 일괄 예약 요청
+    - atomic: 모든 항목이 통과해야 함께 생성 (하나라도 실패하면 전체 취소)
+    - best_effort: 통과한 항목만 생성하고 항목별 결과 보고
+    """
+
+    items: List[SeatReservationCreate] = Field(
+        ...,
+        min_length=1,
+        max_length=ReservationLimits.SEAT_BATCH_MAX_ITEMS,
+        description=f"예약 항목 목록 (최대 {ReservationLimits.SEAT_BATCH_MAX_ITEMS}개)",
+    )
+    mode: Literal["atomic", "best_effort"] = Field("atomic", description="처리 방식 (atomic | best_effort)")
+
+
+class SeatReservationBatchItem(BaseModel):
+    """좌석 일괄 예약 항목별 결과"""
+
+    index: int = Field(..., description="요청 items 내 위치 (0부터)")
+    reservation: Optional[SeatReservationResponse] = Field(None, description="생성된 예약 (실패 시 null)")
+    code: Optional[str] = Field(None, description="실패 사유 코드 (성공 시 null)")
+    message: Optional[str] = Field(None, description="실패 사유 (성공 시 null)")
+
+
+class SeatReservationBatchResponse(BaseModel):
+    """좌석 일괄 예약 결과"""
+
+    created_count: int = Field(..., description="생성된 예약 수")
+    failed_count: int = Field(..., description="실패한 항목 수")
+    items: List[SeatReservationBatchItem] = Field(default_factory=list, description="항목별 결과")
+
+
+class SeatWaitlistResponse(BaseModel):
+    """좌석 대기 항목"""
+
+    waitlist_id: int = Field(..., description="대기 ID")
+    seat_id: Optional[int] = Field(None, description="좌석 번호 (아무 좌석 대기 시 null)")
+    date: str = Field(..., description="예약 날짜 (YYYY-MM-DD)")
+    start_time: str = Field(..., description="시작 시간 (HH:MM)")
+    end_time: str = Field(..., description="종료 시간 (HH:MM)")
+    status: str = Field(..., description="대기 상태 (WAITING | PROMOTED | CANCELED | EXPIRED)")
+    position: Optional[int] = Field(None, description="대기 순번 (WAITING일 때, 1부터)")
+    reservation_id: Optional[int] = Field(None, description="전환된 예약 ID (PROMOTED일 때)")
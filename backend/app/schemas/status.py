@@ -30,6 +30,7 @@ class MeetingRoomRoomStatus(BaseModel):
     """회의실 한 개의 전체 슬롯 상태."""
 
     room_id: int = Field(..., description="회의실 ID")
+    is_available: bool = Field(True, description="시설 이용 가능 여부 (관리자가 비활성화하면 false)")
     slots: List[MeetingRoomSlotStatus] = Field(default_factory=list)
 
 
@@ -54,6 +55,7 @@ class SeatSeatStatus(BaseModel):
     """좌석 한 개의 전체 슬롯 상태."""
 
     seat_id: int = Field(..., description="좌석 ID")
+    is_available: bool = Field(True, description="시설 이용 가능 여부 (관리자가 비활성화하면 false)")
     slots: List[SeatSlotStatus] = Field(default_factory=list)
 
 
@@ -11,6 +11,11 @@ from . import seat_service
 from . import meeting_room_service
 from . import reservation_service
 from . import status_service
+from . import archive_service
+from . import admin_service
+from . import shard_service
+from . import series_service
+from . import waitlist_service
 
 __all__ = [
     "user_service",
@@ -18,4 +23,9 @@ __all__ = [
     "meeting_room_service",
     "reservation_service",
     "status_service",
+    "archive_service",
+    "admin_service",
+    "shard_service",
+    "series_service",
+    "waitlist_service",
 ]
@@ -0,0 +1,563 @@
+"""
+services/admin_service.py - Admin Reservation Service
+=====================================================
+관리자 전체 예약 조회 (Keyset Pagination), 스트리밍 내보내기(CSV / NDJSON),
+예약 일괄 취소·이동, 시설 이용 가능 여부 일괄 변경, 활성 예약 메모리 인덱스 점검
+"""
+
+import csv
+import io
+import json
+from datetime import datetime, timedelta, timezone
+from itertools import chain
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import Select, and_, false, or_, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from app import facility_availability, models, reservation_index, schemas
+from app.config import settings
+from app.constants import ErrorCode, OperationHours, ReservationType
+from app.database import begin_immediate
+from app.exceptions import ValidationException
+from app.models import EPOCH, to_epoch_minutes
+from app.services import reservation_service
+from app.sharding import reservation_sessions
+
+KST = timezone(timedelta(hours=9))
+
+# 일괄 이동 시 충돌 검사 대상 상태
+CONFLICT_CHECK_STATUSES = [
+    models.ReservationStatus.RESERVED,
+    models.ReservationStatus.IN_USE,
+]
+
+# (start_minute, end_minute)
+Interval = Tuple[int, int]
+
+# 내보내기 컬럼 순서 (CSV 헤더)
+EXPORT_FIELDS = [
+    "reservation_id",
+    "type",
+    "room_id",
+    "seat_id",
+    "student_id",
+    "date",
+    "start_time",
+    "end_time",
+    "status",
+    "created_at",
+]
+
+# CSV 청크 하나에 담을 행 수
+_CSV_ROWS_PER_CHUNK = 500
+
+
+def _reject_sharded(action: str) -> None:
+    """샤딩 모드에서는 예약이 건물 샤드에 있어 메인 DB 기준 관리자 작업을 거부 (action은 조사 포함)"""
+    if settings.SHARDING_ENABLED:
+        raise ValidationException(
+            code=ErrorCode.VALIDATION_ERROR,
+            message=f"샤딩 모드에서는 {action} 지원하지 않습니다.",
+        )
+
+
+def build_reservation_query(
+    start_from: Optional[datetime] = None,
+    start_before: Optional[datetime] = None,
+    reservation_type: Optional[str] = None,
+    status: Optional[models.ReservationStatus] = None,
+) -> Select:
+    """
+    관리자 예약 조회 공통 쿼리 (시작 시각 오름차순)
+
+    status를 지정하면 idx_status_start (status, start_time [, rowid]) 인덱스 순서가
+    ORDER BY start_time, reservation_id와 일치하므로 정렬 없이 인덱스 스캔만으로 처리됩니다.
+    """
+    Reservation = models.Reservation
+    stmt = select(
+        Reservation.reservation_id,
+        Reservation.student_id,
+        Reservation.meeting_room_id,
+        Reservation.seat_id,
+        Reservation.start_time,
+        Reservation.end_time,
+        Reservation.status,
+        Reservation.created_at,
+    )
+
+    if status is not None:
+        stmt = stmt.where(Reservation.status == status)
+    if start_from is not None:
+        stmt = stmt.where(Reservation.start_time >= start_from)
+    if start_before is not None:
+        stmt = stmt.where(Reservation.start_time < start_before)
+
+    if reservation_type == ReservationType.MEETING_ROOM:
+        stmt = stmt.where(Reservation.meeting_room_id.isnot(None))
+    elif reservation_type == ReservationType.SEAT:
+        stmt = stmt.where(Reservation.seat_id.isnot(None))
+    elif reservation_type is not None:
+        stmt = stmt.where(false())
+
+    return stmt.order_by(Reservation.start_time, Reservation.reservation_id)
+
+
+def list_reservations(
+    db: Session,
+    start_from: Optional[datetime] = None,
+    start_before: Optional[datetime] = None,
+    reservation_type: Optional[str] = None,
+    status: Optional[models.ReservationStatus] = None,
+    limit: int = 50,
+    cursor: Optional[Tuple[datetime, int]] = None,
+) -> List[Row]:
+    """
+    전체 예약 목록 한 페이지 조회 (Keyset: (start_time, reservation_id) > cursor)
+
+    샤딩 모드에서는 메인 DB에 예약이 없어 빈 목록이 되므로 ValidationException으로 거부합니다.
+    """
+    _reject_sharded("예약 목록 조회를")
+    stmt = build_reservation_query(start_from, start_before, reservation_type, status)
+
+    if cursor is not None:
+        cursor_start, cursor_id = cursor
+        stmt = stmt.where(
+            or_(
+                models.Reservation.start_time > cursor_start,
+                and_(
+                    models.Reservation.start_time == cursor_start,
+                    models.Reservation.reservation_id > cursor_id,
+                ),
+            )
+        )
+
+    return list(db.execute(stmt.limit(limit)).all())
+
+
+def to_item_dict(row: Row) -> Dict[str, Any]:
+    """조회 결과 행을 응답/내보내기용 dict로 변환 (시간은 KST)"""
+    start_kst = _to_kst(row.start_time)
+    end_kst = _to_kst(row.end_time)
+    is_meeting = row.meeting_room_id is not None
+
+    return {
+        "reservation_id": row.reservation_id,
+        "type": ReservationType.MEETING_ROOM if is_meeting else ReservationType.SEAT,
+        "room_id": row.meeting_room_id,
+        "seat_id": row.seat_id,
+        "student_id": row.student_id,
+        "date": start_kst.date().isoformat(),
+        "start_time": start_kst.strftime("%H:%M"),
+        "end_time": end_kst.strftime("%H:%M"),
+        "status": row.status.value if hasattr(row.status, "value") else row.status,
+        "created_at": _to_kst(row.created_at).strftime("%Y-%m-%d %H:%M:%S") if row.created_at else None,
+    }
+
+
+def iter_export(
+    session_factory: Callable[[], Session],
+    export_format: str,
+    start_from: Optional[datetime] = None,
+    start_before: Optional[datetime] = None,
+    reservation_type: Optional[str] = None,
+    status: Optional[models.ReservationStatus] = None,
+) -> Iterator[str]:
+    """
+    조회 조건에 맞는 예약을 CSV 또는 NDJSON 문자열 청크로 스트리밍.
+
+    - 요청 수명과 무관하게 스트림 동안 자체 세션을 열고 종료 시 닫습니다.
+    - yield_per + stream_results로 결과를 settings.EXPORT_FETCH_SIZE 단위로 가져오므로
+      전체 결과 크기와 관계없이 메모리 사용량이 일정합니다.
+    - 샤딩 모드 거부(ValidationException)는 스트림 시작 전, 호출 시점에 발생합니다.
+    """
+    _reject_sharded("예약 내보내기를")
+    stmt = build_reservation_query(start_from, start_before, reservation_type, status)
+    stmt = stmt.execution_options(yield_per=settings.EXPORT_FETCH_SIZE, stream_results=True)
+    return _stream_export(session_factory, stmt, export_format)
+
+
+def _stream_export(session_factory: Callable[[], Session], stmt, export_format: str) -> Iterator[str]:
+    """내보내기 쿼리 결과를 자체 세션으로 스트리밍"""
+    db = session_factory()
+    try:
+        rows = db.execute(stmt)
+        if export_format == "csv":
+            yield from _iter_csv(rows)
+        else:
+            for row in rows:
+                yield json.dumps(to_item_dict(row), ensure_ascii=False) + "\n"
+    finally:
+        db.close()
+
+
+def _iter_csv(rows) -> Iterator[str]:
+    """행 이터레이터를 헤더 포함 CSV 청크로 변환"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+    writer.writeheader()
+
+    for count, row in enumerate(rows, start=1):
+        writer.writerow(to_item_dict(row))
+        if count % _CSV_ROWS_PER_CHUNK == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+
+    yield buffer.getvalue()
+
+
+def bulk_update_reservations(
+    db: Session,
+    request: schemas.AdminBulkReservationRequest,
+) -> Dict[str, Any]:
+    """
+    조건에 맞는 RESERVED 예약 일괄 취소 / 이동 (관리자)
+
+    - 대상 조회와 변경을 쓰기 락(BEGIN IMMEDIATE) 하나 안에서 처리하므로
+      dry_run 결과는 같은 시점의 실제 적용 결과와 같습니다. (dry_run은 롤백)
+    - cancel: 조회 조건 그대로 UPDATE 한 번으로 취소 (대기열 전환 없음)
+    - move: 대상 시설·사용자의 기존 예약 구간을 한 번씩 읽어 메모리에서 순서대로 검증하고,
+      통과한 예약만 기본 키 기준 executemany UPDATE로 반영
+      (관리자 작업이므로 일일·주간 이용 한도는 적용하지 않음)
+    """
+    _reject_sharded("예약 일괄 변경을")
+
+    Reservation = models.Reservation
+    is_seat = request.type == ReservationType.SEAT
+    facility_column = Reservation.seat_id if is_seat else Reservation.meeting_room_id
+    start_from, start_before = reservation_service.kst_date_range_to_utc(request.from_date, request.to_date)
+
+    conditions = [
+        Reservation.status == models.ReservationStatus.RESERVED,
+        facility_column.isnot(None),
+        Reservation.start_time >= start_from,
+        Reservation.start_time < start_before,
+    ]
+    source_ids = request.source_facility_ids()
+    if source_ids is not None:
+        conditions.append(facility_column.in_(source_ids))
+
+    try:
+        begin_immediate(db)
+
+        rows = db.execute(
+            select(
+                Reservation.reservation_id,
+                Reservation.student_id,
+                facility_column.label("facility_id"),
+                Reservation.start_minute,
+                Reservation.end_minute,
+            )
+            .where(*conditions)
+            .order_by(Reservation.start_minute, Reservation.reservation_id)
+        ).all()
+
+        if request.action == "cancel":
+            items = [_bulk_item(row) for row in rows]
+            if rows and not request.dry_run:
+                db.execute(
+                    update(Reservation)
+                    .where(*conditions)
+                    .values(status=models.ReservationStatus.CANCELED)
+                    .execution_options(synchronize_session=False)
+                )
+        else:
+            items, moves = _plan_moves(db, request, rows, facility_column)
+            if moves and not request.dry_run:
+                db.execute(update(Reservation), moves)
+
+        changed_ids = [item["reservation_id"] for item in items if item.get("code") is None]
+        if request.dry_run:
+            db.rollback()
+        else:
+            reservation_index.stage_bulk_changes(db, changed_ids)
+            db.commit()
+
+    except Exception as e:
+        db.rollback()
+        raise e
+
+    return {
+        "action": request.action,
+        "dry_run": request.dry_run,
+        "matched": len(rows),
+        "succeeded": len(changed_ids),
+        "failed": len(rows) - len(changed_ids),
+        "items": items,
+    }
+
+
+def _plan_moves(
+    db: Session,
+    request: schemas.AdminBulkReservationRequest,
+    rows: List[Row],
+    facility_column,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    이동 검증 및 배정 (시작 시각 순서대로, 앞서 배정한 결과를 이어서 반영)
+
+    Returns:
+        (예약별 결과, executemany UPDATE 파라미터)
+    """
+    items: List[Dict[str, Any]] = []
+    moves: List[Dict[str, Any]] = []
+    if not rows:
+        return items, moves
+
+    shift = request.shift_minutes
+    pool = request.target_pool()
+    moving_ids = [row.reservation_id for row in rows]
+    span_start = EPOCH + timedelta(minutes=rows[0].start_minute + shift)
+    span_end = EPOCH + timedelta(minutes=max(row.end_minute for row in rows) + shift)
+
+    candidate_ids = set(pool) if pool is not None else {row.facility_id for row in rows}
+    available = _available_facilities(db, request.type, candidate_ids)
+    facility_busy = _facility_intervals(db, facility_column, candidate_ids, moving_ids, span_start, span_end)
+
+    # 시간이 바뀔 때만 예약자·참여자의 다른 예약과 겹치는지 확인
+    people: Dict[int, List[int]] = {row.reservation_id: [row.student_id] for row in rows}
+    user_busy: Dict[int, List[Interval]] = {}
+    if shift:
+        if request.type == ReservationType.MEETING_ROOM:
+            participants = db.execute(
+                select(
+                    models.ReservationParticipant.reservation_id,
+                    models.ReservationParticipant.participant_student_id,
+                ).where(models.ReservationParticipant.reservation_id.in_(moving_ids))
+            )
+            for row in participants:
+                if row.participant_student_id not in people[row.reservation_id]:
+                    people[row.reservation_id].append(row.participant_student_id)
+        student_ids = {sid for sids in people.values() for sid in sids}
+        user_busy = _student_intervals(db, student_ids, moving_ids, span_start, span_end)
+
+    now_minute = to_epoch_minutes(datetime.now(timezone.utc))
+    open_minute = OperationHours.START_HOUR * 60 + OperationHours.START_MINUTE
+    close_minute = OperationHours.END_HOUR * 60 + OperationHours.END_MINUTE
+
+    for row in rows:
+        new_start = row.start_minute + shift
+        new_end = row.end_minute + shift
+        item = _bulk_item(row)
+        items.append(item)
+
+        start_kst = _to_kst(EPOCH + timedelta(minutes=new_start))
+        end_kst = _to_kst(EPOCH + timedelta(minutes=new_end))
+        start_of_day = start_kst.hour * 60 + start_kst.minute
+        end_of_day = start_of_day + (new_end - new_start)
+        if start_of_day < open_minute or end_of_day > close_minute:
+            item.update(code=ErrorCode.VALIDATION_ERROR.value, message="이동한 시간이 운영 시간을 벗어납니다.")
+            continue
+        if new_start <= now_minute:
+            item.update(code=ErrorCode.VALIDATION_ERROR.value, message="이미 지난 시간으로 이동할 수 없습니다.")
+            continue
+
+        overlapped = next(
+            (sid for sid in people[row.reservation_id]
+             if _overlaps_any(user_busy.get(sid, []), new_start, new_end)),
+            None,
+        )
+        if overlapped is not None:
+            item.update(
+                code=ErrorCode.OVERLAP_WITH_OTHER_FACILITY.value,
+                message=f"학번 {overlapped}의 동일 시간대 예약이 이미 존재합니다.",
+            )
+            continue
+
+        # 원래 시설이 후보에 있으면 우선 배정
+        candidates = pool if pool is not None else [row.facility_id]
+        if pool is not None and row.facility_id in candidate_ids:
+            candidates = [row.facility_id] + [f for f in pool if f != row.facility_id]
+        free = [f for f in candidates if f in available]
+        if not free:
+            code = (
+                ErrorCode.SEAT_NOT_AVAILABLE if request.type == ReservationType.SEAT
+                else ErrorCode.MEETING_ROOM_NOT_AVAILABLE
+            )
+            item.update(code=code.value, message="이용 가능한 시설이 없습니다.")
+            continue
+        target = next(
+            (f for f in free if not _overlaps_any(facility_busy.get(f, []), new_start, new_end)),
+            None,
+        )
+        if target is None:
+            item.update(
+                code=ErrorCode.RESERVATION_CONFLICT.value,
+                message="이동할 시간대에 비어 있는 시설이 없습니다.",
+            )
+            continue
+
+        facility_busy.setdefault(target, []).append((new_start, new_end))
+        for sid in people[row.reservation_id]:
+            user_busy.setdefault(sid, []).append((new_start, new_end))
+
+        item.update(
+            new_facility_id=target,
+            new_date=start_kst.date().isoformat(),
+            new_start_time=start_kst.strftime("%H:%M"),
+            new_end_time=end_kst.strftime("%H:%M"),
+        )
+        moves.append({
+            "reservation_id": row.reservation_id,
+            facility_column.key: target,
+            "start_time": EPOCH + timedelta(minutes=new_start),
+            "end_time": EPOCH + timedelta(minutes=new_end),
+            # ORM 일괄 UPDATE는 @validates를 거치지 않으므로 epoch 분도 직접 지정
+            "start_minute": new_start,
+            "end_minute": new_end,
+        })
+
+    return items, moves
+
+
+def _bulk_item(row: Row) -> Dict[str, Any]:
+    start_kst = _to_kst(EPOCH + timedelta(minutes=row.start_minute))
+    end_kst = _to_kst(EPOCH + timedelta(minutes=row.end_minute))
+    return {
+        "reservation_id": row.reservation_id,
+        "student_id": row.student_id,
+        "facility_id": row.facility_id,
+        "date": start_kst.date().isoformat(),
+        "start_time": start_kst.strftime("%H:%M"),
+        "end_time": end_kst.strftime("%H:%M"),
+    }
+
+
+def _available_facilities(db: Session, reservation_type: str, facility_ids: set) -> set:
+    """후보 중 이용 가능(is_available) 상태인 시설 ID"""
+    if reservation_type == ReservationType.SEAT:
+        is_available = facility_availability.seat_available
+    else:
+        is_available = facility_availability.meeting_room_available
+    return {facility_id for facility_id in facility_ids if is_available(db, facility_id)}
+
+
+def _facility_intervals(
+    db: Session, facility_column, facility_ids: set, exclude_ids: List[int], start: datetime, end: datetime
+) -> Dict[int, List[Interval]]:
+    """기간 내 시설별 활성 예약 구간 (이동 대상 예약 제외)"""
+    Reservation = models.Reservation
+    busy: Dict[int, List[Interval]] = {}
+    rows = db.execute(
+        select(facility_column.label("facility_id"), Reservation.start_minute, Reservation.end_minute).where(
+            facility_column.in_(facility_ids),
+            Reservation.status.in_(CONFLICT_CHECK_STATUSES),
+            Reservation.reservation_id.not_in(exclude_ids),
+            Reservation.overlaps(start, end),
+        )
+    )
+    for row in rows:
+        busy.setdefault(row.facility_id, []).append((row.start_minute, row.end_minute))
+    return busy
+
+
+def _student_intervals(
+    db: Session, student_ids: set, exclude_ids: List[int], start: datetime, end: datetime
+) -> Dict[int, List[Interval]]:
+    """기간 내 학생별 활성 예약 구간 (예약자 + 회의실 참여자, 이동 대상 예약 제외)"""
+    Reservation = models.Reservation
+    Participant = models.ReservationParticipant
+    busy: Dict[int, List[Interval]] = {}
+    active = [
+        Reservation.status.in_(CONFLICT_CHECK_STATUSES),
+        Reservation.reservation_id.not_in(exclude_ids),
+        Reservation.overlaps(start, end),
+    ]
+
+    owned = db.execute(
+        select(Reservation.student_id, Reservation.start_minute, Reservation.end_minute)
+        .where(Reservation.student_id.in_(student_ids), *active)
+    )
+    joined = db.execute(
+        select(Participant.participant_student_id.label("student_id"), Reservation.start_minute, Reservation.end_minute)
+        .join(Reservation, Reservation.reservation_id == Participant.reservation_id)
+        .where(Participant.participant_student_id.in_(student_ids), *active)
+    )
+    for row in chain(owned, joined):
+        busy.setdefault(row.student_id, []).append((row.start_minute, row.end_minute))
+    return busy
+
+
+def _overlaps_any(intervals: List[Interval], start_minute: int, end_minute: int) -> bool:
+    return any(start < end_minute and start_minute < end for start, end in intervals)
+
+
+def set_facility_availability(
+    db: Session,
+    request: schemas.AdminFacilityAvailabilityRequest,
+) -> Dict[str, Any]:
+    """
+    좌석 / 회의실 이용 가능 여부 일괄 변경 (UPDATE 한 번)
+
+    변경된 시설은 커밋 시 이용 가능 여부 캐시에 반영됩니다. (새 version)
+    이미 잡힌 예약은 그대로 두므로 필요하면 일괄 취소·이동을 함께 사용합니다.
+    """
+    is_seat = request.type == ReservationType.SEAT
+    table = models.Seat if is_seat else models.MeetingRoom
+    id_column = table.seat_id if is_seat else table.room_id
+    target_ids = request.target_ids()
+
+    try:
+        begin_immediate(db)
+
+        existing = set(db.scalars(select(id_column).where(id_column.in_(target_ids))))
+        updated_ids = sorted(db.scalars(
+            select(id_column).where(id_column.in_(existing), table.is_available.isnot(request.is_available))
+        ))
+        if updated_ids:
+            db.execute(
+                update(table)
+                .where(id_column.in_(updated_ids))
+                .values(is_available=request.is_available)
+                .execution_options(synchronize_session=False)
+            )
+            if is_seat:
+                facility_availability.stage_bulk_changes(db, seat_ids=updated_ids)
+            else:
+                facility_availability.stage_bulk_changes(db, meeting_room_ids=updated_ids)
+        db.commit()
+
+    except Exception as e:
+        db.rollback()
+        raise e
+
+    snapshot = facility_availability.get_snapshot()
+    disabled = snapshot.disabled_seat_ids if is_seat else snapshot.disabled_meeting_room_ids
+    return {
+        "type": request.type,
+        "is_available": request.is_available,
+        "updated_ids": updated_ids,
+        "not_found_ids": sorted(set(target_ids) - existing),
+        "disabled_count": len(disabled),
+        "version": snapshot.version,
+    }
+
+
+def check_reservation_index(db: Session, rebuild: bool = False) -> Dict[str, Any]:
+    """
+    활성 예약 메모리 인덱스를 DB(샤딩 모드에서는 모든 샤드)와 비교
+
+    Args:
+        rebuild: True면 비교 전에 DB에서 인덱스를 다시 구성
+    """
+    with reservation_sessions(db) as sessions:
+        if rebuild:
+            reservation_index.rebuild(sessions)
+        report = reservation_index.verify(sessions)
+
+    index = reservation_index.active_index
+    return {
+        "indexed": len(index),
+        "consistent": not any(report.values()),
+        **report,
+        "rebuilt_at": index.rebuilt_at.isoformat() if index.rebuilt_at else None,
+    }
+
+
+def _to_kst(dt: datetime) -> datetime:
+    """DB에서 꺼낸 UTC 시각(naive 포함)을 KST로 변환"""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(KST)
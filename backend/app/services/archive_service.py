@@ -0,0 +1,172 @@
+"""
+services/archive_service.py - Reservation Archive Service
+=========================================================
+오래된 COMPLETED/CANCELED 예약을 아카이브 테이블(Cold Storage)로 이동합니다.
+
+hot 테이블(reservations)에는 진행 중이거나 최근 예약만 남겨
+충돌 검사·현황 조회·내 예약 조회가 작은 인덱스만 스캔하도록 합니다.
+
+[불변식] reservations의 최대 reservation_id 행은 삭제하지 않습니다.
+reservations는 AUTOINCREMENT 없는 rowid 테이블이라 새 ID가 "현재 최대 rowid + 1"이므로,
+최대 행만 남아 있으면 아카이브된 ID가 다시 발급되지 않습니다. (예약 행을 삭제하는 곳은 이 모듈뿐)
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Optional
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from app import lock_profiler, models
+from app.config import settings
+from app.database import begin_immediate
+
+KST = timezone(timedelta(hours=9))
+
+# 아카이브 대상 상태: 더 이상 변경되지 않는 예약만 이동
+ARCHIVABLE_STATUSES = [
+    models.ReservationStatus.COMPLETED,
+    models.ReservationStatus.CANCELED,
+]
+
+# 아카이브 테이블로 복사할 공통 컬럼
+_RESERVATION_COLUMNS = [
+    "reservation_id",
+    "student_id",
+    "meeting_room_id",
+    "seat_id",
+    "start_time",
+    "end_time",
+    "created_at",
+    "status",
+]
+
+
+def get_archive_cutoff(now: Optional[datetime] = None) -> datetime:
+    """이 시각 이전에 종료된 예약이 아카이브 대상 (UTC)"""
+    now = now or datetime.now(timezone.utc)
+    return now - timedelta(days=settings.ARCHIVE_RETENTION_DAYS)
+
+
+def covers_archive(from_date: Optional[date] = None, now: Optional[datetime] = None) -> bool:
+    """
+    조회 시작 날짜(KST)가 아카이브 보존 기간 이전까지 거슬러 올라가는지 확인.
+
+    from_date가 없으면 hot 테이블만 조회합니다. (기본 목록 조회 시 아카이브 스캔 방지)
+    """
+    if from_date is None:
+        return False
+    return from_date <= get_archive_cutoff(now).astimezone(KST).date()
+
+
+def archive_reservations(
+    db: Session,
+    cutoff: Optional[datetime] = None,
+    batch_size: Optional[int] = None,
+) -> int:
+    """
+    cutoff 이전에 종료된 COMPLETED/CANCELED 예약과 참여자를 배치 단위로 아카이브 테이블로 이동.
+
+    - 배치마다 BEGIN IMMEDIATE 트랜잭션 하나(대상 조회 → INSERT ... SELECT → DELETE)로 처리하여
+      쓰기 락 점유 시간을 배치 단위로 제한하고, 읽기 후 쓰기로 올라가다 SQLITE_BUSY가 나지 않도록 합니다.
+    - 최대 reservation_id 행은 이동하지 않습니다. (모듈 docstring의 불변식 - 배치마다 락 안에서 다시 조회)
+
+    Returns:
+        이동된 예약 건수
+    """
+    cutoff = cutoff or get_archive_cutoff()
+    batch_size = batch_size or settings.ARCHIVE_BATCH_SIZE
+
+    Reservation = models.Reservation
+    Participant = models.ReservationParticipant
+
+    total_moved = 0
+    while True:
+        try:
+            begin_immediate(db, section="archive")
+            max_id = db.execute(select(func.max(Reservation.reservation_id))).scalar()
+            if max_id is None:
+                db.commit()
+                break
+
+            ids: List[int] = list(
+                db.execute(
+                    select(Reservation.reservation_id)
+                    .where(
+                        Reservation.status.in_(ARCHIVABLE_STATUSES),
+                        Reservation.end_time < cutoff,
+                        Reservation.reservation_id < max_id,
+                    )
+                    .order_by(Reservation.reservation_id)
+                    .limit(batch_size)
+                ).scalars()
+            )
+            lock_profiler.mark(db, "select")
+            if not ids:
+                db.commit()
+                break
+
+            # 1. 예약 복사
+            db.execute(
+                insert(models.ReservationArchive).from_select(
+                    _RESERVATION_COLUMNS,
+                    select(
+                        *[getattr(Reservation, name) for name in _RESERVATION_COLUMNS]
+                    ).where(Reservation.reservation_id.in_(ids)),
+                )
+            )
+
+            # 2. 참여자 복사
+            db.execute(
+                insert(models.ReservationParticipantArchive).from_select(
+                    ["reservation_id", "participant_student_id"],
+                    select(
+                        Participant.reservation_id,
+                        Participant.participant_student_id,
+                    ).where(Participant.reservation_id.in_(ids)),
+                )
+            )
+
+            # 3. hot 테이블에서 삭제 (참여자 → 예약 순)
+            db.execute(delete(Participant).where(Participant.reservation_id.in_(ids)))
+            db.execute(delete(Reservation).where(Reservation.reservation_id.in_(ids)))
+            lock_profiler.mark(db, "move")
+
+            db.commit()
+            total_moved += len(ids)
+
+            if len(ids) < batch_size:
+                break
+
+        except Exception as e:
+            db.rollback()
+            raise e
+
+    return total_moved
+
+
+def get_user_archived_reservations(
+    db: Session,
+    student_id: int,
+) -> List[models.ReservationArchive]:
+    """
+    아카이브된 내 예약 목록 조회 (예약자 + 참여자)
+    """
+    owned = (
+        db.query(models.ReservationArchive)
+        .filter(models.ReservationArchive.student_id == student_id)
+        .all()
+    )
+
+    participating = (
+        db.query(models.ReservationArchive)
+        .join(
+            models.ReservationParticipantArchive,
+            models.ReservationArchive.reservation_id == models.ReservationParticipantArchive.reservation_id,
+        )
+        .filter(models.ReservationParticipantArchive.participant_student_id == student_id)
+        .all()
+    )
+
+    merged = {res.reservation_id: res for res in owned + participating}
+    return list(merged.values())
@@ -8,10 +8,11 @@ from datetime import datetime, timedelta, timezone
 from typing import List
 
 from sqlalchemy.orm import Session
-from sqlalchemy import text
 
-from app import constants, models, schemas
+from app import constants, facility_availability, lock_profiler, metrics, models, reservation_index, schemas
+from app.config import settings
 from app.constants import ErrorCode
+from app.database import begin_immediate
 from app.exceptions import ConflictException, LimitExceededException, ValidationException
 from app.services import reservation_service, user_service
 
@@ -37,31 +38,40 @@ def process_reservation(
     student_id: int,
     request: schemas.MeetingRoomReservationCreate,
 ) -> models.Reservation:
-    
+
+    # 락을 잡기 전에 메모리 인덱스로 확실한 충돌 먼저 거절
+    precheck_conflicts(db, student_id, request)
+
+    # 유저 및 참여자 확보 - get_or_create_user는 내부에서 커밋하므로 쓰기 락을 잡기 전에 처리
+    # (락 안에서 호출하면 그 커밋으로 락이 풀린 채 이후 검증과 INSERT가 실행됨)
+    user_service.get_or_create_user(db, student_id)
+
+    participant_ids: list[int] = []
+    for participant in request.participants:
+        user_service.get_or_create_user(db, participant.student_id)
+        participant_ids.append(participant.student_id)
+
     try:
         # ---------------------------------------------------
         # [0] 트랜잭션 시작 & 쓰기 잠금 (Critical Section Start)
         # ---------------------------------------------------
         # 로직 시작과 동시에 DB 파일을 잠급니다.
         # 이 시점부터 db.commit() 전까지 다른 쓰기 작업은 대기 상태가 됩니다.
-        db.execute(text("BEGIN IMMEDIATE"))
+        begin_immediate(db, section="meeting_room.reserve")
 
         # ---------------------------------------------------
         # 1. 회의실 존재 및 가용성 검증
         # ---------------------------------------------------
-        room = (
-            db.query(models.MeetingRoom)
-            .filter(models.MeetingRoom.room_id == request.room_id)
-            .first()
-        )
+        # 이용 가능 여부는 메모리 캐시로 확인 (회의실 테이블 조회 생략)
+        available = facility_availability.meeting_room_available(db, request.room_id)
 
-        if not room:
+        if available is None:
             raise ValidationException(
                 code=ErrorCode.NOT_FOUND,
                 message="존재하지 않는 회의실입니다.",
             )
         
-        if not room.is_available:
+        if not available:
             raise ValidationException(
                  code=ErrorCode.MEETING_ROOM_NOT_AVAILABLE,
                  message="해당 회의실은 현재 이용할 수 없습니다."
@@ -73,7 +83,8 @@ def process_reservation(
                 code=ErrorCode.PARTICIPANT_MIN_NOT_MET,
                 message=f"회의실 예약은 최소 {min_participants}명 이상이어야 합니다.",
             )
-            
+        lock_profiler.mark(db, "room_check")
+
         # ---------------------------------------------------
         # 2. 데이터 가공 (KST -> UTC)
         # ---------------------------------------------------
@@ -86,27 +97,18 @@ def process_reservation(
         duration_minutes = (end_dt_utc - start_dt_utc).total_seconds() / 60
 
         # ---------------------------------------------------
-        # 3. 유저 및 참여자 확보
-        # ---------------------------------------------------
-        user_service.get_or_create_user(db, student_id)
-
-        participant_ids: list[int] = []
-        for participant in request.participants:
-            user_service.get_or_create_user(db, participant.student_id)
-            participant_ids.append(participant.student_id)
-
-        # ---------------------------------------------------
-        # 4. 비즈니스 로직 검증 (Lock 상태에서 안전하게 수행)
+        # 3. 비즈니스 로직 검증 (Lock 상태에서 안전하게 수행)
         # ---------------------------------------------------
 
-        # 4-1. 회의실 중복 예약 확인
+        # 3-1. 회의실 중복 예약 확인
         if check_room_conflict(db, request.room_id, start_dt_utc, end_dt_utc):
             raise ConflictException(
                 code=ErrorCode.RESERVATION_CONFLICT,
                 message="해당 회의실은 이미 예약되어 있습니다.",
             )
+        lock_profiler.mark(db, "room_conflict")
 
-        # 4-2. 신청자/참여자 모두 중복 이용(좌석·회의실) 확인
+        # 3-2. 신청자/참여자 모두 중복 이용(좌석·회의실) 확인
         participants_all = {student_id} | {p.student_id for p in request.participants}
         for pid in participants_all:
             if _has_overlap_for_user(db, pid, start_dt_utc, end_dt_utc):
@@ -114,8 +116,9 @@ def process_reservation(
                     code=ErrorCode.OVERLAP_WITH_OTHER_FACILITY,
                     message=f"사용자 {pid}의 동일 시간대 예약이 이미 존재합니다.",
                 )
+        lock_profiler.mark(db, "overlap_check")
 
-        # 4-3. 일일/주간 이용 한도 확인
+        # 3-3. 일일/주간 이용 한도 확인
         limit_daily = constants.ReservationLimits.MEETING_ROOM_DAILY_LIMIT_MINUTES
         limit_weekly = constants.ReservationLimits.MEETING_ROOM_WEEKLY_LIMIT_MINUTES
 
@@ -133,9 +136,10 @@ def process_reservation(
                     code=ErrorCode.WEEKLY_LIMIT_EXCEEDED,
                     message=f"사용자 {pid}의 주간 이용 한도({limit_weekly}분)를 초과했습니다. (현재: {int(weekly_used)}분 사용 중)",
                 )
+        lock_profiler.mark(db, "usage_limits")
 
         # ---------------------------------------------------
-        # 5. 최종 예약 생성 및 커밋
+        # 4. 최종 예약 생성 및 커밋
         # ---------------------------------------------------
         new_reservation = reservation_service.create_meeting_room_reservation(
             db=db,
@@ -145,6 +149,7 @@ def process_reservation(
             end_time=end_dt_utc,
             participant_ids=participant_ids,
         )
+        lock_profiler.mark(db, "insert")
 
         db.commit() # [중요] 모든 검증 통과 후 여기서 최종 커밋 (락 해제)
         db.refresh(new_reservation)
@@ -156,6 +161,41 @@ def process_reservation(
         raise e
 
 
+def precheck_conflicts(db: Session, student_id: int, request: schemas.MeetingRoomReservationCreate) -> None:
+    """
+    메모리 인덱스 기준 후보 충돌 사전 거절 (쓰기 락 밖).
+    인덱스 충돌은 DB에서 다시 확인한 뒤에만 거절하며 (다른 워커의 취소 반영),
+    통과해도 락 안의 DB 검사가 최종 판단합니다.
+    """
+    if not settings.RESERVATION_INDEX_ENABLED:
+        return
+
+    start_dt_utc = datetime.combine(request.date, request.start_time).replace(tzinfo=KST).astimezone(timezone.utc)
+    end_dt_utc = datetime.combine(request.date, request.end_time).replace(tzinfo=KST).astimezone(timezone.utc)
+
+    index = reservation_index.active_index
+    if reservation_index.confirm_conflict(
+        db, lambda: index.room_conflict(request.room_id, start_dt_utc, end_dt_utc)
+    ):
+        metrics.RESERVATION_PRECHECKS.inc(facility="meeting_room", result="rejected")
+        raise ConflictException(
+            code=ErrorCode.RESERVATION_CONFLICT,
+            message="해당 회의실은 이미 예약되어 있습니다.",
+        )
+
+    participants_all = {student_id} | {p.student_id for p in request.participants}
+    for pid in participants_all:
+        if reservation_index.confirm_conflict(
+            db, lambda: index.student_conflict(pid, start_dt_utc, end_dt_utc)
+        ):
+            metrics.RESERVATION_PRECHECKS.inc(facility="meeting_room", result="rejected")
+            raise ConflictException(
+                code=ErrorCode.OVERLAP_WITH_OTHER_FACILITY,
+                message=f"사용자 {pid}의 동일 시간대 예약이 이미 존재합니다.",
+            )
+    metrics.RESERVATION_PRECHECKS.inc(facility="meeting_room", result="passed")
+
+
 # --- 내부 지원 함수들 (변경 없음) ---
 
 def check_room_conflict(db: Session, room_id: int, start_time: datetime, end_time: datetime) -> bool:
@@ -165,8 +205,7 @@ def check_room_conflict(db: Session, room_id: int, start_time: datetime, end_tim
         .filter(
             models.Reservation.meeting_room_id == room_id,
             models.Reservation.status.in_(CONFLICT_CHECK_STATUSES),
-            models.Reservation.start_time < end_time,
-            models.Reservation.end_time > start_time,
+            models.Reservation.overlaps(start_time, end_time),
         )
         .first()
     )
@@ -188,8 +227,7 @@ def check_user_daily_meeting_limit(db: Session, student_id: int, target_date: da
         .filter(
             models.Reservation.meeting_room_id.isnot(None),
             models.Reservation.status.in_(USAGE_COUNT_STATUSES),
-            models.Reservation.start_time >= start_of_day,
-            models.Reservation.start_time <= end_of_day,
+            models.Reservation.starts_between(start_of_day, end_of_day),
             (
                 (models.Reservation.student_id == student_id) |
                 (models.ReservationParticipant.participant_student_id == student_id)
@@ -217,8 +255,7 @@ def check_user_weekly_meeting_limit(db: Session, student_id: int, target_date: d
         .filter(
             models.Reservation.meeting_room_id.isnot(None),
             models.Reservation.status.in_(USAGE_COUNT_STATUSES),
-            models.Reservation.start_time >= start_of_week,
-            models.Reservation.start_time <= end_of_week,
+            models.Reservation.starts_between(start_of_week, end_of_week),
             (
                 (models.Reservation.student_id == student_id) |
                 (models.ReservationParticipant.participant_student_id == student_id)
@@ -264,8 +301,7 @@ def _has_overlap_for_user(
         .filter(
             models.Reservation.meeting_room_id.isnot(None),
             models.Reservation.status.in_(CONFLICT_CHECK_STATUSES),
-            models.Reservation.start_time < end_time,
-            models.Reservation.end_time > start_time,
+            models.Reservation.overlaps(start_time, end_time),
             (
                 (models.Reservation.student_id == student_id) |
                 (models.ReservationParticipant.participant_student_id == student_id)
@@ -283,8 +319,7 @@ def _has_overlap_for_user(
             models.Reservation.seat_id.isnot(None),
             models.Reservation.student_id == student_id,
             models.Reservation.status.in_(CONFLICT_CHECK_STATUSES),
-            models.Reservation.start_time < end_time,
-            models.Reservation.end_time > start_time,
+            models.Reservation.overlaps(start_time, end_time),
         )
         .first()
     )
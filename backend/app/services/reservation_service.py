@@ -2,14 +2,20 @@
 services/reservation_service.py - Reservation persistence helpers.
 """
 
-from datetime import datetime
-from typing import List, Optional
+import base64
+from datetime import date, datetime, time, timedelta, timezone
+from typing import List, Optional, Tuple
 
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
-from sqlalchemy import text
-from app import models
-from app.constants import ErrorCode
-from app.exceptions import BusinessException, ForbiddenException
+from sqlalchemy import and_, false, or_, select, union
+from app import lock_profiler, models
+from app.constants import ErrorCode, ReservationType
+from app.database import begin_immediate
+from app.exceptions import BusinessException, ForbiddenException, ValidationException
+from app.services import archive_service, waitlist_service
+
+KST = timezone(timedelta(hours=9))
 
 # 충돌 검사용: 해당 시설이 현재 점유 중인지 확인 (예약됨, 사용 중)
 CONFLICT_CHECK_STATUSES = [
@@ -43,8 +49,7 @@ def check_overlap_with_other_facility(
     query_owner = db.query(models.Reservation).filter(
         models.Reservation.student_id == student_id,
         models.Reservation.status.in_(CONFLICT_CHECK_STATUSES),
-        models.Reservation.start_time < end_time,
-        models.Reservation.end_time > start_time,
+        models.Reservation.overlaps(start_time, end_time),
     )
 
     if include_seats and not include_meeting_rooms:
@@ -73,8 +78,7 @@ def check_overlap_with_other_facility(
             .filter(
                 models.ReservationParticipant.participant_student_id == student_id, # 내 학번이 참여자 명단에 있는지
                 models.Reservation.status.in_(CONFLICT_CHECK_STATUSES),
-                models.Reservation.start_time < end_time,
-                models.Reservation.end_time > start_time,
+                models.Reservation.overlaps(start_time, end_time),
             )
         )
         
@@ -91,9 +95,11 @@ def create_meeting_room_reservation(
     start_time: datetime,
     end_time: datetime,
     participant_ids: List[int],
+    reservation_id: Optional[int] = None,
 ) -> models.Reservation:
-    """회의실 예약 엔터티 생성"""
+    """회의실 예약 엔터티 생성 (reservation_id를 주면 해당 ID 사용 - 샤딩 모드의 전역 ID)"""
     reservation = models.Reservation(
+        reservation_id=reservation_id,
         student_id=student_id,
         meeting_room_id=room_id,
         seat_id=None,
@@ -121,9 +127,11 @@ def create_seat_reservation(
     seat_id: int,
     start_time: datetime,
     end_time: datetime,
+    reservation_id: Optional[int] = None,
 ) -> models.Reservation:
-    """좌석 예약 엔터티 생성"""
+    """좌석 예약 엔터티 생성 (reservation_id를 주면 해당 ID 사용 - 샤딩 모드의 전역 ID)"""
     reservation = models.Reservation(
+        reservation_id=reservation_id,
         student_id=student_id,
         meeting_room_id=None,
         seat_id=seat_id,
@@ -137,9 +145,15 @@ def create_seat_reservation(
     return reservation
 
 
-def get_user_reservations(db: Session, student_id: int) -> List[models.Reservation]:
+def get_user_reservations(
+    db: Session,
+    student_id: int,
+    include_archived: bool = False,
+) -> List[models.Reservation]:
     """
     내 예약 목록 조회 (예약자 + 참여자)
+
+    include_archived=True이면 아카이브 테이블(reservations_archive)의 예약도 함께 반환합니다.
     """
     # 1. 내가 예약한 것
     owned = (
@@ -161,18 +175,173 @@ def get_user_reservations(db: Session, student_id: int) -> List[models.Reservati
 
     # 병합 및 정렬 (중복 제거)
     merged = {res.reservation_id: res for res in owned + participating}
+
+    # 3. 보존 기간이 지난 예약 (Cold Storage)
+    if include_archived:
+        for res in archive_service.get_user_archived_reservations(db, student_id):
+            merged.setdefault(res.reservation_id, res)
+
     return sorted(merged.values(), key=lambda r: r.start_time, reverse=True)
 
 
+def get_user_reservations_page(
+    db: Session,
+    student_id: int,
+    start_from: Optional[datetime] = None,
+    start_before: Optional[datetime] = None,
+    reservation_type: Optional[str] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[Tuple[datetime, int]] = None,
+    include_archived: bool = False,
+) -> List[Row]:
+    """
+    내 예약 목록 조회 (SQL 필터링 + Keyset Pagination)
+
+    예약자/참여자 조회를 하나의 UNION 쿼리로 합치고, 날짜 구간·시설 유형 필터와
+    (start_time, reservation_id) 기준 내림차순 keyset 페이지네이션을 DB에서 처리합니다.
+
+    Args:
+        start_from: 이 시각 이후 시작하는 예약만 (UTC, 포함)
+        start_before: 이 시각 이전에 시작하는 예약만 (UTC, 미포함)
+        reservation_type: meeting_room | seat (그 외 값이면 빈 결과)
+        limit: 최대 반환 건수 (None이면 전체)
+        cursor: 이전 페이지 마지막 항목의 (start_time, reservation_id)
+        include_archived: 아카이브 테이블도 함께 조회할지 여부
+
+    Returns:
+        reservation_id, meeting_room_id, seat_id, start_time, end_time, status 컬럼을 가진 Row 목록
+    """
+    sources = [(models.Reservation, models.ReservationParticipant)]
+    if include_archived:
+        sources.append((models.ReservationArchive, models.ReservationParticipantArchive))
+
+    branches = []
+    for reservation_model, participant_model in sources:
+        columns = [
+            reservation_model.reservation_id,
+            reservation_model.meeting_room_id,
+            reservation_model.seat_id,
+            reservation_model.start_time,
+            reservation_model.end_time,
+            reservation_model.status,
+        ]
+        filters = _build_my_reservation_filters(
+            reservation_model, start_from, start_before, reservation_type, cursor
+        )
+
+        # 1. 내가 예약한 것
+        branches.append(
+            select(*columns).where(reservation_model.student_id == student_id, *filters)
+        )
+
+        # 2. 내가 참여자로 포함된 것
+        branches.append(
+            select(*columns)
+            .join(
+                participant_model,
+                reservation_model.reservation_id == participant_model.reservation_id,
+            )
+            .where(participant_model.participant_student_id == student_id, *filters)
+        )
+
+    # UNION: 예약자이면서 참여자인 경우 등 중복 제거
+    merged = union(*branches).subquery()
+    stmt = select(merged).order_by(
+        merged.c.start_time.desc(),
+        merged.c.reservation_id.desc(),
+    )
+    if limit is not None:
+        stmt = stmt.limit(limit)
+
+    return list(db.execute(stmt).all())
+
+
+def _build_my_reservation_filters(
+    reservation_model,
+    start_from: Optional[datetime],
+    start_before: Optional[datetime],
+    reservation_type: Optional[str],
+    cursor: Optional[Tuple[datetime, int]],
+) -> list:
+    """내 예약 조회 UNION 각 분기에 공통으로 적용할 WHERE 조건"""
+    filters = []
+
+    if start_from is not None:
+        filters.append(reservation_model.start_time >= start_from)
+    if start_before is not None:
+        filters.append(reservation_model.start_time < start_before)
+
+    if reservation_type == ReservationType.MEETING_ROOM:
+        filters.append(reservation_model.meeting_room_id.isnot(None))
+    elif reservation_type == ReservationType.SEAT:
+        filters.append(reservation_model.seat_id.isnot(None))
+    elif reservation_type is not None:
+        filters.append(false())
+
+    # Keyset: (start_time, reservation_id) < cursor (내림차순 다음 페이지)
+    if cursor is not None:
+        cursor_start, cursor_id = cursor
+        filters.append(
+            or_(
+                reservation_model.start_time < cursor_start,
+                and_(
+                    reservation_model.start_time == cursor_start,
+                    reservation_model.reservation_id < cursor_id,
+                ),
+            )
+        )
+
+    return filters
+
+
+def kst_date_range_to_utc(
+    from_date: Optional[date],
+    to_date: Optional[date],
+) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """
+    KST 날짜 구간 [from_date, to_date]를 시작 시각 기준 UTC 반개구간 [start_from, start_before)로 변환
+    """
+    start_from = (
+        datetime.combine(from_date, time.min, tzinfo=KST).astimezone(timezone.utc)
+        if from_date else None
+    )
+    start_before = (
+        datetime.combine(to_date + timedelta(days=1), time.min, tzinfo=KST).astimezone(timezone.utc)
+        if to_date else None
+    )
+    return start_from, start_before
+
+
+def encode_cursor(start_time: datetime, reservation_id: int) -> str:
+    """페이지 마지막 항목을 불투명(opaque) 커서 문자열로 인코딩"""
+    raw = f"{start_time.replace(tzinfo=None).isoformat()}|{reservation_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """encode_cursor로 만든 커서를 (start_time(UTC), reservation_id)로 복원"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        start_str, id_str = raw.split("|", 1)
+        start_time = datetime.fromisoformat(start_str).replace(tzinfo=timezone.utc)
+        return start_time, int(id_str)
+    except (ValueError, UnicodeDecodeError):
+        raise ValidationException(
+            code=ErrorCode.VALIDATION_ERROR,
+            message="유효하지 않은 페이지 커서입니다.",
+        )
+
+
 def cancel_reservation(
     db: Session,
     reservation_id: int,
-    student_id: int
+    student_id: int,
+    promote_waitlist: bool = True,
 ) -> models.Reservation:
-    """예약 취소"""
+    """예약 취소 (promote_waitlist=False면 좌석 대기열 전환 생략 - 대기열이 없는 샤드 DB)"""
 
     try:
-        db.execute(text("BEGIN IMMEDIATE"))
+        begin_immediate(db, section="reservation.cancel")
         
         reservation = (
             db.query(models.Reservation)
@@ -205,6 +374,13 @@ def cancel_reservation(
             )
 
         reservation.status = models.ReservationStatus.CANCELED
+        lock_profiler.mark(db, "load")
+
+        # 좌석 대기열 선두를 같은 트랜잭션에서 예약으로 전환 (한도 재검증)
+        if promote_waitlist:
+            waitlist_service.promote_next(db, reservation)
+            lock_profiler.mark(db, "waitlist_promotion")
+
         db.commit() # [중요] 모든 검증 통과 후 여기서 최종 커밋 (락 해제)
         db.refresh(reservation)
 
@@ -2,23 +2,31 @@
 services/seat_service.py - Seat metadata and reservation helpers.
 """
 
+import random
+from collections import defaultdict
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from sqlalchemy import and_, func, select, text
+from sqlalchemy import and_, func, select
 from sqlalchemy.orm import Session
 
-from app import models
+from app import facility_availability, lock_profiler, metrics, models, reservation_index
+from app.config import settings
 from app.constants import ErrorCode, ReservationLimits
+from app.database import begin_immediate
 from app.exceptions import (
     BusinessException,
     ConflictException,
     LimitExceededException,
+    ValidationException,
 )
-from app.schemas.seat import SeatReservationCreate
+from app.models import to_epoch_minutes
+from app.schemas.seat import SeatReservationBatchCreate, SeatReservationCreate
 from app.services import reservation_service, user_service
 
 KST = timezone(timedelta(hours=9))
+KST_OFFSET_MINUTES = 9 * 60
+MINUTES_PER_DAY = 24 * 60
 
 # 충돌 검사용: 해당 좌석이 현재 점유 중인지 확인
 CONFLICT_CHECK_STATUSES = [
@@ -76,36 +84,44 @@ def reserve_seat(
     - SELECT ... FOR UPDATE를 사용하여 조회 시점에 Row Lock을 획득합니다.
     - 트랜잭션이 커밋(create_seat_reservation 내부)될 때까지 락이 유지됩니다.
     """
+    # 시간 변환 (공통)
+    start_dt_kst = datetime.combine(request.date, request.start_time, tzinfo=KST)
+    end_dt_kst = datetime.combine(request.date, request.end_time, tzinfo=KST)
+    start_dt_utc = start_dt_kst.astimezone(timezone.utc)
+    end_dt_utc = end_dt_kst.astimezone(timezone.utc)
+    duration_minutes = (end_dt_utc - start_dt_utc).total_seconds() / 60
+
+    # 락을 잡기 전에 메모리 인덱스로 확실한 충돌 먼저 거절
+    precheck_conflicts(db, student_id, request.seat_id, start_dt_utc, end_dt_utc)
+
+    # get_or_create_user는 내부에서 커밋하므로 쓰기 락을 잡기 전에 처리
+    # (락 안에서 호출하면 그 커밋으로 락이 풀린 채 INSERT가 실행됨)
+    user_service.get_or_create_user(db, student_id)
+
     try:
         # [핵심] 로직 시작하자마자 '쓰기 잠금' 획득
         # 이후의 모든 조회(SELECT)와 생성(INSERT)은 이 락 안에서 보호됨
-        db.execute(text("BEGIN IMMEDIATE"))
-
-        # 시간 변환 (공통)
-        start_dt_kst = datetime.combine(request.date, request.start_time, tzinfo=KST)
-        end_dt_kst = datetime.combine(request.date, request.end_time, tzinfo=KST)
-        start_dt_utc = start_dt_kst.astimezone(timezone.utc)
-        end_dt_utc = end_dt_kst.astimezone(timezone.utc)
-        duration_minutes = (end_dt_utc - start_dt_utc).total_seconds() / 60
+        begin_immediate(db, section="seat.reserve")
 
         selected_seat_id = None
         # -------------------------------------------------------
         # 1. 좌석 결정 및 Lock 획득 (Critical Section)
         # -------------------------------------------------------
         if request.seat_id is not None:
-            seat = (
-                db.query(models.Seat)
-                .filter(models.Seat.seat_id == request.seat_id)
-                .first()
-            )
-
-            if not seat.is_available:
+            # 이용 가능 여부는 메모리 캐시로 확인 (좌석 테이블 조회 생략)
+            available = facility_availability.seat_available(db, request.seat_id)
+            if available is None:
+                raise BusinessException(
+                    code=ErrorCode.NOT_FOUND,
+                    message=f"좌석 ID {request.seat_id}번을 찾을 수 없습니다.",
+                )
+            if not available:
                 raise BusinessException(
                     code=ErrorCode.SEAT_NOT_AVAILABLE,
                     message=f"좌석 ID {request.seat_id}번은 현재 이용 불가 상태입니다.",
                 )
             
-            selected_seat_id = seat.seat_id
+            selected_seat_id = request.seat_id
 
             # Lock을 획득한 상태에서 시간 충돌 여부를 확실하게 검증합니다.
             _ensure_no_seat_conflict(db, selected_seat_id, start_dt_utc, end_dt_utc)
@@ -122,6 +138,7 @@ def reserve_seat(
                     code=ErrorCode.RESERVATION_CONFLICT,
                     message="해당 시간대에 예약 가능한 좌석이 없습니다.",
                 )
+        lock_profiler.mark(db, "seat_check")
 
         # -------------------------------------------------------
         # 2. 비즈니스 로직 검증 (사용자 중복, 한도 등)
@@ -154,6 +171,7 @@ def reserve_seat(
                 code=ErrorCode.OVERLAP_WITH_OTHER_FACILITY,
                 message="동일 시간대에 이미 회의실 예약이 존재합니다.",
             )
+        lock_profiler.mark(db, "overlap_check")
 
         # 일일 이용 한도 확인
         used_minutes = _get_daily_seat_usage_minutes(db, student_id, start_dt_kst)
@@ -163,10 +181,8 @@ def reserve_seat(
                 code=ErrorCode.DAILY_LIMIT_EXCEEDED,
                 message=f"일일 좌석 이용 한도({limit_minutes}분)를 초과했습니다. (현재 {used_minutes}분 이용)",
             )
+        lock_profiler.mark(db, "daily_limit")
 
-        # 사용자 정보 확인 및 생성
-        user_service.get_or_create_user(db, student_id)
-        
         reservation = reservation_service.create_seat_reservation(
             db=db,
             student_id=student_id,
@@ -174,6 +190,7 @@ def reserve_seat(
             start_time=start_dt_utc,
             end_time=end_dt_utc,
         )
+        lock_profiler.mark(db, "insert")
 
         # -------------------------------------------------------
         # 3. 예약 생성 (여기서 Commit 되면서 Lock 해제됨)
@@ -186,6 +203,289 @@ def reserve_seat(
         raise e
 
 
+def reserve_seats_batch(
+    db: Session,
+    student_id: int,
+    request: SeatReservationBatchCreate,
+) -> List[Tuple[Optional[models.Reservation], Optional[BusinessException]]]:
+    """
+    좌석 일괄 예약 (쓰기 락 1회, 커밋 1회).
+
+    - 좌석 충돌 / 본인 중복 이용 / 일일 한도를 배치 기간 전체에 대해 한 번씩 조회한 뒤
+      항목 순서대로 판정하며, 앞서 통과한 항목도 뒤 항목 판정에 반영합니다. (배치 내 일일 한도 포함)
+    - atomic: 첫 실패 항목의 예외를 그대로 발생시키고 전체 롤백 (details.index = 항목 위치)
+    - best_effort: 실패 항목은 예외를 결과에 담고 통과한 항목만 생성
+
+    Returns:
+        요청 items 순서대로 (생성된 예약, 실패 예외) 목록
+    """
+    if settings.SHARDING_ENABLED:
+        raise ValidationException(
+            code=ErrorCode.VALIDATION_ERROR,
+            message="샤딩 모드에서는 일괄 예약을 지원하지 않습니다.",
+        )
+
+    atomic = request.mode == "atomic"
+    slots = [_to_utc_range(item) for item in request.items]
+    failures: Dict[int, BusinessException] = {}
+
+    def fail(index: int, exc: BusinessException) -> None:
+        if atomic:
+            exc.details = {"index": index}
+            raise exc
+        failures[index] = exc
+
+    # 락을 잡기 전에 메모리 인덱스로 확실한 충돌 먼저 거절
+    for index, (item, (start_dt_utc, end_dt_utc)) in enumerate(zip(request.items, slots)):
+        try:
+            precheck_conflicts(db, student_id, item.seat_id, start_dt_utc, end_dt_utc)
+        except ConflictException as e:
+            fail(index, e)
+
+    # get_or_create_user는 내부에서 커밋하므로 쓰기 락을 잡기 전에 처리
+    user_service.get_or_create_user(db, student_id)
+
+    created: Dict[int, models.Reservation] = {}
+    try:
+        begin_immediate(db, section="seat.reserve_batch")
+
+        span_start = min(start for start, _ in slots)
+        span_end = max(end for _, end in slots)
+        seat_ids = {item.seat_id for item in request.items if item.seat_id is not None}
+
+        # -------------------------------------------------------
+        # 1. 배치 기간 전체를 한 번씩 조회
+        # -------------------------------------------------------
+        seat_busy = _seat_intervals(db, seat_ids, span_start, span_end)
+        lock_profiler.mark(db, "seat_intervals")
+        own_seat_busy, own_room_busy = _student_intervals(db, student_id, span_start, span_end)
+        lock_profiler.mark(db, "student_intervals")
+        used_by_day = _daily_seat_usage_by_day(db, student_id, span_start, span_end)
+        lock_profiler.mark(db, "daily_usage")
+        limit_minutes = ReservationLimits.SEAT_DAILY_LIMIT_MINUTES
+
+        # -------------------------------------------------------
+        # 2. 항목별 판정 (통과한 항목은 누적)
+        # -------------------------------------------------------
+        for index, (item, (start_dt_utc, end_dt_utc)) in enumerate(zip(request.items, slots)):
+            if index in failures:
+                continue
+
+            interval = (to_epoch_minutes(start_dt_utc), to_epoch_minutes(end_dt_utc))
+            duration = interval[1] - interval[0]
+            day = (interval[0] + KST_OFFSET_MINUTES) // MINUTES_PER_DAY
+
+            if item.seat_id is not None:
+                if not facility_availability.seat_available(db, item.seat_id):
+                    fail(index, BusinessException(
+                        code=ErrorCode.SEAT_NOT_AVAILABLE,
+                        message=f"좌석 ID {item.seat_id}번은 현재 이용 불가 상태입니다.",
+                    ))
+                    continue
+                if _overlaps_any(seat_busy[item.seat_id], interval):
+                    fail(index, ConflictException(
+                        code=ErrorCode.RESERVATION_CONFLICT,
+                        message="해당 시간대에 이미 좌석 예약이 존재합니다.",
+                    ))
+                    continue
+                selected_seat_id = item.seat_id
+            else:
+                # 랜덤 배정: 이번 배치에서 먼저 배정된 좌석은 제외
+                taken = {sid for sid, intervals in seat_busy.items() if _overlaps_any(intervals, interval)}
+                selected_seat_id = _find_and_lock_random_available_seat(
+                    db, start_dt_utc, end_dt_utc, exclude_seat_ids=taken
+                )
+                if selected_seat_id is None:
+                    fail(index, ConflictException(
+                        code=ErrorCode.RESERVATION_CONFLICT,
+                        message="해당 시간대에 예약 가능한 좌석이 없습니다.",
+                    ))
+                    continue
+
+            if _overlaps_any(own_seat_busy, interval):
+                fail(index, ConflictException(
+                    code=ErrorCode.OVERLAP_WITH_OTHER_FACILITY,
+                    message="동일 시간대에 이미 좌석 예약이 존재합니다.",
+                ))
+                continue
+            if _overlaps_any(own_room_busy, interval):
+                fail(index, ConflictException(
+                    code=ErrorCode.OVERLAP_WITH_OTHER_FACILITY,
+                    message="동일 시간대에 이미 회의실 예약이 존재합니다.",
+                ))
+                continue
+            if used_by_day[day] + duration > limit_minutes:
+                fail(index, LimitExceededException(
+                    code=ErrorCode.DAILY_LIMIT_EXCEEDED,
+                    message=f"일일 좌석 이용 한도({limit_minutes}분)를 초과했습니다. (현재 {used_by_day[day]}분 이용)",
+                ))
+                continue
+
+            seat_busy[selected_seat_id].append(interval)
+            own_seat_busy.append(interval)
+            used_by_day[day] += duration
+            created[index] = models.Reservation(
+                student_id=student_id,
+                seat_id=selected_seat_id,
+                meeting_room_id=None,
+                start_time=start_dt_utc,
+                end_time=end_dt_utc,
+                status=models.ReservationStatus.RESERVED,
+            )
+        lock_profiler.mark(db, "evaluate_items")
+
+        # -------------------------------------------------------
+        # 3. 통과한 항목 일괄 생성 및 커밋
+        # -------------------------------------------------------
+        db.add_all(created.values())
+        db.flush()
+        lock_profiler.mark(db, "insert")
+        db.commit()
+
+        # 커밋으로 만료된 객체를 한 번의 조회로 다시 채움
+        if created:
+            reservation_ids = [r.reservation_id for r in created.values()]
+            db.query(models.Reservation).filter(
+                models.Reservation.reservation_id.in_(reservation_ids)
+            ).all()
+    except Exception as e:
+        db.rollback()
+        raise e
+
+    return [(created.get(index), failures.get(index)) for index in range(len(request.items))]
+
+
+def precheck_conflicts(
+    db: Session,
+    student_id: int,
+    seat_id: Optional[int],
+    start_time: datetime,
+    end_time: datetime,
+) -> None:
+    """
+    메모리 인덱스 기준 후보 충돌 사전 거절 (쓰기 락 밖).
+    인덱스 충돌은 DB에서 다시 확인한 뒤에만 거절하며 (다른 워커의 취소 반영),
+    통과해도 락 안의 DB 검사가 최종 판단합니다.
+    """
+    if not settings.RESERVATION_INDEX_ENABLED:
+        return
+
+    index = reservation_index.active_index
+    if seat_id is not None and reservation_index.confirm_conflict(
+        db, lambda: index.seat_conflict(seat_id, start_time, end_time)
+    ):
+        metrics.RESERVATION_PRECHECKS.inc(facility="seat", result="rejected")
+        raise ConflictException(
+            code=ErrorCode.RESERVATION_CONFLICT,
+            message="해당 시간대에 이미 좌석 예약이 존재합니다.",
+        )
+    if reservation_index.confirm_conflict(
+        db, lambda: index.student_conflict(student_id, start_time, end_time, include_meeting_rooms=False)
+    ):
+        metrics.RESERVATION_PRECHECKS.inc(facility="seat", result="rejected")
+        raise ConflictException(
+            code=ErrorCode.OVERLAP_WITH_OTHER_FACILITY,
+            message="동일 시간대에 이미 좌석 예약이 존재합니다.",
+        )
+    if reservation_index.confirm_conflict(
+        db, lambda: index.student_conflict(student_id, start_time, end_time, include_seats=False)
+    ):
+        metrics.RESERVATION_PRECHECKS.inc(facility="seat", result="rejected")
+        raise ConflictException(
+            code=ErrorCode.OVERLAP_WITH_OTHER_FACILITY,
+            message="동일 시간대에 이미 회의실 예약이 존재합니다.",
+        )
+    metrics.RESERVATION_PRECHECKS.inc(facility="seat", result="passed")
+
+
+def _to_utc_range(request: SeatReservationCreate) -> Tuple[datetime, datetime]:
+    start_dt_kst = datetime.combine(request.date, request.start_time, tzinfo=KST)
+    end_dt_kst = datetime.combine(request.date, request.end_time, tzinfo=KST)
+    return start_dt_kst.astimezone(timezone.utc), end_dt_kst.astimezone(timezone.utc)
+
+
+def _overlaps_any(intervals: List[Tuple[int, int]], interval: Tuple[int, int]) -> bool:
+    start_minute, end_minute = interval
+    return any(s < end_minute and e > start_minute for s, e in intervals)
+
+
+def _seat_intervals(
+    db: Session, seat_ids: Iterable[int], start: datetime, end: datetime
+) -> Dict[int, List[Tuple[int, int]]]:
+    """기간 내 좌석별 활성 예약 구간 (epoch 분)"""
+    busy: Dict[int, List[Tuple[int, int]]] = defaultdict(list)
+    rows = db.execute(
+        select(
+            models.Reservation.seat_id, models.Reservation.start_minute, models.Reservation.end_minute
+        ).where(
+            models.Reservation.seat_id.in_(list(seat_ids)),
+            models.Reservation.status.in_(CONFLICT_CHECK_STATUSES),
+            models.Reservation.overlaps(start, end),
+        )
+    )
+    for row in rows:
+        busy[row.seat_id].append((row.start_minute, row.end_minute))
+    return busy
+
+
+def _student_intervals(
+    db: Session, student_id: int, start: datetime, end: datetime
+) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+    """기간 내 본인 활성 예약 구간 (좌석, 회의실 예약자·참여자)"""
+    reservation = models.Reservation
+    seat_busy: List[Tuple[int, int]] = []
+    room_busy: List[Tuple[int, int]] = []
+
+    owned = db.execute(
+        select(reservation.seat_id, reservation.start_minute, reservation.end_minute).where(
+            reservation.student_id == student_id,
+            reservation.status.in_(CONFLICT_CHECK_STATUSES),
+            reservation.overlaps(start, end),
+        )
+    )
+    for row in owned:
+        target = seat_busy if row.seat_id is not None else room_busy
+        target.append((row.start_minute, row.end_minute))
+
+    joined = db.execute(
+        select(reservation.start_minute, reservation.end_minute)
+        .join(
+            models.ReservationParticipant,
+            reservation.reservation_id == models.ReservationParticipant.reservation_id,
+        )
+        .where(
+            models.ReservationParticipant.participant_student_id == student_id,
+            reservation.meeting_room_id.isnot(None),
+            reservation.status.in_(CONFLICT_CHECK_STATUSES),
+            reservation.overlaps(start, end),
+        )
+    )
+    room_busy.extend((row.start_minute, row.end_minute) for row in joined)
+    return seat_busy, room_busy
+
+
+def _daily_seat_usage_by_day(
+    db: Session, student_id: int, start: datetime, end: datetime
+) -> Dict[int, int]:
+    """기간이 걸친 KST 날짜별 본인 좌석 이용량(분) - 키는 KST 기준 epoch 일자"""
+    first_day = (to_epoch_minutes(start) + KST_OFFSET_MINUTES) // MINUTES_PER_DAY
+    last_day = (to_epoch_minutes(end) + KST_OFFSET_MINUTES) // MINUTES_PER_DAY
+
+    rows = db.execute(
+        select(models.Reservation.start_minute, models.Reservation.end_minute).where(
+            models.Reservation.student_id == student_id,
+            models.Reservation.seat_id.isnot(None),
+            models.Reservation.status.in_(USAGE_COUNT_STATUSES),
+            models.Reservation.start_minute >= first_day * MINUTES_PER_DAY - KST_OFFSET_MINUTES,
+            models.Reservation.start_minute < (last_day + 1) * MINUTES_PER_DAY - KST_OFFSET_MINUTES,
+        )
+    )
+    used: Dict[int, int] = defaultdict(int)
+    for row in rows:
+        used[(row.start_minute + KST_OFFSET_MINUTES) // MINUTES_PER_DAY] += row.end_minute - row.start_minute
+    return used
+
+
 def _ensure_no_seat_conflict(
     db: Session,
     seat_id: int,
@@ -198,8 +498,7 @@ def _ensure_no_seat_conflict(
         .filter(
             models.Reservation.seat_id == seat_id,
             models.Reservation.status.in_(CONFLICT_CHECK_STATUSES),
-            models.Reservation.start_time < end_time,
-            models.Reservation.end_time > start_time,
+            models.Reservation.overlaps(start_time, end_time),
         )
         .first()
     )
@@ -222,34 +521,35 @@ def _get_daily_seat_usage_minutes(
     start_of_day_utc = start_of_day_kst.astimezone(timezone.utc)
     end_of_day_utc = end_of_day_kst.astimezone(timezone.utc)
 
-    reservations = (
-        db.query(models.Reservation)
-        .filter(
+    # 정수 시각 차이를 DB에서 합산 (행을 ORM 객체로 읽지 않음)
+    used_minutes = db.execute(
+        select(
+            func.coalesce(
+                func.sum(models.Reservation.end_minute - models.Reservation.start_minute), 0
+            )
+        ).where(
             models.Reservation.student_id == student_id,
             models.Reservation.seat_id.isnot(None),
             models.Reservation.status.in_(USAGE_COUNT_STATUSES),
-            models.Reservation.start_time >= start_of_day_utc,
-            models.Reservation.start_time <= end_of_day_utc,
+            models.Reservation.starts_between(start_of_day_utc, end_of_day_utc),
         )
-        .all()
-    )
+    ).scalar()
 
-    return int(
-        sum(
-            (reservation.end_time - reservation.start_time).total_seconds() / 60
-            for reservation in reservations
-        )
-    )
+    return int(used_minutes)
 
 
 def _find_and_lock_random_available_seat(
     db: Session,
     start_time: datetime,
     end_time: datetime,
+    exclude_seat_ids: Iterable[int] = (),
 ) -> Optional[int]:
     """
     DB 쿼리 한 번으로 예약 가능한 좌석을 찾아 Lock을 걸고 반환합니다.
     (동시성 문제 해결 + 성능 최적화)
+
+    이용 가능 좌석 목록은 메모리 캐시에서 가져오고, DB에서는 해당 시간대에
+    이미 예약된 좌석만 조회합니다. (캐시 로드 전에는 좌석 테이블과 함께 조회)
     """
     
     # 1. 해당 시간대에 이미 예약된 좌석 ID들을 찾는 서브쿼리
@@ -258,11 +558,18 @@ def _find_and_lock_random_available_seat(
         .where(
             models.Reservation.seat_id.isnot(None),
             models.Reservation.status.in_(CONFLICT_CHECK_STATUSES),
-            models.Reservation.end_time > start_time,
-            models.Reservation.start_time < end_time,
+            models.Reservation.overlaps(start_time, end_time),
         )
     )
 
+    snapshot = facility_availability.ensure_current(db)
+    if snapshot.loaded:
+        # 2. 캐시의 이용 가능 좌석에서 예약된 좌석을 빼고 랜덤 선택
+        occupied = set(db.scalars(occupied_subquery))
+        occupied.update(exclude_seat_ids)
+        candidates = [seat_id for seat_id in snapshot.available_seat_ids if seat_id not in occupied]
+        return random.choice(candidates) if candidates else None
+
     # 2. 예약되지 않은(is_available=True) 좌석 중 하나를 랜덤으로 선택하여 Lock
     # func.random(): PostgreSQL, SQLite / func.rand(): MySQL
     # 사용 환경에 따라 다를 수 있으나 보통 func.random()이 표준에 가깝습니다.
@@ -270,6 +577,7 @@ def _find_and_lock_random_available_seat(
         db.query(models.Seat.seat_id)
         .filter(models.Seat.is_available.is_(True))
         .filter(models.Seat.seat_id.notin_(occupied_subquery))
+        .filter(models.Seat.seat_id.notin_(list(exclude_seat_ids)))
         .order_by(func.random())  # DB 랜덤 정렬
         .limit(1)
     )
@@ -0,0 +1,348 @@
+"""
+services/series_service.py - Recurring Meeting Room Reservation Service
+======================================================================
+회의실 반복 예약(매일 / 매주) 생성
+
+- 반복 규칙을 서버에서 회차 목록으로 펼칩니다.
+- 회의실 충돌, 신청자·참여자 중복 이용, 일일/주간 한도를 회차마다 다시 조회하지 않고
+  시리즈 전체 기간에 대해 한 번씩 조회(set-based)한 뒤 메모리에서 판정합니다.
+- 앞선 회차가 통과하면 그 사용량을 누적 카운터에 더해 다음 회차 한도 판정에 반영합니다.
+- 통과한 회차는 하나의 트랜잭션으로 한 번에 저장하고, 실패한 회차는 사유와 함께 보고합니다.
+"""
+
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app import constants, facility_availability, lock_profiler, models, schemas
+from app.config import settings
+from app.constants import ErrorCode
+from app.database import begin_immediate
+from app.exceptions import ValidationException
+from app.models import to_epoch_minutes
+from app.services import user_service
+from app.services.meeting_room_service import (
+    CONFLICT_CHECK_STATUSES,
+    KST,
+    USAGE_COUNT_STATUSES,
+)
+
+MINUTES_PER_DAY = 24 * 60
+
+# (start_minute, end_minute)
+Interval = Tuple[int, int]
+
+
+def create_series(
+    db: Session,
+    student_id: int,
+    request: schemas.MeetingRoomSeriesCreate,
+) -> schemas.MeetingRoomSeriesResponse:
+    """
+    반복 예약 생성
+
+    Returns:
+        시리즈 ID와 회차별 결과 (통과한 회차가 없으면 시리즈를 만들지 않음)
+    """
+    if settings.SHARDING_ENABLED:
+        raise ValidationException(
+            code=ErrorCode.VALIDATION_ERROR,
+            message="샤딩 모드에서는 반복 예약을 지원하지 않습니다.",
+        )
+
+    results: Dict[str, schemas.SeriesOccurrenceResult] = {}
+    occurrences: List[Tuple[str, datetime, datetime]] = []
+    for occurrence_date in request.occurrence_dates():
+        key = occurrence_date.isoformat()
+        try:
+            occurrence = request.occurrence_request(occurrence_date)
+        except ValidationError as e:
+            results[key] = _failed(key, ErrorCode.VALIDATION_ERROR, _validation_message(e))
+            continue
+        start_dt_utc = datetime.combine(occurrence.date, occurrence.start_time).replace(tzinfo=KST).astimezone(timezone.utc)
+        end_dt_utc = datetime.combine(occurrence.date, occurrence.end_time).replace(tzinfo=KST).astimezone(timezone.utc)
+        occurrences.append((key, start_dt_utc, end_dt_utc))
+
+    participant_ids = [p.student_id for p in request.participants]
+    participants_all = sorted({student_id} | set(participant_ids))
+
+    # get_or_create_user는 내부에서 커밋하므로 쓰기 락을 잡기 전에 처리
+    for pid in participants_all:
+        user_service.get_or_create_user(db, pid)
+
+    series_id: Optional[int] = None
+    try:
+        begin_immediate(db, section="series.create")
+
+        # ---------------------------------------------------
+        # 1. 회의실 존재 및 가용성 검증
+        # ---------------------------------------------------
+        available = facility_availability.meeting_room_available(db, request.room_id)
+        if available is None:
+            raise ValidationException(
+                code=ErrorCode.NOT_FOUND,
+                message="존재하지 않는 회의실입니다.",
+            )
+        if not available:
+            raise ValidationException(
+                code=ErrorCode.MEETING_ROOM_NOT_AVAILABLE,
+                message="해당 회의실은 현재 이용할 수 없습니다.",
+            )
+        lock_profiler.mark(db, "room_check")
+
+        # ---------------------------------------------------
+        # 2. 시리즈 기간 전체를 한 번씩 조회 후 회차별 판정
+        # ---------------------------------------------------
+        accepted: List[Tuple[str, datetime, datetime]] = []
+        if occurrences:
+            span_start = occurrences[0][1]
+            span_end = occurrences[-1][2]
+
+            room_busy = _room_intervals(db, request.room_id, span_start, span_end)
+            lock_profiler.mark(db, "room_intervals")
+            user_busy = _user_intervals(db, participants_all, span_start, span_end)
+            lock_profiler.mark(db, "user_intervals")
+            daily_used, weekly_used = _usage_minutes(db, participants_all, span_start, span_end)
+            lock_profiler.mark(db, "usage_limits")
+
+            for key, start_dt_utc, end_dt_utc in occurrences:
+                interval = (to_epoch_minutes(start_dt_utc), to_epoch_minutes(end_dt_utc))
+                failure = _check_occurrence(
+                    interval, participants_all, room_busy, user_busy, daily_used, weekly_used
+                )
+                if failure:
+                    results[key] = _failed(key, *failure)
+                    continue
+
+                # 통과한 회차를 누적해 이후 회차 판정에 반영
+                duration = interval[1] - interval[0]
+                day, week = _day_and_week(interval[0])
+                room_busy.append(interval)
+                for pid in participants_all:
+                    user_busy[pid].append(interval)
+                    daily_used[pid][day] += duration
+                    weekly_used[pid][week] += duration
+                accepted.append((key, start_dt_utc, end_dt_utc))
+            lock_profiler.mark(db, "evaluate_occurrences")
+
+        # ---------------------------------------------------
+        # 3. 통과한 회차 일괄 저장 (단일 트랜잭션)
+        # ---------------------------------------------------
+        if accepted:
+            series = models.ReservationSeries(
+                student_id=student_id,
+                meeting_room_id=request.room_id,
+                frequency=request.frequency,
+                start_date=request.start_date,
+                end_date=request.end_date,
+                start_time=request.start_time,
+                end_time=request.end_time,
+            )
+            reservations = [
+                models.Reservation(
+                    series=series,
+                    student_id=student_id,
+                    meeting_room_id=request.room_id,
+                    seat_id=None,
+                    start_time=start_dt_utc,
+                    end_time=end_dt_utc,
+                    status=models.ReservationStatus.RESERVED,
+                    participants=[
+                        models.ReservationParticipant(participant_student_id=pid)
+                        for pid in participant_ids
+                    ],
+                )
+                for _, start_dt_utc, end_dt_utc in accepted
+            ]
+            db.add(series)
+            db.add_all(reservations)
+            db.flush()
+
+            series_id = series.series_id
+            for (key, _, _), reservation in zip(accepted, reservations):
+                results[key] = schemas.SeriesOccurrenceResult(
+                    date=key, reservation_id=reservation.reservation_id
+                )
+            lock_profiler.mark(db, "insert")
+
+        db.commit()
+
+    except Exception as e:
+        db.rollback()
+        raise e
+
+    ordered = [results[d.isoformat()] for d in request.occurrence_dates()]
+    created_count = sum(1 for r in ordered if r.reservation_id is not None)
+    return schemas.MeetingRoomSeriesResponse(
+        series_id=series_id,
+        room_id=request.room_id,
+        frequency=request.frequency,
+        created_count=created_count,
+        failed_count=len(ordered) - created_count,
+        occurrences=ordered,
+    )
+
+
+# ---------------------------------------------------------------------------
+# 회차 판정
+# ---------------------------------------------------------------------------
+def _check_occurrence(
+    interval: Interval,
+    participants_all: Iterable[int],
+    room_busy: List[Interval],
+    user_busy: Dict[int, List[Interval]],
+    daily_used: Dict[int, Dict[int, int]],
+    weekly_used: Dict[int, Dict[int, int]],
+) -> Optional[Tuple[ErrorCode, str]]:
+    """회차 하나를 메모리의 점유 구간·누적 사용량으로 판정 (실패 시 (코드, 메시지))"""
+    if _overlaps_any(room_busy, interval):
+        return ErrorCode.RESERVATION_CONFLICT, "해당 회의실은 이미 예약되어 있습니다."
+
+    for pid in participants_all:
+        if _overlaps_any(user_busy[pid], interval):
+            return ErrorCode.OVERLAP_WITH_OTHER_FACILITY, f"사용자 {pid}의 동일 시간대 예약이 이미 존재합니다."
+
+    limit_daily = constants.ReservationLimits.MEETING_ROOM_DAILY_LIMIT_MINUTES
+    limit_weekly = constants.ReservationLimits.MEETING_ROOM_WEEKLY_LIMIT_MINUTES
+    duration = interval[1] - interval[0]
+    day, week = _day_and_week(interval[0])
+
+    for pid in participants_all:
+        used = daily_used[pid][day]
+        if used + duration > limit_daily:
+            return (
+                ErrorCode.DAILY_LIMIT_EXCEEDED,
+                f"사용자 {pid}의 일일 이용 한도({limit_daily}분)를 초과했습니다. (현재: {used}분 사용 중)",
+            )
+        used = weekly_used[pid][week]
+        if used + duration > limit_weekly:
+            return (
+                ErrorCode.WEEKLY_LIMIT_EXCEEDED,
+                f"사용자 {pid}의 주간 이용 한도({limit_weekly}분)를 초과했습니다. (현재: {used}분 사용 중)",
+            )
+    return None
+
+
+def _overlaps_any(intervals: List[Interval], interval: Interval) -> bool:
+    start_minute, end_minute = interval
+    return any(s < end_minute and e > start_minute for s, e in intervals)
+
+
+def _day_and_week(start_minute: int) -> Tuple[int, int]:
+    """UTC 기준 epoch 일자와 그 주 월요일의 epoch 일자 (1970-01-01은 목요일)"""
+    day = start_minute // MINUTES_PER_DAY
+    return day, day - (day + 3) % 7
+
+
+def _failed(key: str, code: ErrorCode, message: str) -> schemas.SeriesOccurrenceResult:
+    return schemas.SeriesOccurrenceResult(date=key, code=code.value, message=message)
+
+
+def _validation_message(error: ValidationError) -> str:
+    message = error.errors()[0]["msg"]
+    return message.removeprefix("Value error, ")
+
+
+# ---------------------------------------------------------------------------
+# 시리즈 기간 일괄 조회
+# ---------------------------------------------------------------------------
+def _room_intervals(db: Session, room_id: int, start: datetime, end: datetime) -> List[Interval]:
+    """기간 내 회의실 활성 예약 구간"""
+    reservation = models.Reservation
+    rows = db.execute(
+        select(reservation.start_minute, reservation.end_minute).where(
+            reservation.meeting_room_id == room_id,
+            reservation.status.in_(CONFLICT_CHECK_STATUSES),
+            reservation.overlaps(start, end),
+        )
+    )
+    return [(row.start_minute, row.end_minute) for row in rows]
+
+
+def _user_intervals(
+    db: Session, student_ids: List[int], start: datetime, end: datetime
+) -> Dict[int, List[Interval]]:
+    """기간 내 학생별 활성 예약 구간 (좌석·회의실 예약자 + 회의실 참여자)"""
+    reservation = models.Reservation
+    participant = models.ReservationParticipant
+    busy: Dict[int, List[Interval]] = defaultdict(list)
+
+    owned = db.execute(
+        select(reservation.student_id, reservation.start_minute, reservation.end_minute).where(
+            reservation.student_id.in_(student_ids),
+            reservation.status.in_(CONFLICT_CHECK_STATUSES),
+            reservation.overlaps(start, end),
+        )
+    )
+    for row in owned:
+        busy[row.student_id].append((row.start_minute, row.end_minute))
+
+    joined = db.execute(
+        select(participant.participant_student_id, reservation.start_minute, reservation.end_minute)
+        .join(reservation, reservation.reservation_id == participant.reservation_id)
+        .where(
+            participant.participant_student_id.in_(student_ids),
+            reservation.meeting_room_id.isnot(None),
+            reservation.status.in_(CONFLICT_CHECK_STATUSES),
+            reservation.overlaps(start, end),
+        )
+    )
+    for row in joined:
+        busy[row.participant_student_id].append((row.start_minute, row.end_minute))
+    return busy
+
+
+def _usage_minutes(
+    db: Session, student_ids: List[int], start: datetime, end: datetime
+) -> Tuple[Dict[int, Dict[int, int]], Dict[int, Dict[int, int]]]:
+    """
+    시리즈 기간을 포함하는 주(월요일~일요일, UTC) 범위의 학생별 회의실 사용량
+
+    Returns:
+        (일자별 사용 분, 주별 사용 분) - 키는 epoch 일자 / 주 월요일의 epoch 일자
+    """
+    reservation = models.Reservation
+    participant = models.ReservationParticipant
+
+    first_week = _day_and_week(to_epoch_minutes(start))[1]
+    last_week = _day_and_week(to_epoch_minutes(end))[1]
+    range_start = first_week * MINUTES_PER_DAY
+    range_end = (last_week + 7) * MINUTES_PER_DAY
+
+    base = (
+        reservation.meeting_room_id.isnot(None),
+        reservation.status.in_(USAGE_COUNT_STATUSES),
+        reservation.start_minute >= range_start,
+        reservation.start_minute < range_end,
+    )
+    owned = db.execute(
+        select(
+            reservation.student_id, reservation.reservation_id,
+            reservation.start_minute, reservation.end_minute,
+        ).where(reservation.student_id.in_(student_ids), *base)
+    )
+    joined = db.execute(
+        select(
+            participant.participant_student_id, reservation.reservation_id,
+            reservation.start_minute, reservation.end_minute,
+        )
+        .join(reservation, reservation.reservation_id == participant.reservation_id)
+        .where(participant.participant_student_id.in_(student_ids), *base)
+    )
+
+    # 예약자이면서 참여자로도 등록된 경우 한 번만 계산
+    seen: Set[Tuple[int, int]] = set()
+    daily: Dict[int, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+    weekly: Dict[int, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+    for pid, reservation_id, start_minute, end_minute in list(owned) + list(joined):
+        if (pid, reservation_id) in seen:
+            continue
+        seen.add((pid, reservation_id))
+        day, week = _day_and_week(start_minute)
+        daily[pid][day] += end_minute - start_minute
+        weekly[pid][week] += end_minute - start_minute
+    return daily, weekly
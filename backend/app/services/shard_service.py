@@ -0,0 +1,636 @@
+"""
+services/shard_service.py - Sharded Reservation Service
+=======================================================
+건물별 샤딩 모드(settings.SHARDING_ENABLED)의 예약 생성·취소·조회.
+
+예약 생성 순서 (락 범위 최소화):
+1. 건물 샤드에서 BEGIN IMMEDIATE → 시설 충돌 검사 (건물 단위 락)
+2. 메인 DB에서 BEGIN IMMEDIATE → 사용자 인덱스로 중복 이용·이용 한도 검사,
+   전역 예약 ID 발급 및 인덱스 기록 후 즉시 커밋 (짧은 전역 락)
+3. 샤드에 예약 INSERT 후 커밋
+   3이 실패하면 2에서 기록한 인덱스/디렉터리 행을 삭제(보상)합니다.
+
+예약 취소도 같은 순서입니다. 인덱스를 먼저 CANCELED로 바꾸고 샤드에서 취소하며,
+샤드 취소가 실패하면 인덱스 상태를 되돌립니다. (샤드 예약이 이미 취소된 경우는 샤드 기준으로 CANCELED 유지)
+
+시설 충돌 검사와 예약 기록은 건물별로 병렬 진행되고,
+전역 락은 사용자 인덱스 검사·기록 구간에서만 잡습니다.
+"""
+
+import random
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from app import constants, facility_availability, facility_registry, models, schemas
+from app.constants import ErrorCode, ReservationLimits
+from app.database import begin_immediate
+from app.exceptions import (
+    BusinessException,
+    ConflictException,
+    ForbiddenException,
+    LimitExceededException,
+    ValidationException,
+)
+from app.sharding import shard_router
+from app.services import (
+    meeting_room_service,
+    reservation_service,
+    seat_service,
+    status_service,
+    user_service,
+)
+
+KST = timezone(timedelta(hours=9))
+
+CONFLICT_CHECK_STATUSES = [
+    models.ReservationStatus.RESERVED,
+    models.ReservationStatus.IN_USE,
+]
+
+USAGE_COUNT_STATUSES = [
+    models.ReservationStatus.RESERVED,
+    models.ReservationStatus.IN_USE,
+    models.ReservationStatus.COMPLETED,
+]
+
+Index = models.UserReservationIndex
+
+
+# ---------------------------------------------------------------------------
+# 사용자 인덱스 (메인 DB)
+# ---------------------------------------------------------------------------
+def _index_has_overlap(
+    db: Session,
+    student_id: int,
+    start_time: datetime,
+    end_time: datetime,
+    include_seats: bool = True,
+    include_meeting_rooms: bool = True,
+) -> bool:
+    """사용자 인덱스 기준 동일 시간대 예약(예약자/참여자) 존재 여부"""
+    stmt = select(Index.id).where(
+        Index.student_id == student_id,
+        Index.status.in_(CONFLICT_CHECK_STATUSES),
+        Index.overlaps(start_time, end_time),
+    )
+    if include_seats and not include_meeting_rooms:
+        stmt = stmt.where(Index.seat_id.isnot(None))
+    elif include_meeting_rooms and not include_seats:
+        stmt = stmt.where(Index.meeting_room_id.isnot(None))
+
+    return db.execute(stmt.limit(1)).first() is not None
+
+
+def _index_usage_minutes(
+    db: Session,
+    student_id: int,
+    range_start: datetime,
+    range_end: datetime,
+    seats: bool,
+) -> int:
+    """사용자 인덱스 기준 기간 내 좌석(seats=True) 또는 회의실 이용 시간(분)"""
+    facility_column = Index.seat_id if seats else Index.meeting_room_id
+    used_minutes = db.execute(
+        select(func.coalesce(func.sum(Index.end_minute - Index.start_minute), 0)).where(
+            Index.student_id == student_id,
+            facility_column.isnot(None),
+            Index.status.in_(USAGE_COUNT_STATUSES),
+            Index.starts_between(range_start, range_end),
+        )
+    ).scalar()
+
+    return int(used_minutes)
+
+
+def _register(
+    db: Session,
+    building_id: int,
+    student_id: int,
+    participant_ids: List[int],
+    seat_id: Optional[int],
+    room_id: Optional[int],
+    start_time: datetime,
+    end_time: datetime,
+    check: Callable[[], None],
+) -> int:
+    """
+    메인 DB: 사용자 검사(check) 후 전역 예약 ID 발급 + 사용자 인덱스 기록
+
+    Returns:
+        발급된 전역 reservation_id
+    """
+    try:
+        begin_immediate(db)
+        check()
+
+        entry = models.ReservationDirectory(building_id=building_id)
+        db.add(entry)
+        db.flush()
+        reservation_id = entry.reservation_id
+
+        members = [(student_id, True)] + [
+            (pid, False) for pid in participant_ids if pid != student_id
+        ]
+        for member_id, is_owner in members:
+            db.add(Index(
+                reservation_id=reservation_id,
+                student_id=member_id,
+                building_id=building_id,
+                seat_id=seat_id,
+                meeting_room_id=room_id,
+                start_time=start_time,
+                end_time=end_time,
+                status=models.ReservationStatus.RESERVED,
+                is_owner=is_owner,
+            ))
+
+        db.commit()
+        return reservation_id
+
+    except Exception as e:
+        db.rollback()
+        raise e
+
+
+def _unregister(db: Session, reservation_id: int) -> None:
+    """샤드 기록 실패 시 보상: 인덱스/디렉터리 행 삭제"""
+    try:
+        begin_immediate(db)
+        db.execute(delete(Index).where(Index.reservation_id == reservation_id))
+        db.execute(
+            delete(models.ReservationDirectory)
+            .where(models.ReservationDirectory.reservation_id == reservation_id)
+        )
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        raise e
+
+
+def _set_index_status(
+    db: Session,
+    reservation_id: int,
+    from_status: models.ReservationStatus,
+    to_status: models.ReservationStatus,
+) -> int:
+    """인덱스 행 상태 전환 (from_status인 행만) - 변경된 행 수 반환"""
+    try:
+        begin_immediate(db)
+        result = db.execute(
+            update(Index)
+            .where(Index.reservation_id == reservation_id, Index.status == from_status)
+            .values(status=to_status)
+        )
+        db.commit()
+        return result.rowcount
+    except Exception as e:
+        db.rollback()
+        raise e
+
+
+# ---------------------------------------------------------------------------
+# 좌석 예약
+# ---------------------------------------------------------------------------
+def _building_seat_ids(building_id: int) -> List[int]:
+    """건물에 속한 좌석 번호 (열람실 범위 기준)"""
+    snapshot = facility_registry.get_snapshot()
+    seat_ids = []
+    for reading_room_id in snapshot.buildings[building_id].reading_room_ids:
+        room = snapshot.reading_rooms[reading_room_id]
+        seat_ids.extend(range(room.seat_min_id, room.seat_max_id + 1))
+    return seat_ids
+
+
+def _check_seat_available(db: Session, seat_id: int) -> None:
+    """좌석 존재·이용 가능 여부 (메모리 캐시, 쓰기 락 안에서는 DB 버전 확인 후)"""
+    available = facility_availability.seat_available(db, seat_id)
+    if available is None:
+        raise BusinessException(
+            code=ErrorCode.NOT_FOUND,
+            message=f"좌석 ID {seat_id}번을 찾을 수 없습니다.",
+        )
+    if not available:
+        raise BusinessException(
+            code=ErrorCode.SEAT_NOT_AVAILABLE,
+            message=f"좌석 ID {seat_id}번은 현재 이용 불가 상태입니다.",
+        )
+
+
+def _lock_random_seat(
+    db: Session,
+    start_time: datetime,
+    end_time: datetime,
+) -> Tuple[Optional[int], Optional[int], Optional[Session]]:
+    """
+    건물을 무작위 순서로 돌며 가용 좌석을 찾아 해당 샤드의 쓰기 락을 잡은 채 반환
+
+    Returns:
+        (building_id, seat_id, 락을 잡은 샤드 세션) - 없으면 (None, None, None)
+    """
+    # 이용 가능 좌석은 메모리 캐시로 확인 (좌석 테이블 조회 생략, 락 안에서 _check_seat_available로 재확인)
+    available = set(facility_availability.ensure_current(db).available_seat_ids)
+
+    building_ids = shard_router.building_ids()
+    random.shuffle(building_ids)
+
+    for building_id in building_ids:
+        shard = shard_router.session(building_id)
+        try:
+            begin_immediate(shard)
+            occupied = set(
+                shard.execute(
+                    select(models.Reservation.seat_id).where(
+                        models.Reservation.seat_id.isnot(None),
+                        models.Reservation.status.in_(CONFLICT_CHECK_STATUSES),
+                        models.Reservation.overlaps(start_time, end_time),
+                    )
+                ).scalars()
+            )
+            candidates = [
+                seat_id for seat_id in _building_seat_ids(building_id)
+                if seat_id in available and seat_id not in occupied
+            ]
+            if candidates:
+                return building_id, random.choice(candidates), shard
+        except Exception:
+            shard.rollback()
+            shard.close()
+            raise
+
+        shard.rollback()
+        shard.close()
+
+    return None, None, None
+
+
+def reserve_seat(
+    db: Session,
+    student_id: int,
+    request: schemas.SeatReservationCreate,
+) -> models.Reservation:
+    """
+    좌석 예약 (샤딩 모드) - seat_service.reserve_seat와 동일한 검증 규칙
+    """
+    user_service.get_or_create_user(db, student_id)
+
+    start_dt_kst = datetime.combine(request.date, request.start_time, tzinfo=KST)
+    end_dt_kst = datetime.combine(request.date, request.end_time, tzinfo=KST)
+    start_dt_utc = start_dt_kst.astimezone(timezone.utc)
+    end_dt_utc = end_dt_kst.astimezone(timezone.utc)
+    duration_minutes = (end_dt_utc - start_dt_utc).total_seconds() / 60
+
+    seat_service.precheck_conflicts(db, student_id, request.seat_id, start_dt_utc, end_dt_utc)
+
+    # 1. 좌석 결정 + 건물 샤드 쓰기 락
+    if request.seat_id is not None:
+        _check_seat_available(db, request.seat_id)
+        seat_id = request.seat_id
+        building_id = shard_router.building_for_seat(seat_id)
+        shard = shard_router.session(building_id)
+    else:
+        building_id, seat_id, shard = _lock_random_seat(db, start_dt_utc, end_dt_utc)
+        if shard is None:
+            raise ConflictException(
+                code=ErrorCode.RESERVATION_CONFLICT,
+                message="해당 시간대에 예약 가능한 좌석이 없습니다.",
+            )
+
+    try:
+        if request.seat_id is not None:
+            begin_immediate(shard)
+            conflict = shard.execute(
+                select(models.Reservation.reservation_id).where(
+                    models.Reservation.seat_id == seat_id,
+                    models.Reservation.status.in_(CONFLICT_CHECK_STATUSES),
+                    models.Reservation.overlaps(start_dt_utc, end_dt_utc),
+                ).limit(1)
+            ).first()
+            if conflict:
+                raise ConflictException(
+                    code=ErrorCode.RESERVATION_CONFLICT,
+                    message="해당 시간대에 이미 좌석 예약이 존재합니다.",
+                )
+
+        # 2. 사용자 검사 + 전역 ID 발급 (메인 DB)
+        start_of_day_kst = start_dt_kst.replace(hour=0, minute=0, second=0, microsecond=0)
+        end_of_day_kst = start_of_day_kst + timedelta(hours=23, minutes=59, seconds=59, microseconds=999999)
+
+        def check():
+            # 메인 DB 락 안에서 DB 버전과 비교한 캐시로 재확인 (다른 워커의 이용 불가 전환 반영)
+            _check_seat_available(db, seat_id)
+            if _index_has_overlap(db, student_id, start_dt_utc, end_dt_utc, include_meeting_rooms=False):
+                raise ConflictException(
+                    code=ErrorCode.OVERLAP_WITH_OTHER_FACILITY,
+                    message="동일 시간대에 이미 좌석 예약이 존재합니다.",
+                )
+            if _index_has_overlap(db, student_id, start_dt_utc, end_dt_utc, include_seats=False):
+                raise ConflictException(
+                    code=ErrorCode.OVERLAP_WITH_OTHER_FACILITY,
+                    message="동일 시간대에 이미 회의실 예약이 존재합니다.",
+                )
+
+            used_minutes = _index_usage_minutes(
+                db,
+                student_id,
+                start_of_day_kst.astimezone(timezone.utc),
+                end_of_day_kst.astimezone(timezone.utc),
+                seats=True,
+            )
+            limit_minutes = ReservationLimits.SEAT_DAILY_LIMIT_MINUTES
+            if used_minutes + duration_minutes > limit_minutes:
+                raise LimitExceededException(
+                    code=ErrorCode.DAILY_LIMIT_EXCEEDED,
+                    message=f"일일 좌석 이용 한도({limit_minutes}분)를 초과했습니다. (현재 {used_minutes}분 이용)",
+                )
+
+        reservation_id = _register(
+            db, building_id, student_id, [], seat_id, None, start_dt_utc, end_dt_utc, check
+        )
+
+        # 3. 샤드에 예약 기록 (실패 시 인덱스 보상)
+        try:
+            reservation = reservation_service.create_seat_reservation(
+                db=shard,
+                student_id=student_id,
+                seat_id=seat_id,
+                start_time=start_dt_utc,
+                end_time=end_dt_utc,
+                reservation_id=reservation_id,
+            )
+            shard.commit()
+        except Exception:
+            shard.rollback()
+            _unregister(db, reservation_id)
+            raise
+
+        shard.refresh(reservation)
+        return reservation
+
+    except Exception as e:
+        shard.rollback()
+        raise e
+    finally:
+        shard.close()
+
+
+# ---------------------------------------------------------------------------
+# 회의실 예약
+# ---------------------------------------------------------------------------
+def _check_meeting_room_available(db: Session, room_id: int) -> None:
+    """회의실 존재·이용 가능 여부 (메모리 캐시, 쓰기 락 안에서는 DB 버전 확인 후)"""
+    available = facility_availability.meeting_room_available(db, room_id)
+    if available is None:
+        raise ValidationException(
+            code=ErrorCode.NOT_FOUND,
+            message="존재하지 않는 회의실입니다.",
+        )
+    if not available:
+        raise ValidationException(
+            code=ErrorCode.MEETING_ROOM_NOT_AVAILABLE,
+            message="해당 회의실은 현재 이용할 수 없습니다.",
+        )
+
+
+def process_reservation(
+    db: Session,
+    student_id: int,
+    request: schemas.MeetingRoomReservationCreate,
+) -> models.Reservation:
+    """
+    회의실 예약 (샤딩 모드) - meeting_room_service.process_reservation과 동일한 검증 규칙
+    """
+    _check_meeting_room_available(db, request.room_id)
+
+    min_participants = constants.ReservationLimits.MEETING_ROOM_MIN_PARTICIPANTS
+    if len(request.participants) < min_participants:
+        raise ValidationException(
+            code=ErrorCode.PARTICIPANT_MIN_NOT_MET,
+            message=f"회의실 예약은 최소 {min_participants}명 이상이어야 합니다.",
+        )
+
+    meeting_room_service.precheck_conflicts(db, student_id, request)
+
+    start_dt_utc = datetime.combine(request.date, request.start_time).replace(tzinfo=KST).astimezone(timezone.utc)
+    end_dt_utc = datetime.combine(request.date, request.end_time).replace(tzinfo=KST).astimezone(timezone.utc)
+    duration_minutes = (end_dt_utc - start_dt_utc).total_seconds() / 60
+
+    user_service.get_or_create_user(db, student_id)
+    participant_ids: List[int] = []
+    for participant in request.participants:
+        user_service.get_or_create_user(db, participant.student_id)
+        participant_ids.append(participant.student_id)
+
+    building_id = shard_router.building_for_meeting_room(request.room_id)
+    shard = shard_router.session(building_id)
+
+    try:
+        # 1. 회의실 충돌 검사 (건물 샤드 락)
+        begin_immediate(shard)
+        if meeting_room_service.check_room_conflict(shard, request.room_id, start_dt_utc, end_dt_utc):
+            raise ConflictException(
+                code=ErrorCode.RESERVATION_CONFLICT,
+                message="해당 회의실은 이미 예약되어 있습니다.",
+            )
+
+        # 2. 신청자/참여자 검사 + 전역 ID 발급 (메인 DB)
+        participants_all = {student_id} | set(participant_ids)
+        limit_daily = constants.ReservationLimits.MEETING_ROOM_DAILY_LIMIT_MINUTES
+        limit_weekly = constants.ReservationLimits.MEETING_ROOM_WEEKLY_LIMIT_MINUTES
+        start_of_day = start_dt_utc.replace(hour=0, minute=0, second=0, microsecond=0)
+        end_of_day = start_dt_utc.replace(hour=23, minute=59, second=59, microsecond=999999)
+        start_of_week = start_of_day - timedelta(days=start_dt_utc.weekday())
+        end_of_week = start_of_week + timedelta(days=6, hours=23, minutes=59, seconds=59)
+
+        def check():
+            _check_meeting_room_available(db, request.room_id)
+            for pid in participants_all:
+                if _index_has_overlap(db, pid, start_dt_utc, end_dt_utc):
+                    raise ConflictException(
+                        code=ErrorCode.OVERLAP_WITH_OTHER_FACILITY,
+                        message=f"사용자 {pid}의 동일 시간대 예약이 이미 존재합니다.",
+                    )
+
+            for pid in participants_all:
+                daily_used = _index_usage_minutes(db, pid, start_of_day, end_of_day, seats=False)
+                if daily_used + duration_minutes > limit_daily:
+                    raise LimitExceededException(
+                        code=ErrorCode.DAILY_LIMIT_EXCEEDED,
+                        message=f"사용자 {pid}의 일일 이용 한도({limit_daily}분)를 초과했습니다. (현재: {int(daily_used)}분 사용 중)",
+                    )
+
+                weekly_used = _index_usage_minutes(db, pid, start_of_week, end_of_week, seats=False)
+                if weekly_used + duration_minutes > limit_weekly:
+                    raise LimitExceededException(
+                        code=ErrorCode.WEEKLY_LIMIT_EXCEEDED,
+                        message=f"사용자 {pid}의 주간 이용 한도({limit_weekly}분)를 초과했습니다. (현재: {int(weekly_used)}분 사용 중)",
+                    )
+
+        reservation_id = _register(
+            db, building_id, student_id, participant_ids, None, request.room_id,
+            start_dt_utc, end_dt_utc, check,
+        )
+
+        # 3. 샤드에 예약 기록 (실패 시 인덱스 보상)
+        try:
+            reservation = reservation_service.create_meeting_room_reservation(
+                db=shard,
+                student_id=student_id,
+                room_id=request.room_id,
+                start_time=start_dt_utc,
+                end_time=end_dt_utc,
+                participant_ids=participant_ids,
+                reservation_id=reservation_id,
+            )
+            shard.commit()
+        except Exception:
+            shard.rollback()
+            _unregister(db, reservation_id)
+            raise
+
+        shard.refresh(reservation)
+        return reservation
+
+    except Exception as e:
+        shard.rollback()
+        raise e
+    finally:
+        shard.close()
+
+
+# ---------------------------------------------------------------------------
+# 취소 / 조회
+# ---------------------------------------------------------------------------
+def cancel_reservation(
+    db: Session,
+    reservation_id: int,
+    student_id: int,
+) -> models.Reservation:
+    """
+    예약 취소 (샤딩 모드) - 디렉터리로 샤드를 찾아 취소
+
+    인덱스를 먼저 CANCELED로 바꾼 뒤 샤드에서 취소하고, 샤드 취소가 실패하면 인덱스를 되돌립니다.
+    (샤드가 취소됐는데 인덱스만 RESERVED로 남아 사용자가 그 시간대에 계속 막히는 상태 방지)
+    """
+    entry = db.get(models.ReservationDirectory, reservation_id)
+    if entry is None:
+        raise BusinessException(
+            code=ErrorCode.NOT_FOUND,
+            message=f"예약 ID {reservation_id}를 찾을 수 없습니다.",
+        )
+
+    owner_id = db.execute(
+        select(Index.student_id)
+        .where(Index.reservation_id == reservation_id, Index.is_owner.is_(True))
+    ).scalar()
+    if owner_id is not None and owner_id != student_id:
+        raise ForbiddenException(
+            code=ErrorCode.AUTH_FORBIDDEN,
+            message="본인의 예약만 취소할 수 있습니다.",
+        )
+
+    # 1. 인덱스 먼저 취소 (메인 DB, 짧은 전역 락)
+    changed = _set_index_status(
+        db, reservation_id, models.ReservationStatus.RESERVED, models.ReservationStatus.CANCELED
+    )
+
+    # 2. 샤드에서 취소 (실패 시 인덱스 보상)
+    shard = shard_router.session(entry.building_id)
+    try:
+        reservation = reservation_service.cancel_reservation(
+            shard, reservation_id, student_id, promote_waitlist=False
+        )
+    except Exception as e:
+        # 샤드 예약이 이미 취소된 상태면 샤드가 기준이므로 인덱스는 CANCELED로 둠 (이전 불일치 복구 포함)
+        already_canceled = getattr(e, "code", None) == ErrorCode.RESERVATION_ALREADY_CANCELED
+        if changed and not already_canceled:
+            _set_index_status(
+                db, reservation_id, models.ReservationStatus.CANCELED, models.ReservationStatus.RESERVED
+            )
+        raise e
+    finally:
+        shard.close()
+
+    return reservation
+
+
+def get_user_reservations_page(
+    db: Session,
+    student_id: int,
+    start_from: Optional[datetime] = None,
+    start_before: Optional[datetime] = None,
+    reservation_type: Optional[str] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[Tuple[datetime, int]] = None,
+    include_archived: bool = False,
+) -> List[Row]:
+    """
+    내 예약 목록 (샤딩 모드) - 사용자 인덱스만 조회하므로 샤드를 순회하지 않습니다.
+
+    아카이브는 샤딩 모드에서 지원하지 않으므로 include_archived는 무시합니다.
+    """
+    filters = reservation_service._build_my_reservation_filters(
+        Index, start_from, start_before, reservation_type, cursor
+    )
+    stmt = (
+        select(
+            Index.reservation_id,
+            Index.meeting_room_id,
+            Index.seat_id,
+            Index.start_time,
+            Index.end_time,
+            Index.status,
+        )
+        .where(Index.student_id == student_id, *filters)
+        .order_by(Index.start_time.desc(), Index.reservation_id.desc())
+    )
+    if limit is not None:
+        stmt = stmt.limit(limit)
+
+    return list(db.execute(stmt).all())
+
+
+def get_seat_status(db: Session, target_date: date) -> schemas.SeatStatusPayload:
+    """좌석 현황 (샤딩 모드) - 건물 샤드별로 조회 후 병합"""
+    snapshot = facility_registry.get_snapshot()
+    seats_by_building: Dict[int, List[int]] = defaultdict(list)
+    for seat_id in snapshot.sorted_seat_ids:
+        seats_by_building[snapshot.seat_buildings[seat_id]].append(seat_id)
+
+    payload = status_service.get_seat_status(db, target_date, seat_ids=[])
+    seats = []
+    for building_id, seat_ids in sorted(seats_by_building.items()):
+        shard = shard_router.session(building_id)
+        try:
+            seats.extend(status_service.get_seat_status(shard, target_date, seat_ids=seat_ids).seats)
+        finally:
+            shard.close()
+
+    seats.sort(key=lambda seat: seat.seat_id)
+    return payload.model_copy(update={"seats": seats})
+
+
+def get_meeting_room_status(db: Session, target_date: date) -> schemas.MeetingRoomStatusPayload:
+    """회의실 현황 (샤딩 모드) - 건물 샤드별로 조회 후 병합 (건물 미지정 회의실 제외)"""
+    snapshot = facility_registry.get_snapshot()
+    rooms_by_building: Dict[int, List[int]] = defaultdict(list)
+    for room_id in snapshot.sorted_meeting_room_ids:
+        building_id = snapshot.meeting_room_buildings.get(room_id)
+        if building_id is not None:
+            rooms_by_building[building_id].append(room_id)
+
+    payload = status_service.get_meeting_room_status(db, target_date, room_ids=[])
+    rooms = []
+    for building_id, room_ids in sorted(rooms_by_building.items()):
+        shard = shard_router.session(building_id)
+        try:
+            rooms.extend(status_service.get_meeting_room_status(shard, target_date, room_ids=room_ids).rooms)
+        finally:
+            shard.close()
+
+    rooms.sort(key=lambda room: room.room_id)
+    return payload.model_copy(update={"rooms": rooms})
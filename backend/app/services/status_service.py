@@ -3,12 +3,12 @@ services/status_service.py - Status query helpers.
 """
 
 from datetime import date, time as Time, datetime, timezone, timedelta
-from typing import List
+from typing import Iterable, List, Optional
 
 from sqlalchemy.orm import Session
 
-from app import models, schemas
-from app.constants import FacilityConstants, OperationHours, ReservationLimits, SeatSlotConstants
+from app import facility_availability, facility_registry, models, schemas
+from app.constants import OperationHours, ReservationLimits, SeatSlotConstants
 
 KST = timezone(timedelta(hours=9))
 CONFLICT_CHECK_STATUSES = [
@@ -19,10 +19,13 @@ CONFLICT_CHECK_STATUSES = [
 
 def get_meeting_room_status(
     db: Session,
-    target_date: date
+    target_date: date,
+    room_ids: Optional[Iterable[int]] = None,
 ) -> schemas.MeetingRoomStatusPayload:
     """
     회의실 예약 현황 조회 (날짜별, 슬롯별)
+
+    room_ids를 주면 해당 회의실만 조회합니다. (샤딩 모드에서 건물별 조회)
     """
     # 1. 운영 시간 정보
     operation_hours = schemas.TimeRange(
@@ -39,10 +42,20 @@ def get_meeting_room_status(
         slots_time.append((start, end))
         current_hour += 1
 
-    # 3. 각 회의실별로 슬롯 상태 생성
+    # 3. 각 회의실별로 슬롯 상태 생성 (관리자가 비활성화한 회의실은 조회 없이 전체 불가)
     rooms = []
-    for room_id in FacilityConstants.MEETING_ROOM_IDS:
+    if room_ids is None:
+        room_ids = facility_registry.get_snapshot().sorted_meeting_room_ids
+    disabled_ids = facility_availability.get_snapshot().disabled_meeting_room_ids
+    for room_id in room_ids:
         room_slots = []
+        if room_id in disabled_ids:
+            rooms.append(schemas.MeetingRoomRoomStatus(
+                room_id=room_id,
+                is_available=False,
+                slots=[_unavailable_slot(schemas.MeetingRoomSlotStatus, *slot) for slot in slots_time],
+            ))
+            continue
 
         for start_time, end_time in slots_time:
             # KST 시간을 UTC로 변환
@@ -55,8 +68,7 @@ def get_meeting_room_status(
             conflict = db.query(models.Reservation).filter(
                 models.Reservation.meeting_room_id == room_id,
                 models.Reservation.status.in_(CONFLICT_CHECK_STATUSES),
-                models.Reservation.start_time < end_dt_utc,
-                models.Reservation.end_time > start_dt_utc,
+                models.Reservation.overlaps(start_dt_utc, end_dt_utc),
             ).first()
 
             room_slots.append(schemas.MeetingRoomSlotStatus(
@@ -80,10 +92,13 @@ def get_meeting_room_status(
 
 def get_seat_status(
     db: Session,
-    target_date: date
+    target_date: date,
+    seat_ids: Optional[Iterable[int]] = None,
 ) -> schemas.SeatStatusPayload:
     """
     좌석 예약 현황 조회 (날짜별, 슬롯별)
+
+    seat_ids를 주면 해당 좌석만 조회합니다. (샤딩 모드에서 건물별 조회)
     """
     # 1. 운영 시간 정보
     operation_hours = schemas.TimeRange(
@@ -100,10 +115,20 @@ def get_seat_status(
         end = Time(end_hour, end_minute)
         slots_time.append((start, end))
 
-    # 3. 각 좌석별로 슬롯 상태 생성
+    # 3. 각 좌석별로 슬롯 상태 생성 (관리자가 비활성화한 좌석은 조회 없이 전체 불가)
     seats = []
-    for seat_id in range(FacilityConstants.SEAT_MIN_ID, FacilityConstants.SEAT_MAX_ID + 1):
+    if seat_ids is None:
+        seat_ids = facility_registry.get_snapshot().sorted_seat_ids
+    disabled_ids = facility_availability.get_snapshot().disabled_seat_ids
+    for seat_id in seat_ids:
         seat_slots = []
+        if seat_id in disabled_ids:
+            seats.append(schemas.SeatSeatStatus(
+                seat_id=seat_id,
+                is_available=False,
+                slots=[_unavailable_slot(schemas.SeatSlotStatus, *slot) for slot in slots_time],
+            ))
+            continue
 
         for start_time, end_time in slots_time:
             # KST 시간을 UTC로 변환
@@ -116,8 +141,7 @@ def get_seat_status(
             conflict = db.query(models.Reservation).filter(
                 models.Reservation.seat_id == seat_id,
                 models.Reservation.status.in_(CONFLICT_CHECK_STATUSES),
-                models.Reservation.start_time < end_dt_utc,
-                models.Reservation.end_time > start_dt_utc,
+                models.Reservation.overlaps(start_dt_utc, end_dt_utc),
             ).first()
 
             seat_slots.append(schemas.SeatSlotStatus(
@@ -137,3 +161,11 @@ def get_seat_status(
         slot_unit_minutes=ReservationLimits.SEAT_SLOT_MINUTES,
         seats=seats,
     )
+
+
+def _unavailable_slot(slot_class, start_time: Time, end_time: Time):
+    return slot_class(
+        start=start_time.strftime("%H:%M"),
+        end=end_time.strftime("%H:%M"),
+        is_available=False,
+    )
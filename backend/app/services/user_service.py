@@ -7,10 +7,12 @@ services/user_service.py - User Service
 from datetime import datetime, timezone
 from typing import Optional, Union
 
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app import models
 from app.constants import ErrorCode
+from app.database import holds_write_lock
 from app.exceptions import BusinessException
 
 # 차단된 학번 목록 (정수로 보관하여 입력 타입에 상관없이 일관 비교)
@@ -25,6 +27,28 @@ def login_student(db: Session, student_id: Union[int, str]) -> models.User:
     return get_or_create_user(db, int(student_id))
 
 
+def get_authenticated_user(db: Session, student_id: int) -> models.User:
+    """
+    인증된 요청의 사용자 확인 (조회만 - 읽기 전용 세션에서 사용)
+
+    로그인 시간 갱신은 /auth/login에서만 하므로 요청마다 쓰기 트랜잭션을 열지 않습니다.
+    로그인한 적 없는 학번의 토큰은 거부합니다.
+    """
+    if int(student_id) in INVALID_STUDENT_IDS:
+        raise BusinessException(
+            code=ErrorCode.AUTH_INVALID_STUDENT_ID,
+            message="접근이 제한된 학번입니다.",
+        )
+
+    user = get_user(db, student_id)
+    if user is None:
+        raise BusinessException(
+            code=ErrorCode.AUTH_UNAUTHORIZED,
+            message="로그인이 필요합니다.",
+        )
+    return user
+
+
 def get_user(db: Session, student_id: int) -> Optional[models.User]:
     """학번으로 사용자 조회"""
     return db.query(models.User).filter(models.User.student_id == student_id).first()
@@ -33,8 +57,14 @@ def get_user(db: Session, student_id: int) -> Optional[models.User]:
 def get_or_create_user(db: Session, student_id: int) -> models.User:
     """
     사용자가 있으면 반환(로그인 시간 업데이트), 없으면 생성 후 반환.
+
+    내부에서 커밋하므로 begin_immediate로 쓰기 락을 잡은 뒤에 호출하면 락이 풀려
+    이후 검사와 INSERT가 락 밖에서 실행됩니다. 예약 서비스는 락을 잡기 전에 호출해야 하며,
+    락 안에서 호출하면 RuntimeError를 발생시킵니다.
     """
-    
+    if holds_write_lock(db):
+        raise RuntimeError("get_or_create_user commits and would release the write lock; call it before begin_immediate")
+
     normalized_id = int(student_id)
 
     if normalized_id in INVALID_STUDENT_IDS:
@@ -57,7 +87,14 @@ def get_or_create_user(db: Session, student_id: int) -> models.User:
         )
         db.add(user)
 
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        # 같은 학번의 첫 요청이 동시에 들어와 다른 요청이 먼저 생성한 경우 그 사용자를 사용
+        db.rollback()
+        user = get_user(db, student_id)
+        if user is None:
+            raise
     db.refresh(user)
 
     return user
@@ -0,0 +1,295 @@
+"""
+services/waitlist_service.py - Seat Waitlist Service
+====================================================
+만석인 좌석 시간대 대기열 (선착순)
+
+- 특정 좌석 또는 "아무 좌석"(seat_id=None)을 시간대별로 기다릴 수 있습니다.
+- 좌석 예약이 취소되면 cancel_reservation과 같은 트랜잭션 안에서 대기 순번이 가장 앞선 항목을
+  중복 이용·일일 한도를 다시 검증한 뒤 예약으로 전환합니다. (검증에 실패한 항목은 대기 유지)
+- 시작 시각이 지난 대기 항목은 스케줄러가 EXPIRED로 정리합니다.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.orm import Session, aliased
+
+from app import facility_availability, models, schemas
+from app.config import settings
+from app.constants import ErrorCode, ReservationLimits
+from app.database import begin_immediate
+from app.exceptions import (
+    BusinessException,
+    ConflictException,
+    ForbiddenException,
+    ValidationException,
+)
+from app.models import to_epoch_minutes
+from app.services import reservation_service, seat_service, user_service
+
+KST = timezone(timedelta(hours=9))
+
+CONFLICT_CHECK_STATUSES = [
+    models.ReservationStatus.RESERVED,
+    models.ReservationStatus.IN_USE,
+]
+
+
+def join_waitlist(
+    db: Session,
+    student_id: int,
+    request: schemas.SeatReservationCreate,
+) -> models.SeatWaitlistEntry:
+    """
+    좌석 대기 등록
+
+    - 지금 바로 예약할 수 있는 시간대이면 거절 (대기 대신 예약 유도)
+    - 같은 시간대에 본인 예약이 있거나 이미 대기 중이면 거절
+    """
+    if settings.SHARDING_ENABLED:
+        raise ValidationException(
+            code=ErrorCode.VALIDATION_ERROR,
+            message="샤딩 모드에서는 대기열을 지원하지 않습니다.",
+        )
+
+    start_dt_utc = datetime.combine(request.date, request.start_time, tzinfo=KST).astimezone(timezone.utc)
+    end_dt_utc = datetime.combine(request.date, request.end_time, tzinfo=KST).astimezone(timezone.utc)
+
+    # get_or_create_user는 내부에서 커밋하므로 쓰기 락을 잡기 전에 처리
+    user_service.get_or_create_user(db, student_id)
+
+    try:
+        begin_immediate(db)
+
+        waitlist = models.SeatWaitlistEntry
+        seat_filter = (
+            waitlist.seat_id == request.seat_id if request.seat_id is not None
+            else waitlist.seat_id.is_(None)
+        )
+        duplicate = (
+            db.query(waitlist)
+            .filter(
+                waitlist.student_id == student_id,
+                waitlist.status == models.WaitlistStatus.WAITING,
+                waitlist.start_minute == to_epoch_minutes(start_dt_utc),
+                seat_filter,
+            )
+            .first()
+        )
+        if duplicate:
+            raise ConflictException(
+                code=ErrorCode.RESERVATION_CONFLICT,
+                message="이미 대기 중인 시간대입니다.",
+            )
+
+        if reservation_service.check_overlap_with_other_facility(db, student_id, start_dt_utc, end_dt_utc):
+            raise ConflictException(
+                code=ErrorCode.OVERLAP_WITH_OTHER_FACILITY,
+                message="동일 시간대에 이미 예약이 존재합니다.",
+            )
+
+        if request.seat_id is not None:
+            if not facility_availability.seat_available(db, request.seat_id):
+                raise BusinessException(
+                    code=ErrorCode.SEAT_NOT_AVAILABLE,
+                    message=f"좌석 ID {request.seat_id}번은 현재 이용 불가 상태입니다.",
+                )
+            slot_open = not _has_seat_conflict(db, request.seat_id, start_dt_utc, end_dt_utc)
+        else:
+            slot_open = seat_service._find_and_lock_random_available_seat(
+                db, start_dt_utc, end_dt_utc
+            ) is not None
+
+        if slot_open:
+            raise ValidationException(
+                code=ErrorCode.VALIDATION_ERROR,
+                message="지금 예약 가능한 시간대입니다. 대기 대신 바로 예약해 주세요.",
+            )
+
+        entry = models.SeatWaitlistEntry(
+            student_id=student_id,
+            seat_id=request.seat_id,
+            start_time=start_dt_utc,
+            end_time=end_dt_utc,
+            status=models.WaitlistStatus.WAITING,
+        )
+        db.add(entry)
+        db.commit()
+        db.refresh(entry)
+        return entry
+
+    except Exception as e:
+        db.rollback()
+        raise e
+
+
+def cancel_waitlist(db: Session, student_id: int, waitlist_id: int) -> models.SeatWaitlistEntry:
+    """대기 취소 (WAITING 상태만)"""
+    try:
+        begin_immediate(db)
+
+        entry = db.get(models.SeatWaitlistEntry, waitlist_id)
+        if not entry:
+            raise BusinessException(
+                code=ErrorCode.NOT_FOUND,
+                message=f"대기 ID {waitlist_id}를 찾을 수 없습니다.",
+            )
+        if entry.student_id != student_id:
+            raise ForbiddenException(
+                code=ErrorCode.AUTH_FORBIDDEN,
+                message="본인의 대기만 취소할 수 있습니다.",
+            )
+        if entry.status != models.WaitlistStatus.WAITING:
+            raise ForbiddenException(
+                code=ErrorCode.AUTH_FORBIDDEN,
+                message="대기 중(WAITING) 상태만 취소할 수 있습니다.",
+            )
+
+        entry.status = models.WaitlistStatus.CANCELED
+        db.commit()
+        db.refresh(entry)
+        return entry
+
+    except Exception as e:
+        db.rollback()
+        raise e
+
+
+def get_my_waitlist(db: Session, student_id: int) -> List[models.SeatWaitlistEntry]:
+    """본인의 대기 목록 (최근 등록순)"""
+    return (
+        db.query(models.SeatWaitlistEntry)
+        .filter(models.SeatWaitlistEntry.student_id == student_id)
+        .order_by(models.SeatWaitlistEntry.waitlist_id.desc())
+        .all()
+    )
+
+
+def get_positions(db: Session, entries: List[models.SeatWaitlistEntry]) -> Dict[int, int]:
+    """
+    WAITING 항목의 대기 순번 (1부터)
+
+    특정 좌석 대기는 같은 좌석 대기 + "아무 좌석" 대기 중 앞선 항목 수로,
+    "아무 좌석" 대기는 같은 시간대의 "아무 좌석" 대기 중 앞선 항목 수로 계산합니다.
+    항목 수와 관계없이 self-join + GROUP BY 쿼리 한 번으로 모두 계산합니다.
+    """
+    waiting_ids = [e.waitlist_id for e in entries if e.status == models.WaitlistStatus.WAITING]
+    if not waiting_ids:
+        return {}
+
+    target = aliased(models.SeatWaitlistEntry)
+    ahead = aliased(models.SeatWaitlistEntry)
+    rows = db.execute(
+        select(target.waitlist_id, func.count(ahead.waitlist_id))
+        .join(ahead, and_(
+            ahead.status == models.WaitlistStatus.WAITING,
+            ahead.start_minute == target.start_minute,
+            ahead.waitlist_id <= target.waitlist_id,
+            # target.seat_id가 NULL이면 두 번째 조건은 참이 될 수 없어 "아무 좌석" 대기만 셈
+            or_(ahead.seat_id.is_(None), ahead.seat_id == target.seat_id),
+        ))
+        .where(target.waitlist_id.in_(waiting_ids))
+        .group_by(target.waitlist_id)
+    )
+    return {waitlist_id: position for waitlist_id, position in rows}
+
+
+def promote_next(db: Session, canceled: models.Reservation) -> Optional[models.Reservation]:
+    """
+    취소된 좌석 예약 자리로 대기열 선두를 예약 전환.
+
+    호출자(cancel_reservation)의 트랜잭션 안에서 실행되며 커밋하지 않습니다.
+    대기 순서대로 중복 이용·일일 한도를 다시 검증하여 처음 통과한 항목 하나만 전환합니다.
+
+    Returns:
+        새로 생성된 예약 (전환된 항목이 없으면 None)
+    """
+    if canceled.seat_id is None:
+        return None
+
+    # 취소 상태를 먼저 반영해야 좌석 충돌 검사에서 빠짐 (autoflush 비활성)
+    db.flush()
+
+    if not facility_availability.seat_available(db, canceled.seat_id):
+        return None
+
+    now = datetime.now(timezone.utc)
+    now_minute = to_epoch_minutes(now)
+    waitlist = models.SeatWaitlistEntry
+    candidates = (
+        db.query(waitlist)
+        .filter(
+            waitlist.status == models.WaitlistStatus.WAITING,
+            or_(waitlist.seat_id == canceled.seat_id, waitlist.seat_id.is_(None)),
+            waitlist.overlaps(canceled.start_time, canceled.end_time),
+        )
+        .order_by(waitlist.waitlist_id)
+        .all()
+    )
+
+    limit_minutes = ReservationLimits.SEAT_DAILY_LIMIT_MINUTES
+    for entry in candidates:
+        if entry.start_minute <= now_minute:
+            entry.status = models.WaitlistStatus.EXPIRED
+            continue
+
+        start_time = _as_utc(entry.start_time)
+        end_time = _as_utc(entry.end_time)
+
+        # 대기 시간대가 취소된 예약과 일부만 겹치면 다른 예약이 남아 있을 수 있음
+        if _has_seat_conflict(db, canceled.seat_id, start_time, end_time):
+            continue
+        if reservation_service.check_overlap_with_other_facility(db, entry.student_id, start_time, end_time):
+            continue
+        used_minutes = seat_service._get_daily_seat_usage_minutes(
+            db, entry.student_id, start_time.astimezone(KST)
+        )
+        if used_minutes + (entry.end_minute - entry.start_minute) > limit_minutes:
+            continue
+
+        reservation = reservation_service.create_seat_reservation(
+            db=db,
+            student_id=entry.student_id,
+            seat_id=canceled.seat_id,
+            start_time=start_time,
+            end_time=end_time,
+        )
+        entry.status = models.WaitlistStatus.PROMOTED
+        entry.reservation_id = reservation.reservation_id
+        entry.promoted_at = now
+        db.flush()
+        return reservation
+
+    return None
+
+
+def expire_waiting(db: Session, now: datetime) -> int:
+    """시작 시각이 지난 대기 항목 일괄 만료 (스케줄러, 커밋은 호출자) - 만료된 항목 수 반환"""
+    result = db.execute(
+        update(models.SeatWaitlistEntry)
+        .where(
+            models.SeatWaitlistEntry.status == models.WaitlistStatus.WAITING,
+            models.SeatWaitlistEntry.start_minute <= to_epoch_minutes(now),
+        )
+        .values(status=models.WaitlistStatus.EXPIRED)
+    )
+    return result.rowcount
+
+
+def _has_seat_conflict(db: Session, seat_id: int, start_time: datetime, end_time: datetime) -> bool:
+    return (
+        db.query(models.Reservation.reservation_id)
+        .filter(
+            models.Reservation.seat_id == seat_id,
+            models.Reservation.status.in_(CONFLICT_CHECK_STATUSES),
+            models.Reservation.overlaps(start_time, end_time),
+        )
+        .first()
+        is not None
+    )
+
+
+def _as_utc(value: datetime) -> datetime:
+    """DB에서 읽은 naive UTC 값을 aware로"""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
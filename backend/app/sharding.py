@@ -0,0 +1,116 @@
+"""
+sharding.py - Per-Building Shard Router
+=======================================
+건물별 샤딩 모드(settings.SHARDING_ENABLED)에서 건물마다 별도의 SQLite 파일과
+엔진을 두고, 시설 ID로 해당 샤드 세션을 골라 줍니다.
+
+- 샤드 DB: 해당 건물 시설의 reservations / reservation_participants
+- 메인 DB: 사용자, 시설 레지스트리, 전역 예약 ID(reservation_directory),
+  사용자별 예약 인덱스(user_reservation_index)
+
+SQLite는 파일당 writer가 하나뿐이므로, 서로 다른 건물의 예약은
+서로의 쓰기 락을 기다리지 않습니다.
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app import facility_registry, models
+from app.config import settings
+from app.constants import ErrorCode
+from app.database import Base, create_write_engine
+from app.exceptions import BusinessException
+
+# 샤드 DB에 생성할 테이블
+SHARD_TABLES = [
+    models.Reservation.__table__,
+    models.ReservationParticipant.__table__,
+]
+
+
+class ShardRouter:
+    """건물 ID → 샤드 엔진/세션 라우터 (엔진은 처음 사용할 때 생성)"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._engines: Dict[int, Engine] = {}
+        self._session_factories: Dict[int, sessionmaker] = {}
+        self._lock = threading.Lock()
+
+    def shard_path(self, building_id: int) -> str:
+        return os.path.join(self.directory, f"building_{building_id}.db")
+
+    def get_engine(self, building_id: int) -> Engine:
+        """건물 샤드 엔진 (없으면 파일·테이블 생성)"""
+        engine = self._engines.get(building_id)
+        if engine is not None:
+            return engine
+
+        with self._lock:
+            if building_id not in self._engines:
+                os.makedirs(self.directory, exist_ok=True)
+                engine = create_write_engine(f"sqlite:///{self.shard_path(building_id)}")
+                Base.metadata.create_all(bind=engine, tables=SHARD_TABLES)
+                self._session_factories[building_id] = sessionmaker(
+                    autocommit=False, autoflush=False, bind=engine
+                )
+                self._engines[building_id] = engine
+        return self._engines[building_id]
+
+    def session(self, building_id: int) -> Session:
+        """건물 샤드의 새 세션 (호출자가 close)"""
+        self.get_engine(building_id)
+        return self._session_factories[building_id]()
+
+    def building_ids(self) -> List[int]:
+        """레지스트리에 등록된 전체 건물 ID"""
+        return sorted(facility_registry.get_snapshot().buildings)
+
+    def building_for_seat(self, seat_id: int) -> int:
+        building_id = facility_registry.get_snapshot().seat_buildings.get(seat_id)
+        if building_id is None:
+            raise BusinessException(
+                code=ErrorCode.NOT_FOUND,
+                message=f"좌석 ID {seat_id}번을 찾을 수 없습니다.",
+            )
+        return building_id
+
+    def building_for_meeting_room(self, room_id: int) -> int:
+        building_id = facility_registry.get_snapshot().meeting_room_buildings.get(room_id)
+        if building_id is None:
+            raise BusinessException(
+                code=ErrorCode.NOT_FOUND,
+                message="건물이 지정되지 않은 회의실입니다.",
+            )
+        return building_id
+
+    def dispose(self) -> None:
+        """모든 샤드 엔진 종료"""
+        with self._lock:
+            for engine in self._engines.values():
+                engine.dispose()
+            self._engines.clear()
+            self._session_factories.clear()
+
+
+shard_router = ShardRouter(settings.SHARD_DIRECTORY)
+
+
+@contextmanager
+def reservation_sessions(db: Session) -> Iterator[List[Session]]:
+    """예약이 저장된 DB 세션 목록 (샤딩 모드에서는 건물 샤드 전체, 아니면 [db])"""
+    if not settings.SHARDING_ENABLED:
+        yield [db]
+        return
+
+    shards = [shard_router.session(building_id) for building_id in shard_router.building_ids()]
+    try:
+        yield shards
+    finally:
+        for shard in shards:
+            shard.close()
@@ -0,0 +1,162 @@
+"""
+slow_query_log.py - Slow Query Log
+==================================
+SLOW_QUERY_THRESHOLD_MS 이상 걸린 SQL을 파라미터와 함께 JSON 한 줄씩 기록합니다. (SLOW_QUERY_LOG_ENABLED)
+
+- 기록은 RotatingFileHandler로 SLOW_QUERY_LOG_PATH에 남기며, 크기가 넘으면 파일을 돌려 씁니다.
+- 같은 모양(파라미터를 뺀 SQL 문자열)의 문장은 처음 느렸을 때 한 번만 SQLite의
+  EXPLAIN QUERY PLAN을 같은 커넥션에서 실행해 plan으로 함께 남기고, 이후 항목은 shape ID로 연결합니다.
+- plan 중 인덱스 검색(SEARCH)이 아닌 전체 스캔(SCAN) 단계는 full_scans로 따로 표시합니다.
+  (예: check_user_weekly_meeting_limit의 outer join + OR 조건이 인덱스를 못 타는지 확인)
+- 프로세스 단위 캐시이므로 워커가 여러 개면 plan은 워커마다 한 번씩 남습니다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timezone
+from logging.handlers import RotatingFileHandler
+from typing import Dict, List, Optional
+
+from app.config import settings
+
+logger = logging.getLogger("app.slow_query")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+# plan을 확인할 문장 (DDL / PRAGMA / 트랜잭션 제어 제외)
+_EXPLAINABLE = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH")
+# plan을 기록해 둘 문장 모양 수 상한
+_MAX_SHAPES = 1000
+# 기록할 파라미터 수 / 값 길이 상한
+_MAX_PARAMETERS = 20
+_MAX_VALUE_LENGTH = 200
+
+_lock = threading.Lock()
+# shape ID → 전체 스캔 단계 (plan을 이미 기록한 문장)
+_shapes: Dict[str, List[str]] = {}
+_handler: Optional[RotatingFileHandler] = None
+
+
+def _ensure_handler() -> None:
+    """설정된 경로로 파일 핸들러 준비 (경로가 바뀌면 교체)"""
+    global _handler
+    path = os.path.abspath(settings.SLOW_QUERY_LOG_PATH)
+    if _handler is not None and _handler.baseFilename == path:
+        return
+    with _lock:
+        if _handler is not None:
+            if _handler.baseFilename == path:
+                return
+            logger.removeHandler(_handler)
+            _handler.close()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        handler = RotatingFileHandler(
+            path,
+            maxBytes=settings.SLOW_QUERY_LOG_MAX_BYTES,
+            backupCount=settings.SLOW_QUERY_LOG_BACKUP_COUNT,
+            encoding="utf-8",
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        _handler = handler
+
+
+def reset() -> None:
+    """plan 캐시 초기화 + 파일 핸들러 닫기 (테스트용)"""
+    global _handler
+    with _lock:
+        _shapes.clear()
+        if _handler is not None:
+            logger.removeHandler(_handler)
+            _handler.close()
+            _handler = None
+
+
+def shape_id(statement: str) -> str:
+    """파라미터를 뺀 SQL 문자열 기준 식별자"""
+    return hashlib.sha1(statement.encode("utf-8")).hexdigest()[:12]
+
+
+def full_scans(plan: List[str]) -> List[str]:
+    """EXPLAIN QUERY PLAN 단계 중 전체 스캔 (SCAN CONSTANT ROW 제외)"""
+    return [
+        detail for detail in plan
+        if detail.startswith("SCAN ") and not detail.startswith("SCAN CONSTANT ROW")
+    ]
+
+
+def explain(dbapi_connection, statement: str, parameters) -> List[str]:
+    """SQLite EXPLAIN QUERY PLAN 결과의 detail 목록 (SQLAlchemy 이벤트를 거치지 않는 DBAPI 커서 사용)"""
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters or ())
+        return [row[-1] for row in cursor.fetchall()]
+    finally:
+        cursor.close()
+
+
+def first_parameters(parameters, executemany: bool):
+    """executemany는 첫 번째 파라미터 묶음만 기록 / plan에 사용"""
+    if executemany and parameters and isinstance(parameters[0], (tuple, list, dict)):
+        return parameters[0]
+    return parameters
+
+
+def _format_parameters(parameters) -> list:
+    def value(item):
+        text = item if isinstance(item, (int, float, bool)) or item is None else str(item)
+        if isinstance(text, str) and len(text) > _MAX_VALUE_LENGTH:
+            return text[:_MAX_VALUE_LENGTH] + "..."
+        return text
+
+    if isinstance(parameters, dict):
+        parameters = list(parameters.values())
+    return [value(item) for item in list(parameters or ())[:_MAX_PARAMETERS]]
+
+
+def record(dbapi_connection, statement: str, parameters, executemany: bool, elapsed: float) -> None:
+    """느린 SQL 한 건 기록 (after_cursor_execute에서 호출)"""
+    _ensure_handler()
+
+    parameters = first_parameters(parameters, executemany)
+
+    shape = shape_id(statement)
+    entry = {
+        "ts": datetime.now(timezone.utc).isoformat(),
+        "event": "slow_query",
+        "elapsed_ms": round(elapsed * 1000, 3),
+        "shape": shape,
+        "statement": " ".join(statement.split()),
+        "parameters": _format_parameters(parameters),
+        "executemany": executemany,
+    }
+
+    with _lock:
+        scans = _shapes.get(shape)
+        explain_now = (
+            scans is None
+            and len(_shapes) < _MAX_SHAPES
+            and statement.lstrip().upper().startswith(_EXPLAINABLE)
+        )
+        if explain_now:
+            # 같은 모양을 동시에 두 번 EXPLAIN하지 않도록 먼저 자리 표시
+            _shapes[shape] = []
+
+    if explain_now:
+        try:
+            plan = explain(dbapi_connection, statement, parameters)
+        except Exception as e:  # plan 수집 실패가 본 요청을 깨뜨리지 않도록
+            entry["plan_error"] = str(e)
+        else:
+            scans = full_scans(plan)
+            with _lock:
+                _shapes[shape] = scans
+            entry["plan"] = plan
+
+    if scans:
+        entry["full_scans"] = scans
+    logger.info(json.dumps(entry, ensure_ascii=False, default=str))
+
@@ -0,0 +1,212 @@
+"""
+benchmarks/bench_epoch_minutes.py - DateTime(문자열) vs 정수 시각(epoch 분) 인덱스 비교
+=====================================================================================
+실제 models.Reservation 테이블(start_time/end_time 문자열과 start_minute/end_minute 정수를 모두 가진 행)에
+같은 예약 N건을 넣고, 인덱스 구성만 바꿔 인덱스 크기와 겹침 검사 쿼리 시간을 비교합니다.
+
+- text:    정수 시각 도입 전 인덱스 - (seat_id, start_time, status), (meeting_room_id, start_time, status),
+           사용자 검사는 (student_id, start_time) + start_time/end_time 문자열 비교
+- integer: 현재 모델의 인덱스 - (seat_id, start_minute, status), (meeting_room_id, start_minute, status),
+           (student_id, start_minute) + 정수 비교
+           (최대 예약 길이로 start_minute 하한을 두어 인덱스 범위를 좁힘 - models.Reservation.overlaps)
+- 두 레이아웃의 테이블은 같으므로(행 크기 동일) 차이는 인덱스 크기와 쿼리 시간에서만 납니다.
+- 쿼리: 좌석 충돌 검사(seat), 사용자 동일 시간대 좌석 예약 검사(student)
+
+실행 (backend 디렉터리에서):
+    python -m benchmarks.bench_epoch_minutes --rows 1000000
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from app.models import MAX_RESERVATION_MINUTES, Reservation
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+STATUSES = ["RESERVED", "IN_USE", "COMPLETED", "CANCELED"]
+SEAT_COUNT = 2000
+STUDENT_COUNT = 20000
+FIRST_STUDENT_ID = 202000001
+
+# 정수 시각 도입 전 인덱스 (init_db.EPOCH_MINUTE_TABLES가 제거하는 인덱스 + 사용자 검사는 idx_student_start)
+TEXT_INDEXES = {
+    "idx_seat_start": "seat_id, start_time, status",
+    "idx_room_start": "meeting_room_id, start_time, status",
+}
+MINUTE_INDEXES = {"idx_seat_minute", "idx_room_minute", "idx_student_minute"}
+
+QUERIES = {
+    "text": {
+        "seat": (
+            "SELECT reservation_id FROM reservations "
+            "WHERE seat_id = ? AND status IN ('RESERVED', 'IN_USE') "
+            "AND start_time < ? AND end_time > ? LIMIT 1"
+        ),
+        "student": (
+            "SELECT reservation_id FROM reservations "
+            "WHERE student_id = ? AND seat_id IS NOT NULL AND status IN ('RESERVED', 'IN_USE') "
+            "AND start_time < ? AND end_time > ? LIMIT 1"
+        ),
+    },
+    "integer": {
+        "seat": (
+            "SELECT reservation_id FROM reservations "
+            "WHERE seat_id = ? AND status IN ('RESERVED', 'IN_USE') "
+            "AND start_minute > ? AND start_minute < ? AND end_minute > ? LIMIT 1"
+        ),
+        "student": (
+            "SELECT reservation_id FROM reservations "
+            "WHERE student_id = ? AND seat_id IS NOT NULL AND status IN ('RESERVED', 'IN_USE') "
+            "AND start_minute > ? AND start_minute < ? AND end_minute > ? LIMIT 1"
+        ),
+    },
+}
+LAYOUTS = tuple(QUERIES)
+
+
+def _epoch_minutes(value: datetime) -> int:
+    return int((value - EPOCH).total_seconds() // 60)
+
+
+def _index_ddl(layout: str) -> list:
+    """레이아웃별 CREATE INDEX 문 (모델 인덱스 기준)"""
+    statements = [
+        str(CreateIndex(index).compile(dialect=sqlite.dialect()))
+        for index in sorted(Reservation.__table__.indexes, key=lambda index: index.name)
+        if layout == "integer" or index.name not in MINUTE_INDEXES
+    ]
+    if layout == "text":
+        statements += [f"CREATE INDEX {name} ON reservations ({columns})" for name, columns in TEXT_INDEXES.items()]
+    return statements
+
+
+def _generate_rows(rows: int, seed: int):
+    """2시간 단위 좌석 예약 행 (약 1년 범위) - reservations 전체 컬럼"""
+    rng = random.Random(seed)
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    for reservation_id in range(1, rows + 1):
+        start = base + timedelta(days=rng.randrange(365), hours=rng.choice((0, 2, 4, 6, 8)))
+        end = start + timedelta(hours=2)
+        yield (
+            reservation_id,
+            FIRST_STUDENT_ID + rng.randrange(STUDENT_COUNT),
+            rng.randrange(1, SEAT_COUNT + 1),
+            start.strftime(DATETIME_FORMAT),
+            end.strftime(DATETIME_FORMAT),
+            (start - timedelta(days=1)).strftime(DATETIME_FORMAT),
+            rng.choice(STATUSES),
+            _epoch_minutes(start),
+            _epoch_minutes(end),
+        )
+
+
+def _db_bytes(conn: sqlite3.Connection) -> int:
+    page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+    page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+    return page_size * page_count
+
+
+def _build(path: str, layout: str, rows: int, seed: int) -> dict:
+    """실제 reservations 테이블 생성 후 레이아웃별 인덱스 크기 측정"""
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=OFF")
+    conn.execute("PRAGMA synchronous=OFF")
+
+    conn.execute(str(CreateTable(Reservation.__table__).compile(dialect=sqlite.dialect())))
+    conn.executemany(
+        "INSERT INTO reservations (reservation_id, student_id, seat_id, start_time, end_time, created_at, "
+        "status, start_minute, end_minute) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        _generate_rows(rows, seed),
+    )
+    conn.commit()
+    table_bytes = _db_bytes(conn)
+
+    started = time.perf_counter()
+    for statement in _index_ddl(layout):
+        conn.execute(statement)
+    conn.commit()
+    index_seconds = time.perf_counter() - started
+    conn.execute("ANALYZE")
+    conn.commit()
+
+    index_bytes = _db_bytes(conn) - table_bytes
+    conn.close()
+    return {"table_bytes": table_bytes, "index_bytes": index_bytes, "index_seconds": index_seconds}
+
+
+def _probes(layout: str, queries: int, seed: int) -> dict:
+    """쿼리 종류별 무작위 (좌석 또는 학생, 시간대) 파라미터"""
+    rng = random.Random(seed)
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    probes = {"seat": [], "student": []}
+    for _ in range(queries):
+        start = base + timedelta(days=rng.randrange(365), hours=rng.choice((0, 2, 4, 6, 8)))
+        end = start + timedelta(hours=2)
+        keys = {
+            "seat": rng.randrange(1, SEAT_COUNT + 1),
+            "student": FIRST_STUDENT_ID + rng.randrange(STUDENT_COUNT),
+        }
+        for kind, key in keys.items():
+            if layout == "text":
+                probes[kind].append((key, end.strftime(DATETIME_FORMAT), start.strftime(DATETIME_FORMAT)))
+            else:
+                start_minute = _epoch_minutes(start)
+                probes[kind].append((key, start_minute - MAX_RESERVATION_MINUTES, _epoch_minutes(end), start_minute))
+    return probes
+
+
+def _time_queries(path: str, layout: str, queries: int, seed: int) -> dict:
+    """쿼리 종류별 평균 시간 (µs)"""
+    conn = sqlite3.connect(path)
+    results = {}
+    for kind, probes in _probes(layout, queries, seed).items():
+        sql = QUERIES[layout][kind]
+        for probe in probes[:100]:  # 캐시 워밍업
+            conn.execute(sql, probe).fetchone()
+
+        started = time.perf_counter()
+        for probe in probes:
+            conn.execute(sql, probe).fetchone()
+        results[f"{kind}_us"] = (time.perf_counter() - started) / queries * 1_000_000
+    conn.close()
+    return results
+
+
+def run(rows: int, queries: int, seed: int = 42) -> dict:
+    """두 레이아웃을 생성·측정하여 결과 반환"""
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for layout in LAYOUTS:
+            path = os.path.join(directory, f"{layout}.db")
+            results[layout] = _build(path, layout, rows, seed)
+            results[layout].update(_time_queries(path, layout, queries, seed + 1))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000, help="예약 행 수")
+    parser.add_argument("--queries", type=int, default=5000, help="쿼리 종류별 겹침 검사 횟수")
+    args = parser.parse_args()
+
+    results = run(args.rows, args.queries)
+
+    print(f"rows={args.rows:,} queries={args.queries:,}")
+    print(f"{'layout':<8} {'table MB':>10} {'index MB':>10} {'index build s':>14} {'seat µs':>9} {'student µs':>11}")
+    for layout, result in results.items():
+        print(
+            f"{layout:<8} {result['table_bytes'] / 1e6:>10.1f} {result['index_bytes'] / 1e6:>10.1f} "
+            f"{result['index_seconds']:>14.2f} {result['seat_us']:>9.1f} {result['student_us']:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+benchmarks/bench_init_db.py - 시설 초기 데이터(시딩) 시간 측정
+===============================================================
+빈 파일 DB(WAL)에 좌석 N개 + 회의실을 seed_facilities로 만드는 콜드 스타트와,
+이미 모두 있는 DB에서 다시 실행하는 재시작(웜) 시간을 측정합니다.
+
+- cold: 청크 단위 다중 행 INSERT OR IGNORE (init_db.SEED_CHUNK_SIZE)
+- warm: 설정 범위 조회만 하고 INSERT 없음
+- 쿼리 수 / INSERT 수 같은 동작 검사는 tests/unit/test_init_db.py가 맡고, 여기서는 시간만 봅니다.
+
+실행 (backend 디렉터리에서):
+    python -m benchmarks.bench_init_db --seats 10000,100000 --rounds 5
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from sqlalchemy.orm import sessionmaker
+
+from app.constants import FacilityConstants
+from app.database import Base, create_write_engine
+from app.init_db import seed_facilities
+
+
+def _seed_seconds(session_factory, seats: int) -> float:
+    with session_factory() as db:
+        started = time.perf_counter()
+        seed_facilities(db, seat_ids=range(1, seats + 1), meeting_room_ids=FacilityConstants.MEETING_ROOM_IDS)
+        return time.perf_counter() - started
+
+
+def run(seats: int, rounds: int) -> dict:
+    """라운드마다 새 DB에서 cold 1회 + warm 1회 측정, median 반환 (초)"""
+    cold, warm = [], []
+    with tempfile.TemporaryDirectory() as directory:
+        for round_no in range(rounds):
+            engine = create_write_engine(f"sqlite:///{os.path.join(directory, f'seed_{round_no}.db')}")
+            Base.metadata.create_all(bind=engine)
+            session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+            cold.append(_seed_seconds(session_factory, seats))
+            warm.append(_seed_seconds(session_factory, seats))
+            engine.dispose()
+    return {"cold_s": statistics.median(cold), "warm_s": statistics.median(warm)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seats", default="10000", help="좌석 수 (쉼표로 여러 개)")
+    parser.add_argument("--rounds", type=int, default=5, help="좌석 수별 반복 횟수 (median)")
+    args = parser.parse_args()
+
+    print(f"rounds={args.rounds}")
+    print(f"{'seats':>8} {'cold ms':>10} {'warm ms':>10}")
+    for seats in (int(value) for value in args.seats.split(",")):
+        result = run(seats, args.rounds)
+        print(f"{seats:>8,} {result['cold_s'] * 1000:>10.1f} {result['warm_s'] * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
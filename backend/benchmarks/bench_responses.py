@@ -0,0 +1,94 @@
+"""
+benchmarks/bench_responses.py - 좌석 현황 응답 직렬화 비교
+=========================================================
+GET /api/status/seats의 payload(좌석 × 슬롯)를 한 번 만들어 두고 응답 바이트를 만드는 방식별 시간을 비교합니다.
+
+- validate+json:   기존 경로. response_model(ApiResponse[SeatStatusPayload])로 재검증 + jsonable 변환 후 JSONResponse
+- validate+orjson: 같은 재검증 후 ORJSONResponse (앱 기본 응답 클래스만 바꾼 경우)
+- envelope:        app.responses.envelope - 재검증 없이 pydantic-core로 payload를 바로 JSON 바이트로
+- 끝으로 TestClient로 엔드포인트 전체(조회 포함) 시간도 측정합니다.
+
+실행 (backend 디렉터리에서):
+    python -m benchmarks.bench_responses --seats 2000 --rounds 200
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+
+
+def _median_ms(fn, rounds: int) -> float:
+    fn()
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+def run(seats: int, rounds: int) -> dict:
+    """방식별 median(ms)과 응답 크기"""
+    from fastapi.responses import JSONResponse, ORJSONResponse
+    from fastapi.routing import serialize_response
+    from fastapi.testclient import TestClient
+
+    from app import facility_registry, responses, schemas
+    from app.database import SessionLocal
+    from app.main import app
+    from app.services import status_service
+
+    route = next(r for r in app.routes if getattr(r, "path", None) == "/api/status/seats")
+    field = route.secure_cloned_response_field
+    target_date = date.today() + timedelta(days=1)
+
+    with TestClient(app) as client:
+        # 좌석 수를 늘린 스냅샷으로 payload 생성 (조회 대상 좌석은 DB에 없어도 빈 슬롯으로 채워짐)
+        seat_ids = range(1, seats + 1)
+        with SessionLocal() as db:
+            payload = status_service.get_seat_status(db, target_date, seat_ids=seat_ids)
+
+        def validated():
+            content = schemas.ApiResponse(is_success=True, code=None, payload=payload)
+            return asyncio.run(serialize_response(field=field, response_content=content))
+
+        result = {
+            "validate+json": _median_ms(lambda: JSONResponse(validated()), rounds),
+            "validate+orjson": _median_ms(lambda: ORJSONResponse(validated()), rounds),
+            "envelope": _median_ms(lambda: responses.envelope(payload), rounds),
+        }
+        body = responses.envelope(payload).body
+        assert body == JSONResponse(validated()).body, "envelope output differs from the validated response"
+
+        default_seats = len(facility_registry.get_snapshot().seat_ids)
+        result["endpoint"] = _median_ms(
+            lambda: client.get("/api/status/seats", params={"date": target_date.isoformat()}),
+            max(1, rounds // 20),
+        )
+    return {"seats": seats, "default_seats": default_seats, "bytes": len(body), "median_ms": result}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seats", type=int, default=70, help="payload 좌석 수 (기본: 실제 좌석 수)")
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["LIBRARY_DATABASE_PATH"] = os.path.join(tmp, "bench_responses.db")
+        result = run(args.seats, args.rounds)
+
+    timings = result["median_ms"]
+    print(f"payload: {result['seats']} seats, {result['bytes']:,} bytes")
+    baseline = timings["validate+json"]
+    for name in ("validate+json", "validate+orjson", "envelope"):
+        print(f"{name:<16} {timings[name]:>9.3f} ms  x{baseline / timings[name]:.1f}")
+    print(f"{'endpoint':<16} {timings['endpoint']:>9.3f} ms  (GET /api/status/seats, {result['default_seats']} seats, 조회 포함)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,309 @@
+"""
+benchmarks/bench_services.py - 서비스 계층 핫 패스 마이크로벤치마크
+===================================================================
+예약 N건(기본 1k / 100k / 1M)을 benchmarks.dataset으로 넣은 임시 SQLite DB에서 서비스 함수를 반복 호출해 시간을 잽니다.
+
+- 대상: status_service.get_seat_status / get_meeting_room_status,
+        seat_service.reserve_seat (직접 선택 / 랜덤), meeting_room_service.process_reservation (참여자 6명),
+        reservation_service.get_user_reservations_page (유형·날짜 필터 + 커서로 두 번째 페이지),
+        scheduler.update_reservation_status
+- 케이스마다 워밍업 후 --rounds번 측정하고 min / median / mean / p95를 냅니다.
+  (호출마다 새 세션, 인자 준비와 세션 종료는 측정에서 제외)
+- 예약 생성 케이스는 합성 데이터 이후 날짜의 빈 슬롯을 라운드마다 새 학생으로 예약합니다.
+- update_reservation_status는 합성 데이터가 이미 현재 시각 기준 상태라 매분 실행되는 평상시 비용입니다.
+- --save-baseline으로 결과를 저장하고, --compare로 저장된 기준과 median을 비교해
+  --threshold(기본 25%) 넘게 느려진 케이스가 있으면 종료 코드 1을 반환합니다.
+- 절대 시간은 머신에 따라 다르므로 기준에 측정 머신 정보를 함께 저장하고, 다른 머신의 기준과 비교하면 경고합니다.
+  저장소의 benchmarks/baselines/services.json(1k / 100k)은 참조 머신 기준이며,
+  회귀 판정은 같은 머신에서 --save-baseline으로 만든 기준과 비교하는 것이 정확합니다.
+
+실행 (backend 디렉터리에서):
+    python -m benchmarks.bench_services --sizes 1000,100000 --save-baseline benchmarks/baselines/services.json
+    python -m benchmarks.bench_services --sizes 1000,100000 --compare benchmarks/baselines/services.json
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime, time as Time, timedelta, timezone
+
+DEFAULT_SIZES = "1000,100000,1000000"
+# 예약 생성 케이스용 신규 학생 (합성 데이터 학생과 겹치지 않도록)
+BENCH_STUDENT_ID = 203000001
+# 합성 데이터는 오늘 + DATA_DAYS_AHEAD일까지, 예약 생성 케이스는 그 이후 날짜 사용
+DATA_DAYS_AHEAD = 7
+SEAT_SLOT_HOURS = (9, 11, 13, 15)
+ROOM_SLOT_HOURS = tuple(range(9, 18))
+# 내 예약 조회 케이스: GET /reservations/me?type=seat&from=..&to=..&limit=PAGE_SIZE&cursor=.. 와 같은 인자
+PAGE_SIZE = 20
+
+CASES = (
+    "get_seat_status",
+    "get_meeting_room_status",
+    "reserve_seat_direct",
+    "reserve_seat_random",
+    "process_reservation_6",
+    "get_user_reservations_page",
+    "update_reservation_status",
+)
+
+
+def _percentile(ordered, q: float) -> float:
+    """nearest-rank 백분위 (ordered는 오름차순)"""
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+def _busiest_student(db) -> int:
+    """예약이 가장 많은 학생 (내 예약 조회 케이스용)"""
+    from sqlalchemy import func
+
+    from app.models import Reservation
+
+    return db.query(Reservation.student_id).group_by(Reservation.student_id).order_by(
+        func.count().desc()
+    ).limit(1).scalar()
+
+
+def _bench_day(offset: int, index: int, per_day: int) -> date:
+    return date.today() + timedelta(days=DATA_DAYS_AHEAD + offset + index // per_day)
+
+
+def build_cases(session_factory) -> dict:
+    """케이스 이름 → setup(라운드 번호) → (세션, 측정할 callable)"""
+    from app import facility_registry
+    from app.schemas.meeting_room import MeetingRoomReservationCreate
+    from app.schemas.seat import SeatReservationCreate
+    from app.scheduler import update_reservation_status
+    from app.services import meeting_room_service, reservation_service, seat_service, status_service
+
+    target_date = date.today() + timedelta(days=1)
+    # 내 예약 조회: 좌석 유형 + 날짜 구간 필터, 첫 페이지 마지막 항목을 커서로 두 번째 페이지 조회
+    start_from, start_before = reservation_service.kst_date_range_to_utc(
+        date.today() - timedelta(days=30), date.today() + timedelta(days=DATA_DAYS_AHEAD)
+    )
+    page_filters = {"start_from": start_from, "start_before": start_before, "reservation_type": "seat"}
+    with session_factory() as db:
+        busy_student = _busiest_student(db)
+        first_page = reservation_service.get_user_reservations_page(
+            db, busy_student, limit=PAGE_SIZE, **page_filters
+        )
+    page_cursor = (first_page[-1].start_time, first_page[-1].reservation_id) if first_page else None
+    snapshot = facility_registry.get_snapshot()
+    seat_ids = snapshot.sorted_seat_ids
+    room_ids = snapshot.sorted_meeting_room_ids
+    seat_count, room_count = len(seat_ids), len(room_ids)
+    seat_slots = len(SEAT_SLOT_HOURS)
+
+    def status_seats(i):
+        db = session_factory()
+        return db, lambda: status_service.get_seat_status(db, target_date)
+
+    def status_rooms(i):
+        db = session_factory()
+        return db, lambda: status_service.get_meeting_room_status(db, target_date)
+
+    def reserve_direct(i):
+        db = session_factory()
+        hour = SEAT_SLOT_HOURS[(i // seat_count) % seat_slots]
+        request = SeatReservationCreate(
+            date=_bench_day(1, i, seat_count * seat_slots),
+            start_time=Time(hour),
+            end_time=Time(hour + 2),
+            seat_id=seat_ids[i % seat_count],
+        )
+        return db, lambda: seat_service.reserve_seat(db, BENCH_STUDENT_ID + i, request)
+
+    def reserve_random(i):
+        db = session_factory()
+        hour = SEAT_SLOT_HOURS[i % seat_slots]
+        request = SeatReservationCreate(
+            date=_bench_day(101, i, seat_count * seat_slots),
+            start_time=Time(hour),
+            end_time=Time(hour + 2),
+        )
+        return db, lambda: seat_service.reserve_seat(db, BENCH_STUDENT_ID + 100_000 + i, request)
+
+    def meeting(i):
+        db = session_factory()
+        hour = ROOM_SLOT_HOURS[(i // room_count) % len(ROOM_SLOT_HOURS)]
+        student_id = BENCH_STUDENT_ID + 200_000 + i * 7
+        request = MeetingRoomReservationCreate(
+            room_id=room_ids[i % room_count],
+            date=_bench_day(201, i, room_count * len(ROOM_SLOT_HOURS)),
+            start_time=Time(hour),
+            end_time=Time(hour + 1),
+            participants=[{"student_id": student_id + k} for k in range(1, 7)],
+        )
+        return db, lambda: meeting_room_service.process_reservation(db, student_id, request)
+
+    def my_reservations(i):
+        db = session_factory()
+        return db, lambda: reservation_service.get_user_reservations_page(
+            db, busy_student, limit=PAGE_SIZE + 1, cursor=page_cursor, **page_filters
+        )
+
+    def scheduler_tick(i):
+        # 작업이 자체 세션을 열고 닫음
+        return None, update_reservation_status
+
+    return {
+        "get_seat_status": status_seats,
+        "get_meeting_room_status": status_rooms,
+        "reserve_seat_direct": reserve_direct,
+        "reserve_seat_random": reserve_random,
+        "process_reservation_6": meeting,
+        "get_user_reservations_page": my_reservations,
+        "update_reservation_status": scheduler_tick,
+    }
+
+
+def measure(setup, rounds: int, warmup: int, round_offset: int = 0) -> dict:
+    """워밍업 후 rounds번 측정 (초 단위 통계)"""
+    samples = []
+    for i in range(warmup + rounds):
+        db, call = setup(round_offset + i)
+        try:
+            started = time.perf_counter()
+            call()
+            elapsed = time.perf_counter() - started
+        finally:
+            if db is not None:
+                db.close()
+        if i >= warmup:
+            samples.append(elapsed)
+    ordered = sorted(samples)
+    return {
+        "rounds": rounds,
+        "min": ordered[0],
+        "median": statistics.median(ordered),
+        "mean": statistics.fmean(ordered),
+        "p95": _percentile(ordered, 0.95),
+        "stddev": statistics.pstdev(ordered),
+    }
+
+
+def run(sizes, cases, rounds: int, warmup: int, seed_value: int) -> dict:
+    """크기별로 데이터를 다시 만들고 케이스 측정 → {크기: {케이스: 통계}}"""
+    from app import facility_availability, facility_registry, reservation_index
+    from app.database import SessionLocal, engine
+    from benchmarks import dataset
+
+    results = {}
+    for size in sizes:
+        started = time.perf_counter()
+        dataset.generate(engine, size, seed=seed_value, days_ahead=DATA_DAYS_AHEAD, reset=True)
+        engine.dispose()
+        with SessionLocal() as db:
+            facility_registry.refresh(db)
+            facility_availability.reload(db)
+            reservation_index.rebuild([db])
+        print(f"[{size:,} reservations] seeded in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+
+        factories = build_cases(SessionLocal)
+        results[str(size)] = {}
+        for name in cases:
+            results[str(size)][name] = measure(factories[name], rounds, warmup)
+            print(f"  {name:<28} median {results[str(size)][name]['median'] * 1000:9.3f} ms", file=sys.stderr)
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """기준 대비 median이 threshold 넘게 느려진 (크기, 케이스, 비율) 목록"""
+    regressions = []
+    for size, cases in results.items():
+        for name, stats in cases.items():
+            base = baseline.get(size, {}).get(name)
+            if base is None:
+                continue
+            ratio = stats["median"] / base["median"]
+            if ratio > 1 + threshold:
+                regressions.append((size, name, ratio))
+    return regressions
+
+
+def machine_info() -> dict:
+    """기준 파일에 남길 측정 환경"""
+    from benchmarks.load_test import git_commit
+
+    return {
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "commit": git_commit(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help=f"예약 건수 목록 (기본: {DEFAULT_SIZES})")
+    parser.add_argument("--cases", default=",".join(CASES), help="측정할 케이스 (쉼표 구분)")
+    parser.add_argument("--rounds", type=int, default=30)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--save-baseline", metavar="PATH", help="결과를 기준으로 저장")
+    parser.add_argument("--compare", metavar="PATH", help="저장된 기준과 비교")
+    parser.add_argument("--threshold", type=float, default=0.25, help="허용 median 증가율 (기본 0.25 = 25%%)")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    cases = [name.strip() for name in args.cases.split(",")]
+    unknown = set(cases) - set(CASES)
+    if unknown:
+        parser.error(f"알 수 없는 케이스: {', '.join(sorted(unknown))} (허용: {', '.join(CASES)})")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # app 모듈이 엔진을 만들기 전에 임시 DB 경로 지정
+        os.environ["LIBRARY_DATABASE_PATH"] = os.path.join(tmp, "bench_services.db")
+        results = run(sizes, cases, args.rounds, args.warmup, args.seed)
+        from app.database import engine
+
+        engine.dispose()
+
+    baseline = None
+    machine = machine_info()
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            saved = json.load(f)
+        baseline = saved["results"]
+        base_machine = saved.get("machine", {})
+        if {k: base_machine.get(k) for k in ("platform", "cpu_count")} != {k: machine[k] for k in ("platform", "cpu_count")}:
+            print(f"warning: baseline measured on a different machine ({base_machine.get('platform', 'unknown')}, "
+                  f"{base_machine.get('cpu_count', '?')} CPUs) - 같은 머신에서 만든 기준으로 비교하세요.", file=sys.stderr)
+
+    print(f"{'size':>9} {'case':<28} {'min ms':>9} {'median ms':>10} {'p95 ms':>9} {'vs base':>8}")
+    for size, cases_result in results.items():
+        for name, stats in cases_result.items():
+            base = (baseline or {}).get(size, {}).get(name)
+            delta = f"{stats['median'] / base['median'] - 1:+.0%}" if base else "-"
+            print(f"{int(size):>9,} {name:<28} {stats['min'] * 1000:>9.3f} {stats['median'] * 1000:>10.3f} "
+                  f"{stats['p95'] * 1000:>9.3f} {delta:>8}")
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save_baseline)), exist_ok=True)
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump({
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "rounds": args.rounds,
+                "seed": args.seed,
+                "machine": machine,
+                "results": results,
+            }, f, indent=2)
+        print(f"saved baseline: {args.save_baseline}")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold)
+        for size, name, ratio in regressions:
+            print(f"REGRESSION {name} @ {int(size):,}: median x{ratio:.2f} (threshold +{args.threshold:.0%})")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,342 @@
+"""
+benchmarks/dataset.py - 대용량 합성 예약 데이터 생성기
+======================================================
+벤치마크 / 실행 계획 테스트용으로 실제 이용 패턴에 가까운 예약 데이터를 한 번에 적재합니다.
+
+- 날짜: 기준일 + --days-ahead일부터 과거로 하루씩 채웁니다. 평일 > 토 > 일 순으로 많고,
+  미래 날짜는 멀수록 아직 덜 찼습니다. 좌석 70석 규모에서는 하루 수백 건이 한계이므로
+  예약 수가 많으면 그만큼 과거(여러 학기) 기록이 쌓인 DB가 됩니다.
+- 시간: 오후(13~15시) 시작이 가장 많은 피크 가중치, 좌석 2시간 / 회의실 1시간 정각 슬롯.
+- 사용자: Zipf 분포로 골라 소수의 단골이 예약 대부분을 차지합니다.
+- 취소: --cancel-rate 비율은 CANCELED (시설 / 사용자 시간을 점유하지 않음).
+  나머지는 기준일 이전이면 COMPLETED, 이후면 RESERVED.
+- 활성(취소 아닌) 예약은 시설별로 겹치지 않고, 사용자별로도 겹치지 않으며 하루 이용 한도
+  (좌석 4시간 / 회의실 2시간)와 주간 회의실 한도(5시간)를 넘지 않습니다.
+  회의실 참여자도 같은 사용자로 셉니다.
+- 회의실 예약에는 참여자 3~6명(적은 쪽이 흔함)을 붙입니다. (--users는 최소 7명)
+- 같은 --seed와 --anchor-date면 항상 같은 행이 만들어집니다. (기준일 생략 시 오늘)
+- 행은 Core insert(executemany)로 CHUNK_SIZE씩, 전체를 한 트랜잭션으로 넣고 마지막에 ANALYZE합니다.
+
+실행 (backend 디렉터리에서):
+    python -m benchmarks.dataset --db ./semester.db --reservations 1000000 --seed 42
+    python -m benchmarks.dataset --db ./semester.db --reservations 50000 --anchor-date 2026-03-02 --reset
+"""
+
+import argparse
+import itertools
+import os
+import random
+import time
+from datetime import date, datetime, time as Time, timedelta, timezone
+
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.orm import sessionmaker
+
+from app.constants import ReservationLimits
+from app.database import Base
+from app.init_db import seed_facilities
+from app.models import (
+    MeetingRoom,
+    Reservation,
+    ReservationParticipant,
+    ReservationStatus,
+    Seat,
+    User,
+    to_epoch_minutes,
+)
+
+KST = timezone(timedelta(hours=9))
+FIRST_STUDENT_ID = 202400001
+CHUNK_SIZE = 50_000
+
+# 요일별 가중치 (월 ~ 일)
+WEEKDAY_WEIGHTS = (1.0, 1.0, 1.0, 1.0, 0.9, 0.5, 0.3)
+# 시작 시각별 가중치 (좌석은 16시, 회의실은 17시 시작까지)
+HOUR_WEIGHTS = {9: 0.5, 10: 0.8, 11: 0.9, 12: 0.7, 13: 1.3, 14: 1.4, 15: 1.2, 16: 0.9, 17: 0.6}
+SEAT_HOURS = ReservationLimits.SEAT_SLOT_MINUTES // 60
+ROOM_HOURS = ReservationLimits.MEETING_ROOM_SLOT_MINUTES // 60
+# 참여자 수 3 ~ 6명 가중치
+PARTICIPANT_COUNT_WEIGHTS = {3: 5, 4: 3, 5: 1, 6: 1}
+# 회의실 예약자 + 서로 다른 참여자를 뽑을 수 있는 최소 사용자 수
+MIN_USERS = max(PARTICIPANT_COUNT_WEIGHTS) + 1
+# 하루 최대 적재율 (빈 슬롯을 찾느라 재시도가 길어지지 않도록)
+DAY_FILL = 0.6
+# 빈 시설 / 가능한 사용자 찾기 재시도 횟수
+ATTEMPTS = 8
+
+
+def _hour_mask(start_hour: int, hours: int) -> int:
+    return ((1 << hours) - 1) << start_hour
+
+
+class _Picker:
+    """누적 가중치 기반 선택 (random.choices + cum_weights, O(log n))"""
+
+    def __init__(self, rng: random.Random, values, weights):
+        self.rng = rng
+        self.values = list(values)
+        self.cum_weights = list(itertools.accumulate(weights))
+
+    def __call__(self):
+        return self.rng.choices(self.values, cum_weights=self.cum_weights)[0]
+
+
+def generate(
+    engine,
+    reservations: int,
+    seed: int = 42,
+    users: int = None,
+    anchor_date: date = None,
+    days_ahead: int = 14,
+    cancel_rate: float = 0.12,
+    room_share: float = 0.1,
+    reset: bool = False,
+    analyze: bool = True,
+) -> dict:
+    """
+    합성 데이터 적재
+
+    Args:
+        reservations: 만들 예약 수 (취소 포함)
+        users: 사용자 수 (기본: 예약 40건당 1명, 최소 1000명 / 지정 시 MIN_USERS 이상)
+        anchor_date: 현재로 간주할 날짜 (기본: 오늘, KST)
+        days_ahead: 기준일 이후로 예약을 채울 일수
+        room_share: 회의실 예약 비율
+        reset: 기존 테이블을 지우고 새로 만들지 여부
+
+    Returns:
+        적재 결과 요약 (건수 / 날짜 범위 / 소요 시간)
+    """
+    started = time.perf_counter()
+    rng = random.Random(seed)
+    anchor_date = anchor_date or datetime.now(KST).date()
+    users = users or max(1000, reservations // 40)
+    if users < MIN_USERS:
+        raise ValueError(f"users는 최소 {MIN_USERS}명이어야 합니다. (회의실 예약자 + 참여자)")
+
+    if reset:
+        Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    seed_facilities(session)
+    seat_ids = [seat_id for (seat_id,) in session.query(Seat.seat_id).order_by(Seat.seat_id)]
+    room_ids = [room_id for (room_id,) in session.query(MeetingRoom.room_id).order_by(MeetingRoom.room_id)]
+    first_reservation_id = (session.query(Reservation.reservation_id).order_by(
+        Reservation.reservation_id.desc()
+    ).limit(1).scalar() or 0) + 1
+
+    student_ids = [FIRST_STUDENT_ID + i for i in range(users)]
+    anchor_utc = datetime.combine(anchor_date, Time(0), tzinfo=KST).astimezone(timezone.utc)
+    existing = {sid for (sid,) in session.query(User.student_id).filter(
+        User.student_id.between(student_ids[0], student_ids[-1])
+    )}
+    new_users = [{"student_id": sid, "last_login_at": anchor_utc} for sid in student_ids if sid not in existing]
+    for start in range(0, len(new_users), CHUNK_SIZE):
+        session.execute(insert(User), new_users[start:start + CHUNK_SIZE])
+
+    # 단골 편중: rank 1의 사용자가 가장 자주 선택됨 (Zipf s=1.1, 순위는 학번과 무관하게 섞음)
+    ranked = student_ids[:]
+    rng.shuffle(ranked)
+    pick_user = _Picker(rng, ranked, [1 / (rank ** 1.1) for rank in range(1, users + 1)])
+    pick_seat_hour = _Picker(rng, [h for h in HOUR_WEIGHTS if h + SEAT_HOURS <= 18], [
+        w for h, w in HOUR_WEIGHTS.items() if h + SEAT_HOURS <= 18
+    ])
+    pick_room_hour = _Picker(rng, list(HOUR_WEIGHTS), list(HOUR_WEIGHTS.values()))
+    pick_participant_count = _Picker(rng, list(PARTICIPANT_COUNT_WEIGHTS), list(PARTICIPANT_COUNT_WEIGHTS.values()))
+
+    # 하루 수용량 (정각 슬롯 기준, DAY_FILL만큼만 채움)
+    capacity = len(seat_ids) * (9 // SEAT_HOURS) + len(room_ids) * (9 // ROOM_HOURS)
+    per_day = max(1, int(capacity * DAY_FILL))
+
+    rows, participants = [], []
+    counts = {"canceled": 0, "participants": 0}
+    reservation_id = first_reservation_id
+    remaining = reservations
+    day = anchor_date + timedelta(days=days_ahead)
+    last_day = day
+    # 학생 → 이번 주 회의실 이용 분 (예약자 + 참여자)
+    room_week = {}
+    current_week = None
+
+    def flush():
+        if rows:
+            session.execute(insert(Reservation), rows)
+            rows.clear()
+        if participants:
+            session.execute(insert(ReservationParticipant), participants)
+            participants.clear()
+
+    while remaining > 0:
+        weight = WEEKDAY_WEIGHTS[day.weekday()]
+        ahead = (day - anchor_date).days
+        if ahead > 0:
+            # 먼 미래일수록 아직 덜 찬 상태
+            weight *= max(0.1, 1 - ahead / (days_ahead + 1))
+        quota = min(remaining, max(1, round(per_day * weight * rng.uniform(0.8, 1.2))))
+
+        facility_busy = {}
+        # 학생 → [좌석 분, 회의실 분, 시간 마스크] (예약자와 회의실 참여자 모두)
+        user_day = {}
+        week = day.isocalendar()[:2]
+        if week != current_week:
+            # 날짜를 과거로 채우므로 주가 바뀌면 주간 회의실 이용량을 새로 셈
+            current_week = week
+            room_week.clear()
+
+        def fits(candidate: int, is_room: bool, hours: int, mask: int) -> bool:
+            """candidate가 이 시간대를 쓸 수 있는지 (사용자 겹침 / 일일 / 주간 한도)"""
+            usage = user_day.get(candidate, [0, 0, 0])
+            if usage[2] & mask:
+                return False
+            if not is_room:
+                return usage[0] + hours * 60 <= ReservationLimits.SEAT_DAILY_LIMIT_MINUTES
+            return (
+                usage[1] + hours * 60 <= ReservationLimits.MEETING_ROOM_DAILY_LIMIT_MINUTES
+                and room_week.get(candidate, 0) + hours * 60 <= ReservationLimits.MEETING_ROOM_WEEKLY_LIMIT_MINUTES
+            )
+
+        for _ in range(quota):
+            is_room = rng.random() < room_share
+            hours = ROOM_HOURS if is_room else SEAT_HOURS
+            canceled = rng.random() < cancel_rate
+
+            placed = None
+            for _ in range(ATTEMPTS):
+                facility = ("room", rng.choice(room_ids)) if is_room else ("seat", rng.choice(seat_ids))
+                hour = pick_room_hour() if is_room else pick_seat_hour()
+                mask = _hour_mask(hour - 9, hours)
+                if canceled or not facility_busy.get(facility, 0) & mask:
+                    placed = facility, hour, mask
+                    break
+            if placed is None:
+                continue
+            facility, hour, mask = placed
+
+            student_id = None
+            for _ in range(ATTEMPTS):
+                candidate = pick_user()
+                if canceled or fits(candidate, is_room, hours, mask):
+                    student_id = candidate
+                    break
+            if student_id is None:
+                continue
+
+            # 회의실 참여자도 예약자와 같은 규칙으로 고르고, 다 채우지 못하면 이 예약은 건너뜀
+            members = set()
+            if is_room:
+                target = pick_participant_count()
+                for _ in range(target * ATTEMPTS):
+                    candidate = pick_user()
+                    if candidate != student_id and candidate not in members and (
+                        canceled or fits(candidate, is_room, hours, mask)
+                    ):
+                        members.add(candidate)
+                        if len(members) == target:
+                            break
+                if len(members) < target:
+                    continue
+
+            if not canceled:
+                facility_busy[facility] = facility_busy.get(facility, 0) | mask
+                for member_id in (student_id, *members):
+                    usage = user_day.setdefault(member_id, [0, 0, 0])
+                    usage[1 if is_room else 0] += hours * 60
+                    usage[2] |= mask
+                    if is_room:
+                        room_week[member_id] = room_week.get(member_id, 0) + hours * 60
+
+            start = datetime.combine(day, Time(hour), tzinfo=KST).astimezone(timezone.utc)
+            end = start + timedelta(hours=hours)
+            if canceled:
+                status = ReservationStatus.CANCELED
+                counts["canceled"] += 1
+            elif day < anchor_date:
+                status = ReservationStatus.COMPLETED
+            else:
+                status = ReservationStatus.RESERVED
+            rows.append({
+                "reservation_id": reservation_id,
+                "student_id": student_id,
+                "seat_id": None if is_room else facility[1],
+                "meeting_room_id": facility[1] if is_room else None,
+                "start_time": start,
+                "end_time": end,
+                "start_minute": to_epoch_minutes(start),
+                "end_minute": to_epoch_minutes(end),
+                # 보통 1시간 ~ 7일 전에 예약
+                "created_at": start - timedelta(minutes=rng.randrange(60, 7 * 24 * 60)),
+                "status": status,
+            })
+            if members:
+                participants.extend(
+                    {"reservation_id": reservation_id, "participant_student_id": sid} for sid in sorted(members)
+                )
+                counts["participants"] += len(members)
+
+            reservation_id += 1
+            remaining -= 1
+            if len(rows) >= CHUNK_SIZE:
+                flush()
+        day -= timedelta(days=1)
+
+    flush()
+    session.commit()
+    if analyze:
+        session.execute(text("ANALYZE"))
+    session.close()
+
+    return {
+        "reservations": reservations,
+        "canceled": counts["canceled"],
+        "participants": counts["participants"],
+        "users": users,
+        "first_day": (day + timedelta(days=1)).isoformat(),
+        "last_day": last_day.isoformat(),
+        "first_reservation_id": first_reservation_id,
+        "seed": seed,
+        "anchor_date": anchor_date.isoformat(),
+        "elapsed_s": round(time.perf_counter() - started, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", required=True, help="SQLite DB 파일 경로 (없으면 생성)")
+    parser.add_argument("--reservations", type=int, default=100_000)
+    parser.add_argument("--users", type=int, help="사용자 수 (기본: 예약 40건당 1명, 최소 1000명)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--anchor-date", type=date.fromisoformat, help="현재로 간주할 날짜 YYYY-MM-DD (기본: 오늘)")
+    parser.add_argument("--days-ahead", type=int, default=14, help="기준일 이후로 예약을 채울 일수")
+    parser.add_argument("--cancel-rate", type=float, default=0.12)
+    parser.add_argument("--room-share", type=float, default=0.1, help="회의실 예약 비율")
+    parser.add_argument("--reset", action="store_true", help="기존 테이블을 지우고 새로 생성")
+    args = parser.parse_args()
+
+    if os.path.exists(args.db) and not args.reset:
+        parser.error(f"{args.db}가 이미 있습니다. 덮어쓰려면 --reset을 지정하세요.")
+
+    if args.users is not None and args.users < MIN_USERS:
+        parser.error(f"--users는 최소 {MIN_USERS}명이어야 합니다.")
+
+    engine = create_engine(f"sqlite:///{args.db}")
+    try:
+        result = generate(
+            engine,
+            args.reservations,
+            seed=args.seed,
+            users=args.users,
+            anchor_date=args.anchor_date,
+            days_ahead=args.days_ahead,
+            cancel_rate=args.cancel_rate,
+            room_share=args.room_share,
+            reset=args.reset,
+        )
+    finally:
+        engine.dispose()
+
+    for key, value in result.items():
+        print(f"{key:<22} {value}")
+
+
+if __name__ == "__main__":
+    main()
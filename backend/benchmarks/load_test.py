@@ -0,0 +1,341 @@
+"""
+benchmarks/load_test.py - 예약 트래픽 부하 테스트
+=================================================
+가상 사용자 N명이 실제 이용 패턴을 섞어 API를 호출하고 지연 시간 / 처리량 / 충돌률을 측정합니다.
+
+- 시작 시 모든 사용자가 동시에 로그인합니다. (09:00 예약 오픈 직후의 로그인 폭주)
+- 이후 --mix 비율대로 현황 조회, 좌석 직접 / 랜덤 예약, 회의실 예약(참여자 포함),
+  내 예약 조회, 취소를 --duration초 동안(또는 --requests건까지) 반복합니다.
+- 응답은 ok / conflict(409) / rejected(그 밖의 4xx) / lock_error(503 DATABASE_BUSY) / error로 나눕니다.
+- 기본은 임시 SQLite 파일로 앱을 프로세스 안에서 띄웁니다(TestClient).
+  --base-url을 주면 이미 떠 있는 uvicorn 서버로 보냅니다.
+- --output으로 설정 / 커밋 / 결과를 JSON으로 남겨 커밋 간 비교에 씁니다.
+
+실행 (backend 디렉터리에서):
+    python -m benchmarks.load_test --users 50 --duration 30 --output load.json
+    python -m benchmarks.load_test --base-url http://127.0.0.1:8000 --users 100 --duration 60
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import subprocess
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, timezone
+
+DEFAULT_MIX = "status=40,me=15,seat=15,random_seat=10,meeting=10,cancel=10"
+OPERATIONS = ("status", "me", "seat", "random_seat", "meeting", "cancel")
+
+SEAT_IDS = range(1, 71)
+ROOM_IDS = (1, 2, 3)
+# 좌석 2시간 / 회의실 1시간, 운영 시간 09:00 ~ 18:00
+SEAT_START_HOURS = range(9, 17)
+ROOM_START_HOURS = range(9, 18)
+FIRST_STUDENT_ID = 202600001
+
+
+def parse_mix(text: str) -> dict:
+    """'status=40,seat=15,...' → {작업: 가중치}"""
+    mix = {}
+    for item in text.split(","):
+        name, _, weight = item.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f"알 수 없는 작업: {name} (허용: {', '.join(OPERATIONS)})")
+        mix[name] = float(weight)
+    if not any(mix.values()):
+        raise argparse.ArgumentTypeError("가중치 합이 0입니다.")
+    return mix
+
+
+def classify(status_code: int, body: dict) -> str:
+    if status_code < 400:
+        return "ok"
+    if status_code == 409:
+        return "conflict"
+    if status_code == 503 and body.get("code") == "DATABASE_BUSY":
+        return "lock_error"
+    if status_code < 500:
+        return "rejected"
+    return "error"
+
+
+def percentile(ordered: list, q: float) -> float:
+    """nearest-rank 백분위 (ordered는 오름차순)"""
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+class Recorder:
+    """작업별 지연 시간 / 결과 집계 (스레드 공유)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.outcomes = defaultdict(lambda: defaultdict(int))
+
+    def add(self, operation: str, seconds: float, outcome: str) -> None:
+        with self._lock:
+            self.latencies[operation].append(seconds)
+            self.outcomes[operation][outcome] += 1
+
+    def summary(self, elapsed: float) -> dict:
+        operations = {}
+        for operation in sorted(self.latencies):
+            ordered = sorted(self.latencies[operation])
+            outcomes = dict(self.outcomes[operation])
+            count = len(ordered)
+            operations[operation] = {
+                "count": count,
+                "throughput_rps": round(count / elapsed, 2),
+                "p50_ms": round(percentile(ordered, 0.50) * 1000, 2),
+                "p95_ms": round(percentile(ordered, 0.95) * 1000, 2),
+                "p99_ms": round(percentile(ordered, 0.99) * 1000, 2),
+                "max_ms": round(ordered[-1] * 1000, 2),
+                "outcomes": outcomes,
+                "conflict_rate": round(outcomes.get("conflict", 0) / count, 4),
+                "lock_error_rate": round(outcomes.get("lock_error", 0) / count, 4),
+            }
+
+        total = sum(item["count"] for item in operations.values())
+        everything = sorted(value for values in self.latencies.values() for value in values)
+        totals = defaultdict(int)
+        for item in operations.values():
+            for outcome, count in item["outcomes"].items():
+                totals[outcome] += count
+        return {
+            "elapsed_s": round(elapsed, 3),
+            "requests": total,
+            "throughput_rps": round(total / elapsed, 2) if elapsed else 0.0,
+            "p50_ms": round(percentile(everything, 0.50) * 1000, 2) if everything else None,
+            "p95_ms": round(percentile(everything, 0.95) * 1000, 2) if everything else None,
+            "p99_ms": round(percentile(everything, 0.99) * 1000, 2) if everything else None,
+            "outcomes": dict(totals),
+            "conflict_rate": round(totals["conflict"] / total, 4) if total else 0.0,
+            "lock_error_rate": round(totals["lock_error"] / total, 4) if total else 0.0,
+            "operations": operations,
+        }
+
+
+class VirtualUser:
+    """로그인한 학생 한 명 (자기 예약 ID를 들고 있다가 취소에 사용)"""
+
+    def __init__(self, client, student_id: int, days: list, rng: random.Random, recorder: Recorder):
+        self.client = client
+        self.student_id = student_id
+        self.days = days
+        self.rng = rng
+        self.recorder = recorder
+        self.headers = {}
+        self.reservation_ids = []
+
+    def _call(self, operation: str, method: str, url: str, **kwargs):
+        started = time.perf_counter()
+        try:
+            response = self.client.request(method, url, headers=self.headers, **kwargs)
+        except Exception:
+            self.recorder.add(operation, time.perf_counter() - started, "error")
+            return None
+        elapsed = time.perf_counter() - started
+        try:
+            body = response.json()
+        except ValueError:
+            body = {}
+        self.recorder.add(operation, elapsed, classify(response.status_code, body))
+        return body if response.status_code < 400 else None
+
+    def login(self) -> None:
+        body = self._call("login", "POST", "/api/auth/login", json={"student_id": self.student_id})
+        if body:
+            self.headers = {"Authorization": f"Bearer {body['payload']['access_token']}"}
+
+    def _seat_body(self) -> dict:
+        hour = self.rng.choice(SEAT_START_HOURS)
+        return {
+            "date": self.rng.choice(self.days),
+            "start_time": f"{hour:02d}:00",
+            "end_time": f"{hour + 2:02d}:00",
+        }
+
+    def status(self) -> None:
+        kind = self.rng.choice(("seats", "meeting-rooms"))
+        self._call("status", "GET", f"/api/status/{kind}", params={"date": self.rng.choice(self.days)})
+
+    def me(self) -> None:
+        self._call("me", "GET", "/api/reservations/me")
+
+    def seat(self) -> None:
+        body = self._call("seat", "POST", "/api/reservations/seats", json={
+            **self._seat_body(), "seat_id": self.rng.choice(SEAT_IDS),
+        })
+        if body:
+            self.reservation_ids.append(body["payload"]["reservation_id"])
+
+    def random_seat(self) -> None:
+        body = self._call("random_seat", "POST", "/api/reservations/seats/random", json=self._seat_body())
+        if body:
+            self.reservation_ids.append(body["payload"]["reservation_id"])
+
+    def meeting(self) -> None:
+        hour = self.rng.choice(ROOM_START_HOURS)
+        participants = [
+            {"student_id": FIRST_STUDENT_ID + 100_000 + self.rng.randrange(10_000)}
+            for _ in range(3)
+        ]
+        body = self._call("meeting", "POST", "/api/reservations/meeting-rooms", json={
+            "room_id": self.rng.choice(ROOM_IDS),
+            "date": self.rng.choice(self.days),
+            "start_time": f"{hour:02d}:00",
+            "end_time": f"{hour + 1:02d}:00",
+            "participants": participants,
+        })
+        if body:
+            self.reservation_ids.append(body["payload"]["reservation_id"])
+
+    def cancel(self) -> None:
+        if not self.reservation_ids:
+            # 취소할 예약이 없으면 현황 조회로 대신 (취소만 건너뛰어 비율이 틀어지지 않도록)
+            self.status()
+            return
+        reservation_id = self.reservation_ids.pop(self.rng.randrange(len(self.reservation_ids)))
+        self._call("cancel", "DELETE", f"/api/reservations/me/{reservation_id}")
+
+
+def run(client, users: int, duration: float, requests: int, mix: dict, days: int, seed: int) -> dict:
+    """가상 사용자 부하 실행 후 요약 dict"""
+    recorder = Recorder()
+    booking_days = [(date.today() + timedelta(days=offset)).isoformat() for offset in range(1, days + 1)]
+    virtual_users = [
+        VirtualUser(client, FIRST_STUDENT_ID + index, booking_days, random.Random(seed + index), recorder)
+        for index in range(users)
+    ]
+    operations, weights = zip(*mix.items())
+
+    with ThreadPoolExecutor(max_workers=users) as pool:
+        # 1) 로그인 폭주: 전원 동시에
+        login_started = time.perf_counter()
+        list(pool.map(lambda user: user.login(), virtual_users))
+        login_elapsed = time.perf_counter() - login_started
+
+        # 2) 혼합 트래픽
+        remaining = [requests]
+        remaining_lock = threading.Lock()
+        deadline = time.perf_counter() + duration
+
+        def take() -> bool:
+            if requests:
+                with remaining_lock:
+                    if remaining[0] <= 0:
+                        return False
+                    remaining[0] -= 1
+                    return True
+            return time.perf_counter() < deadline
+
+        def drive(user: VirtualUser) -> None:
+            while take():
+                getattr(user, user.rng.choices(operations, weights)[0])()
+
+        mixed_started = time.perf_counter()
+        list(pool.map(drive, virtual_users))
+        mixed_elapsed = time.perf_counter() - mixed_started
+
+    login = recorder.latencies.pop("login", [])
+    login_outcomes = dict(recorder.outcomes.pop("login", {}))
+    ordered = sorted(login)
+    result = recorder.summary(mixed_elapsed)
+    result["login_burst"] = {
+        "users": users,
+        "elapsed_s": round(login_elapsed, 3),
+        "p50_ms": round(percentile(ordered, 0.50) * 1000, 2) if ordered else None,
+        "p99_ms": round(percentile(ordered, 0.99) * 1000, 2) if ordered else None,
+        "outcomes": login_outcomes,
+    }
+    return result
+
+
+@contextmanager
+def in_process_client():
+    """임시 SQLite 파일로 앱을 띄운 TestClient (lifespan으로 테이블 / 시설 생성)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["LIBRARY_DATABASE_PATH"] = os.path.join(tmp, "load_test.db")
+        from fastapi.testclient import TestClient
+
+        from app.main import app
+
+        with TestClient(app) as client:
+            yield client
+
+
+@contextmanager
+def remote_client(base_url: str, users: int):
+    import httpx
+
+    limits = httpx.Limits(max_connections=users, max_keepalive_connections=users)
+    with httpx.Client(base_url=base_url, limits=limits, timeout=30.0) as client:
+        yield client
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", help="대상 서버 (생략 시 프로세스 내 TestClient)")
+    parser.add_argument("--users", type=int, default=20, help="동시 가상 사용자 수")
+    parser.add_argument("--duration", type=float, default=10.0, help="혼합 트래픽 시간(초)")
+    parser.add_argument("--requests", type=int, default=0, help="혼합 트래픽 총 요청 수 (지정 시 --duration 대신)")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX), help=f"작업 가중치 (기본: {DEFAULT_MIX})")
+    parser.add_argument("--days", type=int, default=3, help="예약 / 조회 날짜 범위 (내일부터 N일)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="결과 JSON 경로")
+    args = parser.parse_args()
+
+    client_factory = remote_client(args.base_url, args.users) if args.base_url else in_process_client()
+    with client_factory as client:
+        result = run(client, args.users, args.duration, args.requests, args.mix, args.days, args.seed)
+
+    burst = result["login_burst"]
+    print(f"login burst: {burst['users']} users in {burst['elapsed_s']}s "
+          f"(p50 {burst['p50_ms']}ms, p99 {burst['p99_ms']}ms)")
+    print(f"{'operation':<12} {'count':>7} {'rps':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+          f"{'conflict':>9} {'lock err':>9}")
+    for name, item in result["operations"].items():
+        print(f"{name:<12} {item['count']:>7} {item['throughput_rps']:>8} {item['p50_ms']:>8} "
+              f"{item['p95_ms']:>8} {item['p99_ms']:>8} {item['conflict_rate']:>9.2%} {item['lock_error_rate']:>9.2%}")
+    print(f"{'total':<12} {result['requests']:>7} {result['throughput_rps']:>8} {result['p50_ms']:>8} "
+          f"{result['p95_ms']:>8} {result['p99_ms']:>8} {result['conflict_rate']:>9.2%} {result['lock_error_rate']:>9.2%}")
+
+    if args.output:
+        document = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "commit": git_commit(),
+            "target": args.base_url or "in-process",
+            "config": {
+                "users": args.users,
+                "duration": args.duration,
+                "requests": args.requests,
+                "mix": args.mix,
+                "days": args.days,
+                "seed": args.seed,
+            },
+            "result": result,
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(document, f, ensure_ascii=False, indent=2)
+        print(f"saved: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
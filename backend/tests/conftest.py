@@ -2,13 +2,16 @@
 conftest.py - pytest 설정 및 공통 fixture
 """
 import pytest
+from contextlib import contextmanager
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from datetime import datetime, timezone, timedelta, date
 
+from app import facility_availability, lock_profiler, reservation_index
 from app.main import app
-from app.database import Base, get_db
+from app.config import settings
+from app.database import Base, get_db, get_read_db, repeated_statements, start_query_tracking
 from app.models import User, Seat, MeetingRoom, Reservation, ReservationStatus, ReservationParticipant
 # from app.utils.auth import create_access_token
 
@@ -40,6 +43,8 @@ def db_session(test_engine):
     """각 테스트마다 독립적인 DB 세션 제공"""
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
     session = TestingSessionLocal()
+    reservation_index.active_index.clear()
+    facility_availability.reset()
     yield session
     session.rollback()
     # 모든 테이블 데이터 삭제 (테스트 격리)
@@ -47,6 +52,9 @@ def db_session(test_engine):
         session.execute(table.delete())
     session.commit()
     session.close()
+    # 일괄 DELETE는 세션 이벤트에 잡히지 않으므로 예약 인덱스·시설 캐시도 비움
+    reservation_index.active_index.clear()
+    facility_availability.reset()
 
 
 @pytest.fixture(scope="function")
@@ -59,7 +67,11 @@ def client(db_session):
             pass
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     with TestClient(app) as test_client:
+        # lifespan이 앱 DB로 구성한 예약 인덱스·시설 캐시를 테스트 DB 기준으로 다시 구성
+        reservation_index.rebuild([db_session])
+        facility_availability.reload(db_session)
         yield test_client
     app.dependency_overrides.clear()
 
@@ -300,3 +312,51 @@ def operation_hours():
         "end_hour": 22,    # 오후 10시
         "timezone": KST
     }
+
+
+# --------------------------------------------------------------------------
+# Query Budget Fixtures (N+1 회귀 방지)
+# --------------------------------------------------------------------------
+class QueryBudget:
+    """요청/코드 블록의 SQL 실행 횟수 상한 검사"""
+
+    def __call__(self, response, max_queries):
+        """응답의 X-DB-Queries 헤더로 요청 한 번의 쿼리 수 검사"""
+        count = int(response.headers["X-DB-Queries"])
+        assert count <= max_queries, (
+            f"{count} queries exceed budget {max_queries} (X-DB-Time={response.headers['X-DB-Time']}ms)"
+        )
+        return count
+
+    @contextmanager
+    def limit(self, max_queries):
+        """블록 안에서 (같은 스레드로) 실행된 쿼리 수 검사 - 서비스 함수용"""
+        stats = start_query_tracking()
+        yield stats
+        repeated = repeated_statements(stats, 2)[:3]
+        assert stats["count"] <= max_queries, (
+            f"{stats['count']} queries exceed budget {max_queries}; most repeated: {repeated}"
+        )
+
+
+@pytest.fixture
+def query_budget(monkeypatch):
+    """
+    쿼리 수 상한 검사 fixture (디버그 헤더 활성화)
+
+    사용 예:
+        query_budget(client.get("/api/reservations/me", headers=...), 5)
+        with query_budget.limit(3):
+            seat_service.reserve_seat(...)
+    """
+    monkeypatch.setattr(settings, "DEBUG", True)
+    return QueryBudget()
+
+
+@pytest.fixture
+def lock_profile(monkeypatch):
+    """쓰기 락 프로파일러 활성화 + 집계 초기화 (lock_profiler.report()로 결과 확인)"""
+    monkeypatch.setattr(settings, "LOCK_PROFILER_ENABLED", True)
+    lock_profiler.reset()
+    yield lock_profiler
+    lock_profiler.reset()
@@ -0,0 +1,456 @@
+"""
+tests/integration/test_admin_api.py - 관리자 API 통합 테스트
+"""
+import csv
+import io
+import json
+
+import pytest
+from datetime import date, datetime, time, timedelta, timezone
+from sqlalchemy.orm import sessionmaker
+
+from app import facility_registry, reservation_index
+from app.config import settings
+from app.database import get_read_session_factory
+from app.main import app
+from app.models import Building, MeetingRoom, ReadingRoom, Reservation, ReservationStatus
+from tests.utils.assertions import ResponseAssertions
+
+
+@pytest.fixture
+def admin_headers(test_user, test_token, monkeypatch):
+    """test_user를 관리자로 지정한 인증 헤더"""
+    monkeypatch.setattr(settings, "ADMIN_STUDENT_IDS", [test_user.student_id])
+    return {"Authorization": f"Bearer {test_token}"}
+
+
+@pytest.fixture
+def export_session_factory(test_engine):
+    """내보내기 스트림이 테스트 DB를 사용하도록 세션 팩토리 교체"""
+    app.dependency_overrides[get_read_session_factory] = lambda: sessionmaker(bind=test_engine)
+    yield
+    app.dependency_overrides.pop(get_read_session_factory, None)
+
+
+@pytest.fixture
+def period_reservations(db_session, test_user, test_seat, test_meeting_room):
+    """2025-12-10 ~ 2025-12-14 좌석 예약 5건 + 회의실 예약 1건"""
+    for day in range(10, 15):
+        db_session.add(Reservation(
+            student_id=test_user.student_id,
+            seat_id=test_seat.seat_id,
+            meeting_room_id=None,
+            start_time=datetime(2025, 12, day, 1, 0, 0, tzinfo=timezone.utc),
+            end_time=datetime(2025, 12, day, 3, 0, 0, tzinfo=timezone.utc),
+            status=ReservationStatus.COMPLETED if day < 14 else ReservationStatus.RESERVED,
+        ))
+    db_session.add(Reservation(
+        student_id=test_user.student_id,
+        seat_id=None,
+        meeting_room_id=test_meeting_room.room_id,
+        start_time=datetime(2025, 12, 12, 5, 0, 0, tzinfo=timezone.utc),
+        end_time=datetime(2025, 12, 12, 6, 0, 0, tzinfo=timezone.utc),
+        status=ReservationStatus.RESERVED,
+    ))
+    db_session.commit()
+
+
+@pytest.mark.integration
+@pytest.mark.reservation
+class TestAdminReservationList:
+    """관리자 전체 예약 조회 API 테스트"""
+
+    def test_non_admin_forbidden(self, client, test_token, period_reservations):
+        """관리자가 아니면 403"""
+        response = client.get(
+            "/api/admin/reservations",
+            headers={"Authorization": f"Bearer {test_token}"}
+        )
+
+        assert response.status_code == 403
+        ResponseAssertions.assert_error_code(response, "AUTH_FORBIDDEN")
+
+    def test_list_sorted_by_start_time(self, client, admin_headers, period_reservations):
+        """시작 시각 오름차순 조회"""
+        response = client.get("/api/admin/reservations", headers=admin_headers)
+
+        ResponseAssertions.assert_success_response(response, status_code=200)
+        items = response.json()["payload"]["items"]
+        assert len(items) == 6
+        assert [item["date"] for item in items] == sorted(item["date"] for item in items)
+        assert all(item["student_id"] == 202312345 for item in items)
+
+    def test_keyset_pagination(self, client, admin_headers, period_reservations):
+        """커서를 따라가면 중복/누락 없이 전체 조회"""
+        ids = []
+        cursor = None
+        while True:
+            query = "limit=4" + (f"&cursor={cursor}" if cursor else "")
+            payload = client.get(f"/api/admin/reservations?{query}", headers=admin_headers).json()["payload"]
+            ids.extend(item["reservation_id"] for item in payload["items"])
+            cursor = payload["next_cursor"]
+            if cursor is None:
+                break
+
+        assert len(ids) == 6
+        assert len(set(ids)) == 6
+
+    def test_filter_by_type_status_and_period(self, client, admin_headers, period_reservations):
+        """기간·유형·상태 필터"""
+        response = client.get(
+            "/api/admin/reservations?from=2025-12-11&to=2025-12-13&type=seat&status=COMPLETED",
+            headers=admin_headers,
+        )
+
+        items = response.json()["payload"]["items"]
+        assert [item["date"] for item in items] == ["2025-12-11", "2025-12-12", "2025-12-13"]
+        assert all(item["type"] == "seat" and item["status"] == "COMPLETED" for item in items)
+
+    def test_invalid_status(self, client, admin_headers):
+        """잘못된 상태 값 - 400 Bad Request"""
+        response = client.get("/api/admin/reservations?status=UNKNOWN", headers=admin_headers)
+
+        assert response.status_code == 400
+
+    def test_sharding_mode_rejected(self, client, admin_headers, period_reservations, monkeypatch):
+        """샤딩 모드에서는 메인 DB에 예약이 없으므로 빈 목록 대신 400 VALIDATION_ERROR"""
+        monkeypatch.setattr(settings, "SHARDING_ENABLED", True)
+
+        response = client.get("/api/admin/reservations", headers=admin_headers)
+
+        assert response.status_code == 400
+        assert response.json()["code"] == "VALIDATION_ERROR"
+
+
+@pytest.mark.integration
+@pytest.mark.reservation
+class TestAdminReservationExport:
+    """관리자 예약 내보내기 API 테스트"""
+
+    def test_export_csv(self, client, admin_headers, export_session_factory, period_reservations):
+        """CSV 내보내기 (헤더 + 행)"""
+        response = client.get("/api/admin/reservations/export?format=csv", headers=admin_headers)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert len(rows) == 6
+        assert rows[0]["date"] == "2025-12-10"
+
+    def test_export_ndjson_with_filter(self, client, admin_headers, export_session_factory, period_reservations):
+        """NDJSON 내보내기 + 유형 필터"""
+        response = client.get(
+            "/api/admin/reservations/export?format=ndjson&type=meeting_room",
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 200
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert len(lines) == 1
+        assert lines[0]["type"] == "meeting_room"
+        assert lines[0]["start_time"] == "14:00"
+
+    def test_export_sharding_mode_rejected(self, client, admin_headers, export_session_factory, monkeypatch):
+        """샤딩 모드에서는 스트림 시작 전에 400 VALIDATION_ERROR"""
+        monkeypatch.setattr(settings, "SHARDING_ENABLED", True)
+
+        response = client.get("/api/admin/reservations/export?format=csv", headers=admin_headers)
+
+        assert response.status_code == 400
+        assert response.json()["code"] == "VALIDATION_ERROR"
+
+    def test_export_non_admin_forbidden(self, client, test_token, export_session_factory):
+        """관리자가 아니면 403"""
+        response = client.get(
+            "/api/admin/reservations/export",
+            headers={"Authorization": f"Bearer {test_token}"}
+        )
+
+        assert response.status_code == 403
+
+
+@pytest.mark.integration
+class TestAdminFacilityRefresh:
+    """시설 레지스트리 갱신 API 테스트"""
+
+    @pytest.fixture
+    def new_building(self, db_session):
+        """새 건물 (열람실 좌석 501~510, 회의실 9)"""
+        original = facility_registry.get_snapshot()
+        db_session.add(Building(building_id=5, name="신관"))
+        db_session.flush()
+        db_session.add_all([
+            ReadingRoom(reading_room_id=50, building_id=5, name="신관열람실", seat_min_id=501, seat_max_id=510),
+            MeetingRoom(room_id=9, building_id=5),
+        ])
+        db_session.commit()
+        yield
+        facility_registry.set_snapshot(original)
+
+    def test_refresh_loads_new_building(self, client, admin_headers, new_building):
+        """갱신 후 새 건물 시설이 응답 및 현황 조회에 반영"""
+        response = client.post("/api/admin/facilities/refresh", headers=admin_headers)
+
+        ResponseAssertions.assert_success_response(response, status_code=200)
+        payload = response.json()["payload"]
+        assert payload["seat_count"] == 10
+        assert payload["meeting_room_count"] == 1
+        assert payload["buildings"][0]["reading_rooms"][0]["seat_min_id"] == 501
+
+        status_payload = client.get("/api/status/seats?date=2025-12-20").json()["payload"]
+        assert [seat["seat_id"] for seat in status_payload["seats"]] == list(range(501, 511))
+
+    def test_refresh_non_admin_forbidden(self, client, test_token):
+        """관리자가 아니면 403"""
+        response = client.post(
+            "/api/admin/facilities/refresh",
+            headers={"Authorization": f"Bearer {test_token}"}
+        )
+
+        assert response.status_code == 403
+
+
+@pytest.mark.integration
+class TestAdminFacilityAvailability:
+    """시설 이용 가능 여부 일괄 변경 API 테스트"""
+
+    def test_disable_seat_row(self, client, admin_headers, available_seats):
+        """좌석 한 줄을 비활성화하면 현황·예약에 바로 반영"""
+        response = client.post(
+            "/api/admin/facilities/availability",
+            json={"type": "seat", "is_available": False, "from_id": 1, "to_id": 5},
+            headers=admin_headers,
+        )
+
+        ResponseAssertions.assert_success_response(response, status_code=200)
+        payload = response.json()["payload"]
+        assert payload["updated_ids"] == [1, 2, 3, 4, 5]
+        assert payload["disabled_count"] == 5
+
+        tomorrow = (date.today() + timedelta(days=1)).isoformat()
+        seats = client.get(f"/api/status/seats?date={tomorrow}").json()["payload"]["seats"]
+        disabled = [seat["seat_id"] for seat in seats if not seat["is_available"]]
+        assert disabled == [1, 2, 3, 4, 5]
+        assert not any(slot["is_available"] for slot in seats[0]["slots"])
+
+        response = client.post(
+            "/api/reservations/seats",
+            json={"date": tomorrow, "start_time": "10:00", "end_time": "12:00", "seat_id": 3},
+            headers=admin_headers,
+        )
+        ResponseAssertions.assert_error_code(response, "SEAT_NOT_AVAILABLE")
+
+    def test_unchanged_and_missing_ids_reported(self, client, admin_headers, test_meeting_room):
+        """이미 같은 상태인 시설은 변경하지 않고, 없는 시설은 따로 보고"""
+        response = client.post(
+            "/api/admin/facilities/availability",
+            json={"type": "meeting_room", "is_available": True, "facility_ids": [test_meeting_room.room_id, 99]},
+            headers=admin_headers,
+        )
+
+        payload = response.json()["payload"]
+        assert payload["updated_ids"] == []
+        assert payload["not_found_ids"] == [99]
+
+
+KST = timezone(timedelta(hours=9))
+
+
+def tomorrow_at(hour, days=1):
+    """내일(KST) hour시를 UTC aware datetime으로"""
+    return datetime.combine(date.today() + timedelta(days=days), time(hour, 0), tzinfo=KST).astimezone(timezone.utc)
+
+
+def add_seat_reservation(db_session, student_id, seat_id, hour, days=1):
+    reservation = Reservation(
+        student_id=student_id,
+        seat_id=seat_id,
+        start_time=tomorrow_at(hour, days),
+        end_time=tomorrow_at(hour + 2, days),
+        status=ReservationStatus.RESERVED,
+    )
+    db_session.add(reservation)
+    return reservation
+
+
+def bulk_body(**overrides):
+    tomorrow = (date.today() + timedelta(days=1)).isoformat()
+    body = {"action": "cancel", "type": "seat", "from_date": tomorrow, "to_date": tomorrow}
+    body.update(overrides)
+    return body
+
+
+@pytest.mark.integration
+@pytest.mark.reservation
+class TestAdminBulkReservations:
+    """예약 일괄 취소 / 이동 API 테스트"""
+
+    def test_dry_run_then_cancel(self, client, admin_headers, db_session, available_seats, multiple_users):
+        """dry_run은 변경하지 않고, 실제 실행은 조건에 맞는 예약만 취소"""
+        targets = [add_seat_reservation(db_session, u.student_id, seat_id, 10)
+                   for u, seat_id in zip(multiple_users, (1, 2))]
+        other = add_seat_reservation(db_session, multiple_users[2].student_id, 3, 10)
+        db_session.commit()
+
+        response = client.post(
+            "/api/admin/reservations/bulk", json=bulk_body(facility_ids=[1, 2]), headers=admin_headers
+        )
+        ResponseAssertions.assert_success_response(response, status_code=200)
+        payload = response.json()["payload"]
+        assert (payload["dry_run"], payload["matched"], payload["succeeded"]) == (True, 2, 2)
+        db_session.expire_all()
+        assert all(r.status == ReservationStatus.RESERVED for r in targets)
+
+        response = client.post(
+            "/api/admin/reservations/bulk",
+            json=bulk_body(facility_ids=[1, 2], dry_run=False),
+            headers=admin_headers,
+        )
+        assert response.json()["payload"]["succeeded"] == 2
+
+        db_session.expire_all()
+        assert [r.status for r in targets] == [ReservationStatus.CANCELED] * 2
+        assert other.status == ReservationStatus.RESERVED
+        assert not any(reservation_index.verify([db_session]).values())
+
+    def test_move_to_target_seats_reports_conflicts(self, client, admin_headers, db_session, available_seats, multiple_users):
+        """재배정할 좌석이 모두 차 있으면 해당 예약만 실패로 보고"""
+        first = add_seat_reservation(db_session, multiple_users[0].student_id, 1, 10)
+        second = add_seat_reservation(db_session, multiple_users[1].student_id, 2, 10)
+        add_seat_reservation(db_session, multiple_users[2].student_id, 3, 10)
+        db_session.commit()
+
+        response = client.post(
+            "/api/admin/reservations/bulk",
+            json=bulk_body(action="move", facility_ids=[1, 2], target_facility_ids=[3, 4], dry_run=False),
+            headers=admin_headers,
+        )
+
+        payload = response.json()["payload"]
+        assert (payload["succeeded"], payload["failed"]) == (1, 1)
+        assert payload["items"][1]["code"] == "RESERVATION_CONFLICT"
+
+        db_session.expire_all()
+        assert (first.seat_id, second.seat_id) == (4, 2)
+        assert not any(reservation_index.verify([db_session]).values())
+
+    def test_shift_checks_user_overlap_and_hours(self, client, admin_headers, db_session, available_seats, multiple_users):
+        """시간 이동은 본인 다른 예약·운영 시간을 검사"""
+        student_id = multiple_users[0].student_id
+        blocked = add_seat_reservation(db_session, student_id, 1, 10)
+        add_seat_reservation(db_session, student_id, 5, 12)
+        late = add_seat_reservation(db_session, multiple_users[1].student_id, 1, 16)
+        movable = add_seat_reservation(db_session, multiple_users[2].student_id, 2, 10)
+        db_session.commit()
+
+        response = client.post(
+            "/api/admin/reservations/bulk",
+            json=bulk_body(action="move", facility_ids=[1, 2], shift_minutes=120, dry_run=False),
+            headers=admin_headers,
+        )
+
+        items = {item["reservation_id"]: item for item in response.json()["payload"]["items"]}
+        assert items[blocked.reservation_id]["code"] == "OVERLAP_WITH_OTHER_FACILITY"
+        assert items[late.reservation_id]["code"] == "VALIDATION_ERROR"
+        assert items[movable.reservation_id]["new_start_time"] == "12:00"
+
+        db_session.expire_all()
+        assert movable.start_time.replace(tzinfo=timezone.utc) == tomorrow_at(12)
+        assert movable.start_minute == blocked.start_minute + 120
+
+    def test_facility_closure_in_one_request(self, client, admin_headers, db_session):
+        """시설 폐쇄: 500건을 한 번의 요청으로 취소"""
+        for i in range(500):
+            add_seat_reservation(db_session, 202400000 + i, i % 100 + 1, 10 + 2 * (i // 100 % 4), days=1 + i // 400)
+        db_session.commit()
+
+        response = client.post(
+            "/api/admin/reservations/bulk",
+            json=bulk_body(
+                dry_run=False,
+                to_date=(date.today() + timedelta(days=2)).isoformat(),
+            ),
+            headers=admin_headers,
+        )
+
+        payload = response.json()["payload"]
+        assert (payload["matched"], payload["succeeded"]) == (500, 500)
+        assert db_session.query(Reservation).filter(
+            Reservation.status == ReservationStatus.RESERVED
+        ).count() == 0
+
+    def test_cancel_with_move_options_rejected(self, client, admin_headers):
+        """취소 작업에 이동 옵션을 주면 400"""
+        response = client.post(
+            "/api/admin/reservations/bulk", json=bulk_body(shift_minutes=60), headers=admin_headers
+        )
+
+        assert response.status_code == 400
+
+
+class TestAdminReservationIndex:
+    """예약 인덱스 점검/재구성 API 테스트"""
+
+    def test_check_reports_stale_and_rebuild_fixes(self, client, admin_headers, seat_reservation, db_session):
+        """일괄 변경으로 어긋난 인덱스를 점검 후 재구성"""
+        reservation_id = seat_reservation.reservation_id
+        response = client.get("/api/admin/reservation-index", headers=admin_headers)
+        ResponseAssertions.assert_success_response(response, status_code=200)
+        assert response.json()["payload"]["consistent"] is True
+        assert response.json()["payload"]["indexed"] == 1
+
+        db_session.query(Reservation).delete(synchronize_session=False)
+        db_session.commit()
+
+        payload = client.get("/api/admin/reservation-index", headers=admin_headers).json()["payload"]
+        assert payload["consistent"] is False
+        assert payload["stale"] == [reservation_id]
+
+        response = client.post("/api/admin/reservation-index/rebuild", headers=admin_headers)
+        ResponseAssertions.assert_success_response(response, status_code=200)
+        payload = response.json()["payload"]
+        assert payload["consistent"] is True
+        assert payload["indexed"] == 0
+        assert payload["rebuilt_at"] is not None
+
+    def test_check_non_admin_forbidden(self, client, test_token):
+        """관리자가 아니면 403"""
+        response = client.get(
+            "/api/admin/reservation-index",
+            headers={"Authorization": f"Bearer {test_token}"}
+        )
+
+        assert response.status_code == 403
+
+
+@pytest.mark.integration
+class TestAdminLockProfile:
+    """쓰기 락 구간 프로파일 API 테스트"""
+
+    def test_profile_and_folded(self, client, admin_headers, test_seat, lock_profile):
+        """예약 후 구간 통계와 folded stack 조회, 초기화"""
+        response = client.post(
+            "/api/reservations/seats",
+            json={
+                "date": (date.today() + timedelta(days=1)).isoformat(),
+                "start_time": "10:00",
+                "end_time": "12:00",
+                "seat_id": 1,
+            },
+            headers=admin_headers,
+        )
+        assert response.status_code == 201, response.text
+
+        response = client.get("/api/admin/lock-profile", headers=admin_headers)
+        ResponseAssertions.assert_success_response(response, status_code=200)
+        payload = response.json()["payload"]
+        assert payload["enabled"] is True
+        assert [s["section"] for s in payload["sections"]] == ["seat.reserve"]
+        assert payload["sections"][0]["hold"]["p99_ms"] > 0
+
+        response = client.get("/api/admin/lock-profile/folded", headers=admin_headers)
+        assert response.status_code == 200
+        assert "seat.reserve;held;commit" in response.text
+
+        response = client.post("/api/admin/lock-profile/reset", headers=admin_headers)
+        assert response.json()["payload"]["sections"] == []
@@ -0,0 +1,290 @@
+"""
+tests/integration/test_concurrency_stress.py - 동시 예약 스트레스 테스트
+
+파일 DB(WAL)에 여러 스레드 / 프로세스가 같은 좌석 슬롯과 랜덤 좌석을 동시에 예약한 뒤
+불변식을 검사합니다. BEGIN IMMEDIATE 쓰기 락 설계가 이중 예약을 막는지 확인하는 안전망입니다.
+
+- 좌석은 CONTENDED_SEATS만 열어 두고(나머지 이용 불가) 랜덤 배정도 같은 좌석을 두고 경쟁하게 합니다.
+- 학생 풀이 작아 같은 학생이 여러 워커에서 동시에 예약하므로 사용자 중복 / 일일 한도도 경합합니다.
+- 학생은 미리 만들지 않습니다. (get_or_create_user의 동시 생성 경로 포함)
+- 검사: 시설별 활성 예약 겹침 없음, 사용자별 활성 좌석 예약 겹침 없음, 일일 좌석 한도 초과 없음,
+  예상하지 못한 예외(500 경로) 없음, 실행 후 경합 좌석 × 슬롯이 모두 찼는지(잘못된 409로 빈칸이 남지 않음).
+- 메모리 예약 인덱스를 켠 경우와 끈 경우(RESERVATION_INDEX_ENABLED=False)를 모두 실행합니다.
+  끄면 락 밖 사전 거절이 없어 모든 시도가 BEGIN IMMEDIATE 안의 DB 검사까지 갑니다.
+- 다른 프로세스가 취소한 칸을 다시 예약하는 경우(인덱스가 낡은 워커)도 잘못된 409 없이 채워지는지 확인합니다.
+"""
+import multiprocessing
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, time as Time, timedelta
+from itertools import product
+
+import pytest
+from sqlalchemy import text, update
+from sqlalchemy.orm import sessionmaker
+
+from app import facility_availability, reservation_index
+from app.config import settings
+from app.constants import ReservationLimits
+from app.database import Base, create_write_engine
+from app.exceptions import BusinessException, ConflictException, ServiceUnavailableException
+from app.init_db import seed_facilities
+from app.models import Seat
+from app.schemas.seat import SeatReservationCreate
+from app.services import reservation_service, seat_service
+
+CONTENDED_SEATS = (1, 2, 3, 4)
+SLOT_HOURS = (9, 11, 13, 15)
+STUDENT_POOL = tuple(202700001 + i for i in range(12))
+ATTEMPTS_PER_WORKER = 40
+# 랜덤 배정 요청 비율
+RANDOM_SHARE = 0.3
+
+# 활성 예약이 시설별로 겹치는 쌍
+OVERLAP_SQL = """
+SELECT a.reservation_id, b.reservation_id
+FROM reservations a JOIN reservations b
+  ON a.{column} = b.{column} AND a.reservation_id < b.reservation_id
+WHERE a.{column} IS NOT NULL
+  AND a.status IN ('RESERVED', 'IN_USE') AND b.status IN ('RESERVED', 'IN_USE')
+  AND a.start_minute < b.end_minute AND b.start_minute < a.end_minute
+"""
+
+
+def booking_day() -> date:
+    return date.today() + timedelta(days=3)
+
+
+def prepare_database(path) -> None:
+    """시설 생성 + 경합 좌석 외 이용 불가 처리"""
+    engine = create_write_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine)() as db:
+        seed_facilities(db)
+        db.execute(update(Seat).where(Seat.seat_id.notin_(CONTENDED_SEATS)).values(is_available=False))
+        db.commit()
+    engine.dispose()
+
+
+def run_worker(path, worker_seed: int, threads: int = 1) -> Counter:
+    """
+    워커 하나(스레드 threads개)가 예약을 시도하고 결과별 건수 반환
+
+    프로세스 워커에서도 호출되므로 엔진과 캐시를 직접 준비합니다.
+    """
+    engine = create_write_engine(f"sqlite:///{path}")
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    with SessionLocal() as db:
+        facility_availability.reload(db)
+        reservation_index.rebuild([db])
+
+    outcomes = Counter()
+    lock = threading.Lock()
+    start_barrier = threading.Barrier(threads)
+
+    def attempt_all(thread_index: int) -> None:
+        rng = random.Random(worker_seed * 1000 + thread_index)
+        start_barrier.wait()
+        for _ in range(ATTEMPTS_PER_WORKER):
+            hour = rng.choice(SLOT_HOURS)
+            request = SeatReservationCreate(
+                date=booking_day(),
+                start_time=Time(hour),
+                end_time=Time(hour + 2),
+                seat_id=None if rng.random() < RANDOM_SHARE else rng.choice(CONTENDED_SEATS),
+            )
+            db = SessionLocal()
+            try:
+                seat_service.reserve_seat(db, rng.choice(STUDENT_POOL), request)
+                outcome = "reserved"
+            except ConflictException:
+                outcome = "conflict"
+            except ServiceUnavailableException:
+                outcome = "lock_error"
+            except BusinessException as e:
+                outcome = e.code
+            except Exception as e:  # 예상하지 못한 예외 = API에서는 500
+                outcome = f"error: {type(e).__name__}: {str(e).splitlines()[0]}"
+            finally:
+                db.close()
+            with lock:
+                outcomes[outcome] += 1
+
+    try:
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            list(pool.map(attempt_all, range(threads)))
+    finally:
+        engine.dispose()
+    return outcomes
+
+
+def run_process_worker(path, worker_seed: int, threads: int, index_enabled: bool) -> Counter:
+    """spawn 프로세스용 워커 (부모의 설정 변경이 전달되지 않으므로 인덱스 사용 여부를 직접 설정)"""
+    settings.RESERVATION_INDEX_ENABLED = index_enabled
+    return run_worker(path, worker_seed, threads)
+
+
+def cell_requests():
+    """경합 좌석 × 슬롯 전체 칸의 (학생, 예약 요청) - 학생마다 같은 좌석의 연속 두 슬롯 (일일 한도 내)"""
+    cells = product(CONTENDED_SEATS, SLOT_HOURS)
+    return [
+        (STUDENT_POOL[i // 2], SeatReservationCreate(
+            date=booking_day(), start_time=Time(hour), end_time=Time(hour + 2), seat_id=seat_id,
+        ))
+        for i, (seat_id, hour) in enumerate(cells)
+    ]
+
+
+def book_cells(SessionLocal) -> Counter:
+    outcomes = Counter()
+    for student_id, request in cell_requests():
+        with SessionLocal() as db:
+            try:
+                seat_service.reserve_seat(db, student_id, request)
+                outcomes["reserved"] += 1
+            except BusinessException as e:
+                outcomes[e.code] += 1
+    return outcomes
+
+
+def run_rebook_worker(path, index_enabled: bool, ready, canceled, results) -> None:
+    """
+    spawn 프로세스용 재예약 워커: 모든 칸이 찬 상태로 인덱스를 만든 뒤(ready),
+    다른 프로세스가 취소를 마치면(canceled) 같은 칸을 다시 예약
+    """
+    settings.RESERVATION_INDEX_ENABLED = index_enabled
+    engine = create_write_engine(f"sqlite:///{path}")
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    try:
+        with SessionLocal() as db:
+            facility_availability.reload(db)
+            reservation_index.rebuild([db])
+        ready.set()
+        canceled.wait(timeout=60)
+        results.put(dict(book_cells(SessionLocal)))
+    finally:
+        engine.dispose()
+
+
+def check_invariants(path) -> dict:
+    """불변식 검사 후 활성 예약 요약"""
+    engine = create_write_engine(f"sqlite:///{path}")
+    try:
+        with engine.connect() as conn:
+            for column in ("seat_id", "meeting_room_id"):
+                overlaps = conn.execute(text(OVERLAP_SQL.format(column=column))).all()
+                assert not overlaps, f"{column} double booking: {overlaps}"
+
+            user_overlaps = conn.execute(text(
+                OVERLAP_SQL.format(column="student_id") + " AND a.seat_id IS NOT NULL AND b.seat_id IS NOT NULL"
+            )).all()
+            assert not user_overlaps, f"student seat overlap: {user_overlaps}"
+
+            usage = conn.execute(text(
+                "SELECT student_id, SUM(end_minute - start_minute) FROM reservations "
+                "WHERE seat_id IS NOT NULL AND status IN ('RESERVED', 'IN_USE') GROUP BY student_id"
+            )).all()
+            over = [(sid, minutes) for sid, minutes in usage if minutes > ReservationLimits.SEAT_DAILY_LIMIT_MINUTES]
+            assert not over, f"daily seat limit exceeded: {over}"
+
+            seats = {seat_id for (seat_id,) in conn.execute(text(
+                "SELECT DISTINCT seat_id FROM reservations WHERE status IN ('RESERVED', 'IN_USE')"
+            ))}
+            assert seats <= set(CONTENDED_SEATS), f"unavailable seats booked: {seats - set(CONTENDED_SEATS)}"
+
+            active = conn.execute(text(
+                "SELECT COUNT(*) FROM reservations WHERE status IN ('RESERVED', 'IN_USE')"
+            )).scalar()
+    finally:
+        engine.dispose()
+    return {"active": active}
+
+
+def assert_clean(outcomes: Counter, summary: dict) -> None:
+    errors = {key: count for key, count in outcomes.items() if key.startswith("error")}
+    assert not errors, f"unexpected exceptions: {errors}"
+    assert outcomes["reserved"] == summary["active"]
+    # 학생 12명 × 하루 2슬롯이 좌석 × 슬롯 16칸보다 많으므로, 409가 모두 정당했다면 빈칸 없이 다 참
+    # (취소가 없어 한 번 찬 칸은 그대로 - 빈칸이 남았다면 잘못된 거절이 있었던 것)
+    assert summary["active"] == len(CONTENDED_SEATS) * len(SLOT_HOURS)
+
+
+def report(label: str, outcomes: Counter, elapsed: float) -> None:
+    attempts = sum(outcomes.values())
+    print(f"\n[{label}] {attempts} attempts in {elapsed:.2f}s ({attempts / elapsed:.1f}/s): {dict(outcomes)}")
+
+
+@pytest.fixture(params=[True, False], ids=["index", "db_lock_only"])
+def index_enabled(request, monkeypatch):
+    """메모리 인덱스 사전 거절 사용 여부"""
+    monkeypatch.setattr(settings, "RESERVATION_INDEX_ENABLED", request.param)
+    return request.param
+
+
+@pytest.fixture
+def stress_db(tmp_path):
+    """경합 좌석만 열린 파일 DB (프로세스 전역 캐시는 테스트 후 비움)"""
+    path = tmp_path / "stress.db"
+    prepare_database(path)
+    yield path
+    reservation_index.active_index.clear()
+    facility_availability.reset()
+
+
+@pytest.mark.slow
+@pytest.mark.integration
+class TestConcurrentBooking:
+    """병렬 writer 환경의 이중 예약 방지"""
+
+    def test_threads(self, stress_db, index_enabled):
+        """한 프로세스의 여러 스레드 (메모리 인덱스 공유)"""
+        started = time.perf_counter()
+        outcomes = run_worker(stress_db, worker_seed=1, threads=16)
+        report(f"threads, index={index_enabled}", outcomes, time.perf_counter() - started)
+
+        assert_clean(outcomes, check_invariants(stress_db))
+
+    def test_processes(self, stress_db, index_enabled):
+        """여러 프로세스 (메모리 인덱스가 프로세스마다 따로라 DB 락만으로 막아야 함)"""
+        context = multiprocessing.get_context("spawn")
+        started = time.perf_counter()
+        with context.Pool(4) as pool:
+            results = pool.starmap(run_process_worker, [(stress_db, seed, 4, index_enabled) for seed in range(4)])
+        outcomes = sum(results, Counter())
+        report(f"processes, index={index_enabled}", outcomes, time.perf_counter() - started)
+
+        assert_clean(outcomes, check_invariants(stress_db))
+
+    def test_rebook_after_cancel_in_other_process(self, stress_db, index_enabled):
+        """다른 프로세스가 취소한 칸은 인덱스가 낡은 프로세스에서도 다시 예약됨 (인덱스 충돌은 DB로 재확인)"""
+        engine = create_write_engine(f"sqlite:///{stress_db}")
+        SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        with SessionLocal() as db:
+            facility_availability.reload(db)
+            reservation_index.rebuild([db])
+        assert book_cells(SessionLocal) == Counter(reserved=len(CONTENDED_SEATS) * len(SLOT_HOURS))
+
+        context = multiprocessing.get_context("spawn")
+        ready, canceled, results = context.Event(), context.Event(), context.Queue()
+        worker = context.Process(
+            target=run_rebook_worker, args=(stress_db, index_enabled, ready, canceled, results)
+        )
+        worker.start()
+        try:
+            assert ready.wait(timeout=60)
+            with SessionLocal() as db:
+                booked = db.execute(text("SELECT reservation_id, student_id FROM reservations")).all()
+            for reservation_id, student_id in booked:
+                with SessionLocal() as db:
+                    reservation_service.cancel_reservation(db, reservation_id, student_id)
+            canceled.set()
+            outcomes = Counter(results.get(timeout=60))
+        finally:
+            worker.join(timeout=60)
+            engine.dispose()
+
+        assert outcomes == Counter(reserved=len(CONTENDED_SEATS) * len(SLOT_HOURS))
+        assert check_invariants(stress_db)["active"] == len(CONTENDED_SEATS) * len(SLOT_HOURS)
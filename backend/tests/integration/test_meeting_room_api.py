@@ -524,3 +524,74 @@ class TestMeetingRoomStatusAPI:
         assert data["is_success"] is True
         assert "rooms" in data["payload"]
         assert len(data["payload"]["rooms"]) >= len(available_meeting_rooms)
+
+
+@pytest.mark.integration
+@pytest.mark.meeting_room
+class TestMeetingRoomSeriesAPI:
+    """회의실 반복 예약 API 테스트"""
+
+    def test_create_weekly_series(self, client, test_token, test_meeting_room, multiple_users):
+        """매주 반복 예약 생성 - 201 Created, 회차별 결과 반환"""
+        start = date.today() + timedelta(days=1)
+
+        response = client.post(
+            "/api/reservations/meeting-rooms/series",
+            headers=get_auth_headers(test_token),
+            json={
+                "room_id": test_meeting_room.room_id,
+                "frequency": "weekly",
+                "start_date": start.isoformat(),
+                "end_date": (start + timedelta(weeks=2)).isoformat(),
+                "start_time": "10:00",
+                "end_time": "11:00",
+                "participants": make_participants(multiple_users[:3]),
+            }
+        )
+
+        assert response.status_code == 201
+        payload = response.json()["payload"]
+        assert payload["created_count"] == 3
+        assert payload["failed_count"] == 0
+        assert all(o["reservation_id"] for o in payload["occurrences"])
+
+    def test_series_end_before_start(self, client, test_token, test_meeting_room, multiple_users):
+        """마지막 날짜가 첫 날짜보다 앞서면 400"""
+        start = date.today() + timedelta(days=7)
+
+        response = client.post(
+            "/api/reservations/meeting-rooms/series",
+            headers=get_auth_headers(test_token),
+            json={
+                "room_id": test_meeting_room.room_id,
+                "frequency": "daily",
+                "start_date": start.isoformat(),
+                "end_date": (start - timedelta(days=1)).isoformat(),
+                "start_time": "10:00",
+                "end_time": "11:00",
+                "participants": make_participants(multiple_users[:3]),
+            }
+        )
+
+        assert response.status_code == 400
+
+    def test_series_far_future_end_date(self, client, test_token, test_meeting_room, multiple_users):
+        """회차 수를 넘는 먼 end_date는 500이 아니라 검증 오류(400)"""
+        start = date.today() + timedelta(days=1)
+
+        response = client.post(
+            "/api/reservations/meeting-rooms/series",
+            headers=get_auth_headers(test_token),
+            json={
+                "room_id": test_meeting_room.room_id,
+                "frequency": "daily",
+                "start_date": start.isoformat(),
+                "end_date": "9999-12-31",
+                "start_time": "10:00",
+                "end_time": "11:00",
+                "participants": make_participants(multiple_users[:3]),
+            }
+        )
+
+        assert response.status_code == 400
+        assert response.json()["is_success"] is False
@@ -0,0 +1,32 @@
+"""
+tests/integration/test_metrics_api.py - GET /metrics 테스트
+"""
+from app.config import settings
+
+
+class TestMetricsEndpoint:
+    """Prometheus 텍스트 형식 지표 노출"""
+
+    def test_request_recorded_with_route_template(self, client):
+        """요청 처리 시간은 실제 경로가 아닌 라우트 템플릿 라벨로 기록"""
+        client.get("/health")
+        client.delete("/api/reservations/me/999999", headers={"Authorization": "Bearer token-202312345-x"})
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        text = response.text
+        assert 'http_request_duration_seconds_count{method="GET",route="/health",status="200"}' in text
+        assert 'route="/api/reservations/me/{reservation_id}"' in text
+        assert "/api/reservations/me/999999" not in text
+        assert "db_query_duration_seconds_bucket" in text
+        assert "# TYPE http_requests_in_flight gauge" in text
+
+    def test_disabled(self, client, monkeypatch):
+        """METRICS_ENABLED=False이면 404"""
+        monkeypatch.setattr(settings, "METRICS_ENABLED", False)
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 404
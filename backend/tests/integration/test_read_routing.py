@@ -0,0 +1,109 @@
+"""
+tests/integration/test_read_routing.py - 읽기 전용 엔진 라우팅 통합 테스트
+
+다른 통합 테스트는 get_read_db를 쓰기 가능한 테스트 세션으로 대체하므로,
+여기서는 파일 DB에 실제 쓰기 엔진과 읽기 전용 엔진(mode=ro + query_only)을 따로 연결해
+GET 요청(인증 포함)이 쓰기 엔진을 쓰지 않는지 확인합니다.
+"""
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event, update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app import facility_availability, reservation_index
+from app.database import Base, create_read_engine, create_write_engine, get_db, get_read_db
+from app.main import app
+from app.models import User
+
+
+def get_auth_headers(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def routed(tmp_path):
+    """쓰기 / 읽기 전용 엔진을 따로 쓰는 클라이언트 + 쓰기 엔진에서 실행된 SQL 목록"""
+    path = tmp_path / "routing.db"
+    write_engine = create_write_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=write_engine)
+    read_engine = create_read_engine(f"sqlite:///file:{path}?mode=ro&uri=true")
+    WriteSession = sessionmaker(autocommit=False, autoflush=False, bind=write_engine)
+    ReadSession = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+    def override(session_factory):
+        def dependency():
+            db = session_factory()
+            try:
+                yield db
+            finally:
+                db.close()
+        return dependency
+
+    writes = []
+
+    def collect(conn, cursor, statement, parameters, context, executemany):
+        writes.append(statement)
+
+    app.dependency_overrides[get_db] = override(WriteSession)
+    app.dependency_overrides[get_read_db] = override(ReadSession)
+    with TestClient(app) as client:
+        with WriteSession() as db:
+            reservation_index.rebuild([db])
+            facility_availability.reload(db)
+        event.listen(write_engine, "before_cursor_execute", collect)
+        yield client, ReadSession, writes
+        event.remove(write_engine, "before_cursor_execute", collect)
+    app.dependency_overrides.clear()
+    reservation_index.active_index.clear()
+    facility_availability.reset()
+    read_engine.dispose()
+    write_engine.dispose()
+
+
+@pytest.mark.integration
+class TestReadOnlyRouting:
+    """GET 요청은 읽기 전용 엔진만 사용"""
+
+    def test_my_reservations_uses_read_engine_only(self, routed):
+        """인증 + 내 예약 조회가 쓰기 엔진에 SQL을 보내지 않음 (로그인 시간은 로그인 때만 갱신)"""
+        client, _, writes = routed
+        token = client.post("/api/auth/login", json={"student_id": 202312345}).json()["payload"]["access_token"]
+        writes.clear()
+
+        response = client.get("/api/reservations/me", headers=get_auth_headers(token))
+
+        assert response.status_code == 200
+        assert writes == []
+
+    def test_my_waitlist_uses_read_engine_only(self, routed):
+        """내 좌석 대기 목록 조회도 쓰기 엔진에 SQL을 보내지 않음"""
+        client, _, writes = routed
+        token = client.post("/api/auth/login", json={"student_id": 202312345}).json()["payload"]["access_token"]
+        writes.clear()
+
+        response = client.get("/api/reservations/seats/waitlist", headers=get_auth_headers(token))
+
+        assert response.status_code == 200
+        assert writes == []
+
+    def test_unknown_student_rejected(self, routed):
+        """로그인한 적 없는 학번의 토큰은 사용자를 만들지 않고 거부 (AUTH_UNAUTHORIZED)"""
+        client, ReadSession, writes = routed
+
+        response = client.get("/api/reservations/me", headers=get_auth_headers("token-202312345-x"))
+
+        assert response.status_code == 400
+        assert response.json()["code"] == "AUTH_UNAUTHORIZED"
+        assert writes == []
+        with ReadSession() as db:
+            assert db.get(User, 202312345) is None
+
+    def test_read_session_rejects_writes(self, routed):
+        """GET 요청이 받는 읽기 세션에서는 쓰기가 실패"""
+        client, ReadSession, _ = routed
+        client.post("/api/auth/login", json={"student_id": 202312345})
+
+        with ReadSession() as db:
+            with pytest.raises(OperationalError):
+                db.execute(update(User).values(last_login_at=None))
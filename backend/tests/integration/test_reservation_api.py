@@ -90,6 +90,17 @@ class TestGetMyReservationsAPI:
             assert "end_time" in item
             assert "status" in item
 
+    def test_get_my_reservations_query_budget(self, client, test_token, seat_reservation, meeting_room_reservation, query_budget):
+        """내 예약 조회는 예약 수와 무관하게 쿼리 몇 개로 처리"""
+        response = client.get(
+            "/api/reservations/me",
+            headers={"Authorization": f"Bearer {test_token}"}
+        )
+
+        assert len(response.json()["payload"]["items"]) == 2
+        query_budget(response, 5)
+
+
 
 @pytest.mark.integration
 @pytest.mark.reservation
@@ -119,6 +130,16 @@ class TestCancelReservationAPI:
             expected_fields=["reservation_id", "type", "status"]
         )
 
+    def test_cancel_reservation_reports_lock_wait(self, client, test_token, seat_reservation):
+        """쓰기 락 대기 시간이 Server-Timing 헤더로 보고됨"""
+        response = client.delete(
+            f"/api/reservations/me/{seat_reservation.reservation_id}",
+            headers={"Authorization": f"Bearer {test_token}"}
+        )
+
+        assert response.headers["Server-Timing"].startswith("db-lock;dur=")
+        assert 'desc="retries=0"' in response.headers["Server-Timing"]
+
     def test_cancel_reservation_contains_type_and_facility(self, client, test_token, seat_reservation):
         """취소 응답에 type, room_id/seat_id 포함"""
         response = client.delete(
@@ -291,3 +312,92 @@ class TestCancelSeatReservation:
         assert payload["type"] == "seat"
         assert payload["seat_id"] is not None
         assert payload["room_id"] is None
+
+
+@pytest.mark.integration
+@pytest.mark.reservation
+class TestMyReservationsPagination:
+    """내 예약 목록 페이지네이션 테스트"""
+
+    @pytest.fixture
+    def many_seat_reservations(self, db_session, test_user, test_seat):
+        """하루 간격으로 5건의 좌석 예약 생성 (2025-12-10 ~ 2025-12-14)"""
+        from app.models import Reservation, ReservationStatus
+        from datetime import datetime, timezone
+
+        reservations = []
+        for day in range(10, 15):
+            reservation = Reservation(
+                student_id=test_user.student_id,
+                seat_id=test_seat.seat_id,
+                meeting_room_id=None,
+                start_time=datetime(2025, 12, day, 1, 0, 0, tzinfo=timezone.utc),
+                end_time=datetime(2025, 12, day, 3, 0, 0, tzinfo=timezone.utc),
+                status=ReservationStatus.COMPLETED
+            )
+            db_session.add(reservation)
+            reservations.append(reservation)
+        db_session.commit()
+        return reservations
+
+    def test_limit_returns_next_cursor(self, client, test_token, many_seat_reservations):
+        """limit보다 결과가 많으면 next_cursor 반환"""
+        response = client.get(
+            "/api/reservations/me?limit=2",
+            headers={"Authorization": f"Bearer {test_token}"}
+        )
+
+        ResponseAssertions.assert_success_response(response, status_code=200)
+        payload = response.json()["payload"]
+        assert [item["date"] for item in payload["items"]] == ["2025-12-14", "2025-12-13"]
+        assert payload["next_cursor"] is not None
+
+    def test_follow_cursor_until_last_page(self, client, test_token, many_seat_reservations):
+        """커서를 따라가면 중복/누락 없이 전체 조회"""
+        dates = []
+        cursor = None
+        for _ in range(5):
+            query = "limit=2" + (f"&cursor={cursor}" if cursor else "")
+            response = client.get(
+                f"/api/reservations/me?{query}",
+                headers={"Authorization": f"Bearer {test_token}"}
+            )
+            payload = response.json()["payload"]
+            dates.extend(item["date"] for item in payload["items"])
+            cursor = payload["next_cursor"]
+            if cursor is None:
+                break
+
+        assert dates == ["2025-12-14", "2025-12-13", "2025-12-12", "2025-12-11", "2025-12-10"]
+
+    def test_without_limit_returns_all(self, client, test_token, many_seat_reservations):
+        """limit 생략 시 전체 조회 (next_cursor 없음)"""
+        response = client.get(
+            "/api/reservations/me",
+            headers={"Authorization": f"Bearer {test_token}"}
+        )
+
+        payload = response.json()["payload"]
+        assert len(payload["items"]) == 5
+        assert payload["next_cursor"] is None
+
+    def test_date_filter_with_limit(self, client, test_token, many_seat_reservations):
+        """날짜 구간 필터와 페이지네이션 동시 적용"""
+        response = client.get(
+            "/api/reservations/me?from=2025-12-11&to=2025-12-13&limit=10",
+            headers={"Authorization": f"Bearer {test_token}"}
+        )
+
+        payload = response.json()["payload"]
+        assert [item["date"] for item in payload["items"]] == ["2025-12-13", "2025-12-12", "2025-12-11"]
+        assert payload["next_cursor"] is None
+
+    def test_invalid_cursor(self, client, test_token, many_seat_reservations):
+        """잘못된 커서 - 400 Bad Request"""
+        response = client.get(
+            "/api/reservations/me?limit=2&cursor=not-a-cursor",
+            headers={"Authorization": f"Bearer {test_token}"}
+        )
+
+        assert response.status_code == 400
+        ResponseAssertions.assert_error_code(response, "VALIDATION_ERROR")
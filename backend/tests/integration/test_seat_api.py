@@ -3,6 +3,8 @@ tests/integration/test_seat_api.py - 좌석 예약 API 통합 테스트
 """
 import pytest
 from datetime import date, timedelta
+
+from app.models import Reservation
 from tests.utils.assertions import ResponseAssertions, ReservationAssertions
 
 
@@ -396,3 +398,105 @@ class TestSeatListAPI:
         data = response.json()
         assert data["is_success"] is False
         assert data["code"] == "NOT_FOUND"
+
+
+@pytest.mark.integration
+@pytest.mark.seat
+class TestSeatBatchReservationAPI:
+    """좌석 일괄 예약 API 테스트"""
+
+    @staticmethod
+    def items(*start_hours):
+        return [
+            {
+                "seat_id": 1,
+                "date": get_tomorrow(),
+                "start_time": f"{hour:02d}:00",
+                "end_time": f"{hour + 2:02d}:00",
+            }
+            for hour in start_hours
+        ]
+
+    def test_batch_success(self, client, test_token, test_seat):
+        """하루 4시간을 한 번의 요청으로 예약 - 201 Created"""
+        response = client.post(
+            "/api/reservations/seats/batch",
+            headers=get_auth_headers(test_token),
+            json={"items": self.items(10, 14)},
+        )
+
+        assert response.status_code == 201
+        payload = response.json()["payload"]
+        assert payload["created_count"] == 2
+        assert [item["reservation"]["start_time"] for item in payload["items"]] == ["10:00", "14:00"]
+
+    def test_atomic_batch_rejected(self, client, db_session, test_token, test_seat):
+        """atomic 모드에서 한도를 넘는 항목이 있으면 400, 예약은 생성되지 않음"""
+        response = client.post(
+            "/api/reservations/seats/batch",
+            headers=get_auth_headers(test_token),
+            json={"items": self.items(9, 12, 15)},
+        )
+
+        assert response.status_code == 400
+        ResponseAssertions.assert_error_code(response, "DAILY_LIMIT_EXCEEDED")
+        assert response.json()["payload"]["details"] == {"index": 2}
+        assert db_session.query(Reservation).count() == 0
+
+    def test_best_effort_batch(self, client, test_token, test_seat):
+        """best_effort 모드는 실패 항목을 포함해 201로 항목별 결과 반환"""
+        response = client.post(
+            "/api/reservations/seats/batch",
+            headers=get_auth_headers(test_token),
+            json={"items": self.items(9, 12, 15), "mode": "best_effort"},
+        )
+
+        assert response.status_code == 201
+        payload = response.json()["payload"]
+        assert payload["created_count"] == 2
+        assert payload["items"][2]["code"] == "DAILY_LIMIT_EXCEEDED"
+
+
+
+@pytest.mark.integration
+@pytest.mark.seat
+class TestSeatWaitlistAPI:
+    """좌석 대기열 API 테스트"""
+
+    @staticmethod
+    def slot(seat_id=1):
+        return {"seat_id": seat_id, "date": get_tomorrow(), "start_time": "10:00", "end_time": "12:00"}
+
+    def test_join_and_list(self, client, test_token, test_seat):
+        """만석 시간대 대기 등록 - 201, 내 대기 목록에 순번과 함께 표시"""
+        other_token = client.post("/api/auth/login", json={"student_id": 202300001}).json()["payload"]["access_token"]
+        taken = client.post(
+            "/api/reservations/seats",
+            headers=get_auth_headers(other_token),
+            json=self.slot(),
+        )
+        assert taken.status_code == 201
+
+        response = client.post(
+            "/api/reservations/seats/waitlist",
+            headers=get_auth_headers(test_token),
+            json=self.slot(),
+        )
+
+        assert response.status_code == 201
+        assert response.json()["payload"]["status"] == "WAITING"
+        assert response.json()["payload"]["position"] == 1
+
+        listed = client.get("/api/reservations/seats/waitlist", headers=get_auth_headers(test_token))
+        assert [item["start_time"] for item in listed.json()["payload"]] == ["10:00"]
+
+    def test_open_slot_rejected(self, client, test_token, test_seat):
+        """바로 예약 가능한 시간대는 400"""
+        response = client.post(
+            "/api/reservations/seats/waitlist",
+            headers=get_auth_headers(test_token),
+            json=self.slot(),
+        )
+
+        assert response.status_code == 400
+        ResponseAssertions.assert_error_code(response, "VALIDATION_ERROR")
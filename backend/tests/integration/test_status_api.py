@@ -2,6 +2,8 @@
 tests/integration/test_status_api.py - 상태 조회 API 통합 테스트
 """
 import pytest
+
+from app import main
 from tests.utils.assertions import ResponseAssertions, StatusAssertions
 
 
@@ -114,6 +116,23 @@ class TestGetSeatStatusAPI:
             expected_fields=["date", "operation_hours", "seats"]
         )
 
+    def test_get_seat_status_reports_query_stats(self, client, available_seats, query_budget):
+        """디버그 모드에서 요청별 SQL 실행 횟수 / DB 시간 헤더 보고"""
+        response = client.get("/api/status/seats?date=2025-12-20")
+
+        assert int(response.headers["X-DB-Queries"]) > 0
+        assert float(response.headers["X-DB-Time"]) >= 0
+
+    def test_get_seat_status_hides_query_stats(self, client, available_seats, monkeypatch):
+        """디버그 모드가 아니면 헤더 없음 (SQL 집계도 만들지 않음)"""
+        calls = []
+        monkeypatch.setattr(main, "start_query_tracking", lambda: calls.append(1))
+
+        response = client.get("/api/status/seats?date=2025-12-20")
+
+        assert "X-DB-Queries" not in response.headers
+        assert calls == []
+
     def test_get_seat_status_seat_count(self, client, available_seats):
         """좌석 여러 개 반환 확인"""
         response = client.get("/api/status/seats?date=2025-12-20")
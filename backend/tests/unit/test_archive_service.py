@@ -0,0 +1,173 @@
+"""
+tests/unit/test_archive_service.py - 예약 아카이브 서비스 단위 테스트
+"""
+import pytest
+from datetime import datetime, date, timezone
+
+from app.services import archive_service, reservation_service
+from app.models import (
+    Reservation,
+    ReservationArchive,
+    ReservationParticipant,
+    ReservationParticipantArchive,
+    ReservationStatus,
+)
+
+UTC = timezone.utc
+
+# 아카이브 기준 시각 (이 시각 이전에 종료된 예약이 대상)
+CUTOFF = datetime(2025, 6, 1, 0, 0, 0, tzinfo=UTC)
+
+
+def _make_reservation(db_session, student_id, status, day, seat_id=None, room_id=None):
+    reservation = Reservation(
+        student_id=student_id,
+        seat_id=seat_id,
+        meeting_room_id=room_id,
+        start_time=datetime(day.year, day.month, day.day, 1, 0, 0, tzinfo=UTC),
+        end_time=datetime(day.year, day.month, day.day, 3, 0, 0, tzinfo=UTC),
+        status=status,
+    )
+    db_session.add(reservation)
+    db_session.flush()
+    return reservation
+
+
+@pytest.fixture
+def old_and_recent_reservations(db_session, test_user, test_seat, test_meeting_room, multiple_users):
+    """보존 기간이 지난 예약과 최근/진행 중 예약 혼합"""
+    old_completed = _make_reservation(db_session, test_user.student_id, ReservationStatus.COMPLETED, date(2025, 5, 1), seat_id=1)
+    old_canceled_meeting = _make_reservation(db_session, test_user.student_id, ReservationStatus.CANCELED, date(2025, 5, 2), room_id=1)
+    for user in multiple_users[:3]:
+        db_session.add(ReservationParticipant(
+            reservation_id=old_canceled_meeting.reservation_id,
+            participant_student_id=user.student_id,
+        ))
+    old_reserved = _make_reservation(db_session, test_user.student_id, ReservationStatus.RESERVED, date(2025, 5, 3), seat_id=1)
+    recent_completed = _make_reservation(db_session, test_user.student_id, ReservationStatus.COMPLETED, date(2025, 12, 20), seat_id=1)
+    db_session.commit()
+    return {
+        "old_completed": old_completed.reservation_id,
+        "old_canceled_meeting": old_canceled_meeting.reservation_id,
+        "old_reserved": old_reserved.reservation_id,
+        "recent_completed": recent_completed.reservation_id,
+    }
+
+
+class TestArchiveReservations:
+    """아카이브 이동 로직 테스트"""
+
+    def test_moves_only_old_finished_reservations(self, db_session, old_and_recent_reservations):
+        """보존 기간이 지난 COMPLETED/CANCELED 예약만 이동"""
+        moved = archive_service.archive_reservations(db_session, cutoff=CUTOFF)
+
+        assert moved == 2
+        hot_ids = {r.reservation_id for r in db_session.query(Reservation).all()}
+        archived_ids = {r.reservation_id for r in db_session.query(ReservationArchive).all()}
+
+        assert archived_ids == {
+            old_and_recent_reservations["old_completed"],
+            old_and_recent_reservations["old_canceled_meeting"],
+        }
+        assert old_and_recent_reservations["old_reserved"] in hot_ids
+        assert old_and_recent_reservations["recent_completed"] in hot_ids
+        assert hot_ids.isdisjoint(archived_ids)
+
+    def test_moves_participants_with_reservation(self, db_session, old_and_recent_reservations):
+        """참여자도 함께 아카이브 테이블로 이동"""
+        archive_service.archive_reservations(db_session, cutoff=CUTOFF)
+
+        meeting_id = old_and_recent_reservations["old_canceled_meeting"]
+        assert db_session.query(ReservationParticipant).filter(
+            ReservationParticipant.reservation_id == meeting_id
+        ).count() == 0
+        assert db_session.query(ReservationParticipantArchive).filter(
+            ReservationParticipantArchive.reservation_id == meeting_id
+        ).count() == 3
+
+    def test_archives_in_batches(self, db_session, old_and_recent_reservations):
+        """배치 크기보다 많은 대상도 모두 이동"""
+        moved = archive_service.archive_reservations(db_session, cutoff=CUTOFF, batch_size=1)
+
+        assert moved == 2
+        assert db_session.query(ReservationArchive).count() == 2
+
+    def test_keeps_latest_reservation_id(self, db_session, test_user, test_seat):
+        """rowid 재사용 방지를 위해 최대 reservation_id 행은 이동하지 않음"""
+        _make_reservation(db_session, test_user.student_id, ReservationStatus.COMPLETED, date(2025, 5, 1), seat_id=1)
+        db_session.commit()
+
+        moved = archive_service.archive_reservations(db_session, cutoff=CUTOFF)
+
+        assert moved == 0
+        assert db_session.query(Reservation).count() == 1
+
+    def test_archived_ids_never_reissued(self, db_session, test_user, test_seat):
+        """[불변식] 대상이 전부 아카이브돼도 새 예약 ID는 아카이브 ID와 겹치지 않음"""
+        for day in (1, 2, 3):
+            _make_reservation(db_session, test_user.student_id, ReservationStatus.COMPLETED, date(2025, 5, day), seat_id=1)
+        db_session.commit()
+
+        assert archive_service.archive_reservations(db_session, cutoff=CUTOFF) == 2
+        new_reservation = _make_reservation(
+            db_session, test_user.student_id, ReservationStatus.RESERVED, date(2025, 12, 20), seat_id=1
+        )
+        db_session.commit()
+
+        archived_ids = {r.reservation_id for r in db_session.query(ReservationArchive).all()}
+        assert new_reservation.reservation_id > max(archived_ids)
+
+    def test_each_batch_takes_write_lock(self, db_session, old_and_recent_reservations, monkeypatch):
+        """배치마다 BEGIN IMMEDIATE(archive 구간)로 시작"""
+        sections = []
+        real_begin_immediate = archive_service.begin_immediate
+
+        def recording_begin_immediate(db, section=None):
+            sections.append(section)
+            real_begin_immediate(db, section=section)
+
+        monkeypatch.setattr(archive_service, "begin_immediate", recording_begin_immediate)
+
+        assert archive_service.archive_reservations(db_session, cutoff=CUTOFF, batch_size=1) == 2
+        # 1건씩 두 배치 + 대상이 없음을 확인하는 마지막 배치
+        assert sections == ["archive"] * 3
+
+    def test_empty_table(self, db_session):
+        """예약이 없으면 아무 작업도 하지 않음"""
+        assert archive_service.archive_reservations(db_session, cutoff=CUTOFF) == 0
+
+
+class TestArchivedReservationQuery:
+    """아카이브 포함 내 예약 조회 테스트"""
+
+    def test_user_reservations_include_archived(self, db_session, test_user, old_and_recent_reservations):
+        """include_archived=True이면 아카이브 예약도 반환"""
+        archive_service.archive_reservations(db_session, cutoff=CUTOFF)
+
+        hot_only = reservation_service.get_user_reservations(db_session, test_user.student_id)
+        with_archive = reservation_service.get_user_reservations(
+            db_session, test_user.student_id, include_archived=True
+        )
+
+        assert len(hot_only) == 2
+        assert len(with_archive) == 4
+
+    def test_participant_sees_archived_meeting(self, db_session, multiple_users, old_and_recent_reservations):
+        """참여자로 포함된 아카이브 회의실 예약도 조회"""
+        archive_service.archive_reservations(db_session, cutoff=CUTOFF)
+
+        reservations = reservation_service.get_user_reservations(
+            db_session, multiple_users[0].student_id, include_archived=True
+        )
+
+        assert [r.reservation_id for r in reservations] == [
+            old_and_recent_reservations["old_canceled_meeting"]
+        ]
+
+    def test_covers_archive(self):
+        """조회 시작일이 보존 기간 이전일 때만 아카이브 조회"""
+        now = datetime(2025, 12, 20, 0, 0, 0, tzinfo=UTC)
+
+        assert archive_service.covers_archive(None, now=now) is False
+        assert archive_service.covers_archive(date(2025, 12, 1), now=now) is False
+        assert archive_service.covers_archive(date(2025, 1, 1), now=now) is True
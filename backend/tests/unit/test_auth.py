@@ -6,6 +6,7 @@ from datetime import datetime, timezone
 
 from app.services import user_service
 from app.constants import ErrorCode
+from app.database import begin_immediate, holds_write_lock
 from app.exceptions import BusinessException
 
 
@@ -66,6 +67,38 @@ class TestLoginValidation:
         with pytest.raises(ValueError):
             user_service.login_student(db_session, non_numeric_id)
 
+    def test_concurrent_first_login_reuses_created_user(self, db_session, test_user, monkeypatch):
+        """조회와 생성 사이에 다른 요청이 같은 학번을 먼저 생성해도 기존 사용자 반환"""
+        real_get_user = user_service.get_user
+        calls = []
+
+        def get_user_racing(db, student_id):
+            # 첫 조회는 다른 요청이 커밋하기 직전 시점처럼 사용자가 없다고 응답
+            calls.append(student_id)
+            return None if len(calls) == 1 else real_get_user(db, student_id)
+
+        monkeypatch.setattr(user_service, "get_user", get_user_racing)
+
+        user = user_service.get_or_create_user(db_session, test_user.student_id)
+
+        assert user.student_id == test_user.student_id
+        assert len(calls) == 2
+
+
+class TestUserCreationLock:
+    """get_or_create_user와 쓰기 락"""
+
+    def test_refuses_inside_write_lock(self, db_session):
+        """쓰기 락 안에서는 커밋(락 해제) 대신 RuntimeError - 락은 그대로 유지"""
+        begin_immediate(db_session)
+
+        with pytest.raises(RuntimeError):
+            user_service.get_or_create_user(db_session, 202312399)
+
+        assert holds_write_lock(db_session)
+        db_session.rollback()
+        assert user_service.get_user(db_session, 202312399) is None
+
 
 class TestTokenGeneration:
     """토큰 생성 로직 테스트"""
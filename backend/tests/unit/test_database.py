@@ -0,0 +1,160 @@
+"""
+tests/unit/test_database.py - DB 엔진(읽기/쓰기 풀) 설정 테스트
+"""
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.constants import ErrorCode
+from app.database import (
+    begin_immediate,
+    create_read_engine,
+    create_write_engine,
+    repeated_statements,
+    start_lock_wait_tracking,
+    start_query_tracking,
+)
+from app.exceptions import ServiceUnavailableException
+
+
+@pytest.fixture
+def engines(tmp_path):
+    """임시 파일 DB에 대한 쓰기/읽기 엔진"""
+    db_path = tmp_path / "pool_test.db"
+    write_engine = create_write_engine(f"sqlite:///{db_path}")
+    with write_engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+        conn.execute(text("INSERT INTO items (id) VALUES (1)"))
+
+    read_engine = create_read_engine(f"sqlite:///file:{db_path}?mode=ro&uri=true")
+    yield write_engine, read_engine
+    read_engine.dispose()
+    write_engine.dispose()
+
+
+class TestReadWriteEngines:
+    """읽기 전용 엔진 / 쓰기 엔진 분리 테스트"""
+
+    def test_write_engine_uses_wal(self, engines):
+        """쓰기 엔진은 WAL 모드"""
+        write_engine, _ = engines
+        with write_engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+
+    def test_read_engine_reads(self, engines):
+        """읽기 엔진으로 조회 가능"""
+        _, read_engine = engines
+        with read_engine.connect() as conn:
+            assert conn.execute(text("SELECT COUNT(*) FROM items")).scalar() == 1
+
+    def test_read_engine_rejects_writes(self, engines):
+        """읽기 엔진에서 쓰기 시도 시 즉시 실패"""
+        _, read_engine = engines
+        with read_engine.connect() as conn:
+            with pytest.raises(OperationalError):
+                conn.execute(text("INSERT INTO items (id) VALUES (2)"))
+
+    def test_read_not_blocked_by_open_write_transaction(self, engines):
+        """WAL 모드에서 쓰기 트랜잭션이 열려 있어도 읽기는 진행"""
+        write_engine, read_engine = engines
+        with write_engine.connect() as writer:
+            writer.exec_driver_sql("BEGIN IMMEDIATE")
+            writer.execute(text("INSERT INTO items (id) VALUES (2)"))
+
+            with read_engine.connect() as reader:
+                # 커밋 전이므로 이전 스냅샷(1건)을 읽음
+                assert reader.execute(text("SELECT COUNT(*) FROM items")).scalar() == 1
+
+            writer.exec_driver_sql("COMMIT")
+
+
+class TestPragmaProfile:
+    """설정 기반 PRAGMA 프로파일 테스트"""
+
+    def test_write_engine_profile(self, engines):
+        """쓰기 커넥션에 busy_timeout / temp_store / wal_autocheckpoint 적용"""
+        write_engine, _ = engines
+        with write_engine.connect() as conn:
+            assert conn.execute(text("PRAGMA busy_timeout")).scalar() == settings.SQLITE_BUSY_TIMEOUT_MS
+            assert conn.execute(text("PRAGMA cache_size")).scalar() == settings.SQLITE_CACHE_SIZE
+            assert conn.execute(text("PRAGMA temp_store")).scalar() == 2  # MEMORY
+            assert conn.execute(text("PRAGMA wal_autocheckpoint")).scalar() == settings.SQLITE_WAL_AUTOCHECKPOINT
+
+    def test_read_engine_profile(self, engines):
+        """읽기 커넥션에도 busy_timeout 적용"""
+        _, read_engine = engines
+        with read_engine.connect() as conn:
+            assert conn.execute(text("PRAGMA busy_timeout")).scalar() == settings.SQLITE_BUSY_TIMEOUT_MS
+            assert conn.execute(text("PRAGMA query_only")).scalar() == 1
+
+    def test_profile_follows_settings(self, tmp_path, monkeypatch):
+        """설정 값을 바꾸면 새 엔진에 반영"""
+        monkeypatch.setattr(settings, "SQLITE_BUSY_TIMEOUT_MS", 1234)
+        engine = create_write_engine(f"sqlite:///{tmp_path / 'profile.db'}")
+        with engine.connect() as conn:
+            assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 1234
+        engine.dispose()
+
+
+class TestBeginImmediate:
+    """쓰기 락 획득 재시도 테스트"""
+
+    @pytest.fixture
+    def fast_retry(self, monkeypatch):
+        """테스트 시간을 줄이기 위해 대기 시간을 최소화"""
+        monkeypatch.setattr(settings, "SQLITE_BUSY_TIMEOUT_MS", 10)
+        monkeypatch.setattr(settings, "WRITE_LOCK_MAX_RETRIES", 2)
+        monkeypatch.setattr(settings, "WRITE_LOCK_RETRY_BASE_MS", 1)
+
+    def test_acquires_lock(self, engines):
+        """경합이 없으면 바로 쓰기 트랜잭션 시작"""
+        write_engine, _ = engines
+        stats = start_lock_wait_tracking()
+        with Session(write_engine) as db:
+            begin_immediate(db)
+            db.execute(text("INSERT INTO items (id) VALUES (2)"))
+            db.commit()
+
+        assert stats["retries"] == 0
+        with write_engine.connect() as conn:
+            assert conn.execute(text("SELECT COUNT(*) FROM items")).scalar() == 2
+
+    def test_busy_after_retries(self, tmp_path, fast_retry):
+        """다른 writer가 락을 계속 잡고 있으면 재시도 후 DATABASE_BUSY"""
+        url = f"sqlite:///{tmp_path / 'busy.db'}"
+        holder_engine = create_write_engine(url)
+        engine = create_write_engine(url)
+        stats = start_lock_wait_tracking()
+
+        with holder_engine.connect() as holder:
+            holder.exec_driver_sql("BEGIN IMMEDIATE")
+            with Session(engine) as db:
+                with pytest.raises(ServiceUnavailableException) as exc_info:
+                    begin_immediate(db)
+            holder.exec_driver_sql("ROLLBACK")
+
+        assert exc_info.value.code == ErrorCode.DATABASE_BUSY
+        assert stats["retries"] == 2
+        assert stats["wait_ms"] > 0
+        engine.dispose()
+        holder_engine.dispose()
+
+
+class TestQueryTracking:
+    """요청 단위 SQL 실행 횟수 / 시간 집계 테스트"""
+
+    def test_counts_statements_and_time(self, engines):
+        """실행한 SQL 수와 시간이 현재 컨텍스트 통계에 누적"""
+        _, read_engine = engines
+        stats = start_query_tracking()
+        with read_engine.connect() as conn:
+            for _ in range(3):
+                conn.execute(text("SELECT COUNT(*) FROM items"))
+            conn.execute(text("SELECT id FROM items"))
+
+        assert stats["count"] == 4
+        assert stats["time_ms"] > 0
+        assert repeated_statements(stats, 3) == [("SELECT COUNT(*) FROM items", 3)]
+        assert repeated_statements(stats, 4) == []
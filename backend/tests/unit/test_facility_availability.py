@@ -0,0 +1,139 @@
+"""
+tests/unit/test_facility_availability.py - 시설 이용 가능 여부 캐시 테스트
+"""
+import pytest
+from datetime import date, time, timedelta
+from sqlalchemy import update
+
+from app import facility_availability
+from app.constants import ErrorCode
+from app.database import begin_immediate
+from app.exceptions import BusinessException
+from app.models import FacilityAvailabilityVersion, Seat
+from app.schemas.seat import SeatReservationCreate
+from app.services import seat_service
+
+
+def seat_request(seat_id=None):
+    return SeatReservationCreate(
+        date=date.today() + timedelta(days=1),
+        start_time=time(10, 0),
+        end_time=time(12, 0),
+        seat_id=seat_id,
+    )
+
+
+class TestSessionEvents:
+    """커밋/롤백 시 캐시 반영"""
+
+    def test_committed_change_bumps_version(self, db_session, test_seat):
+        """커밋된 변경은 새 버전 스냅샷으로 반영"""
+        before = facility_availability.get_snapshot()
+        assert facility_availability.seat_available(db_session, test_seat.seat_id) is True
+
+        test_seat.is_available = False
+        db_session.commit()
+
+        after = facility_availability.get_snapshot()
+        assert after.version > before.version
+        assert after.disabled_seat_ids == {test_seat.seat_id}
+        assert facility_availability.seat_available(db_session, test_seat.seat_id) is False
+
+    def test_rolled_back_change_discarded(self, db_session, test_seat):
+        """플러시 후 롤백된 변경은 반영되지 않음"""
+        test_seat.is_available = False
+        db_session.flush()
+        db_session.rollback()
+
+        assert facility_availability.seat_available(db_session, test_seat.seat_id) is True
+
+    def test_unknown_seat(self, db_session):
+        """로드된 캐시에 없는 좌석은 None"""
+        assert facility_availability.seat_available(db_session, 999) is None
+
+
+class TestBookingUsesCache:
+    """예약 검증 / 랜덤 배정"""
+
+    def test_disabled_seat_rejected(self, db_session, test_user, test_seat):
+        """비활성화된 좌석 직접 예약은 거절"""
+        test_seat.is_available = False
+        db_session.commit()
+
+        with pytest.raises(BusinessException) as exc_info:
+            seat_service.reserve_seat(db_session, test_user.student_id, seat_request(test_seat.seat_id))
+
+        assert exc_info.value.code == ErrorCode.SEAT_NOT_AVAILABLE
+
+    def test_random_assignment_skips_disabled(self, db_session, test_user, available_seats):
+        """랜덤 배정은 캐시의 이용 가능 좌석 중에서만 선택"""
+        for seat in available_seats[1:]:
+            seat.is_available = False
+        db_session.commit()
+
+        reservation = seat_service.reserve_seat(db_session, test_user.student_id, seat_request())
+
+        assert reservation.seat_id == available_seats[0].seat_id
+
+
+class TestDatabaseVersion:
+    """다른 워커의 변경 감지 (DB 버전 비교)"""
+
+    def disable_in_other_worker(self, db_session, seat_id):
+        """다른 프로세스의 변경: 이 프로세스의 캐시에는 반영되지 않고 DB 버전만 오름"""
+        db_session.execute(update(Seat).where(Seat.seat_id == seat_id).values(is_available=False))
+        facility_availability._bump_db_version(db_session)
+        db_session.commit()
+
+    def test_change_bumps_db_version_in_same_transaction(self, db_session, test_seat):
+        """이용 가능 여부 변경 커밋 시 DB 버전도 함께 오르고 스냅샷이 이어받음"""
+        facility_availability.reload(db_session)
+        before = db_session.get(FacilityAvailabilityVersion, 1).version
+
+        test_seat.is_available = False
+        db_session.commit()
+
+        assert db_session.get(FacilityAvailabilityVersion, 1).version == before + 1
+        assert facility_availability.get_snapshot().db_version == before + 1
+
+    def test_rollback_keeps_db_version(self, db_session, test_seat):
+        """롤백된 변경은 DB 버전도 되돌림"""
+        facility_availability.reload(db_session)
+        before = db_session.get(FacilityAvailabilityVersion, 1).version
+
+        test_seat.is_available = False
+        db_session.flush()
+        db_session.rollback()
+
+        assert db_session.get(FacilityAvailabilityVersion, 1).version == before
+
+    def test_other_worker_change_reloaded_under_lock(self, db_session, test_user, test_seat):
+        """다른 워커가 비활성화한 좌석은 쓰기 락 안의 버전 비교로 다시 읽어 거절"""
+        facility_availability.reload(db_session)
+        self.disable_in_other_worker(db_session, test_seat.seat_id)
+        assert facility_availability.get_snapshot().seats[test_seat.seat_id] is True
+
+        with pytest.raises(BusinessException) as exc_info:
+            seat_service.reserve_seat(db_session, test_user.student_id, seat_request(test_seat.seat_id))
+
+        assert exc_info.value.code == ErrorCode.SEAT_NOT_AVAILABLE
+        assert facility_availability.get_snapshot().seats[test_seat.seat_id] is False
+
+    def test_not_checked_outside_lock(self, db_session, test_seat):
+        """락 밖의 조회는 현재 스냅샷 그대로 (DB 버전을 읽지 않음)"""
+        facility_availability.reload(db_session)
+        self.disable_in_other_worker(db_session, test_seat.seat_id)
+
+        assert facility_availability.seat_available(db_session, test_seat.seat_id) is True
+
+    def test_compared_once_per_transaction(self, db_session, test_seat, query_budget):
+        """버전이 같으면 다시 읽지 않고, 한 트랜잭션에서 한 번만 비교"""
+        snapshot = facility_availability.reload(db_session)
+
+        begin_immediate(db_session)
+        with query_budget.limit(1):
+            for _ in range(3):
+                assert facility_availability.seat_available(db_session, test_seat.seat_id) is True
+        db_session.rollback()
+
+        assert facility_availability.get_snapshot() is snapshot
@@ -0,0 +1,125 @@
+"""
+tests/unit/test_facility_registry.py - 시설 레지스트리 스냅샷 테스트
+"""
+import pytest
+from datetime import date, time, timedelta
+
+from app import facility_registry
+from app.constants import FacilityConstants
+from app.models import Building, MeetingRoom, ReadingRoom
+from app.schemas import MeetingRoomReservationCreate, SeatReservationCreate
+
+
+@pytest.fixture
+def restore_snapshot():
+    """테스트 후 원래 스냅샷 복원"""
+    original = facility_registry.get_snapshot()
+    yield
+    facility_registry.set_snapshot(original)
+
+
+@pytest.fixture
+def two_buildings(db_session):
+    """건물 2개 (열람실 3개, 회의실 4개)"""
+    db_session.add_all([
+        Building(building_id=1, name="중앙도서관"),
+        Building(building_id=2, name="공학도서관"),
+    ])
+    db_session.flush()
+    db_session.add_all([
+        ReadingRoom(reading_room_id=1, building_id=1, name="제1열람실", seat_min_id=1, seat_max_id=70),
+        ReadingRoom(reading_room_id=2, building_id=1, name="제2열람실", seat_min_id=101, seat_max_id=150),
+        ReadingRoom(reading_room_id=3, building_id=2, name="공학열람실", seat_min_id=2001, seat_max_id=2100),
+        MeetingRoom(room_id=1, building_id=1),
+        MeetingRoom(room_id=2, building_id=1),
+        MeetingRoom(room_id=3, building_id=1),
+        MeetingRoom(room_id=21, building_id=2),
+    ])
+    db_session.commit()
+
+
+class TestFacilitySnapshot:
+    """스냅샷 로드 / 조회 테스트"""
+
+    def test_default_snapshot_matches_constants(self):
+        """DB 로드 전 기본 스냅샷은 constants.py 초기값"""
+        snapshot = facility_registry.default_snapshot()
+
+        assert snapshot.sorted_meeting_room_ids == tuple(FacilityConstants.MEETING_ROOM_IDS)
+        assert snapshot.sorted_seat_ids[0] == FacilityConstants.SEAT_MIN_ID
+        assert snapshot.sorted_seat_ids[-1] == FacilityConstants.SEAT_MAX_ID
+        assert snapshot.loaded_at is None
+
+    def test_load_from_db(self, db_session, two_buildings):
+        """건물 → 열람실/회의실 → 좌석 구성을 DB에서 로드"""
+        snapshot = facility_registry.load_snapshot(db_session)
+
+        assert len(snapshot.seat_ids) == 70 + 50 + 100
+        assert snapshot.has_seat(120) and snapshot.has_seat(2001)
+        assert not snapshot.has_seat(80)
+        assert snapshot.has_meeting_room(21)
+        assert snapshot.seat_buildings[2050] == 2
+        assert snapshot.buildings[1].reading_room_ids == (1, 2)
+        assert snapshot.buildings[2].meeting_room_ids == (21,)
+
+    def test_snapshot_is_immutable(self, db_session, two_buildings):
+        """스냅샷은 변경 불가"""
+        snapshot = facility_registry.load_snapshot(db_session)
+
+        with pytest.raises(Exception):
+            snapshot.seat_ids = frozenset()
+        with pytest.raises(TypeError):
+            snapshot.buildings[3] = None
+
+    def test_refresh_replaces_snapshot(self, db_session, two_buildings, restore_snapshot):
+        """refresh 후 새 스냅샷이 조회됨"""
+        before = facility_registry.get_snapshot()
+
+        after = facility_registry.refresh(db_session)
+
+        assert facility_registry.get_snapshot() is after
+        assert after is not before
+        assert after.has_seat(2100)
+
+
+class TestValidatorsUseSnapshot:
+    """요청 스키마 검증이 스냅샷을 사용하는지 테스트"""
+
+    def test_new_building_seat_accepted(self, db_session, two_buildings, restore_snapshot):
+        """새 건물 좌석도 재배포 없이 예약 요청 가능"""
+        facility_registry.refresh(db_session)
+
+        request = SeatReservationCreate(
+            date=date.today() + timedelta(days=1),
+            start_time=time(9, 0),
+            end_time=time(11, 0),
+            seat_id=2001,
+        )
+
+        assert request.seat_id == 2001
+
+    def test_unregistered_seat_rejected(self, db_session, two_buildings, restore_snapshot):
+        """레지스트리에 없는 좌석 번호는 거부"""
+        facility_registry.refresh(db_session)
+
+        with pytest.raises(ValueError):
+            SeatReservationCreate(
+                date=date.today() + timedelta(days=1),
+                start_time=time(9, 0),
+                end_time=time(11, 0),
+                seat_id=80,
+            )
+
+    def test_new_meeting_room_accepted(self, db_session, two_buildings, restore_snapshot, multiple_users):
+        """새 건물 회의실 ID 허용"""
+        facility_registry.refresh(db_session)
+
+        request = MeetingRoomReservationCreate(
+            room_id=21,
+            date=date.today() + timedelta(days=1),
+            start_time=time(9, 0),
+            end_time=time(10, 0),
+            participants=[{"student_id": u.student_id} for u in multiple_users[:3]],
+        )
+
+        assert request.room_id == 21
@@ -0,0 +1,180 @@
+"""
+tests/unit/test_init_db.py - 시설 초기 데이터(시딩) 테스트
+"""
+import math
+from datetime import datetime, timezone
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.constants import FacilityConstants
+from app.init_db import SEED_CHUNK_SIZE, migrate_schema, seed_facilities
+from app.models import Building, MeetingRoom, ReadingRoom, Seat, to_epoch_minutes
+
+
+def _inserts(stats, table=""):
+    """추적된 SQL 중 INSERT 실행 횟수 (table을 주면 해당 테이블만)"""
+    return sum(
+        count
+        for statement, count in stats["statements"].items()
+        if statement.lstrip().upper().startswith("INSERT") and f"INTO {table}" in statement
+    )
+
+
+class TestSeedFacilities:
+    """좌석/회의실 일괄 시딩 테스트"""
+
+    def test_seed_default_facilities(self, db_session):
+        """빈 DB에 constants 설정대로 생성"""
+        result = seed_facilities(db_session)
+
+        expected_seats = FacilityConstants.SEAT_MAX_ID - FacilityConstants.SEAT_MIN_ID + 1
+        assert result["seats_created"] == expected_seats
+        assert result["meeting_rooms_created"] == len(FacilityConstants.MEETING_ROOM_IDS)
+        assert db_session.query(Seat).count() == expected_seats
+        assert db_session.query(MeetingRoom).count() == len(FacilityConstants.MEETING_ROOM_IDS)
+
+    def test_bootstraps_registry(self, db_session):
+        """빈 DB에는 기본 건물/열람실을 만들고 회의실을 소속시킴"""
+        seed_facilities(db_session)
+
+        assert db_session.get(Building, FacilityConstants.DEFAULT_BUILDING_ID) is not None
+        reading_room = db_session.get(ReadingRoom, FacilityConstants.DEFAULT_READING_ROOM_ID)
+        assert (reading_room.seat_min_id, reading_room.seat_max_id) == (
+            FacilityConstants.SEAT_MIN_ID, FacilityConstants.SEAT_MAX_ID
+        )
+        assert all(
+            room.building_id == FacilityConstants.DEFAULT_BUILDING_ID
+            for room in db_session.query(MeetingRoom).all()
+        )
+
+    def test_seeds_ranges_from_registry(self, db_session):
+        """열람실을 추가하면 해당 범위의 좌석이 생성됨"""
+        seed_facilities(db_session)
+        db_session.add(ReadingRoom(
+            reading_room_id=2,
+            building_id=FacilityConstants.DEFAULT_BUILDING_ID,
+            name="제2열람실",
+            seat_min_id=101,
+            seat_max_id=130,
+        ))
+        db_session.commit()
+
+        result = seed_facilities(db_session)
+
+        assert result["seats_created"] == 30
+        assert db_session.get(Seat, 130) is not None
+
+    def test_seed_is_idempotent(self, db_session):
+        """다시 실행해도 추가 생성 없음"""
+        seed_facilities(db_session)
+        result = seed_facilities(db_session)
+
+        assert result["seats_created"] == 0
+        assert result["meeting_rooms_created"] == 0
+
+    def test_reconciles_missing_ids(self, db_session, test_seat):
+        """일부만 존재하면 빠진 ID만 추가 (기존 행은 유지)"""
+        test_seat.is_available = False
+        db_session.commit()
+
+        result = seed_facilities(db_session, seat_ids=range(1, 11), meeting_room_ids=[])
+
+        assert result["seats_created"] == 9
+        assert db_session.query(Seat).count() == 10
+        assert db_session.get(Seat, 1).is_available is False
+
+    def test_reports_unconfigured_facilities(self, db_session):
+        """설정 범위 밖의 기존 좌석은 삭제하지 않고 개수만 보고"""
+        seed_facilities(db_session, seat_ids=range(1, 21), meeting_room_ids=[1])
+
+        result = seed_facilities(db_session, seat_ids=range(1, 11), meeting_room_ids=[1])
+
+        assert result["seats_unconfigured"] == 10
+        assert db_session.query(Seat).count() == 20
+
+    def test_seed_10k_seats(self, db_session, query_budget):
+        """좌석 10,000개 콜드 스타트는 청크 단위 다중 행 INSERT, 재시작은 INSERT 없이 조회만"""
+        seat_chunks = math.ceil(10000 / SEED_CHUNK_SIZE)
+
+        with query_budget.limit(seat_chunks + 15) as cold:
+            result = seed_facilities(db_session, seat_ids=range(1, 10001), meeting_room_ids=[1, 2, 3])
+        with query_budget.limit(10) as warm:
+            rerun = seed_facilities(db_session, seat_ids=range(1, 10001), meeting_room_ids=[1, 2, 3])
+
+        assert result["seats_created"] == 10000
+        assert result["meeting_rooms_created"] == 3
+        assert db_session.query(Seat).count() == 10000
+        # 행 단위 create_seat 루프(좌석당 INSERT)가 아닌 청크당 INSERT 한 번
+        assert _inserts(cold, "seats") == seat_chunks
+        # 재시작: 추가 행 없음, INSERT 없음
+        assert rerun["seats_created"] == 0
+        assert rerun["meeting_rooms_created"] == 0
+        assert _inserts(warm) == 0
+        assert db_session.query(Seat).count() == 10000
+
+
+class TestMigrateSchema:
+    """기존 DB 컬럼 보강 테스트"""
+
+    def test_adds_building_id_to_existing_meeting_rooms(self, tmp_path):
+        """building_id 컬럼이 없는 기존 meeting_rooms 테이블에 컬럼 추가"""
+        engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+        with engine.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE meeting_rooms (room_id INTEGER PRIMARY KEY, "
+                "min_capacity INTEGER, max_capacity INTEGER, is_available BOOLEAN)"
+            ))
+
+        with Session(engine) as db:
+            migrate_schema(db)
+            migrate_schema(db)  # 멱등
+            columns = {row[1] for row in db.execute(text("PRAGMA table_info(meeting_rooms)"))}
+
+        assert "building_id" in columns
+        engine.dispose()
+
+    def test_backfills_epoch_minutes_for_existing_reservations(self, tmp_path):
+        """정수 시각 컬럼이 없는 기존 reservations에 컬럼 추가 + 백필 + 인덱스 교체"""
+        engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+        with engine.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE reservations (reservation_id INTEGER PRIMARY KEY, "
+                "student_id INTEGER, meeting_room_id INTEGER, seat_id INTEGER, "
+                "start_time DATETIME, end_time DATETIME, status VARCHAR)"
+            ))
+            conn.execute(text("CREATE INDEX idx_seat_start ON reservations (seat_id, start_time, status)"))
+            conn.execute(text(
+                "INSERT INTO reservations VALUES "
+                "(1, 202300001, NULL, 5, '2025-12-20 01:00:00.000000', '2025-12-20 03:00:00.000000', 'RESERVED')"
+            ))
+
+        with Session(engine) as db:
+            migrate_schema(db)
+            migrate_schema(db)  # 멱등
+            row = db.execute(text("SELECT start_minute, end_minute FROM reservations")).one()
+            indexes = {r[1] for r in db.execute(text("PRAGMA index_list(reservations)"))}
+
+        start = datetime(2025, 12, 20, 1, 0, tzinfo=timezone.utc)
+        assert row.start_minute == to_epoch_minutes(start)
+        assert row.end_minute - row.start_minute == 120
+        assert {"idx_seat_minute", "idx_student_minute"} <= indexes
+        assert "idx_seat_start" not in indexes
+        engine.dispose()
+
+    def test_adds_participant_indexes(self, tmp_path):
+        """인덱스가 없는 기존 reservation_participants에 참여자 인덱스 추가"""
+        engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+        with engine.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE reservation_participants (id INTEGER PRIMARY KEY, "
+                "reservation_id INTEGER, participant_student_id INTEGER)"
+            ))
+
+        with Session(engine) as db:
+            migrate_schema(db)
+            migrate_schema(db)  # 멱등
+            indexes = {r[1] for r in db.execute(text("PRAGMA index_list(reservation_participants)"))}
+
+        assert {"idx_participant_reservation", "idx_participant_student"} <= indexes
+        engine.dispose()
@@ -0,0 +1,103 @@
+"""
+tests/unit/test_lock_profiler.py - 쓰기 락 구간 프로파일러 테스트
+"""
+import pytest
+from datetime import date, time, timedelta
+
+from app.exceptions import ConflictException
+from app.schemas.meeting_room import MeetingRoomSeriesCreate, ParticipantBase
+from app.schemas.seat import SeatReservationBatchCreate, SeatReservationCreate
+from app.services import reservation_service, seat_service, series_service
+
+
+def seat_request(seat_id=1, start_hour=10):
+    return SeatReservationCreate(
+        date=date.today() + timedelta(days=1),
+        start_time=time(start_hour, 0),
+        end_time=time(start_hour + 2, 0),
+        seat_id=seat_id,
+    )
+
+
+def section(report, name):
+    return next(item for item in report["sections"] if item["section"] == name)
+
+
+class TestLockProfiler:
+    """단계별 측정과 집계"""
+
+    def test_phases_recorded_in_order(self, db_session, test_user, test_seat, lock_profile):
+        """예약 / 취소 구간의 단계가 실행 순서대로 집계됨"""
+        reservation = seat_service.reserve_seat(db_session, test_user.student_id, seat_request())
+        reservation_service.cancel_reservation(db_session, reservation.reservation_id, test_user.student_id)
+
+        report = lock_profile.report()
+        reserve = section(report, "seat.reserve")
+        assert [p["phase"] for p in reserve["phases"]] == [
+            "seat_check", "overlap_check", "daily_limit", "insert", "commit",
+        ]
+        assert reserve["commits"] == 1
+        assert reserve["hold"]["count"] == 1
+        assert sum(p["total_ms"] for p in reserve["phases"]) == pytest.approx(reserve["hold"]["total_ms"], abs=0.01)
+
+        cancel = section(report, "reservation.cancel")
+        assert [p["phase"] for p in cancel["phases"]] == ["load", "waitlist_promotion", "commit"]
+
+    def test_batch_and_series_sections(self, db_session, test_user, available_seats, test_meeting_room,
+                                       multiple_users, lock_profile):
+        """일괄 좌석 예약 / 반복 예약도 각자의 구간으로 단계별 집계됨"""
+        seat_service.reserve_seats_batch(db_session, test_user.student_id, SeatReservationBatchCreate(
+            items=[seat_request(available_seats[0].seat_id), seat_request(available_seats[1].seat_id, start_hour=14)],
+        ))
+        start = date.today() + timedelta(days=7)
+        series_service.create_series(db_session, test_user.student_id, MeetingRoomSeriesCreate(
+            room_id=test_meeting_room.room_id,
+            frequency="weekly",
+            start_date=start,
+            end_date=start + timedelta(weeks=1),
+            start_time=time(10, 0),
+            end_time=time(11, 0),
+            participants=[ParticipantBase(student_id=u.student_id) for u in multiple_users[:3]],
+        ))
+
+        report = lock_profile.report()
+        assert [p["phase"] for p in section(report, "seat.reserve_batch")["phases"]] == [
+            "seat_intervals", "student_intervals", "daily_usage", "evaluate_items", "insert", "commit",
+        ]
+        assert [p["phase"] for p in section(report, "series.create")["phases"]] == [
+            "room_check", "room_intervals", "user_intervals", "usage_limits", "evaluate_occurrences",
+            "insert", "commit",
+        ]
+
+    def test_rejected_section_ends_in_rollback(self, db_session, test_user, test_seat, lock_profile, monkeypatch):
+        """검증 실패는 마지막 단계가 rollback으로 기록됨"""
+        monkeypatch.setattr("app.config.settings.RESERVATION_INDEX_ENABLED", False)
+        seat_service.reserve_seat(db_session, 202300001, seat_request())
+
+        with pytest.raises(ConflictException):
+            seat_service.reserve_seat(db_session, test_user.student_id, seat_request())
+
+        reserve = section(lock_profile.report(), "seat.reserve")
+        assert reserve["commits"] == 1
+        assert reserve["rollbacks"] == 1
+        assert next(p for p in reserve["phases"] if p["phase"] == "rollback")["count"] == 1
+
+    def test_folded_output(self, db_session, test_user, test_seat, lock_profile):
+        """folded stack은 락 대기와 보유 단계를 구분"""
+        seat_service.reserve_seat(db_session, test_user.student_id, seat_request())
+
+        lines = lock_profile.folded().splitlines()
+        stacks = {line.rsplit(" ", 1)[0] for line in lines}
+
+        assert "seat.reserve;lock_wait" in stacks
+        assert "seat.reserve;held;seat_check" in stacks
+        assert "seat.reserve;held;commit" in stacks
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+    def test_disabled_records_nothing(self, db_session, test_user, test_seat, lock_profile, monkeypatch):
+        """비활성화 상태에서는 집계하지 않음"""
+        monkeypatch.setattr("app.config.settings.LOCK_PROFILER_ENABLED", False)
+
+        seat_service.reserve_seat(db_session, test_user.student_id, seat_request())
+
+        assert lock_profile.report()["sections"] == []
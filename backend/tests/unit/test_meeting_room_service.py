@@ -4,7 +4,8 @@ tests/unit/test_meeting_room_service.py - 회의실 예약 서비스 단위 테
 import pytest
 from datetime import datetime, date, time, timedelta, timezone
 
-from app.services import meeting_room_service
+from app import database
+from app.services import meeting_room_service, reservation_service
 from app.schemas.meeting_room import MeetingRoomReservationCreate, ParticipantBase
 from app.models import ReservationStatus, Reservation, MeetingRoom
 from app.constants import ErrorCode, ReservationLimits
@@ -77,6 +78,32 @@ class TestMeetingRoomReservationCreation:
             )
 
 
+class TestMeetingRoomWriteLockScope:
+    """검증부터 INSERT까지 BEGIN IMMEDIATE 락 유지"""
+
+    def test_insert_runs_inside_write_lock(self, db_session, test_meeting_room, monkeypatch):
+        """신규 신청자 / 참여자여도 INSERT 시점까지 쓰기 락이 풀리지 않음 (중간 커밋 없음)"""
+        original = reservation_service.create_meeting_room_reservation
+        lock_held = []
+
+        def create_meeting_room_reservation(db, **kwargs):
+            lock_held.append(database._WRITE_LOCK_ACQUIRED_KEY in db.info)
+            return original(db=db, **kwargs)
+
+        monkeypatch.setattr(reservation_service, "create_meeting_room_reservation", create_meeting_room_reservation)
+        request = MeetingRoomReservationCreate(
+            room_id=test_meeting_room.room_id,
+            date=get_tomorrow(),
+            start_time=time(10, 0),
+            end_time=time(11, 0),
+            participants=create_participants([202699991, 202699992, 202699993]),
+        )
+
+        meeting_room_service.process_reservation(db_session, 202699990, request)
+
+        assert lock_held == [True]
+
+
 class TestParticipantValidation:
     """참여자 검증 로직 테스트"""
 
@@ -0,0 +1,81 @@
+"""
+tests/unit/test_metrics.py - 프로세스 내 지표 레지스트리 테스트
+"""
+import threading
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app import metrics
+from app.services import seat_service
+
+
+class TestMetricTypes:
+    """카운터 / 히스토그램 / 텍스트 노출"""
+
+    def test_counter_sums_thread_shards(self):
+        """여러 스레드에서 올린 값은 수집 시 합산"""
+        counter = metrics.Counter("test_total", "테스트", ["kind"])
+
+        def work():
+            for _ in range(1000):
+                counter.inc(kind="a")
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        counter.inc(5, kind="b")
+
+        assert counter.value(kind="a") == 4000
+        assert counter.value(kind="b") == 5
+
+    def test_histogram_exposition(self):
+        """버킷은 누적 개수, _sum / _count 포함"""
+        registry = metrics.Registry()
+        histogram = registry.register(
+            metrics.Histogram("test_seconds", "테스트", ["route"], buckets=(0.1, 1.0))
+        )
+        histogram.observe(0.05, route="/a")
+        histogram.observe(0.5, route="/a")
+        histogram.observe(3, route="/a")
+
+        text = registry.expose()
+
+        assert "# TYPE test_seconds histogram" in text
+        assert 'test_seconds_bucket{route="/a",le="0.1"} 1' in text
+        assert 'test_seconds_bucket{route="/a",le="1"} 2' in text
+        assert 'test_seconds_bucket{route="/a",le="+Inf"} 3' in text
+        assert 'test_seconds_sum{route="/a"} 3.55' in text
+        assert 'test_seconds_count{route="/a"} 3' in text
+
+    def test_label_value_escaped(self):
+        """라벨 값의 따옴표 / 줄바꿈 이스케이프"""
+        gauge = metrics.Gauge("test_gauge", "테스트", ["name"])
+        gauge.inc(name='a"b\nc')
+        gauge.dec(name='a"b\nc')
+
+        assert gauge.expose() == ['test_gauge{name="a\\"b\\nc"} 0']
+
+    def test_metric_without_expose_rejected(self):
+        """expose를 구현하지 않은 지표 타입은 만들 수 없음"""
+        class Broken(metrics._Metric):
+            type_name = "untyped"
+
+        with pytest.raises(TypeError):
+            Broken("test_broken", "테스트")
+
+
+class TestInstrumentation:
+    """애플리케이션 계측"""
+
+    def test_precheck_counts(self, db_session, test_user):
+        """인덱스 사전 검사 통과 횟수 기록"""
+        before = metrics.RESERVATION_PRECHECKS.value(facility="seat", result="passed")
+
+        start = datetime.now(timezone.utc) + timedelta(days=1)
+        seat_service.precheck_conflicts(db_session, test_user.student_id, 1, start, start + timedelta(hours=2))
+
+        assert metrics.RESERVATION_PRECHECKS.value(facility="seat", result="passed") == before + 1
+
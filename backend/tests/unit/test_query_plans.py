@@ -0,0 +1,378 @@
+"""
+tests/unit/test_query_plans.py - 서비스 쿼리 실행 계획 회귀 테스트
+
+대량 합성 데이터를 넣고 ANALYZE로 통계를 만든 DB에서 서비스 함수를 실행한 뒤,
+실행된 모든 SQL에 EXPLAIN QUERY PLAN을 돌려 예약 관련 테이블을 전체 스캔하면 실패합니다.
+새 인덱스를 추가하면 여기에 그 인덱스를 쓰는 쿼리의 시나리오를 함께 추가합니다.
+"""
+import random
+from contextlib import contextmanager
+from datetime import date, datetime, time, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, event, func, insert, text
+from sqlalchemy.orm import sessionmaker
+
+from app import facility_availability, reservation_index, slow_query_log
+from app.models import (
+    Reservation,
+    ReservationStatus,
+    Seat,
+    SeatWaitlistEntry,
+    WaitlistStatus,
+    to_epoch_minutes,
+)
+from app.schemas.admin import AdminBulkReservationRequest
+from app.schemas.meeting_room import MeetingRoomReservationCreate, MeetingRoomSeriesCreate
+from app.schemas.seat import SeatReservationBatchCreate, SeatReservationCreate
+from app.services import (
+    admin_service,
+    archive_service,
+    meeting_room_service,
+    reservation_service,
+    seat_service,
+    series_service,
+    shard_service,
+    status_service,
+    waitlist_service,
+)
+from app.scheduler import _sync_status
+from benchmarks import dataset
+
+KST = timezone(timedelta(hours=9))
+
+# 전체 스캔하면 안 되는 테이블 (시설 테이블은 수십 행이라 제외)
+HOT_TABLES = {
+    "reservations",
+    "reservation_participants",
+    "reservations_archive",
+    "reservation_participants_archive",
+    "seat_waitlist",
+    "users",
+}
+
+USER_COUNT = 2000
+RESERVATION_COUNT = 15000
+# 합성 예약은 오늘 + DAYS_AHEAD일까지 (예약 생성 시나리오는 그 다음 날 - 빈 슬롯)
+DAYS_AHEAD = 30
+STUDENT_ID = dataset.FIRST_STUDENT_ID
+# 합성 예약이 없는 신규 학생 (예약 생성 시나리오용 - 한도·중복에 걸리지 않도록)
+NEW_STUDENT_ID = 202500001
+
+
+@pytest.fixture(scope="module")
+def plan_engine(tmp_path_factory):
+    """대량 합성 데이터 + ANALYZE 통계가 있는 별도 DB"""
+    engine = create_engine(f"sqlite:///{tmp_path_factory.mktemp('plans') / 'plans.db'}")
+    dataset.generate(
+        engine, RESERVATION_COUNT, seed=42, users=USER_COUNT, days_ahead=DAYS_AHEAD, analyze=False,
+    )
+
+    rng = random.Random(42)
+    session = sessionmaker(bind=engine)()
+    seat_ids = [seat_id for (seat_id,) in session.query(Seat.seat_id)]
+    student_ids = [STUDENT_ID + i for i in range(USER_COUNT)]
+    waitlist_start = datetime.combine(date.today() + timedelta(days=2), time(9), tzinfo=KST).astimezone(timezone.utc)
+    session.execute(insert(SeatWaitlistEntry), [
+        {
+            "student_id": sid,
+            "seat_id": rng.choice(seat_ids + [None]),
+            "start_time": waitlist_start,
+            "end_time": waitlist_start + timedelta(hours=2),
+            "start_minute": to_epoch_minutes(waitlist_start),
+            "end_minute": to_epoch_minutes(waitlist_start + timedelta(hours=2)),
+            "status": rng.choice(list(WaitlistStatus)),
+        }
+        for sid in student_ids[:500]
+    ])
+    session.commit()
+    session.execute(text("ANALYZE"))
+    session.close()
+
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def plan_db(plan_engine):
+    """시나리오용 세션 (예약 생성 시나리오의 커밋은 모듈 DB에 남음 - 서로 다른 슬롯 사용)"""
+    session = sessionmaker(autocommit=False, autoflush=False, bind=plan_engine)()
+    facility_availability.reload(session)
+    reservation_index.active_index.clear()
+    yield session
+    session.rollback()
+    session.close()
+    reservation_index.active_index.clear()
+    facility_availability.reset()
+
+
+@contextmanager
+def capture_statements(engine):
+    """블록 안에서 실행된 (SQL, 파라미터) 수집"""
+    statements = []
+
+    def collect(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, slow_query_log.first_parameters(parameters, executemany)))
+
+    event.listen(engine, "before_cursor_execute", collect)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", collect)
+
+
+def hot_table_scans(engine, statements):
+    """수집한 SQL 중 HOT_TABLES를 전체 스캔하는 plan 단계 {SQL: [단계...]}"""
+    found = {}
+    raw = engine.raw_connection()
+    try:
+        for statement, parameters in statements:
+            if not statement.lstrip().upper().startswith(("SELECT", "INSERT", "UPDATE", "DELETE", "WITH")):
+                continue
+            plan = slow_query_log.explain(raw, statement, parameters)
+            scans = [
+                detail for detail in slow_query_log.full_scans(plan)
+                if detail.split()[1] in HOT_TABLES
+            ]
+            if scans:
+                found[" ".join(statement.split())] = scans
+    finally:
+        raw.close()
+    return found
+
+
+def assert_indexed(engine, run):
+    with capture_statements(engine) as statements:
+        run()
+    assert statements, "no SQL captured"
+    scans = hot_table_scans(engine, statements)
+    assert not scans, "full table scans:\n" + "\n".join(f"{steps}\n  {sql}" for sql, steps in scans.items())
+
+
+def index_searches(engine, run, table_column):
+    """run에서 실행된 SQL 중 table_column(예: reservations.student_id)으로 거르는 쿼리의 plan 단계 {SQL: [단계...]}"""
+    with capture_statements(engine) as statements:
+        run()
+    found = {}
+    raw = engine.raw_connection()
+    try:
+        for statement, parameters in statements:
+            if f"{table_column} = " not in statement:
+                continue
+            found[" ".join(statement.split())] = slow_query_log.explain(raw, statement, parameters)
+    finally:
+        raw.close()
+    assert found, f"no query filtered by {table_column}"
+    return found
+
+
+def assert_uses_index(engine, run, table_column, index):
+    """table_column으로 거르는 모든 쿼리가 index로 (student_id, start_minute 범위) 검색하는지 확인"""
+    table = table_column.split(".")[0]
+    for sql, plan in index_searches(engine, run, table_column).items():
+        assert any(
+            detail.startswith(f"SEARCH {table} USING INDEX {index} (") and "start_minute" in detail
+            for detail in plan
+        ), f"{index} not used:\n{plan}\n  {sql}"
+
+
+def tomorrow():
+    return date.today() + timedelta(days=1)
+
+
+def free_day():
+    return date.today() + timedelta(days=DAYS_AHEAD + 1)
+
+
+@pytest.mark.slow
+class TestReservationPaths:
+    """예약 생성 / 취소 (쓰기 락 구간)"""
+
+    def test_reserve_seat(self, plan_engine, plan_db):
+        request = SeatReservationCreate(date=free_day(), start_time=time(10), end_time=time(12), seat_id=70)
+        assert_indexed(plan_engine, lambda: seat_service.reserve_seat(plan_db, NEW_STUDENT_ID, request))
+
+    def test_reserve_random_seat(self, plan_engine, plan_db):
+        request = SeatReservationCreate(date=free_day(), start_time=time(14), end_time=time(16))
+        assert_indexed(plan_engine, lambda: seat_service.reserve_seat(plan_db, NEW_STUDENT_ID + 1, request))
+
+    def test_reserve_meeting_room(self, plan_engine, plan_db):
+        request = MeetingRoomReservationCreate(
+            room_id=1,
+            date=free_day(),
+            start_time=time(17),
+            end_time=time(18),
+            participants=[{"student_id": NEW_STUDENT_ID + i} for i in range(3, 6)],
+        )
+        assert_indexed(plan_engine, lambda: meeting_room_service.process_reservation(plan_db, NEW_STUDENT_ID + 2, request))
+
+    def test_reserve_seats_batch(self, plan_engine, plan_db):
+        request = SeatReservationBatchCreate(items=[
+            SeatReservationCreate(date=free_day(), start_time=time(9), end_time=time(11), seat_id=69),
+            SeatReservationCreate(date=free_day() + timedelta(days=1), start_time=time(9), end_time=time(11)),
+        ])
+        assert_indexed(plan_engine, lambda: seat_service.reserve_seats_batch(plan_db, NEW_STUDENT_ID + 10, request))
+
+    def test_create_series(self, plan_engine, plan_db):
+        request = MeetingRoomSeriesCreate(
+            room_id=2,
+            frequency="weekly",
+            start_date=free_day(),
+            end_date=free_day() + timedelta(weeks=2),
+            start_time=time(9),
+            end_time=time(10),
+            participants=[{"student_id": NEW_STUDENT_ID + i} for i in range(21, 24)],
+        )
+        assert_indexed(plan_engine, lambda: series_service.create_series(plan_db, NEW_STUDENT_ID + 20, request))
+
+    def test_cancel_with_waitlist_promotion(self, plan_engine, plan_db):
+        reservation = (
+            plan_db.query(Reservation)
+            .filter(Reservation.status == ReservationStatus.RESERVED, Reservation.seat_id.isnot(None))
+            .first()
+        )
+        assert_indexed(plan_engine, lambda: reservation_service.cancel_reservation(
+            plan_db, reservation.reservation_id, reservation.student_id
+        ))
+
+
+@pytest.mark.slow
+class TestReadPaths:
+    """조회 / 검증 쿼리"""
+
+    def test_usage_limits(self, plan_engine, plan_db):
+        target = datetime.now(timezone.utc) + timedelta(days=1)
+
+        def run():
+            meeting_room_service.check_user_daily_meeting_limit(plan_db, STUDENT_ID, target)
+            meeting_room_service.check_user_weekly_meeting_limit(plan_db, STUDENT_ID, target)
+            seat_service._get_daily_seat_usage_minutes(plan_db, STUDENT_ID, target.astimezone(KST))
+
+        assert_indexed(plan_engine, run)
+
+    def test_my_reservations(self, plan_engine, plan_db):
+        assert_indexed(plan_engine, lambda: reservation_service.get_user_reservations_page(
+            plan_db, STUDENT_ID, limit=20,
+        ))
+
+    def test_my_reservations_filtered(self, plan_engine, plan_db):
+        """유형 / 기간 필터, 커서 다음 페이지, 아카이브 포함"""
+        start_from = datetime.combine(date.today() - timedelta(days=60), time(0), tzinfo=KST).astimezone(timezone.utc)
+        start_before = start_from + timedelta(days=90)
+
+        def run():
+            for reservation_type in ("seat", "meeting_room"):
+                rows = reservation_service.get_user_reservations_page(
+                    plan_db, STUDENT_ID, start_from=start_from, start_before=start_before,
+                    reservation_type=reservation_type, limit=5,
+                )
+                if rows:
+                    reservation_service.get_user_reservations_page(
+                        plan_db, STUDENT_ID, reservation_type=reservation_type, limit=5,
+                        cursor=(rows[-1].start_time, rows[-1].reservation_id),
+                    )
+            reservation_service.get_user_reservations_page(plan_db, STUDENT_ID, limit=20, include_archived=True)
+
+        assert_indexed(plan_engine, run)
+
+    def test_status(self, plan_engine, plan_db):
+        def run():
+            status_service.get_seat_status(plan_db, tomorrow())
+            status_service.get_meeting_room_status(plan_db, tomorrow())
+
+        assert_indexed(plan_engine, run)
+
+    def test_waitlist(self, plan_engine, plan_db):
+        def run():
+            entries = waitlist_service.get_my_waitlist(plan_db, STUDENT_ID)
+            waitlist_service.get_positions(plan_db, entries)
+
+        assert_indexed(plan_engine, run)
+
+    def test_admin_list(self, plan_engine, plan_db):
+        start_from = datetime.combine(tomorrow(), time(0), tzinfo=KST).astimezone(timezone.utc)
+        assert_indexed(plan_engine, lambda: admin_service.list_reservations(
+            plan_db, start_from=start_from, start_before=start_from + timedelta(days=1),
+        ))
+
+    def test_admin_export(self, plan_engine):
+        start_from = datetime.combine(tomorrow(), time(0), tzinfo=KST).astimezone(timezone.utc)
+        session_factory = sessionmaker(bind=plan_engine)
+        assert_indexed(plan_engine, lambda: list(admin_service.iter_export(
+            session_factory, "csv", start_from=start_from, start_before=start_from + timedelta(days=1),
+            reservation_type="seat",
+        )))
+
+
+@pytest.mark.slow
+class TestStudentMinuteIndexes:
+    """
+    사용자 중복 예약 / 좌석 이용 한도 검사가 (student_id, start_minute) 인덱스로 범위 검색
+    (회의실 한도는 예약자 OR 참여자 조건이라 회의실 인덱스를 쓰며 test_usage_limits가 전체 스캔만 검사)
+    """
+
+    def test_reservations(self, plan_engine, plan_db):
+        start = datetime.combine(tomorrow(), time(10), tzinfo=KST).astimezone(timezone.utc)
+
+        def run():
+            reservation_service.check_overlap_with_other_facility(plan_db, STUDENT_ID, start, start + timedelta(hours=2))
+            seat_service._get_daily_seat_usage_minutes(plan_db, STUDENT_ID, start.astimezone(KST))
+
+        assert_uses_index(plan_engine, run, "reservations.student_id", "idx_student_minute")
+
+    def test_user_reservation_index(self, plan_engine, plan_db):
+        """샤딩 모드의 사용자 인덱스 (메인 DB)"""
+        start = datetime.combine(tomorrow(), time(10), tzinfo=KST).astimezone(timezone.utc)
+
+        def run():
+            shard_service._index_has_overlap(plan_db, STUDENT_ID, start, start + timedelta(hours=2))
+            shard_service._index_usage_minutes(plan_db, STUDENT_ID, start, start + timedelta(days=1), seats=True)
+
+        assert_uses_index(
+            plan_engine, run, "user_reservation_index.student_id", "idx_user_index_student_minute"
+        )
+
+
+@pytest.mark.slow
+class TestAdminBulkPaths:
+    """관리자 일괄 취소 / 이동 (dry_run - 모듈 DB는 바뀌지 않음)"""
+
+    def bulk(self, plan_engine, plan_db, **fields):
+        request = AdminBulkReservationRequest(
+            dry_run=True, from_date=tomorrow(), to_date=tomorrow() + timedelta(days=1), **fields
+        )
+        assert_indexed(plan_engine, lambda: admin_service.bulk_update_reservations(plan_db, request))
+
+    def test_bulk_cancel(self, plan_engine, plan_db):
+        self.bulk(plan_engine, plan_db, action="cancel", type="seat", facility_ids=[1, 2, 3])
+
+    def test_bulk_move_seats(self, plan_engine, plan_db):
+        self.bulk(
+            plan_engine, plan_db, action="move", type="seat",
+            facility_ids=[1, 2, 3], shift_minutes=60, target_facility_ids=[10, 11, 12],
+        )
+
+    def test_bulk_move_meeting_rooms(self, plan_engine, plan_db):
+        """회의실 이동은 참여자의 다른 예약도 조회"""
+        self.bulk(plan_engine, plan_db, action="move", type="meeting_room", shift_minutes=60)
+
+
+@pytest.mark.slow
+class TestSchedulerPaths:
+    """스케줄러 일괄 UPDATE"""
+
+    def test_sync_status_and_expire(self, plan_engine, plan_db):
+        now = datetime.now(timezone.utc)
+
+        def run():
+            _sync_status(plan_db, Reservation, now)
+            waitlist_service.expire_waiting(plan_db, now)
+
+        assert_indexed(plan_engine, run)
+
+    def test_archive(self, plan_engine, plan_db):
+        """가장 오래된 하루치만 아카이브 (다른 시나리오 데이터는 그대로)"""
+        oldest_end = plan_db.query(func.min(Reservation.end_time)).scalar().replace(tzinfo=timezone.utc)
+        assert_indexed(plan_engine, lambda: archive_service.archive_reservations(
+            plan_db, cutoff=oldest_end + timedelta(days=1), batch_size=50,
+        ))
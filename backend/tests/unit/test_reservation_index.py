@@ -0,0 +1,153 @@
+"""
+tests/unit/test_reservation_index.py - 활성 예약 메모리 인덱스 테스트
+"""
+import pytest
+from datetime import date, datetime, time, timedelta, timezone
+
+from app import reservation_index
+from app.constants import ErrorCode
+from app.exceptions import ConflictException
+from app.models import Reservation, ReservationParticipant, ReservationStatus
+from app.schemas.seat import SeatReservationCreate
+from app.services import seat_service
+
+UTC = timezone.utc
+START = datetime(2030, 3, 4, 1, 0, tzinfo=UTC)
+END = START + timedelta(hours=2)
+
+index = reservation_index.active_index
+
+
+def add_reservation(db_session, student_id=202312345, seat_id=1, room_id=None,
+                    start=START, end=END, participants=()):
+    reservation = Reservation(
+        student_id=student_id,
+        seat_id=None if room_id else seat_id,
+        meeting_room_id=room_id,
+        start_time=start,
+        end_time=end,
+        status=ReservationStatus.RESERVED,
+    )
+    db_session.add(reservation)
+    db_session.flush()
+    for participant_id in participants:
+        db_session.add(ReservationParticipant(
+            reservation_id=reservation.reservation_id,
+            participant_student_id=participant_id,
+        ))
+    db_session.commit()
+    return reservation
+
+
+class TestSessionEvents:
+    """커밋/롤백 시 인덱스 반영"""
+
+    def test_committed_reservation_indexed(self, db_session):
+        """커밋된 예약은 시설·학생 기준으로 조회됨 (끝나는 시각에 시작하는 구간은 제외)"""
+        add_reservation(db_session)
+
+        assert len(index) == 1
+        assert index.seat_conflict(1, START + timedelta(hours=1), END + timedelta(hours=1))
+        assert not index.seat_conflict(1, END, END + timedelta(hours=2))
+        assert not index.seat_conflict(2, START, END)
+        assert index.student_conflict(202312345, START, END, include_meeting_rooms=False)
+        assert not index.student_conflict(202312345, START, END, include_seats=False)
+
+    def test_rolled_back_reservation_not_indexed(self, db_session):
+        """플러시 후 롤백된 예약은 반영되지 않음"""
+        db_session.add(Reservation(
+            student_id=202312345, seat_id=1, start_time=START, end_time=END,
+            status=ReservationStatus.RESERVED,
+        ))
+        db_session.flush()
+        db_session.rollback()
+
+        assert len(index) == 0
+
+    def test_canceled_reservation_removed(self, db_session):
+        """취소 커밋 시 인덱스에서 제거"""
+        reservation = add_reservation(db_session)
+
+        reservation.status = ReservationStatus.CANCELED
+        db_session.commit()
+
+        assert len(index) == 0
+        assert not index.seat_conflict(1, START, END)
+
+    def test_participants_indexed(self, db_session):
+        """회의실 참여자도 학생 기준으로 조회됨"""
+        add_reservation(db_session, room_id=1, participants=(202312346, 202312347))
+
+        assert index.room_conflict(1, START, END)
+        assert index.student_conflict(202312347, START, END, include_seats=False)
+        assert not index.student_conflict(202312348, START, END)
+
+
+class TestConsistencyTools:
+    """rebuild / verify / prune"""
+
+    def test_verify_detects_bulk_changes_and_rebuild_fixes(self, db_session):
+        """이벤트를 거치지 않은 일괄 변경은 verify로 드러나고 rebuild로 복구"""
+        kept_id = add_reservation(db_session).reservation_id
+        removed_id = add_reservation(db_session, seat_id=2).reservation_id
+        db_session.query(Reservation).filter(
+            Reservation.reservation_id == removed_id
+        ).delete(synchronize_session=False)
+        db_session.commit()
+
+        report = reservation_index.verify([db_session])
+        assert report["stale"] == [removed_id]
+        assert report["missing"] == []
+
+        assert reservation_index.rebuild([db_session]) == 1
+        assert not any(reservation_index.verify([db_session]).values())
+        assert list(index.entries()) == [kept_id]
+
+    def test_prune_removes_ended(self, db_session):
+        """종료 시각이 지난 예약 제거"""
+        add_reservation(db_session)
+        add_reservation(db_session, seat_id=2, start=END, end=END + timedelta(hours=2))
+
+        assert index.prune(END) == 1
+        assert len(index) == 1
+
+
+class TestPrecheck:
+    """예약 생성 전 사전 거절"""
+
+    def test_conflict_rejected_before_lock(self, db_session, test_user, test_seat, monkeypatch):
+        """인덱스에 충돌이 있으면 쓰기 락을 잡지 않고 거절"""
+        tomorrow = date.today() + timedelta(days=1)
+        request = SeatReservationCreate(
+            date=tomorrow, start_time=time(10, 0), end_time=time(12, 0), seat_id=test_seat.seat_id
+        )
+        seat_service.reserve_seat(db_session, 202312399, request)
+
+        def fail_if_locked(db):
+            raise AssertionError("write lock taken")
+
+        monkeypatch.setattr(seat_service, "begin_immediate", fail_if_locked)
+        with pytest.raises(ConflictException) as exc_info:
+            seat_service.reserve_seat(db_session, test_user.student_id, request)
+
+        assert exc_info.value.code == ErrorCode.RESERVATION_CONFLICT
+
+    def test_stale_entry_rechecked_in_db(self, db_session, test_user, test_seat):
+        """다른 워커가 취소해 인덱스에만 남은 예약은 DB 확인 후 무시하고 인덱스에서 제거"""
+        tomorrow = date.today() + timedelta(days=1)
+        request = SeatReservationCreate(
+            date=tomorrow, start_time=time(10, 0), end_time=time(12, 0), seat_id=test_seat.seat_id
+        )
+        canceled_id = seat_service.reserve_seat(db_session, 202312399, request).reservation_id
+        # 다른 프로세스의 취소: 이 프로세스의 세션 이벤트를 거치지 않음
+        db_session.query(Reservation).filter(Reservation.reservation_id == canceled_id).update(
+            {Reservation.status: ReservationStatus.CANCELED}, synchronize_session=False
+        )
+        db_session.commit()
+        assert canceled_id in index.entries()
+
+        reservation = seat_service.reserve_seat(db_session, test_user.student_id, request)
+
+        assert reservation.status == ReservationStatus.RESERVED
+        assert canceled_id not in index.entries()
+        assert not any(reservation_index.verify([db_session]).values())
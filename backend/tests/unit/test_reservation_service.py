@@ -2,10 +2,10 @@
 tests/unit/test_reservation_service.py - 예약 서비스 단위 테스트
 """
 import pytest
-from datetime import datetime, date, time
+from datetime import datetime, date, time, timedelta
 
 from app.services import reservation_service
-from app.models import ReservationStatus
+from app.models import Reservation, ReservationStatus, to_epoch_minutes
 from app.constants import ErrorCode
 from app.exceptions import BusinessException, ForbiddenException
 
@@ -386,3 +386,79 @@ class TestFacilityOverlapValidation:
         # 검증
         assert seat_overlap is False
         assert room_overlap is False
+
+
+class TestReservationPageQuery:
+    """내 예약 SQL 필터링/페이지 조회 테스트"""
+
+    def test_page_includes_participating_reservations(self, db_session, multiple_users, meeting_room_reservation):
+        """참여자로 포함된 회의실 예약도 조회"""
+        from app.models import ReservationParticipant
+
+        participant_id = multiple_users[0].student_id
+        db_session.add(ReservationParticipant(
+            reservation_id=meeting_room_reservation.reservation_id,
+            participant_student_id=participant_id,
+        ))
+        db_session.commit()
+
+        rows = reservation_service.get_user_reservations_page(db_session, participant_id)
+
+        assert [r.reservation_id for r in rows] == [meeting_room_reservation.reservation_id]
+
+    def test_page_filters_by_type(self, db_session, test_user, seat_reservation, meeting_room_reservation):
+        """시설 유형 필터를 SQL에서 적용"""
+        seat_rows = reservation_service.get_user_reservations_page(
+            db_session, test_user.student_id, reservation_type="seat"
+        )
+        unknown_rows = reservation_service.get_user_reservations_page(
+            db_session, test_user.student_id, reservation_type="unknown"
+        )
+
+        assert [r.reservation_id for r in seat_rows] == [seat_reservation.reservation_id]
+        assert unknown_rows == []
+
+    def test_page_orders_by_start_time_desc(self, db_session, test_user, seat_reservation, meeting_room_reservation):
+        """시작 시각 내림차순 정렬"""
+        rows = reservation_service.get_user_reservations_page(db_session, test_user.student_id)
+
+        assert [r.reservation_id for r in rows] == [
+            meeting_room_reservation.reservation_id,
+            seat_reservation.reservation_id,
+        ]
+
+    def test_cursor_round_trip(self):
+        """커서 인코딩/디코딩"""
+        from datetime import timezone
+
+        start = datetime(2025, 12, 20, 2, 0, 0, tzinfo=timezone.utc)
+        cursor = reservation_service.encode_cursor(start, 42)
+
+        assert reservation_service.decode_cursor(cursor) == (start, 42)
+
+
+class TestEpochMinutes:
+    """정수 시각(epoch 분) 컬럼 동기화 및 겹침 검사"""
+
+    def test_minutes_synced_from_datetimes(self, db_session, seat_reservation):
+        """start_time / end_time 설정 시 정수 컬럼 자동 동기화"""
+        assert seat_reservation.start_minute == to_epoch_minutes(seat_reservation.start_time)
+        assert seat_reservation.end_minute == to_epoch_minutes(seat_reservation.end_time)
+
+        seat_reservation.end_time = seat_reservation.end_time + timedelta(hours=1)
+        assert seat_reservation.end_minute == to_epoch_minutes(seat_reservation.end_time)
+
+    def test_overlap_excludes_adjacent_slots(self, db_session, seat_reservation):
+        """끝나는 시각에 시작하는 구간은 겹치지 않음"""
+        start = seat_reservation.start_time
+        end = seat_reservation.end_time
+
+        def overlapping(range_start, range_end):
+            return db_session.query(Reservation).filter(
+                Reservation.overlaps(range_start, range_end)
+            ).count()
+
+        assert overlapping(start, end) == 1
+        assert overlapping(end - timedelta(minutes=1), end + timedelta(hours=1)) == 1
+        assert overlapping(end, end + timedelta(hours=1)) == 0
+        assert overlapping(start - timedelta(hours=1), start) == 0
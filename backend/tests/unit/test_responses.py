@@ -0,0 +1,39 @@
+"""
+tests/unit/test_responses.py - 응답 envelope 직렬화 테스트
+"""
+import asyncio
+from datetime import date, timedelta
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+
+from app import responses, schemas
+from app.main import app
+from app.services import status_service
+
+
+def legacy_body(path: str, payload) -> bytes:
+    """response_model 재검증 + 표준 JSONResponse로 만든 기존 응답 바이트"""
+    route = next(r for r in app.routes if getattr(r, "path", None) == path)
+    content = asyncio.run(serialize_response(
+        field=route.secure_cloned_response_field,
+        response_content=schemas.ApiResponse(is_success=True, code=None, payload=payload),
+    ))
+    return JSONResponse(content).body
+
+
+class TestEnvelope:
+    """재검증 없이 만든 응답이 기존 응답과 같은지"""
+
+    def test_seat_status_matches_validated_response(self, db_session, test_seat, seat_reservation):
+        payload = status_service.get_seat_status(db_session, seat_reservation.start_time.date(), seat_ids=[1, 2])
+
+        response = responses.envelope(payload)
+
+        assert response.media_type == "application/json"
+        assert response.body == legacy_body("/api/status/seats", payload)
+
+    def test_meeting_room_status_matches_validated_response(self, db_session, test_meeting_room):
+        payload = status_service.get_meeting_room_status(db_session, date.today() + timedelta(days=1), room_ids=[1])
+
+        assert responses.envelope(payload).body == legacy_body("/api/status/meeting-rooms", payload)
@@ -4,8 +4,9 @@ tests/unit/test_seat_service.py - 좌석 예약 서비스 단위 테스트
 import pytest
 from datetime import datetime, date, time, timedelta, timezone
 
-from app.services import seat_service
-from app.schemas.seat import SeatReservationCreate
+from app import database
+from app.services import reservation_service, seat_service
+from app.schemas.seat import SeatReservationBatchCreate, SeatReservationCreate
 from app.models import ReservationStatus, Reservation, Seat
 from app.constants import ErrorCode, ReservationLimits
 from app.exceptions import BusinessException, ConflictException, LimitExceededException
@@ -102,6 +103,28 @@ class TestSeatReservationCreation:
         assert exc_info.value.code == ErrorCode.SEAT_NOT_AVAILABLE
 
 
+class TestSeatWriteLockScope:
+    """검증부터 INSERT까지 BEGIN IMMEDIATE 락 유지"""
+
+    def test_insert_runs_inside_write_lock(self, db_session, test_seat, monkeypatch):
+        """신규 사용자여도 INSERT 시점까지 쓰기 락이 풀리지 않음 (중간 커밋 없음)"""
+        original = reservation_service.create_seat_reservation
+        lock_held = []
+
+        def create_seat_reservation(db, **kwargs):
+            lock_held.append(database._WRITE_LOCK_ACQUIRED_KEY in db.info)
+            return original(db=db, **kwargs)
+
+        monkeypatch.setattr(reservation_service, "create_seat_reservation", create_seat_reservation)
+        request = SeatReservationCreate(
+            date=get_tomorrow(), start_time=time(10, 0), end_time=time(12, 0), seat_id=test_seat.seat_id
+        )
+
+        seat_service.reserve_seat(db_session, 202699999, request)
+
+        assert lock_held == [True]
+
+
 class TestSeatTimeConflict:
     """좌석 시간 충돌 검증 테스트
 
@@ -344,3 +367,66 @@ class TestRandomSeatAssignment:
             seat_service.reserve_seat(db_session, test_user.student_id, request)
 
         assert exc_info.value.code == ErrorCode.RESERVATION_CONFLICT
+
+
+class TestSeatBatchReservation:
+    """좌석 일괄 예약 테스트"""
+
+    @staticmethod
+    def batch(start_hours, mode="atomic", seat_id=1):
+        return SeatReservationBatchCreate(
+            mode=mode,
+            items=[
+                SeatReservationCreate(
+                    date=get_tomorrow(),
+                    start_time=time(hour, 0),
+                    end_time=time(hour + 2, 0),
+                    seat_id=seat_id,
+                )
+                for hour in start_hours
+            ],
+        )
+
+    def test_batch_created_together(self, db_session, test_user, test_seat):
+        """일일 한도 안의 여러 항목이 한 번에 생성됨"""
+        outcomes = seat_service.reserve_seats_batch(
+            db_session, test_user.student_id, self.batch([10, 14])
+        )
+
+        assert all(reservation is not None and error is None for reservation, error in outcomes)
+        assert db_session.query(Reservation).count() == 2
+
+    def test_atomic_daily_limit_across_batch(self, db_session, test_user, test_seat):
+        """배치 안의 항목끼리 일일 한도를 함께 계산하고, atomic 모드는 전체 취소"""
+        with pytest.raises(LimitExceededException) as exc_info:
+            seat_service.reserve_seats_batch(
+                db_session, test_user.student_id, self.batch([9, 12, 15])
+            )
+
+        assert exc_info.value.code == ErrorCode.DAILY_LIMIT_EXCEEDED
+        assert exc_info.value.details == {"index": 2}
+        assert db_session.query(Reservation).count() == 0
+
+    def test_best_effort_reports_per_item(self, db_session, test_user, test_seat):
+        """best_effort 모드는 통과한 항목만 생성하고 실패 항목을 보고"""
+        seat_service.reserve_seat(db_session, 202399999, SeatReservationCreate(
+            date=get_tomorrow(), start_time=time(10, 0), end_time=time(12, 0), seat_id=test_seat.seat_id
+        ))
+
+        outcomes = seat_service.reserve_seats_batch(
+            db_session, test_user.student_id, self.batch([10, 14], mode="best_effort")
+        )
+
+        (first, first_error), (second, second_error) = outcomes
+        assert first is None
+        assert first_error.code == ErrorCode.RESERVATION_CONFLICT
+        assert second.seat_id == test_seat.seat_id
+        assert second_error is None
+
+    def test_random_items_assigned(self, db_session, test_user, available_seats):
+        """랜덤 배정 항목도 한 번에 가용 좌석으로 배정"""
+        outcomes = seat_service.reserve_seats_batch(
+            db_session, test_user.student_id, self.batch([10, 14], seat_id=None)
+        )
+
+        assert all(reservation.seat_id in range(1, 11) for reservation, _ in outcomes)
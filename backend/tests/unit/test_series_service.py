@@ -0,0 +1,117 @@
+"""
+tests/unit/test_series_service.py - 회의실 반복 예약 서비스 테스트
+"""
+import pytest
+from datetime import date, datetime, time, timedelta, timezone
+
+from pydantic import ValidationError
+
+from app.constants import ErrorCode, ReservationLimits
+from app.models import Reservation, ReservationSeries, ReservationStatus
+from app.schemas.meeting_room import MeetingRoomSeriesCreate, ParticipantBase
+from app.services import series_service
+
+KST = timezone(timedelta(hours=9))
+MONDAY = date(2030, 3, 4)
+
+
+def series_request(room_id, participants, frequency="weekly", start=MONDAY, end=None, hour=10):
+    return MeetingRoomSeriesCreate(
+        room_id=room_id,
+        frequency=frequency,
+        start_date=start,
+        end_date=end or start + timedelta(weeks=3),
+        start_time=time(hour, 0),
+        end_time=time(hour + 1, 0),
+        participants=[ParticipantBase(student_id=sid) for sid in participants],
+    )
+
+
+@pytest.fixture
+def participant_ids(multiple_users):
+    return [u.student_id for u in multiple_users[:3]]
+
+
+class TestSeriesExpansion:
+    """반복 규칙 전개 및 일괄 생성"""
+
+    def test_weekly_series_created(self, db_session, test_user, test_meeting_room, participant_ids):
+        """매주 4회차가 같은 시리즈로 한 번에 생성됨"""
+        result = series_service.create_series(
+            db_session, test_user.student_id, series_request(test_meeting_room.room_id, participant_ids)
+        )
+
+        assert result.created_count == 4
+        assert result.failed_count == 0
+        assert [o.date for o in result.occurrences] == [
+            (MONDAY + timedelta(weeks=i)).isoformat() for i in range(4)
+        ]
+
+        reservations = db_session.query(Reservation).order_by(Reservation.start_time).all()
+        assert {r.series_id for r in reservations} == {result.series_id}
+        assert all(len(r.participants) == 3 for r in reservations)
+        assert reservations[1].start_time.replace(tzinfo=timezone.utc) == datetime(
+            2030, 3, 11, 10, 0, tzinfo=KST
+        )
+        assert db_session.get(ReservationSeries, result.series_id).frequency == "weekly"
+
+    def test_occurrence_limit(self, test_meeting_room, participant_ids):
+        """최대 회차 수를 넘는 반복 규칙은 요청 단계에서 거부"""
+        limit = ReservationLimits.MEETING_ROOM_SERIES_MAX_OCCURRENCES
+        with pytest.raises(ValidationError):
+            series_request(
+                test_meeting_room.room_id, participant_ids,
+                frequency="daily", end=MONDAY + timedelta(days=limit),
+            )
+
+    def test_far_future_end_date_rejected(self, test_meeting_room, participant_ids):
+        """date 범위 끝까지 가는 반복 규칙도 펼치지 않고 바로 거부 (OverflowError 없음)"""
+        with pytest.raises(ValidationError, match="최대"):
+            series_request(test_meeting_room.room_id, participant_ids, frequency="daily", end=date.max)
+
+
+class TestSeriesOccurrenceFailures:
+    """회차별 실패 보고"""
+
+    def test_room_conflict_reported_per_occurrence(self, db_session, test_user, test_meeting_room, participant_ids):
+        """기존 예약과 겹치는 회차만 실패하고 나머지는 생성"""
+        start = datetime(2030, 3, 11, 10, 0, tzinfo=KST)
+        db_session.add(Reservation(
+            student_id=202300999, meeting_room_id=test_meeting_room.room_id,
+            start_time=start, end_time=start + timedelta(hours=1),
+            status=ReservationStatus.RESERVED,
+        ))
+        db_session.commit()
+
+        result = series_service.create_series(
+            db_session, test_user.student_id, series_request(test_meeting_room.room_id, participant_ids)
+        )
+
+        assert result.created_count == 3
+        failed = [o for o in result.occurrences if o.reservation_id is None]
+        assert [(o.date, o.code) for o in failed] == [("2030-03-11", ErrorCode.RESERVATION_CONFLICT.value)]
+
+    def test_weekly_limit_counts_earlier_occurrences(self, db_session, test_user, test_meeting_room, participant_ids):
+        """앞선 회차 사용 시간이 누적되어 주간 한도를 넘는 회차부터 실패"""
+        weekly_slots = ReservationLimits.MEETING_ROOM_WEEKLY_LIMIT_MINUTES // 60
+        request = series_request(
+            test_meeting_room.room_id, participant_ids,
+            frequency="daily", end=MONDAY + timedelta(days=6),
+        )
+
+        result = series_service.create_series(db_session, test_user.student_id, request)
+
+        assert result.created_count == weekly_slots
+        assert {o.code for o in result.occurrences[weekly_slots:]} == {ErrorCode.WEEKLY_LIMIT_EXCEEDED.value}
+        assert db_session.query(Reservation).count() == weekly_slots
+
+    def test_nothing_created_when_all_fail(self, db_session, test_user, test_meeting_room, participant_ids):
+        """모든 회차가 실패하면 시리즈도 만들지 않음"""
+        request = series_request(test_meeting_room.room_id, participant_ids)
+        series_service.create_series(db_session, test_user.student_id, request)
+
+        result = series_service.create_series(db_session, test_user.student_id, request)
+
+        assert result.series_id is None
+        assert result.failed_count == 4
+        assert db_session.query(ReservationSeries).count() == 1
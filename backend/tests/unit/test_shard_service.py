@@ -0,0 +1,252 @@
+"""
+tests/unit/test_shard_service.py - 건물별 샤딩 모드 예약 서비스 테스트
+"""
+import pytest
+from datetime import date, time, timedelta
+from sqlalchemy import update
+
+from app import facility_availability, facility_registry
+from app.facility_registry import ReadingRoomInfo
+from app.models import (
+    MeetingRoom,
+    Reservation,
+    ReservationDirectory,
+    ReservationStatus,
+    Seat,
+    UserReservationIndex,
+)
+from app.schemas import MeetingRoomReservationCreate, SeatReservationCreate
+from app.schemas.meeting_room import ParticipantBase
+from app.services import shard_service
+from app.sharding import ShardRouter
+from app.constants import ErrorCode
+from app.exceptions import BusinessException, ConflictException, ForbiddenException, ServiceUnavailableException
+from app.services import reservation_service
+
+
+def get_tomorrow():
+    return date.today() + timedelta(days=1)
+
+
+@pytest.fixture
+def router(db_session, tmp_path, monkeypatch):
+    """건물 2개(좌석 1-3 / 101-103, 회의실 1 / 2)로 구성된 샤드 라우터"""
+    original = facility_registry.get_snapshot()
+    facility_registry.set_snapshot(facility_registry.build_snapshot(
+        buildings={1: "중앙도서관", 2: "공학도서관"},
+        reading_rooms=(
+            ReadingRoomInfo(1, 1, "제1열람실", 1, 3),
+            ReadingRoomInfo(2, 2, "공학열람실", 101, 103),
+        ),
+        meeting_rooms={1: 1, 2: 2},
+    ))
+    db_session.add_all(
+        [Seat(seat_id=seat_id, is_available=True) for seat_id in (1, 2, 3, 101, 102, 103)]
+        + [MeetingRoom(room_id=1, building_id=1), MeetingRoom(room_id=2, building_id=2)]
+    )
+    db_session.commit()
+
+    shard_router = ShardRouter(str(tmp_path))
+    monkeypatch.setattr(shard_service, "shard_router", shard_router)
+    yield shard_router
+    shard_router.dispose()
+    facility_registry.set_snapshot(original)
+
+
+def seat_request(seat_id, start_hour=10):
+    return SeatReservationCreate(
+        date=get_tomorrow(),
+        start_time=time(start_hour, 0),
+        end_time=time(start_hour + 2, 0),
+        seat_id=seat_id,
+    )
+
+
+def shard_reservations(router, building_id):
+    shard = router.session(building_id)
+    try:
+        return shard.query(Reservation).all()
+    finally:
+        shard.close()
+
+
+class TestShardedSeatReservation:
+    """좌석 예약 샤드 라우팅"""
+
+    def test_reservation_written_to_building_shard(self, db_session, router):
+        """예약은 좌석이 속한 건물 샤드에만 기록되고 메인 DB에는 인덱스만 남음"""
+        reservation = shard_service.reserve_seat(db_session, 202300001, seat_request(101))
+
+        assert [r.reservation_id for r in shard_reservations(router, 2)] == [reservation.reservation_id]
+        assert shard_reservations(router, 1) == []
+        assert db_session.query(Reservation).count() == 0
+
+        entry = db_session.get(ReservationDirectory, reservation.reservation_id)
+        assert entry.building_id == 2
+        index_row = db_session.query(UserReservationIndex).one()
+        assert index_row.seat_id == 101
+        assert index_row.is_owner is True
+
+    def test_reservation_ids_unique_across_shards(self, db_session, router):
+        """샤드가 달라도 전역 예약 ID가 겹치지 않음"""
+        first = shard_service.reserve_seat(db_session, 202300001, seat_request(1))
+        second = shard_service.reserve_seat(db_session, 202300002, seat_request(101))
+
+        assert first.reservation_id != second.reservation_id
+
+    def test_cross_shard_user_overlap_rejected(self, db_session, router):
+        """다른 건물 좌석이라도 같은 시간대 본인 예약이 있으면 거부"""
+        shard_service.reserve_seat(db_session, 202300001, seat_request(1))
+
+        with pytest.raises(ConflictException) as exc_info:
+            shard_service.reserve_seat(db_session, 202300001, seat_request(101))
+
+        assert exc_info.value.code == ErrorCode.OVERLAP_WITH_OTHER_FACILITY
+        assert shard_reservations(router, 2) == []
+        assert db_session.query(ReservationDirectory).count() == 1
+
+    def test_same_seat_conflict_checked_in_shard(self, db_session, router):
+        """같은 좌석·시간대 예약은 샤드에서 충돌 처리"""
+        shard_service.reserve_seat(db_session, 202300001, seat_request(2))
+
+        with pytest.raises(ConflictException) as exc_info:
+            shard_service.reserve_seat(db_session, 202300002, seat_request(2))
+
+        assert exc_info.value.code == ErrorCode.RESERVATION_CONFLICT
+
+    def test_random_seat_falls_back_to_other_building(self, db_session, router):
+        """한 건물이 꽉 차면 다른 건물 좌석을 배정"""
+        for i, seat_id in enumerate((1, 2, 3)):
+            shard_service.reserve_seat(db_session, 202300010 + i, seat_request(seat_id))
+
+        reservation = shard_service.reserve_seat(db_session, 202300001, seat_request(None))
+
+        assert reservation.seat_id in (101, 102, 103)
+
+    def test_availability_checked_in_cache(self, db_session, router, query_budget):
+        """이용 불가 좌석은 좌석 테이블 조회 없이 캐시로 거절하고 랜덤 배정에서도 제외"""
+        db_session.execute(update(Seat).where(Seat.seat_id.in_((1, 2, 3))).values(is_available=False))
+        db_session.commit()
+        facility_availability.reload(db_session)
+
+        with query_budget.limit(50) as stats:
+            with pytest.raises(BusinessException) as exc_info:
+                shard_service.reserve_seat(db_session, 202300001, seat_request(1))
+            reservation = shard_service.reserve_seat(db_session, 202300001, seat_request(None))
+
+        assert exc_info.value.code == ErrorCode.SEAT_NOT_AVAILABLE
+        assert reservation.seat_id in (101, 102, 103)
+        assert not [sql for sql in stats["statements"] if "FROM seats" in sql]
+
+    def test_other_worker_disable_rejected_under_lock(self, db_session, router):
+        """다른 워커가 비활성화한 좌석은 메인 DB 락 안의 버전 비교로 거절 (인덱스·샤드에 기록 없음)"""
+        facility_availability.reload(db_session)
+        db_session.execute(update(Seat).where(Seat.seat_id == 101).values(is_available=False))
+        facility_availability._bump_db_version(db_session)
+        db_session.commit()
+
+        with pytest.raises(BusinessException) as exc_info:
+            shard_service.reserve_seat(db_session, 202300001, seat_request(101))
+
+        assert exc_info.value.code == ErrorCode.SEAT_NOT_AVAILABLE
+        assert db_session.query(UserReservationIndex).count() == 0
+        assert shard_reservations(router, 2) == []
+
+
+class TestShardedMeetingRoomReservation:
+    """회의실 예약 샤드 라우팅"""
+
+    def test_participants_indexed(self, db_session, router):
+        """참여자마다 인덱스 행이 생기고 참여자의 다른 건물 좌석 예약도 막힘"""
+        request = MeetingRoomReservationCreate(
+            room_id=2,
+            date=get_tomorrow(),
+            start_time=time(10, 0),
+            end_time=time(11, 0),
+            participants=[ParticipantBase(student_id=sid) for sid in (202300002, 202300003, 202300004)],
+        )
+        reservation = shard_service.process_reservation(db_session, 202300001, request)
+
+        rows = db_session.query(UserReservationIndex).filter_by(
+            reservation_id=reservation.reservation_id
+        ).all()
+        assert sorted(r.student_id for r in rows) == [202300001, 202300002, 202300003, 202300004]
+
+        with pytest.raises(ConflictException):
+            shard_service.reserve_seat(db_session, 202300003, seat_request(1))
+
+
+class TestShardedCancelAndQuery:
+    """취소 및 조회"""
+
+    def test_cancel_routed_through_directory(self, db_session, router):
+        """디렉터리로 샤드를 찾아 취소하고 인덱스 상태도 동기화"""
+        reservation = shard_service.reserve_seat(db_session, 202300001, seat_request(102))
+
+        canceled = shard_service.cancel_reservation(db_session, reservation.reservation_id, 202300001)
+
+        assert canceled.status == ReservationStatus.CANCELED
+        assert shard_reservations(router, 2)[0].status == ReservationStatus.CANCELED
+        assert db_session.query(UserReservationIndex).one().status == ReservationStatus.CANCELED
+
+        # 취소 후 같은 시간대 재예약 가능
+        shard_service.reserve_seat(db_session, 202300001, seat_request(1))
+
+    def test_cancel_failure_restores_index(self, db_session, router, monkeypatch):
+        """샤드 취소가 실패하면 인덱스를 RESERVED로 되돌려 샤드와 일치"""
+        reservation = shard_service.reserve_seat(db_session, 202300001, seat_request(102))
+
+        def busy(*args, **kwargs):
+            raise ServiceUnavailableException(code=ErrorCode.DATABASE_BUSY, message="busy")
+
+        monkeypatch.setattr(reservation_service, "cancel_reservation", busy)
+        with pytest.raises(ServiceUnavailableException):
+            shard_service.cancel_reservation(db_session, reservation.reservation_id, 202300001)
+
+        assert shard_reservations(router, 2)[0].status == ReservationStatus.RESERVED
+        db_session.expire_all()
+        assert db_session.query(UserReservationIndex).one().status == ReservationStatus.RESERVED
+
+    def test_cancel_repairs_index_left_reserved(self, db_session, router):
+        """샤드는 취소됐는데 인덱스만 RESERVED인 경우 재시도하면 인덱스가 CANCELED로 복구"""
+        reservation = shard_service.reserve_seat(db_session, 202300001, seat_request(102))
+        shard = router.session(2)
+        reservation_service.cancel_reservation(shard, reservation.reservation_id, 202300001, promote_waitlist=False)
+        shard.close()
+
+        with pytest.raises(BusinessException) as exc_info:
+            shard_service.cancel_reservation(db_session, reservation.reservation_id, 202300001)
+
+        assert exc_info.value.code == ErrorCode.RESERVATION_ALREADY_CANCELED
+        db_session.expire_all()
+        assert db_session.query(UserReservationIndex).one().status == ReservationStatus.CANCELED
+        shard_service.reserve_seat(db_session, 202300001, seat_request(1))
+
+    def test_cancel_other_user_leaves_index(self, db_session, router):
+        """다른 사용자의 취소 요청은 인덱스를 건드리지 않고 거부"""
+        reservation = shard_service.reserve_seat(db_session, 202300001, seat_request(102))
+
+        with pytest.raises(ForbiddenException):
+            shard_service.cancel_reservation(db_session, reservation.reservation_id, 202300002)
+
+        assert db_session.query(UserReservationIndex).one().status == ReservationStatus.RESERVED
+
+    def test_my_reservations_from_index(self, db_session, router):
+        """내 예약 목록은 여러 샤드의 예약을 인덱스에서 한 번에 조회"""
+        shard_service.reserve_seat(db_session, 202300001, seat_request(1, start_hour=10))
+        shard_service.reserve_seat(db_session, 202300001, seat_request(101, start_hour=14))
+
+        rows = shard_service.get_user_reservations_page(db_session, 202300001)
+
+        assert [row.seat_id for row in rows] == [101, 1]
+
+    def test_seat_status_merged_across_shards(self, db_session, router):
+        """좌석 현황은 건물 샤드별 결과를 병합"""
+        shard_service.reserve_seat(db_session, 202300001, seat_request(103))
+
+        payload = shard_service.get_seat_status(db_session, get_tomorrow())
+
+        assert [seat.seat_id for seat in payload.seats] == [1, 2, 3, 101, 102, 103]
+        seat_103 = payload.seats[-1]
+        assert not all(slot.is_available for slot in seat_103.slots)
+        assert all(slot.is_available for slot in payload.seats[0].slots)
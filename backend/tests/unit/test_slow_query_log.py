@@ -0,0 +1,75 @@
+"""
+tests/unit/test_slow_query_log.py - 느린 쿼리 로그 테스트
+"""
+import json
+
+import pytest
+from datetime import datetime, timezone
+
+from app import slow_query_log
+from app.config import settings
+from app.services import meeting_room_service
+
+
+@pytest.fixture
+def slow_log(tmp_path, monkeypatch):
+    """모든 SQL을 임시 파일에 기록하도록 설정하고 기록된 항목을 읽는 함수 반환"""
+    path = tmp_path / "logs" / "slow_query.log"
+    monkeypatch.setattr(settings, "SLOW_QUERY_LOG_ENABLED", True)
+    monkeypatch.setattr(settings, "SLOW_QUERY_THRESHOLD_MS", 0)
+    monkeypatch.setattr(settings, "SLOW_QUERY_LOG_PATH", str(path))
+    slow_query_log.reset()
+
+    def entries():
+        return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+    yield entries
+    slow_query_log.reset()
+
+
+def weekly_entries(entries):
+    return [
+        e for e in entries
+        if "reservation_participants" in e["statement"] and "LEFT OUTER JOIN" in e["statement"]
+    ]
+
+
+class TestSlowQueryLog:
+    """임계값 이상 SQL 기록과 plan 수집"""
+
+    def test_plan_captured_once_per_shape(self, db_session, test_user, slow_log):
+        """같은 모양의 SQL은 처음 한 번만 EXPLAIN QUERY PLAN을 남김"""
+        now = datetime.now(timezone.utc)
+        meeting_room_service.check_user_weekly_meeting_limit(db_session, test_user.student_id, now)
+        meeting_room_service.check_user_weekly_meeting_limit(db_session, 202300002, now)
+
+        first, second = weekly_entries(slow_log())
+        assert first["shape"] == second["shape"]
+        assert first["parameters"][-1] == test_user.student_id
+        assert second["parameters"][-1] == 202300002
+        assert first["plan"]
+        assert "plan" not in second
+        # 전체 스캔 여부는 이후 항목에도 표시
+        assert first.get("full_scans") == second.get("full_scans")
+
+    def test_below_threshold_not_logged(self, db_session, test_user, slow_log, monkeypatch):
+        """임계값보다 빠른 SQL은 기록하지 않음"""
+        monkeypatch.setattr(settings, "SLOW_QUERY_THRESHOLD_MS", 60_000)
+
+        meeting_room_service.check_user_weekly_meeting_limit(
+            db_session, test_user.student_id, datetime.now(timezone.utc)
+        )
+
+        with pytest.raises(FileNotFoundError):
+            slow_log()
+
+    def test_full_scans(self):
+        """SEARCH / 상수 행은 전체 스캔으로 보지 않음"""
+        plan = [
+            "SEARCH reservations USING INDEX ix_reservations_student (student_id=?)",
+            "SCAN reservation_participants",
+            "SCAN CONSTANT ROW",
+            "USE TEMP B-TREE FOR DISTINCT",
+        ]
+
+        assert slow_query_log.full_scans(plan) == ["SCAN reservation_participants"]
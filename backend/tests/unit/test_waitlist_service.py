@@ -0,0 +1,116 @@
+"""
+tests/unit/test_waitlist_service.py - 좌석 대기열 서비스 테스트
+"""
+import pytest
+from datetime import date, datetime, time, timedelta, timezone
+
+from app.constants import ErrorCode
+from app.exceptions import ConflictException, ValidationException
+from app.models import Reservation, ReservationStatus, SeatWaitlistEntry, WaitlistStatus
+from app.schemas.seat import SeatReservationCreate
+from app.services import reservation_service, seat_service, waitlist_service
+
+
+def get_tomorrow():
+    return date.today() + timedelta(days=1)
+
+
+def seat_request(seat_id=1, start_hour=10):
+    return SeatReservationCreate(
+        date=get_tomorrow(),
+        start_time=time(start_hour, 0),
+        end_time=time(start_hour + 2, 0),
+        seat_id=seat_id,
+    )
+
+
+@pytest.fixture
+def full_slot(db_session, test_seat):
+    """좌석 1번 내일 10-12시가 다른 학생에게 예약된 상태"""
+    return seat_service.reserve_seat(db_session, 202300001, seat_request())
+
+
+class TestJoinWaitlist:
+    """대기 등록"""
+
+    def test_join_when_full(self, db_session, test_user, full_slot):
+        """만석인 시간대는 대기 등록되고 순번이 매겨짐"""
+        entry = waitlist_service.join_waitlist(db_session, test_user.student_id, seat_request())
+        second = waitlist_service.join_waitlist(db_session, 202300002, seat_request(seat_id=None))
+
+        assert entry.status == WaitlistStatus.WAITING
+        positions = waitlist_service.get_positions(db_session, [entry, second])
+        assert positions == {entry.waitlist_id: 1, second.waitlist_id: 1}
+
+    def test_positions_in_one_query(self, db_session, test_user, full_slot, query_budget):
+        """여러 항목의 순번을 쿼리 한 번으로 계산 (좌석 지정 대기는 앞선 "아무 좌석" 대기도 셈)"""
+        any_seat = waitlist_service.join_waitlist(db_session, 202300002, seat_request(seat_id=None))
+        seat_1 = waitlist_service.join_waitlist(db_session, test_user.student_id, seat_request())
+        seat_1_next = waitlist_service.join_waitlist(db_session, 202300003, seat_request())
+        entries = [any_seat, seat_1, seat_1_next]
+        for entry in entries:
+            db_session.refresh(entry)  # 커밋으로 만료된 속성 미리 로드
+
+        with query_budget.limit(1):
+            positions = waitlist_service.get_positions(db_session, entries)
+
+        assert positions == {any_seat.waitlist_id: 1, seat_1.waitlist_id: 2, seat_1_next.waitlist_id: 3}
+
+    def test_open_slot_rejected(self, db_session, test_user, test_seat):
+        """바로 예약 가능한 시간대는 대기 대신 거절"""
+        with pytest.raises(ValidationException):
+            waitlist_service.join_waitlist(db_session, test_user.student_id, seat_request())
+
+    def test_duplicate_rejected(self, db_session, test_user, full_slot):
+        """같은 시간대 중복 대기 거절"""
+        waitlist_service.join_waitlist(db_session, test_user.student_id, seat_request())
+
+        with pytest.raises(ConflictException) as exc_info:
+            waitlist_service.join_waitlist(db_session, test_user.student_id, seat_request())
+
+        assert exc_info.value.code == ErrorCode.RESERVATION_CONFLICT
+
+
+class TestPromotionOnCancel:
+    """취소 시 대기열 선두 예약 전환"""
+
+    def test_head_promoted_in_cancel(self, db_session, test_user, full_slot):
+        """취소하면 먼저 등록한 대기자가 같은 좌석으로 예약됨"""
+        first = waitlist_service.join_waitlist(db_session, test_user.student_id, seat_request())
+        second = waitlist_service.join_waitlist(db_session, 202300002, seat_request(seat_id=None))
+
+        reservation_service.cancel_reservation(db_session, full_slot.reservation_id, 202300001)
+
+        db_session.refresh(first)
+        db_session.refresh(second)
+        assert first.status == WaitlistStatus.PROMOTED
+        assert second.status == WaitlistStatus.WAITING
+
+        promoted = db_session.get(Reservation, first.reservation_id)
+        assert promoted.student_id == test_user.student_id
+        assert promoted.seat_id == full_slot.seat_id
+        assert promoted.status == ReservationStatus.RESERVED
+
+    def test_candidate_over_limit_skipped(self, db_session, test_user, available_seats, full_slot):
+        """일일 한도를 넘는 대기자는 건너뛰고 다음 대기자를 전환"""
+        over_limit = waitlist_service.join_waitlist(db_session, test_user.student_id, seat_request())
+        # 대기 등록 이후 같은 날 4시간을 채움
+        seat_service.reserve_seat(db_session, test_user.student_id, seat_request(seat_id=2, start_hour=12))
+        seat_service.reserve_seat(db_session, test_user.student_id, seat_request(seat_id=2, start_hour=14))
+        next_entry = waitlist_service.join_waitlist(db_session, 202300002, seat_request())
+
+        reservation_service.cancel_reservation(db_session, full_slot.reservation_id, 202300001)
+
+        db_session.refresh(over_limit)
+        db_session.refresh(next_entry)
+        assert over_limit.status == WaitlistStatus.WAITING
+        assert next_entry.status == WaitlistStatus.PROMOTED
+
+    def test_expire_waiting(self, db_session, test_user, full_slot):
+        """시작 시각이 지난 대기는 만료"""
+        entry = waitlist_service.join_waitlist(db_session, test_user.student_id, seat_request())
+
+        waitlist_service.expire_waiting(db_session, datetime.now(timezone.utc) + timedelta(days=2))
+        db_session.commit()
+
+        assert db_session.get(SeatWaitlistEntry, entry.waitlist_id).status == WaitlistStatus.EXPIRED